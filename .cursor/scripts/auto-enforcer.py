@@ -23,11 +23,12 @@ import json
 import uuid
 import subprocess
 import argparse
+import threading
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Set, Any
+from typing import List, Dict, Optional, Tuple, Set, Any, Callable, Union
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -44,6 +45,7 @@ from enforcement.core.session_state import (
     load_session,
     save_session,
     get_file_hash,
+    session_mtime_ns,
 )
 from enforcement.core.scope_evaluator import (
     is_historical_dir_path,
@@ -57,6 +59,14 @@ from enforcement.core.git_utils import (
     run_git_command_cached,
 )
 from enforcement.core.file_scanner import is_file_modified_in_session
+from enforcement.core.enforcer_daemon import (
+    EnforcerDaemon,
+    DaemonUnavailable,
+    daemon_supported,
+    get_daemon_socket_path,
+    request_check,
+    send_request,
+)
 from enforcement.reporting import (
     BlockGenerator,
     ContextBundleBuilder,
@@ -79,11 +89,21 @@ try:
     from enforcement.checkers.checker_registry import get_all_checker_classes
     from enforcement.checkers.checker_router import CheckerRouter
     from enforcement.checkers.base_checker import CheckerStatus
+    from enforcement.checkers.file_content_store import FileContentStore, DEFAULT_MAX_BYTES
+    from enforcement.checkers.result_cache import ViolationCache, DEFAULT_MAX_BYTES as DEFAULT_RESULT_CACHE_BYTES
+    from enforcement.checkers.parallel_runner import (
+        run_checkers_in_process_pool,
+        CheckerExecutionFailure,
+        DEFAULT_BATCH_SIZE,
+        DEFAULT_TIMEOUT,
+    )
     MODULAR_CHECKERS_AVAILABLE = True
 except ImportError:
     MODULAR_CHECKERS_AVAILABLE = False
     get_all_checker_classes = None
     CheckerRouter = None
+    FileContentStore = None
+    ViolationCache = None
 
 # Lazy loading for context management modules (memory optimization)
 # Only import when actually needed, not at module load time
@@ -201,6 +221,54 @@ def _use_ascii_output() -> bool:
         return True  # Default to ASCII-safe if we can't determine
 
 
+def _cache_bytes_from_env(name: str, default: int) -> int:
+    """Cache size from a megabytes env var; unset or invalid values give default."""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value) * 1024 * 1024
+    except ValueError:
+        logger.warn(
+            f"Invalid {name}={value!r}, using default cache size",
+            operation="_cache_bytes_from_env",
+            error_code="INVALID_CACHE_SIZE",
+            root_cause=f"{name} must be an integer number of megabytes",
+            default_bytes=default
+        )
+        return default
+
+
+def _positive_number_from_env(
+    name: str,
+    default: Union[int, float],
+    cast: Callable[[str], Union[int, float]] = int
+) -> Union[int, float]:
+    """Positive number from an env var; unset or invalid values give default."""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        number = cast(value)
+        if not number > 0:
+            raise ValueError(f"{number} is not positive")
+        return number
+    except ValueError as e:
+        logger.warn(
+            f"Invalid {name}={value!r}, using default {default}",
+            operation="_positive_number_from_env",
+            error_code="INVALID_ENV_SETTING",
+            root_cause=f"{name} must be a positive {cast.__name__}: {e}",
+            default=default
+        )
+        return default
+
+
+def _stats_delta(before: Dict[str, int], after: Dict[str, int]) -> Dict[str, int]:
+    """Per-run cache counters from before/after snapshots of cumulative stats."""
+    return {key: value - before.get(key, 0) for key, value in after.items()}
+
+
 @dataclass
 class CheckerContext:
     changed_files_all: List[str]
@@ -244,12 +312,18 @@ class VeroFieldEnforcer:
     ]
     
     
-    # Current system date (for comparison)
-    CURRENT_DATE = datetime.now().strftime("%Y-%m-%d")
-    
-    def __init__(self, project_root: Optional[Path] = None):
-        """Initialize enforcer."""
+    def __init__(self, project_root: Optional[Path] = None, persistent: bool = False):
+        """
+        Initialize enforcer.
+        
+        Args:
+            project_root: Project root (default: detected from this script)
+            persistent: Keep file and violation caches open across runs (daemon mode)
+        """
         self.project_root = project_root or Path(__file__).parent.parent.parent
+        self.persistent = persistent
+        self.content_store = None
+        self.result_cache = None
         self.enforcement_dir = get_cursor_enforcer_root(self.project_root)
         self.memory_bank_dir = get_memory_bank_root(self.project_root)
         self.session: Optional[EnforcementSession] = None
@@ -268,6 +342,8 @@ class VeroFieldEnforcer:
             session_sequence_tracker_ref=self.session_sequence_tracker
         )
         
+        self._session_mtime_ns = self._get_session_mtime_ns()
+        
         # Git utilities helper (manages git interactions and caching)
         self.git_utils = GitUtils(self.project_root)
         
@@ -436,6 +512,43 @@ class VeroFieldEnforcer:
                 )
                 self._last_agent_response = ""
     
+    @property
+    def current_date(self) -> str:
+        """Current system date (for comparison), read per use so a daemon crossing midnight stays current."""
+        return datetime.now().strftime("%Y-%m-%d")
+    
+    def _get_session_mtime_ns(self) -> Optional[int]:
+        """Modification time of the persisted session, or None if there is none."""
+        return session_mtime_ns(self.enforcement_dir)
+    
+    def prepare_daemon_request(self):
+        """
+        Refresh the state a warm enforcer can't reuse between daemon requests.
+        
+        Git state is re-read (HEAD-only history is kept while HEAD is
+        unchanged), the session is reloaded only if another process wrote
+        the session store since this enforcer's last run, and the agent response
+        file is re-read, so each request sees what a fresh process would.
+        """
+        self.git_utils.refresh()
+        if self._get_session_mtime_ns() != self._session_mtime_ns:
+            self.session, self.session_sequence_tracker = load_session(
+                self.enforcement_dir,
+                predictor=self.predictor,
+                session_sequence_tracker_ref=self.session_sequence_tracker
+            )
+            logger.info(
+                "Session reloaded (changed on disk)",
+                operation="prepare_daemon_request",
+                session_id=self.session.session_id
+            )
+        self._last_agent_response = ""
+        self._load_agent_response_from_file()
+    
+    def finish_daemon_request(self):
+        """Remember the session file state this enforcer wrote."""
+        self._session_mtime_ns = self._get_session_mtime_ns()
+    
     def set_agent_response(self, response: str):
         """
         Store last agent response for verification (Two-Brain Model: Step 0.5/4.5 removed).
@@ -908,7 +1021,13 @@ class VeroFieldEnforcer:
         
         return True
     
-    def run_all_checks(self, user_message: Optional[str] = None, scope: str = "full", max_files: Optional[int] = None) -> bool:
+    def run_all_checks(
+        self,
+        user_message: Optional[str] = None,
+        scope: str = "full",
+        max_files: Optional[int] = None,
+        paths: Optional[List[str]] = None,
+    ) -> bool:
         """
         Run all compliance checks.
         
@@ -919,6 +1038,7 @@ class VeroFieldEnforcer:
             user_message: Optional user message to pass to context recommendations
             scope: Scan scope - "full" for baseline scan (all files), "current_session" for incremental (changed files only)
             max_files: DEBUG: Limit number of files processed (for debugging hangs)
+            paths: Only check these files (relative to project root) instead of every changed file
         """
         # FIRST: generate fresh recommendations and context-id
         # This must happen BEFORE enforcement checks so agent has latest context
@@ -1142,6 +1262,19 @@ class VeroFieldEnforcer:
                     changed_files_count=changed_files_count
                 )
 
+        if paths is not None:
+            # Explicit "check these paths" request: restrict the file set
+            requested = self._normalize_requested_paths(paths)
+            untracked_set = set(untracked_files)
+            all_changed_files = requested
+            tracked_files = [p for p in requested if p not in untracked_set]
+            untracked_files = [p for p in requested if p in untracked_set]
+            logger.info(
+                f"Restricting checks to {len(requested)} requested files",
+                operation="run_all_checks",
+                files_count=len(requested)
+            )
+
         filtered_all = _filter_paths(all_changed_files)
         filtered_tracked = _filter_paths(tracked_files)
         filtered_untracked = _filter_paths(untracked_files)
@@ -1293,6 +1426,23 @@ class VeroFieldEnforcer:
         blocked_violations = [v for v in self.violations if v.severity == ViolationSeverity.BLOCKED]
         return len(blocked_violations) == 0
     
+    def _normalize_requested_paths(self, paths: List[str]) -> List[str]:
+        """Make requested paths project-relative with forward slashes, dropping duplicates."""
+        normalized = []
+        seen = set()
+        for path_str in paths:
+            path = Path(path_str)
+            if path.is_absolute():
+                try:
+                    path = path.relative_to(self.project_root)
+                except ValueError:
+                    continue
+            norm = str(path).replace("\\", "/")
+            if norm not in seen:
+                seen.add(norm)
+                normalized.append(norm)
+        return normalized
+    
     def _run_modular_checkers(
         self,
         checker_context: CheckerContext,
@@ -1327,6 +1477,34 @@ class VeroFieldEnforcer:
         
         import time
         
+        # Shared file cache: each changed file is read and decoded once. Entries
+        # are keyed by (path, mtime, size), so a persistent enforcer keeps it.
+        content_store = self.content_store
+        if content_store is None:
+            max_bytes = _cache_bytes_from_env("ENFORCER_FILE_CACHE_MB", DEFAULT_MAX_BYTES)
+            content_store = FileContentStore(self.project_root, max_bytes=max_bytes)
+            if self.persistent:
+                self.content_store = content_store
+        for checker in checkers_to_run:
+            checker.content_store = content_store
+            # Cached checkers must see this run's session and git snapshot
+            checker.bind_run_state(session=self.session, git_utils=self.git_utils)
+        cache_stats_before = content_store.stats()
+        
+        # Persistent per-file result cache (ENFORCER_RESULT_CACHE_MB=0 disables it)
+        result_cache = self.result_cache
+        if result_cache is None:
+            result_cache_bytes = _cache_bytes_from_env("ENFORCER_RESULT_CACHE_MB", DEFAULT_RESULT_CACHE_BYTES)
+            if result_cache_bytes > 0:
+                result_cache = ViolationCache.for_project(self.project_root, max_bytes=result_cache_bytes)
+                if not result_cache.enabled:
+                    result_cache = None
+                elif self.persistent:
+                    self.result_cache = result_cache
+        result_cache_stats_before = result_cache.stats() if result_cache is not None else {}
+        session = self.session
+        file_hasher = (lambda path: get_file_hash(path, session, self.project_root)) if session else None
+        
         logger.info(
             f"Running {len(checkers_to_run)} modular checkers",
             operation="_run_modular_checkers",
@@ -1337,6 +1515,43 @@ class VeroFieldEnforcer:
         # Print to stdout for immediate visibility
         print(f"[MODULAR_CHECKERS] Starting {len(checkers_to_run)} checkers on {len(changed_files)} files", flush=True)
         
+        # Optional process-pool mode: checkers (sharded into file batches where
+        # supported) run across cores up front; results are then consumed below in
+        # routing order, so reporting is identical to the serial path.
+        parallel_results = {}
+        execution_mode = os.getenv("ENFORCER_EXECUTION_MODE", "serial").strip().lower()
+        max_workers = _positive_number_from_env("ENFORCER_MAX_WORKERS", 1)
+        if execution_mode == "process" and max_workers > 1:
+            # Cacheable checkers are looked up in the result cache here; only
+            # their misses go to the pool
+            parallel_checkers = [
+                checker for checker in checkers_to_run
+                if not (skip_non_critical and not checker.always_apply)
+            ]
+            batch_size = _positive_number_from_env("ENFORCER_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+            pool_timeout = _positive_number_from_env("ENFORCER_CHECKER_TIMEOUT", DEFAULT_TIMEOUT, cast=float)
+            parallel_start = time.perf_counter()
+            print(f"[MODULAR_CHECKERS] Process pool: {max_workers} workers, batch size {batch_size}", flush=True)
+            parallel_results = run_checkers_in_process_pool(
+                parallel_checkers,
+                changed_files,
+                user_message=user_message,
+                classification_map=classification_map,
+                max_workers=max_workers,
+                batch_size=batch_size,
+                timeout=pool_timeout,
+                result_cache=result_cache,
+                file_hasher=file_hasher,
+            )
+            logger.info(
+                "Process pool execution completed",
+                operation="_run_modular_checkers",
+                max_workers=max_workers,
+                batch_size=batch_size,
+                checkers=len(parallel_checkers),
+                duration_ms=int((time.perf_counter() - parallel_start) * 1000)
+            )
+        
         # Run each checker with detailed logging
         for idx, checker in enumerate(checkers_to_run, 1):
             checker_name = getattr(checker, 'rule_ref', getattr(checker, '__class__', {}).__name__ if hasattr(checker, '__class__') else 'Unknown')
@@ -1364,11 +1579,18 @@ class VeroFieldEnforcer:
                     print(f"[MODULAR_CHECKERS] [{idx}/{len(checkers_to_run)}] SKIPPED (non-critical): {checker_name}", flush=True)
                     continue
                 
-                # Execute checker
-                try:
-                    result = checker.check(changed_files, user_message, classification_map=classification_map)
-                except TypeError:
-                    result = checker.check(changed_files, user_message)
+                # Execute checker (or take its result from the process pool)
+                if checker.rule_ref in parallel_results:
+                    result = parallel_results[checker.rule_ref]
+                    if isinstance(result, CheckerExecutionFailure):
+                        raise result
+                elif result_cache is not None and checker.supports_result_cache:
+                    result = result_cache.check(checker, changed_files, user_message, file_hasher=file_hasher)
+                else:
+                    try:
+                        result = checker.check(changed_files, user_message, classification_map=classification_map)
+                    except TypeError:
+                        result = checker.check(changed_files, user_message)
                 
                 # Convert CheckerResult violations to Violation objects
                 for violation_dict in result.violations:
@@ -1427,12 +1649,50 @@ class VeroFieldEnforcer:
                 print(f"[MODULAR_CHECKERS] [{idx}/{len(checkers_to_run)}] FAILED: {checker_name} ({duration_ms}ms) - {str(e)}", flush=True)
                 self._report_failure(f"Modular Checker: {checker_name}")
         
+        # Detach the cache so cached checker instances don't pin file contents
+        for checker in checkers_to_run:
+            checker.content_store = None
+        cache_stats = _stats_delta(cache_stats_before, content_store.stats())
+        if not self.persistent:
+            content_store.clear()
+        result_cache_stats = None
+        if result_cache is not None:
+            if self.persistent:
+                result_cache.flush()
+            else:
+                result_cache.close()
+            result_cache_stats = _stats_delta(result_cache_stats_before, result_cache.stats())
+        
         logger.info(
             f"All modular checkers completed",
             operation="_run_modular_checkers",
-            total_checkers=len(checkers_to_run)
+            total_checkers=len(checkers_to_run),
+            file_cache_hits=cache_stats['hits'],
+            file_cache_misses=cache_stats['misses'],
+            file_cache_bytes_read=cache_stats['bytes_read'],
+            file_cache_evictions=cache_stats['evictions']
         )
         print(f"[MODULAR_CHECKERS] All {len(checkers_to_run)} checkers completed", flush=True)
+        print(
+            f"[MODULAR_CHECKERS] File cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+            f"{cache_stats['bytes_read']} bytes read, {cache_stats['evictions']} evictions",
+            flush=True
+        )
+        if result_cache_stats is not None:
+            logger.info(
+                "Violation cache summary",
+                operation="_run_modular_checkers",
+                result_cache_hits=result_cache_stats['hits'],
+                result_cache_misses=result_cache_stats['misses'],
+                result_cache_stores=result_cache_stats['stores'],
+                result_cache_evictions=result_cache_stats['evictions']
+            )
+            print(
+                f"[MODULAR_CHECKERS] Violation cache: {result_cache_stats['hits']} hits, "
+                f"{result_cache_stats['misses']} misses, {result_cache_stats['stores']} stored, "
+                f"{result_cache_stats['evictions']} evicted",
+                flush=True
+            )
     
     def _run_legacy_checks(self, checker_context: CheckerContext):
         """
@@ -1451,7 +1711,7 @@ class VeroFieldEnforcer:
         # Ensure agent response is up to date for context checks
         self._load_agent_response_from_file()
 
-        date_checker = DateChecker(current_date=self.CURRENT_DATE)
+        date_checker = DateChecker(current_date=self.current_date)
         security_checker = SecurityChecker(self.session)
         memory_bank_checker = MemoryBankChecker()
         error_checker = ErrorHandlingChecker()
@@ -1601,7 +1861,7 @@ class VeroFieldEnforcer:
             run_check(check_name, check_callable)
 
         if not skip_non_critical:
-            max_workers = max(1, int(os.getenv("ENFORCER_MAX_WORKERS", "1") or 1))
+            max_workers = _positive_number_from_env("ENFORCER_MAX_WORKERS", 1)
             if max_workers > 1:
                 with ThreadPoolExecutor(max_workers=max_workers) as executor:
                     future_map = {executor.submit(check_callable): check_name for check_name, check_callable in non_critical_checks}
@@ -2607,7 +2867,7 @@ The following rule files have been created or deleted:
         # Generate dashboard content
         current_time_utc = datetime.now(timezone.utc)
         # Align dashboard timestamp with enforcement system date to avoid false positives
-        last_updated_str = f"{self.CURRENT_DATE} {current_time_utc.strftime('%H:%M:%S UTC')}"
+        last_updated_str = f"{self.current_date} {current_time_utc.strftime('%H:%M:%S UTC')}"
         content = f"""# Context Management Dashboard
 
 **Last Updated:** {last_updated_str}
@@ -2698,10 +2958,16 @@ The following rule files have been created or deleted:
             )
     
 
-    def run(self, user_message: Optional[str] = None, scope: str = "full", max_files: Optional[int] = None) -> int:
+    def run(
+        self,
+        user_message: Optional[str] = None,
+        scope: str = "full",
+        max_files: Optional[int] = None,
+        paths: Optional[List[str]] = None,
+    ) -> int:
         """Main entry point."""
         try:
-            success = self.run_all_checks(user_message=user_message, scope=scope, max_files=max_files)
+            success = self.run_all_checks(user_message=user_message, scope=scope, max_files=max_files, paths=paths)
             return 0 if success else 1
         except Exception as e:
             logger.error(
@@ -2713,6 +2979,78 @@ The following rule files have been created or deleted:
             return 1
 
 
+def serve_daemon(socket_path: Path) -> int:
+    """
+    Run the enforcer as a daemon serving check requests on socket_path.
+    
+    One VeroFieldEnforcer stays loaded for the daemon's lifetime, so imports,
+    rule metadata, the checker router and its checker instances, the file
+    content store and the violation cache are reused by every request.
+    
+    Returns:
+        Process exit code
+    """
+    import signal
+    
+    enforcer = VeroFieldEnforcer(persistent=True)
+    
+    def handle_check(request: Dict[str, Any]) -> Dict[str, Any]:
+        scope = request.get("scope") or "full"
+        if scope not in ("full", "current_session"):
+            return {"ok": False, "error": f"Invalid scope: {scope}"}
+        paths = request.get("paths")
+        if paths is not None and not isinstance(paths, list):
+            return {"ok": False, "error": "paths must be a list"}
+        enforcer.prepare_daemon_request()
+        try:
+            exit_code = enforcer.run(
+                user_message=request.get("user_message"),
+                scope=scope,
+                paths=paths,
+            )
+        finally:
+            enforcer.finish_daemon_request()
+        return {"exit_code": exit_code}
+    
+    try:
+        daemon = EnforcerDaemon(socket_path, handle_check)
+    except OSError as e:
+        print(f"Cannot start enforcer daemon: {e}", file=sys.stderr)
+        return 1
+    
+    def stop(signum, frame):
+        # shutdown() waits for serve_forever(), which runs on this thread
+        threading.Thread(target=daemon.shutdown, daemon=True).start()
+    
+    signal.signal(signal.SIGTERM, stop)
+    print(f"Enforcer daemon listening on {socket_path} (pid {os.getpid()})", flush=True)
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if enforcer.result_cache is not None:
+            enforcer.result_cache.close()
+    return 0
+
+
+def _print_summary(exit_code: int, use_ascii: bool):
+    """Print the final pass/fail lines."""
+    print()
+    if use_ascii:
+        if exit_code == 0:
+            print("[OK] All compliance checks passed")
+        else:
+            print("[WARN] Compliance checks completed with violations")
+            print("   Check .cursor/enforcement/AGENT_STATUS.md for details")
+    else:
+        if exit_code == 0:
+            print("✅ All compliance checks passed")
+        else:
+            print("⚠️  Compliance checks completed with violations")
+            print("   Check .cursor/enforcement/AGENT_STATUS.md for details")
+
+
 def main():
     """Main entry point for standalone script."""
     # Parse command-line arguments
@@ -2736,11 +3074,65 @@ def main():
         default=None,
         help='DEBUG: Limit number of files processed (for debugging hangs)'
     )
+    parser.add_argument(
+        '--paths',
+        nargs='+',
+        default=None,
+        help='Only check these files (relative to project root) instead of every changed file'
+    )
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help='Run as a long-lived daemon that serves check requests on a Unix socket'
+    )
+    parser.add_argument(
+        '--stop-daemon',
+        action='store_true',
+        help='Stop a running enforcer daemon'
+    )
+    parser.add_argument(
+        '--no-daemon',
+        action='store_true',
+        help='Run in this process even if an enforcer daemon is running'
+    )
     args = parser.parse_args()
     
+    socket_path = get_daemon_socket_path(project_root)
+    if args.daemon:
+        sys.exit(serve_daemon(socket_path))
+    if args.stop_daemon:
+        try:
+            send_request(socket_path, {"op": "shutdown"}, timeout=5.0)
+            print(f"Enforcer daemon at {socket_path} stopped")
+        except DaemonUnavailable:
+            print(f"No enforcer daemon running at {socket_path}")
+        sys.exit(0)
+    
     # Detect Windows console encoding and use ASCII-safe alternatives if needed
     use_ascii = _use_ascii_output()
     
+    # Hand the request to a warm daemon when one is running
+    if not args.no_daemon and args.max_files is None and daemon_supported():
+        try:
+            response = request_check(
+                socket_path,
+                paths=args.paths,
+                scope=args.scope,
+                user_message=args.user_message,
+            )
+        except (OSError, ValueError) as e:
+            # The daemon got the request and may still be running it; a local
+            # run now would write the session concurrently with it
+            print(f"Enforcer daemon did not return a result ({e}); not re-running the check locally", file=sys.stderr)
+            sys.exit(1)
+        if response is not None and response.get("ok"):
+            print(f"[*] Checked by enforcer daemon in {response.get('duration_ms', 0)} ms")
+            exit_code = response.get("exit_code", 1)
+            _print_summary(exit_code, use_ascii)
+            sys.exit(exit_code)
+        if response is not None:
+            print(f"Enforcer daemon error: {response.get('error')}, running locally", file=sys.stderr)
+    
     # Use ASCII-safe alternatives for Windows console compatibility
     if use_ascii:
         print("[*] Loading Auto-Enforcement System...")
@@ -2764,22 +3156,14 @@ def main():
         print()
         print("🔄 Running compliance checks...")
     
-    exit_code = enforcer.run(user_message=args.user_message, scope=args.scope, max_files=args.max_files)
-    
-    print()
-    if use_ascii:
-        if exit_code == 0:
-            print("[OK] All compliance checks passed")
-        else:
-            print("[WARN] Compliance checks completed with violations")
-            print("   Check .cursor/enforcement/AGENT_STATUS.md for details")
-    else:
-        if exit_code == 0:
-            print("✅ All compliance checks passed")
-        else:
-            print("⚠️  Compliance checks completed with violations")
-            print("   Check .cursor/enforcement/AGENT_STATUS.md for details")
+    exit_code = enforcer.run(
+        user_message=args.user_message,
+        scope=args.scope,
+        max_files=args.max_files,
+        paths=args.paths,
+    )
     
+    _print_summary(exit_code, use_ascii)
     sys.exit(exit_code)
 
 
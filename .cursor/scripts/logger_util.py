@@ -3,15 +3,24 @@
 Structured Logging Utility for VeroScore V3
 Provides structured logging with trace ID propagation per Cursor rules.
 
+Records below the logger's level return before any work is done; enabled
+records are serialized to JSON by the formatter, with %-style message args
+formatted only then. enable_async_logging() (or VEROSCORE_LOG_ASYNC=1) moves
+writing to a background thread that batches JSON lines to stdout or a file.
+
 Last Updated: 2025-12-05
 """
 
+import atexit
 import json
 import logging
+import os
+import queue
 import sys
 import uuid
 from datetime import datetime, timezone
-from typing import Dict, Optional, Any
+from logging.handlers import QueueHandler
+from typing import Dict, Optional, Any, TextIO
 from pathlib import Path
 import threading
 
@@ -58,12 +67,31 @@ def set_trace_context(trace_id: Optional[str] = None, span_id: Optional[str] = N
         _trace_context["requestId"] = request_id
 
 
+# StructuredLogger level names -> logging levels
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+# Console handlers installed by StructuredLogger, by logger name (swapped for
+# the async sink's queue handler by enable_async_logging())
+_default_handlers: Dict[str, logging.Handler] = {}
+_handlers_lock = threading.Lock()
+_async_sink: Optional["AsyncLogSink"] = None
+
+
 class StructuredLogger:
     """
     Structured logger that follows Cursor rules (R08):
     - JSON-like format
     - Required fields: level, message, timestamp, traceId, context, operation, severity
     - Optional fields: tenantId, userId, errorCode, rootCause, additionalData
+    
+    Disabled levels cost one isEnabledFor() check; pass message args
+    %-style (not f-strings) so they're only formatted for records that are
+    emitted.
     """
     
     def __init__(self, context: str, level: str = "INFO"):
@@ -71,16 +99,30 @@ class StructuredLogger:
         self.logger = logging.getLogger(context)
         self.logger.setLevel(getattr(logging, level.upper(), logging.INFO))
         
-        # Set up console handler if not already configured
-        if not self.logger.handlers:
-            handler = logging.StreamHandler(sys.stdout)
-            handler.setFormatter(StructuredFormatter())
-            self.logger.addHandler(handler)
+        # Set up console handler (or the async sink) if not already configured
+        with _handlers_lock:
+            if not self.logger.handlers:
+                handler = logging.StreamHandler(sys.stdout)
+                handler.setFormatter(StructuredFormatter())
+                _default_handlers[context] = handler
+                self.logger.addHandler(_async_sink.handler if _async_sink else handler)
+    
+    def is_enabled_for(self, level: str) -> bool:
+        """
+        Check whether records at level would be emitted.
+        
+        Use to skip computing expensive log fields in hot loops.
+        
+        Args:
+            level: DEBUG, INFO, WARN or ERROR
+        """
+        return self.logger.isEnabledFor(_LEVELS.get(level, logging.INFO))
     
     def _log(
         self,
         level: str,
         message: str,
+        *args: Any,
         operation: Optional[str] = None,
         error_code: Optional[str] = None,
         root_cause: Optional[str] = None,
@@ -89,10 +131,13 @@ class StructuredLogger:
         **additional_data
     ):
         """Internal logging method with structured format."""
+        levelno = _LEVELS.get(level, logging.INFO)
+        if not self.logger.isEnabledFor(levelno):
+            return
         trace_ctx = get_or_create_trace_context()
         
+        # Serialized (with timestamp and formatted message) by StructuredFormatter
         log_entry: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
             "level": level,
             "message": message,
             "context": self.context,
@@ -117,35 +162,48 @@ class StructuredLogger:
         if additional_data:
             log_entry.update(additional_data)
         
-        # Log as JSON string
-        log_message = json.dumps(log_entry)
-        
-        # Use appropriate logging level
-        log_method = getattr(self.logger, level.lower(), self.logger.info)
-        log_method(log_message)
+        # Structured entries carry no caller file/line, so skip Logger.findCaller()'s stack walk
+        record = self.logger.makeRecord(
+            self.logger.name, levelno, "(unknown file)", 0, message, args, None,
+            extra={"structured": log_entry}
+        )
+        self.logger.handle(record)
     
-    def info(self, message: str, operation: Optional[str] = None, **kwargs):
+    def info(self, message: str, *args: Any, operation: Optional[str] = None, **kwargs):
         """Log info message."""
-        self._log("INFO", message, operation=operation, **kwargs)
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log("INFO", message, *args, operation=operation, **kwargs)
     
-    def warn(self, message: str, operation: Optional[str] = None, error_code: Optional[str] = None, **kwargs):
+    def warn(
+        self,
+        message: str,
+        *args: Any,
+        operation: Optional[str] = None,
+        error_code: Optional[str] = None,
+        **kwargs
+    ):
         """Log warning message."""
-        self._log("WARN", message, operation=operation, error_code=error_code, **kwargs)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._log("WARN", message, *args, operation=operation, error_code=error_code, **kwargs)
+    
+    warning = warn
     
     def error(
         self,
         message: str,
+        *args: Any,
         operation: Optional[str] = None,
         error_code: Optional[str] = None,
         root_cause: Optional[str] = None,
         **kwargs
     ):
         """Log error message."""
-        self._log("ERROR", message, operation=operation, error_code=error_code, root_cause=root_cause, **kwargs)
+        self._log("ERROR", message, *args, operation=operation, error_code=error_code, root_cause=root_cause, **kwargs)
     
-    def debug(self, message: str, operation: Optional[str] = None, **kwargs):
+    def debug(self, message: str, *args: Any, operation: Optional[str] = None, **kwargs):
         """Log debug message."""
-        self._log("DEBUG", message, operation=operation, **kwargs)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log("DEBUG", message, *args, operation=operation, **kwargs)
     
     def progress(
         self,
@@ -221,6 +279,15 @@ class StructuredFormatter(logging.Formatter):
     """Formatter that outputs structured JSON logs."""
     
     def format(self, record: logging.LogRecord) -> str:
+        # StructuredLogger record: serialize the entry now that it's being emitted
+        log_entry = getattr(record, "structured", None)
+        if log_entry is not None:
+            entry: Dict[str, Any] = {
+                "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat()
+            }
+            entry.update(log_entry)
+            entry["message"] = record.getMessage()
+            return json.dumps(entry, default=str)
         # If message is already JSON, return as-is
         if isinstance(record.msg, str) and record.msg.strip().startswith("{"):
             return record.msg
@@ -234,6 +301,151 @@ class StructuredFormatter(logging.Formatter):
         })
 
 
+class _JSONQueueHandler(QueueHandler):
+    """Queue handler that serializes in the caller's thread (values can't change after the call)."""
+    
+    def prepare(self, record: logging.LogRecord) -> str:
+        return self.format(record)
+
+
+_STOP = object()
+
+
+class AsyncLogSink:
+    """
+    Background writer for JSON log lines.
+    
+    Loggers put serialized lines on a queue through a QueueHandler; a daemon
+    thread drains everything queued (up to batch_size lines) and writes it
+    with one write() and flush(), so hot loops never block on stdout or disk.
+    """
+    
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        file_path: Optional[Path] = None,
+        batch_size: int = 512
+    ):
+        """
+        Initialize and start the sink.
+        
+        Args:
+            stream: Stream to write to (default: stdout)
+            file_path: Append to this file instead of a stream
+            batch_size: Maximum lines per write
+        """
+        self.batch_size = max(1, batch_size)
+        self.queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self.handler = _JSONQueueHandler(self.queue)
+        self.handler.setFormatter(StructuredFormatter())
+        self._file = open(file_path, "a", encoding="utf-8") if file_path else None
+        self._stream = self._file or stream or sys.stdout
+        self.lines_written = 0
+        self.batches_written = 0
+        self._thread = threading.Thread(target=self._run, name="log-sink", daemon=True)
+        self._thread.start()
+    
+    def _run(self):
+        stopping = False
+        while not stopping:
+            line = self.queue.get()
+            if line is _STOP:
+                break
+            batch = [line]
+            while len(batch) < self.batch_size:
+                try:
+                    line = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if line is _STOP:
+                    stopping = True
+                    break
+                batch.append(line)
+            try:
+                self._stream.write("\n".join(batch) + "\n")
+                self._stream.flush()
+            except (OSError, ValueError):
+                continue  # Stream closed; drop the batch like a failed handler would
+            self.lines_written += len(batch)
+            self.batches_written += 1
+    
+    def close(self):
+        """Write everything queued, stop the thread and close the file."""
+        self.queue.put(_STOP)
+        self._thread.join()
+        if self._file is not None:
+            self._file.close()
+
+
+def enable_async_logging(
+    stream: Optional[TextIO] = None,
+    file_path: Optional[Path] = None,
+    batch_size: int = 512
+) -> AsyncLogSink:
+    """
+    Route all structured loggers through a batching background sink.
+    
+    Args:
+        stream: Stream to write to (default: stdout)
+        file_path: Append to this file instead of a stream
+        batch_size: Maximum lines per write
+    
+    Returns:
+        The active AsyncLogSink (flushed at exit or by disable_async_logging())
+    """
+    global _async_sink
+    with _handlers_lock:
+        if _async_sink is not None:
+            return _async_sink
+        _async_sink = AsyncLogSink(stream=stream, file_path=file_path, batch_size=batch_size)
+        for name, handler in _default_handlers.items():
+            logger = logging.getLogger(name)
+            logger.removeHandler(handler)
+            logger.addHandler(_async_sink.handler)
+        return _async_sink
+
+
+def disable_async_logging():
+    """Flush the async sink and restore synchronous console handlers."""
+    global _async_sink
+    with _handlers_lock:
+        sink, _async_sink = _async_sink, None
+        if sink is None:
+            return
+        for name, handler in _default_handlers.items():
+            logger = logging.getLogger(name)
+            logger.removeHandler(sink.handler)
+            logger.addHandler(handler)
+    sink.close()
+
+
+def _drop_async_sink_in_child():
+    """
+    Restore the console handlers in a forked child.
+    
+    The child inherits the queue handler but not the sink's thread, so its
+    lines would pile up on a queue nobody drains. Lines the parent queued
+    before the fork are the parent's to write.
+    """
+    global _async_sink, _handlers_lock
+    _handlers_lock = threading.Lock()  # Another thread may have held it at fork time
+    sink, _async_sink = _async_sink, None
+    if sink is None:
+        return
+    for name, handler in _default_handlers.items():
+        logger = logging.getLogger(name)
+        logger.removeHandler(sink.handler)
+        logger.addHandler(handler)
+
+
+atexit.register(disable_async_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_drop_async_sink_in_child)
+
+if os.getenv("VEROSCORE_LOG_ASYNC", "").lower() in ("1", "true", "yes"):
+    enable_async_logging(file_path=os.getenv("VEROSCORE_LOG_FILE") or None)
+
+
 def get_logger(context: str, level: str = "INFO") -> StructuredLogger:
     """
     Get or create a structured logger for the given context.
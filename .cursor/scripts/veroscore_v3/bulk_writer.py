@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+ChangeBulkWriter - Buffered, retrying writer for changes_queue and session stats.
+
+Changes from many ChangeBuffer flushes are accumulated and written by a
+background thread once per flush window: chunked multi-row inserts into
+changes_queue, then one stats increment per session. Pending work is kept in
+a bounded JSON-lines spill file so it survives restarts.
+
+Last Updated: 2025-12-05
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .supabase_schema_helper import DEFAULT_INSERT_CHUNK_SIZE, SupabaseSchemaHelper, safe_to_resend
+from logger_util import get_logger
+
+logger = get_logger(context="ChangeBulkWriter")
+
+
+# Spill files larger than this are compacted, then trimmed oldest-first
+DEFAULT_MAX_SPILL_BYTES = 16 * 1024 * 1024
+
+
+class _PendingChange:
+    """One change waiting to be written (identity matters, not value)."""
+
+    __slots__ = ("session_id", "change")
+
+    def __init__(self, session_id: str, change: Dict[str, Any]):
+        self.session_id = session_id
+        self.change = change
+
+
+class ChangeBulkWriter:
+    """
+    Accumulates changes and writes them to Supabase in bulk.
+
+    Features:
+    - Background flush every flush_interval seconds (or on flush())
+    - Chunked multi-row inserts into changes_queue
+    - One session stats increment per session per flush
+    - Retries with exponential backoff; failed work stays queued
+    - Writes that may have reached the server are never sent again, so a
+      timeout can't duplicate rows or double-count stats
+    - Bounded spill file so queued work survives restarts
+    """
+
+    def __init__(
+        self,
+        schema_helper: SupabaseSchemaHelper,
+        spill_path: Optional[Path] = None,
+        flush_interval: float = 5.0,
+        chunk_size: int = DEFAULT_INSERT_CHUNK_SIZE,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        max_spill_bytes: int = DEFAULT_MAX_SPILL_BYTES,
+        start: bool = True
+    ):
+        """
+        Initialize bulk writer.
+
+        Args:
+            schema_helper: SupabaseSchemaHelper used for the writes
+            spill_path: JSON-lines file for queued work (None keeps it in memory only)
+            flush_interval: Seconds between background flushes
+            chunk_size: Rows per changes_queue insert
+            max_retries: Retries per request before giving up until the next flush
+            retry_backoff: Initial retry delay in seconds (doubles per retry)
+            max_spill_bytes: Spill file size limit; the oldest changes are
+                dropped if compaction can't get under it
+            start: Start the background flush thread
+        """
+        self.schema_helper = schema_helper
+        self.spill_path = Path(spill_path) if spill_path else None
+        self.flush_interval = flush_interval
+        self.chunk_size = max(1, chunk_size)
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.max_spill_bytes = max_spill_bytes
+
+        self._pending: List[_PendingChange] = []
+        # session_id -> [files, lines_added, lines_removed] for inserted changes
+        self._pending_stats: Dict[str, List[int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._spill_bytes = 0
+
+        # Metrics (guarded by _lock)
+        self.changes_written = 0
+        self.insert_requests = 0
+        self.stats_requests = 0
+        self.retries = 0
+        self.dropped = 0
+        self.unconfirmed = 0
+
+        self._load_spill()
+        if start:
+            self.start()
+
+    def start(self):
+        """Start the background flush thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="ChangeBulkWriter", daemon=True)
+        self._thread.start()
+
+    def close(self, flush: bool = True):
+        """
+        Stop the background thread.
+
+        Args:
+            flush: Write queued work one last time before returning
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=30)
+            self._thread = None
+        if flush:
+            self.flush()
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def enqueue(self, session_id: str, changes: List[Dict[str, Any]]):
+        """
+        Queue changes for the next flush.
+
+        Args:
+            session_id: Session ID
+            changes: Change dictionaries (path, change_type, old_path,
+                lines_added, lines_removed, commit_hash, metadata)
+        """
+        if not changes:
+            return
+        records = [_PendingChange(session_id, dict(change)) for change in changes]
+        with self._lock:
+            self._pending.extend(records)
+            self._append_spill([{"session_id": session_id, "change": r.change} for r in records])
+
+    def pending_count(self) -> int:
+        """Number of changes not yet written."""
+        with self._lock:
+            return len(self._pending)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get writer statistics.
+
+        Returns:
+            Dictionary with pending, pending_sessions, changes_written,
+            insert_requests, stats_requests, retries, dropped, unconfirmed
+            and spill_bytes
+        """
+        with self._lock:
+            return {
+                'pending': len(self._pending),
+                'pending_sessions': len(self._pending_stats),
+                'changes_written': self.changes_written,
+                'insert_requests': self.insert_requests,
+                'stats_requests': self.stats_requests,
+                'retries': self.retries,
+                'dropped': self.dropped,
+                'unconfirmed': self.unconfirmed,
+                'spill_bytes': self._spill_bytes,
+            }
+
+    def flush(self) -> int:
+        """
+        Write queued changes and session stats.
+
+        Returns:
+            Number of changes written
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch = list(self._pending)
+
+            by_session: Dict[str, List[_PendingChange]] = OrderedDict()
+            for record in batch:
+                by_session.setdefault(record.session_id, []).append(record)
+
+            written = 0
+            failed = False
+            inserted: List[Tuple[str, List[_PendingChange]]] = []
+            for session_id, records in by_session.items():
+                for start in range(0, len(records), self.chunk_size):
+                    chunk = records[start:start + self.chunk_size]
+                    ok = self._with_retries(
+                        lambda: self.schema_helper.insert_changes(
+                            session_id, [r.change for r in chunk], chunk_size=self.chunk_size
+                        ),
+                        "insert_changes",
+                        session_id=session_id,
+                        change_count=len(chunk)
+                    )
+                    if not ok:
+                        failed = True
+                        break
+                    inserted.append((session_id, chunk))
+                    written += len(chunk)
+                if failed:
+                    break
+            self._mark_inserted(inserted)
+
+            with self._lock:
+                stats_batch = [(sid, tuple(totals)) for sid, totals in self._pending_stats.items()]
+            stats_written = False
+            for session_id, (files, added, removed) in stats_batch:
+                ok = self._with_retries(
+                    lambda: self.schema_helper.increment_session_stats(session_id, files, added, removed),
+                    "increment_session_stats",
+                    session_id=session_id
+                )
+                with self._lock:
+                    self.stats_requests += 1
+                    if ok:
+                        totals = self._pending_stats[session_id]
+                        totals[0] -= files
+                        totals[1] -= added
+                        totals[2] -= removed
+                        if not any(totals):
+                            del self._pending_stats[session_id]
+                        stats_written = True
+            if stats_written:
+                with self._lock:
+                    self._rewrite_spill()
+
+            if written:
+                logger.info(
+                    "Bulk write completed",
+                    operation="flush",
+                    change_count=written,
+                    session_count=len(by_session),
+                    pending=self.pending_count()
+                )
+            return written
+
+    def _mark_inserted(self, chunks: List[Tuple[str, List[_PendingChange]]]):
+        """Move inserted (session_id, chunk) pairs from pending changes to pending stats."""
+        if not chunks:
+            return
+        inserted = {id(record) for _, chunk in chunks for record in chunk}
+        with self._lock:
+            self._pending = [r for r in self._pending if id(r) not in inserted]
+            for session_id, chunk in chunks:
+                totals = self._pending_stats.setdefault(session_id, [0, 0, 0])
+                totals[0] += len(chunk)
+                totals[1] += sum(r.change.get("lines_added", 0) or 0 for r in chunk)
+                totals[2] += sum(r.change.get("lines_removed", 0) or 0 for r in chunk)
+                self.changes_written += len(chunk)
+            self.insert_requests += len(chunks)
+            self._rewrite_spill()
+
+    def _with_retries(self, call: Callable[[], Any], operation: str, **context) -> bool:
+        """
+        Run call, retrying with exponential backoff while it provably had no effect.
+
+        Returns:
+            True if the write succeeded or may have been applied (it must not
+            be sent again), False if it failed and can stay queued
+        """
+        delay = self.retry_backoff
+        for attempt in range(self.max_retries + 1):
+            try:
+                call()
+                return True
+            except Exception as e:
+                if not safe_to_resend(e):
+                    # e.g. a read timeout after the server got the request
+                    logger.warn(
+                        "Bulk write outcome unknown, not sending it again",
+                        operation=operation,
+                        error_code="BULK_WRITE_UNCONFIRMED",
+                        root_cause=str(e),
+                        attempts=attempt + 1,
+                        **context
+                    )
+                    with self._lock:
+                        self.unconfirmed += 1
+                    return True
+                if attempt == self.max_retries:
+                    logger.warn(
+                        "Bulk write failed, keeping work queued",
+                        operation=operation,
+                        error_code="BULK_WRITE_FAILED",
+                        root_cause=str(e),
+                        attempts=attempt + 1,
+                        **context
+                    )
+                    return False
+                with self._lock:
+                    self.retries += 1
+                time.sleep(delay)
+                delay *= 2
+        return False
+
+    def _spill_lines(self) -> List[str]:
+        """Serialize queued work (lock held)."""
+        lines = [
+            json.dumps({"session_id": sid, "stats": totals})
+            for sid, totals in self._pending_stats.items()
+        ]
+        lines.extend(
+            json.dumps({"session_id": r.session_id, "change": r.change}, default=str)
+            for r in self._pending
+        )
+        return lines
+
+    def _append_spill(self, entries: List[Dict[str, Any]]):
+        """Append entries to the spill file, compacting if it grows too large (lock held)."""
+        if self.spill_path is None:
+            return
+        data = "".join(json.dumps(entry, default=str) + "\n" for entry in entries)
+        try:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.spill_path, "a", encoding="utf-8") as f:
+                f.write(data)
+            self._spill_bytes += len(data.encode("utf-8"))
+        except OSError as e:
+            logger.warn(
+                "Failed to append to spill file",
+                operation="_append_spill",
+                error_code="SPILL_WRITE_FAILED",
+                root_cause=str(e),
+                spill_path=str(self.spill_path)
+            )
+            return
+        if self._spill_bytes > self.max_spill_bytes:
+            self._rewrite_spill()
+
+    def _rewrite_spill(self):
+        """Rewrite the spill file with the current queue, trimming it to the size limit (lock held)."""
+        if self.spill_path is None:
+            return
+        lines = self._spill_lines()
+        size = sum(len(line.encode("utf-8")) + 1 for line in lines)
+        stats_lines = len(self._pending_stats)
+        dropped = 0
+        while size > self.max_spill_bytes and self._pending:
+            # Drop the oldest change (stats lines come first in lines)
+            size -= len(lines.pop(stats_lines).encode("utf-8")) + 1
+            self._pending.pop(0)
+            dropped += 1
+        if dropped:
+            self.dropped += dropped
+            logger.warn(
+                "Spill file over size limit, dropped oldest changes",
+                operation="_rewrite_spill",
+                error_code="SPILL_LIMIT_REACHED",
+                dropped=dropped,
+                max_spill_bytes=self.max_spill_bytes
+            )
+        tmp_path = self.spill_path.with_suffix(self.spill_path.suffix + ".tmp")
+        try:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write("".join(line + "\n" for line in lines))
+            os.replace(tmp_path, self.spill_path)
+            self._spill_bytes = size
+        except OSError as e:
+            logger.warn(
+                "Failed to rewrite spill file",
+                operation="_rewrite_spill",
+                error_code="SPILL_WRITE_FAILED",
+                root_cause=str(e),
+                spill_path=str(self.spill_path)
+            )
+
+    def _load_spill(self):
+        """Restore queued work left by a previous process."""
+        if self.spill_path is None or not self.spill_path.exists():
+            return
+        restored = 0
+        try:
+            with open(self.spill_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # Torn write from a crash
+                    session_id = entry.get("session_id")
+                    if not session_id:
+                        continue
+                    if "stats" in entry:
+                        totals = self._pending_stats.setdefault(session_id, [0, 0, 0])
+                        for i, value in enumerate(entry["stats"][:3]):
+                            totals[i] += int(value)
+                    elif isinstance(entry.get("change"), dict):
+                        self._pending.append(_PendingChange(session_id, entry["change"]))
+                        restored += 1
+        except OSError as e:
+            logger.warn(
+                "Failed to read spill file",
+                operation="_load_spill",
+                error_code="SPILL_READ_FAILED",
+                root_cause=str(e),
+                spill_path=str(self.spill_path)
+            )
+            return
+        with self._lock:
+            self._rewrite_spill()
+        if restored or self._pending_stats:
+            logger.info(
+                "Restored queued changes from spill file",
+                operation="_load_spill",
+                change_count=restored,
+                session_count=len(self._pending_stats),
+                spill_path=str(self.spill_path)
+            )
@@ -2,12 +2,17 @@
 """
 ChangeBuffer - Thread-safe buffer with debouncing for file changes.
 
+One scheduler thread keeps a heap of per-path deadlines instead of one
+threading.Timer per path, and flush callbacks run outside the buffer lock so
+new events are never blocked by a flush.
+
 Last Updated: 2025-12-05
 """
 
+import heapq
 import threading
-from typing import Dict, List, Optional, Callable
-from datetime import datetime, timezone
+import time
+from typing import Dict, List, Optional, Callable, Tuple
 
 from .file_change import FileChange
 from logger_util import get_logger
@@ -18,66 +23,118 @@ logger = get_logger(context="ChangeBuffer")
 class ChangeBuffer:
     """
     Thread-safe buffer for accumulating changes with debouncing.
-    
+
     Features:
     - Thread-safe operations
     - Debouncing (coalesces rapid changes to same file)
-    - Flush callback support
-    - Automatic timer management
+    - Single scheduler thread with a heap of per-path deadlines
+    - Coalesced batches bounded by max_batch_size and max_latency_seconds
+    - Flush callback support (callbacks run outside the lock)
+    - Optional stats resolver that fills in per-change details in one batch
+      when changes are taken out of the buffer
+    - Queue depth, batch size and flush latency metrics
+
+    Two ways to consume changes:
+    - batch_callback(changes): the scheduler takes due changes out of the
+      buffer and hands them over in batches of at most max_batch_size
+    - flush_callback(): the scheduler only signals that changes are due and
+      the callback pulls them with get_all()
     """
-    
-    def __init__(self, debounce_seconds: float = 2.0):
+
+    def __init__(
+        self,
+        debounce_seconds: float = 2.0,
+        max_batch_size: int = 500,
+        max_latency_seconds: float = 10.0,
+        coalesce_seconds: Optional[float] = None
+    ):
         """
         Initialize change buffer.
-        
+
         Args:
             debounce_seconds: Time to wait before processing changes (default: 2.0)
+            max_batch_size: Flush as soon as this many changes are buffered,
+                and never hand more than this to batch_callback at once (default: 500)
+            max_latency_seconds: Longest a change waits, even if its file keeps
+                changing (default: 10.0)
+            coalesce_seconds: When a deadline expires, changes due within this
+                window are flushed with it (default: debounce_seconds)
         """
         self.changes: Dict[str, FileChange] = {}
-        self.timers: Dict[str, threading.Timer] = {}
         self.lock = threading.Lock()
         self.debounce_seconds = debounce_seconds
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_latency_seconds = max(debounce_seconds, max_latency_seconds)
+        self.coalesce_seconds = debounce_seconds if coalesce_seconds is None else coalesce_seconds
         self.flush_callback: Optional[Callable[[], None]] = None
-        
+        self.batch_callback: Optional[Callable[[List[FileChange]], None]] = None
+        self.stats_resolver: Optional[Callable[[List[FileChange]], None]] = None
+
+        # Scheduler state (guarded by lock). Heap entries whose deadline no
+        # longer matches _deadlines[path] are stale and skipped.
+        self._deadlines: Dict[str, float] = {}
+        self._first_seen: Dict[str, float] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = 0
+        self._flush_now = False
+        self._closed = False
+        self._wakeup = threading.Condition(self.lock)
+        self._scheduler: Optional[threading.Thread] = None
+
+        # Metrics (guarded by lock)
+        self._batches = 0
+        self._changes_flushed = 0
+        self._last_batch_size = 0
+        self._max_queue_depth = 0
+        self._last_flush_latency_ms = 0.0
+        self._max_flush_latency_ms = 0.0
+        self._last_callback_ms = 0.0
+
         logger.info(
             "ChangeBuffer initialized",
             operation="__init__",
-            debounce_seconds=debounce_seconds
+            debounce_seconds=debounce_seconds,
+            max_batch_size=self.max_batch_size,
+            max_latency_seconds=self.max_latency_seconds,
+            coalesce_seconds=self.coalesce_seconds
         )
-    
+
     def add_change(self, change: FileChange):
         """
         Add change with debouncing - rapid changes to same file are coalesced.
-        
+
         Args:
             change: FileChange instance to add
         """
         try:
             with self.lock:
-                # Cancel existing timer for this file
-                if change.path in self.timers:
-                    timer = self.timers[change.path]
-                    timer.cancel()
-                    del self.timers[change.path]
-                
+                now = time.monotonic()
+                first_seen = self._first_seen.setdefault(change.path, now)
+
                 # Update change (overwrites previous)
                 self.changes[change.path] = change
-                
-                # Set new timer
-                timer = threading.Timer(
-                    self.debounce_seconds,
-                    self._process_change,
-                    args=[change.path]
-                )
-                self.timers[change.path] = timer
-                timer.start()
-                
+
+                # Push the path's deadline back, but never past max latency
+                deadline = min(now + self.debounce_seconds, first_seen + self.max_latency_seconds)
+                self._deadlines[change.path] = deadline
+                self._seq += 1
+                heapq.heappush(self._heap, (deadline, self._seq, change.path))
+
+                depth = len(self.changes)
+                if depth > self._max_queue_depth:
+                    self._max_queue_depth = depth
+                if depth >= self.max_batch_size:
+                    self._flush_now = True
+
+                self._ensure_scheduler()
+                self._wakeup.notify()
+
                 logger.debug(
                     "Change added to buffer",
                     operation="add_change",
                     file_path=change.path,
                     change_type=change.change_type,
-                    buffered_count=len(self.changes)
+                    buffered_count=depth
                 )
         except Exception as e:
             logger.error(
@@ -88,63 +145,171 @@ class ChangeBuffer:
                 file_path=change.path
             )
             raise
-    
-    def _process_change(self, file_path: str):
+
+    def _ensure_scheduler(self):
+        """Start the scheduler thread on first use (lock held)."""
+        if self._scheduler is None or not self._scheduler.is_alive():
+            self._closed = False
+            self._scheduler = threading.Thread(
+                target=self._run_scheduler,
+                name="ChangeBuffer-scheduler",
+                daemon=True
+            )
+            self._scheduler.start()
+
+    def _pop_due_paths(self, horizon: float) -> List[str]:
         """
-        Called after debounce period - triggers flush if needed.
-        
-        Args:
-            file_path: Path of file that triggered the timer
+        Pop paths whose deadline is at or before horizon, earliest first (lock held).
+
+        If a size-triggered flush is pending, the earliest paths are taken
+        even if they aren't due yet.
         """
-        try:
+        due: List[str] = []
+        heap = self._heap
+        while heap and len(due) < self.max_batch_size:
+            deadline, _, path = heap[0]
+            if self._deadlines.get(path) != deadline:
+                heapq.heappop(heap)  # Stale entry
+                continue
+            if deadline > horizon and not self._flush_now:
+                break
+            heapq.heappop(heap)
+            del self._deadlines[path]
+            due.append(path)
+        return due
+
+    def _next_wait(self, now: float) -> Optional[float]:
+        """Seconds until the next live deadline, or None if idle (lock held)."""
+        heap = self._heap
+        while heap and self._deadlines.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+        if not heap:
+            return None
+        return max(0.0, heap[0][0] - now)
+
+    def _run_scheduler(self):
+        """Scheduler loop: wait for the earliest deadline, then flush."""
+        while True:
             with self.lock:
-                # Remove timer reference
-                if file_path in self.timers:
-                    del self.timers[file_path]
-                
-                # Trigger flush callback if set and we have changes
-                if self.flush_callback and len(self.changes) > 0:
-                    logger.debug(
-                        "Debounce period expired, triggering flush",
-                        operation="_process_change",
-                        file_path=file_path,
-                        buffered_count=len(self.changes)
-                    )
-                    self.flush_callback()
+                while True:
+                    if self._closed:
+                        return
+                    now = time.monotonic()
+                    if self._flush_now:
+                        break
+                    wait = self._next_wait(now)
+                    if wait == 0.0:
+                        break
+                    self._wakeup.wait(wait)
+
+                # Coalesce: paths falling due within the next coalesce
+                # window go out in the same batch
+                due = self._pop_due_paths(time.monotonic() + self.coalesce_seconds)
+                if not due:
+                    self._flush_now = False
+                    continue
+                batch_callback = self.batch_callback
+                flush_callback = self.flush_callback
+                oldest = min(self._first_seen.pop(path, now) for path in due)
+                if batch_callback:
+                    batch = [self.changes.pop(path) for path in due if path in self.changes]
+                    self._flush_now = bool(self._deadlines) and len(self.changes) >= self.max_batch_size
+                else:
+                    batch = [self.changes[path] for path in due if path in self.changes]
+                    self._flush_now = False
+                latency_ms = (time.monotonic() - oldest) * 1000
+                queue_depth = len(self.changes)
+
+            if not batch or not (batch_callback or flush_callback):
+                continue
+            self._flush(batch, batch_callback, flush_callback, latency_ms, queue_depth)
+
+    def _flush(
+        self,
+        batch: List[FileChange],
+        batch_callback: Optional[Callable[[List[FileChange]], None]],
+        flush_callback: Optional[Callable[[], None]],
+        latency_ms: float,
+        queue_depth: int
+    ):
+        """Run the flush callback for one batch (lock not held)."""
+        start = time.perf_counter()
+        try:
+            logger.debug(
+                "Debounce period expired, triggering flush",
+                operation="_flush",
+                batch_size=len(batch),
+                buffered_count=queue_depth
+            )
+            if batch_callback:
+                self._resolve_stats(batch)
+                batch_callback(batch)
+            else:
+                flush_callback()
         except Exception as e:
             logger.error(
-                "Failed to process change after debounce",
-                operation="_process_change",
+                "Failed to flush changes",
+                operation="_flush",
                 error_code="BUFFER_PROCESS_FAILED",
                 root_cause=str(e),
-                file_path=file_path
+                batch_size=len(batch)
             )
-    
+        callback_ms = (time.perf_counter() - start) * 1000
+
+        with self.lock:
+            self._batches += 1
+            self._changes_flushed += len(batch)
+            self._last_batch_size = len(batch)
+            self._last_flush_latency_ms = latency_ms
+            self._max_flush_latency_ms = max(self._max_flush_latency_ms, latency_ms)
+            self._last_callback_ms = callback_ms
+
+    def _resolve_stats(self, changes: List[FileChange]):
+        """Run the stats resolver, if any (lock not held)."""
+        if not self.stats_resolver or not changes:
+            return
+        try:
+            self.stats_resolver(changes)
+        except Exception as e:
+            logger.error(
+                "Failed to resolve change stats",
+                operation="_resolve_stats",
+                error_code="BUFFER_STATS_RESOLVE_FAILED",
+                root_cause=str(e),
+                change_count=len(changes)
+            )
+
+    def _reset_schedule(self):
+        """Forget all deadlines (lock held)."""
+        self._deadlines.clear()
+        self._first_seen.clear()
+        self._heap.clear()
+        self._flush_now = False
+
     def get_all(self) -> List[FileChange]:
         """
         Get all buffered changes and clear buffer.
-        
+
+        If a stats_resolver is set it is called with the changes (outside the
+        lock, so new events aren't blocked by it) before they are returned.
+
         Returns:
             List of FileChange instances
         """
         try:
             with self.lock:
-                # Cancel all pending timers
-                for timer in self.timers.values():
-                    timer.cancel()
-                self.timers.clear()
-                
+                # Drop all pending deadlines
+                self._reset_schedule()
+
                 # Get all changes
                 changes = list(self.changes.values())
                 self.changes.clear()
-                
+
                 logger.debug(
                     "Retrieved all buffered changes",
                     operation="get_all",
                     change_count=len(changes)
                 )
-                
-                return changes
         except Exception as e:
             logger.error(
                 "Failed to get all changes from buffer",
@@ -153,30 +318,53 @@ class ChangeBuffer:
                 root_cause=str(e)
             )
             raise
-    
+
+        self._resolve_stats(changes)
+        return changes
+
     def count(self) -> int:
         """
         Get count of buffered changes (non-destructive).
-        
+
         Returns:
             Number of buffered changes
         """
         with self.lock:
             return len(self.changes)
-    
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        Get scheduler metrics.
+
+        Returns:
+            Dictionary with queue_depth, max_queue_depth, scheduled, batches,
+            changes_flushed, last_batch_size, last_flush_latency_ms (age of
+            the oldest change in the last batch when it was flushed),
+            max_flush_latency_ms and last_callback_ms
+        """
+        with self.lock:
+            return {
+                'queue_depth': len(self.changes),
+                'max_queue_depth': self._max_queue_depth,
+                'scheduled': len(self._deadlines),
+                'batches': self._batches,
+                'changes_flushed': self._changes_flushed,
+                'last_batch_size': self._last_batch_size,
+                'last_flush_latency_ms': round(self._last_flush_latency_ms, 1),
+                'max_flush_latency_ms': round(self._max_flush_latency_ms, 1),
+                'last_callback_ms': round(self._last_callback_ms, 1),
+            }
+
     def clear(self):
-        """Clear all buffered changes and cancel timers."""
+        """Clear all buffered changes and pending deadlines."""
         try:
             with self.lock:
-                # Cancel all timers
-                for timer in self.timers.values():
-                    timer.cancel()
-                self.timers.clear()
-                
+                self._reset_schedule()
+
                 # Clear changes
                 count = len(self.changes)
                 self.changes.clear()
-                
+
                 logger.debug(
                     "Buffer cleared",
                     operation="clear",
@@ -190,5 +378,11 @@ class ChangeBuffer:
                 root_cause=str(e)
             )
 
-
-
+    def close(self):
+        """Stop the scheduler thread (buffered changes are kept)."""
+        with self.lock:
+            self._closed = True
+            self._wakeup.notify_all()
+            scheduler = self._scheduler
+        if scheduler is not None and scheduler is not threading.current_thread():
+            scheduler.join(timeout=5)
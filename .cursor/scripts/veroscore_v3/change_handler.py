@@ -6,9 +6,9 @@ Last Updated: 2025-12-05
 """
 
 import os
-import subprocess
+import threading
 from pathlib import Path
-from typing import Set, Optional
+from typing import Dict, List, Set, Optional
 
 try:
     from watchdog.events import FileSystemEventHandler, FileSystemEvent
@@ -20,7 +20,7 @@ except ImportError:
 
 from .file_change import FileChange
 from .change_buffer import ChangeBuffer
-from .git_diff_analyzer import GitDiffAnalyzer
+from .git_diff_analyzer import GitDiffAnalyzer, HeadCommitCache
 from logger_util import get_logger, get_or_create_trace_context
 
 logger = get_logger(context="VeroFieldChangeHandler")
@@ -32,7 +32,8 @@ class VeroFieldChangeHandler(FileSystemEventHandler):
     
     Features:
     - Ignores temp files, build artifacts, .gitignore files
-    - Gets accurate line counts via git diff
+    - Gets accurate line counts via git diff, resolved lazily in one batch
+      when the ChangeBuffer is flushed
     - Processes changes through ChangeBuffer
     """
     
@@ -80,6 +81,16 @@ class VeroFieldChangeHandler(FileSystemEventHandler):
         else:
             self.repo_root = repo_root
         
+        # HEAD hash is re-read only when .git/HEAD or the branch ref changes
+        self.head_cache = HeadCommitCache(self.repo_root)
+        
+        # Changes still waiting for diff stats, by path. Holding the
+        # FileChange itself means a newer event for the same path (which
+        # replaces it in the buffer) is never mistaken for a resolved one.
+        self._pending_stats: Dict[str, FileChange] = {}
+        self._pending_lock = threading.Lock()
+        buffer.stats_resolver = self.resolve_diff_stats
+        
         # Get exclusion patterns from config
         exclusions = config.get("exclusions", {}).get("patterns", [])
         self.exclusion_patterns = exclusions
@@ -210,26 +221,21 @@ class VeroFieldChangeHandler(FileSystemEventHandler):
             else:
                 rel_path = file_path
             
-            # Get diff stats (only for modified/added files)
-            lines_added = 0
-            lines_removed = 0
-            if change_type in ('modified', 'added') and self.repo_root:
-                lines_added, lines_removed = self.git_analyzer.get_diff_stats(rel_path, self.repo_root)
-            
-            # Get commit hash if available
-            commit_hash = self._get_current_commit_hash()
-            
-            # Create FileChange
+            # Diff stats are resolved at flush time (resolve_diff_stats)
             change = FileChange(
                 path=rel_path,
                 change_type=change_type,
                 timestamp=os.path.getmtime(file_path) if os.path.exists(file_path) else None,
-                lines_added=lines_added,
-                lines_removed=lines_removed,
                 old_path=old_path,
-                commit_hash=commit_hash
+                commit_hash=self._get_current_commit_hash()
             )
             
+            with self._pending_lock:
+                if change_type in ('modified', 'added') and self.repo_root:
+                    self._pending_stats[rel_path] = change
+                else:
+                    self._pending_stats.pop(rel_path, None)
+            
             # Add to buffer (will be debounced)
             self.buffer.add_change(change)
             
@@ -238,8 +244,6 @@ class VeroFieldChangeHandler(FileSystemEventHandler):
                 operation="_process_change",
                 file_path=rel_path,
                 change_type=change_type,
-                lines_added=lines_added,
-                lines_removed=lines_removed,
                 **trace_ctx
             )
             
@@ -253,26 +257,37 @@ class VeroFieldChangeHandler(FileSystemEventHandler):
                 change_type=change_type
             )
     
+    def resolve_diff_stats(self, changes: List[FileChange]):
+        """
+        Fill in lines_added/lines_removed for buffered changes.
+        
+        Installed as the ChangeBuffer's stats_resolver: one
+        ``git diff --numstat`` covers every pending change in the flush.
+        
+        Args:
+            changes: Changes taken out of the buffer
+        """
+        with self._pending_lock:
+            pending = []
+            for change in changes:
+                if self._pending_stats.get(change.path) is change:
+                    del self._pending_stats[change.path]
+                    pending.append(change)
+        if not pending:
+            return
+        
+        stats = self.git_analyzer.get_batch_diff_stats(
+            [change.path for change in pending], self.repo_root
+        )
+        for change in pending:
+            change.lines_added, change.lines_removed = stats.get(change.path, (0, 0))
+        
+        logger.debug(
+            "Diff stats resolved",
+            operation="resolve_diff_stats",
+            change_count=len(pending)
+        )
+    
     def _get_current_commit_hash(self) -> Optional[str]:
-        """Get current git commit hash."""
-        try:
-            if not self.repo_root:
-                return None
-            
-            result = subprocess.run(
-                ['git', 'rev-parse', 'HEAD'],
-                cwd=self.repo_root,
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=5
-            )
-            
-            if result.returncode == 0:
-                return result.stdout.strip()[:12]  # Short hash
-            return None
-        except Exception:
-            return None
-
-
-
+        """Get current git commit hash (cached until HEAD moves)."""
+        return self.head_cache.get()
@@ -14,10 +14,14 @@ Detects violations with massive penalties:
 """
 
 import re
+import hashlib
 import json
+import os
 import subprocess
-from dataclasses import dataclass, asdict
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, asdict, replace
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 from pathlib import Path
 import sys
 
@@ -690,15 +694,97 @@ class LoggingComplianceDetector:
         return None
 
 
+# Severities reported as violations; everything else is a warning
+BLOCKING_SEVERITIES = ('critical', 'high')
+
+# Files per PR below which detect_iter doesn't start a process pool
+PARALLEL_MIN_FILES = 32
+
+# Per-file results kept in memory by MasterDetector
+DEFAULT_RESULT_CACHE_SIZE = 4096
+
+
+class DetectionSummary:
+    """
+    Running totals for a stream of ViolationResults.
+    
+    Produces the same summary dictionary as MasterDetector.detect_all
+    without holding on to the results.
+    """
+    
+    def __init__(self):
+        self.total_violations = 0
+        self.total_warnings = 0
+        self.total_penalty = 0.0
+        self.violations_by_detector: Dict[str, int] = {}
+    
+    def add(self, violation: ViolationResult):
+        """Count one result."""
+        if violation.severity in BLOCKING_SEVERITIES:
+            self.total_violations += 1
+        else:
+            self.total_warnings += 1
+        self.total_penalty += violation.penalty
+        detector = violation.detector_name
+        self.violations_by_detector[detector] = self.violations_by_detector.get(detector, 0) + 1
+    
+    def as_dict(self, files_checked: int) -> Dict[str, Any]:
+        """Summary dictionary (detect_all's 'summary')."""
+        return {
+            'total_violations': self.total_violations,
+            'total_warnings': self.total_warnings,
+            'total_penalty': self.total_penalty,
+            'violations_by_detector': self.violations_by_detector,
+            'files_checked': files_checked
+        }
+
+
+def _detector_fingerprint() -> str:
+    """Hash of the detector source, so cached results expire when rules change."""
+    digest = hashlib.sha256()
+    try:
+        digest.update(Path(__file__).read_bytes())
+    except OSError:
+        pass
+    return digest.hexdigest()[:16]
+
+
+# Process pool workers build their own MasterDetector once
+_worker_detector: Optional["MasterDetector"] = None
+
+
+def _init_worker():
+    global _worker_detector
+    _worker_detector = MasterDetector()
+
+
+def _detect_content_worker(full_path: str, data: bytes) -> Optional[List[ViolationResult]]:
+    """Run all detectors on one file's bytes in a pool worker (None for binary files)."""
+    try:
+        content = data.decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+    return _worker_detector.detect_file(full_path, content)
+
+
 class MasterDetector:
     """
     Orchestrates all detectors and aggregates results.
     
     Runs all detectors on files and aggregates violations/warnings.
+    detect_iter() streams results, optionally across a process pool, and
+    reuses the results for files whose content hash matches a previous scan.
     """
     
-    def __init__(self):
-        """Initialize master detector with all sub-detectors."""
+    def __init__(self, cache_path: Optional[Path] = None, cache_size: int = DEFAULT_RESULT_CACHE_SIZE):
+        """
+        Initialize master detector with all sub-detectors.
+        
+        Args:
+            cache_path: Optional JSON file keeping per-file results across runs
+                (written by save_cache())
+            cache_size: Maximum files kept in the result cache (0 disables it)
+        """
         self.detectors = [
             RLSViolationDetector(),
             ArchitectureDriftDetector(),
@@ -707,6 +793,15 @@ class MasterDetector:
             LoggingComplianceDetector(),
         ]
         self.trace_ctx = get_or_create_trace_context()
+        # full path -> (content sha256, results)
+        self._result_cache: "OrderedDict[str, Tuple[str, List[ViolationResult]]]" = OrderedDict()
+        self.cache_size = max(0, cache_size)
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._fingerprint: Optional[str] = None
+        if self.cache_path is not None:
+            self._load_cache()
         
         logger.info(
             "MasterDetector initialized",
@@ -715,71 +810,136 @@ class MasterDetector:
             **self.trace_ctx
         )
     
-    def detect_all(self, file_paths: List[str], base_path: Optional[Path] = None) -> Dict[str, Any]:
+    def detect_file(self, full_path: str, content: str) -> List[ViolationResult]:
         """
-        Run all detectors on a list of files.
+        Run all detectors on one file.
         
         Args:
-            file_paths: List of file paths to analyze
-            base_path: Base path for resolving relative paths
-            
+            full_path: Resolved file path
+            content: File content
+        
         Returns:
-            Dictionary with violations, warnings, and summary
+            Violations and warnings in detector order
         """
-        all_violations = []
-        all_warnings = []
-        
-        for file_path in file_paths:
+        results = []
+        for detector in self.detectors:
             try:
-                # Resolve path
-                if base_path:
-                    full_path = base_path / file_path if not Path(file_path).is_absolute() else Path(file_path)
-                else:
-                    full_path = Path(file_path)
-                
-                if not full_path.exists():
-                    logger.warn(
-                        "File not found, skipping detection",
-                        operation="detect_all",
-                        file_path=str(full_path),
-                        **self.trace_ctx
-                    )
-                    continue
-                
-                # Read file content
-                try:
-                    content = full_path.read_text(encoding='utf-8')
-                except UnicodeDecodeError:
-                    # Skip binary files
-                    logger.debug(
-                        "Skipping binary file",
-                        operation="detect_all",
-                        file_path=str(full_path),
-                        **self.trace_ctx
-                    )
-                    continue
-                
-                # Run all detectors
-                for detector in self.detectors:
+                results.extend(detector.detect(full_path, content))
+            except Exception as e:
+                logger.error(
+                    f"Detector {detector.__class__.__name__} failed",
+                    operation="detect_all",
+                    error_code="DETECTOR_FAILED",
+                    root_cause=str(e),
+                    file_path=full_path,
+                    **self.trace_ctx
+                )
+                # Continue with other detectors
+                continue
+        return results
+    
+    def _read_file(
+        self,
+        file_path: str,
+        base_path: Optional[Path],
+        contents: Optional[Mapping[str, bytes]] = None
+    ) -> Optional[Tuple[str, bytes]]:
+        """Resolve and read a file (or take it from contents); None (with a log record) if it's missing."""
+        if base_path:
+            full_path = base_path / file_path if not Path(file_path).is_absolute() else Path(file_path)
+        else:
+            full_path = Path(file_path)
+        
+        if contents is not None and file_path in contents:
+            return str(full_path), contents[file_path]
+        try:
+            return str(full_path), full_path.read_bytes()
+        except FileNotFoundError:
+            logger.warn(
+                "File not found, skipping detection",
+                operation="detect_all",
+                file_path=str(full_path),
+                **self.trace_ctx
+            )
+            return None
+    
+    def _cached(self, full_path: str, digest: str) -> Optional[List[ViolationResult]]:
+        if not self.cache_size:
+            return None
+        entry = self._result_cache.get(full_path)
+        if entry is not None and entry[0] == digest:
+            self._result_cache.move_to_end(full_path)
+            self.cache_hits += 1
+            return entry[1]
+        self.cache_misses += 1
+        return None
+    
+    def _store(self, full_path: str, digest: str, results: List[ViolationResult]):
+        if not self.cache_size:
+            return
+        self._result_cache[full_path] = (digest, results)
+        self._result_cache.move_to_end(full_path)
+        while len(self._result_cache) > self.cache_size:
+            self._result_cache.popitem(last=False)
+    
+    def detect_iter(
+        self,
+        file_paths: Iterable[str],
+        base_path: Optional[Path] = None,
+        workers: Optional[int] = None,
+        contents: Optional[Mapping[str, bytes]] = None
+    ) -> Iterator[ViolationResult]:
+        """
+        Run all detectors on files, yielding results as files finish.
+        
+        Results come out in input order with at most a few files in flight,
+        so memory doesn't grow with PR size. Files whose content hash matches the previous scan
+        of the same path reuse its results without running the detectors.
+        
+        Args:
+            file_paths: File paths to analyze (any iterable)
+            base_path: Base path for resolving relative paths
+            workers: Worker processes (None: one per CPU, up to 8, when there
+                are at least PARALLEL_MIN_FILES files; 1: run in this process)
+            contents: Optional file bytes already read by the caller, keyed by
+                the paths in file_paths (other paths are read from disk)
+        
+        Yields:
+            ViolationResult objects (copies; callers may modify them)
+        """
+        if workers is None:
+            if not isinstance(file_paths, (list, tuple)):
+                file_paths = list(file_paths)
+            workers = min(os.cpu_count() or 1, 8) if len(file_paths) >= PARALLEL_MIN_FILES else 1
+        
+        if workers <= 1:
+            for item in self._iter_files(file_paths, base_path, contents):
+                full_path, digest, data = item
+                results = self._cached(full_path, digest)
+                if results is None:
                     try:
-                        violations = detector.detect(str(full_path), content)
-                        for violation in violations:
-                            if violation.severity in ['critical', 'high']:
-                                all_violations.append(violation)  # Keep as ViolationResult object
-                            else:
-                                all_warnings.append(violation)  # Keep as ViolationResult object
-                    except Exception as e:
-                        logger.error(
-                            f"Detector {detector.__class__.__name__} failed",
-                            operation="detect_all",
-                            error_code="DETECTOR_FAILED",
-                            root_cause=str(e),
-                            file_path=str(full_path),
-                            **self.trace_ctx
-                        )
-                        # Continue with other detectors
+                        content = data.decode('utf-8')
+                    except UnicodeDecodeError:
+                        self._skip_binary(full_path)
                         continue
-                        
+                    results = self.detect_file(full_path, content)
+                    self._store(full_path, digest, results)
+                for violation in results:
+                    yield replace(violation)
+            return
+        
+        yield from self._detect_parallel(file_paths, base_path, workers, contents)
+    
+    def _iter_files(
+        self,
+        file_paths: Iterable[str],
+        base_path: Optional[Path],
+        contents: Optional[Mapping[str, bytes]] = None
+    ) -> Iterator[Tuple[str, str, bytes]]:
+        """(full path, sha256, bytes) for each readable file."""
+        for file_path in file_paths:
+            try:
+                read = self._read_file(file_path, base_path, contents)
             except Exception as e:
                 logger.error(
                     "Failed to process file",
@@ -790,34 +950,158 @@ class MasterDetector:
                     **self.trace_ctx
                 )
                 continue
+            if read is not None:
+                yield read[0], hashlib.sha256(read[1]).hexdigest(), read[1]
+    
+    def _skip_binary(self, full_path: str):
+        logger.debug(
+            "Skipping binary file",
+            operation="detect_all",
+            file_path=full_path,
+            **self.trace_ctx
+        )
+    
+    def _detect_parallel(
+        self,
+        file_paths: Iterable[str],
+        base_path: Optional[Path],
+        workers: int,
+        contents: Optional[Mapping[str, bytes]] = None
+    ) -> Iterator[ViolationResult]:
+        """detect_iter() across a process pool with a bounded in-flight window."""
+        # (full path, digest, cached results or future)
+        pending: Deque[Tuple[str, str, Any]] = deque()
+        max_in_flight = workers * 4
+        in_flight = 0
         
-        # Calculate summary
-        total_penalty = sum(v.penalty for v in all_violations + all_warnings)
-        violations_by_detector = {}
-        for v in all_violations + all_warnings:
-            detector = v.detector_name
-            violations_by_detector[detector] = violations_by_detector.get(detector, 0) + 1
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            def drain(block_until: int) -> Iterator[ViolationResult]:
+                nonlocal in_flight
+                while pending and (in_flight > block_until or not isinstance(pending[0][2], Future)):
+                    full_path, digest, work = pending.popleft()
+                    if isinstance(work, Future):
+                        in_flight -= 1
+                        try:
+                            results = work.result()
+                        except Exception as e:
+                            logger.error(
+                                "Failed to process file",
+                                operation="detect_all",
+                                error_code="FILE_PROCESSING_FAILED",
+                                root_cause=str(e),
+                                file_path=full_path,
+                                **self.trace_ctx
+                            )
+                            continue
+                        if results is None:
+                            self._skip_binary(full_path)
+                            continue
+                        self._store(full_path, digest, results)
+                    else:
+                        results = work
+                    for violation in results:
+                        yield replace(violation)
+            
+            for full_path, digest, data in self._iter_files(file_paths, base_path, contents):
+                cached = self._cached(full_path, digest)
+                if cached is not None:
+                    pending.append((full_path, digest, cached))
+                else:
+                    pending.append((full_path, digest, pool.submit(_detect_content_worker, full_path, data)))
+                    in_flight += 1
+                yield from drain(max_in_flight - 1)
+            yield from drain(-1)
+    
+    def detect_all(
+        self,
+        file_paths: List[str],
+        base_path: Optional[Path] = None,
+        workers: Optional[int] = 1,
+        contents: Optional[Mapping[str, bytes]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run all detectors on a list of files.
+        
+        Args:
+            file_paths: List of file paths to analyze
+            base_path: Base path for resolving relative paths
+            workers: Worker processes (see detect_iter; default runs in this process)
+            contents: Optional file bytes already read by the caller (see detect_iter)
+            
+        Returns:
+            Dictionary with violations, warnings, and summary
+        """
+        all_violations = []
+        all_warnings = []
+        summary = DetectionSummary()
+        
+        for violation in self.detect_iter(file_paths, base_path, workers=workers, contents=contents):
+            summary.add(violation)
+            if violation.severity in BLOCKING_SEVERITIES:
+                all_violations.append(violation)  # Keep as ViolationResult object
+            else:
+                all_warnings.append(violation)  # Keep as ViolationResult object
         
         result = {
             'violations': all_violations,
             'warnings': all_warnings,
-            'summary': {
-                'total_violations': len(all_violations),
-                'total_warnings': len(all_warnings),
-                'total_penalty': total_penalty,
-                'violations_by_detector': violations_by_detector,
-                'files_checked': len(file_paths)
-            }
+            'summary': summary.as_dict(len(file_paths))
         }
         
         logger.info(
             "Detection completed",
             operation="detect_all",
-            total_violations=len(all_violations),
-            total_warnings=len(all_warnings),
-            total_penalty=total_penalty,
+            total_violations=summary.total_violations,
+            total_warnings=summary.total_warnings,
+            total_penalty=summary.total_penalty,
+            cache_hits=self.cache_hits,
             **self.trace_ctx
         )
         
         return result
-
+    
+    def _cache_fingerprint(self) -> str:
+        if self._fingerprint is None:
+            self._fingerprint = _detector_fingerprint()
+        return self._fingerprint
+    
+    def _load_cache(self):
+        """Load per-file results saved by a previous run (ignored if the detectors changed)."""
+        try:
+            data = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get('fingerprint') != self._cache_fingerprint():
+            return
+        for full_path, entry in data.get('files', {}).items():
+            try:
+                results = [ViolationResult(**item) for item in entry['results']]
+            except (KeyError, TypeError):
+                continue
+            self._store(full_path, entry.get('sha256', ''), results)
+    
+    def save_cache(self):
+        """Write the result cache to cache_path (no-op without one)."""
+        if self.cache_path is None:
+            return
+        data = {
+            'fingerprint': self._cache_fingerprint(),
+            'files': {
+                full_path: {'sha256': digest, 'results': [v.to_dict() for v in results]}
+                for full_path, (digest, results) in self._result_cache.items()
+            }
+        }
+        tmp_path = self.cache_path.with_suffix(self.cache_path.suffix + '.tmp')
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data), encoding='utf-8')
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warn(
+                "Failed to save detection cache",
+                operation="save_cache",
+                error_code="DETECTION_CACHE_SAVE_FAILED",
+                root_cause=str(e),
+                cache_path=str(self.cache_path),
+                **self.trace_ctx
+            )
@@ -5,14 +5,72 @@ GitDiffAnalyzer - Analyzes git diffs to get accurate line counts.
 Last Updated: 2025-12-05
 """
 
+import os
 import subprocess
+import threading
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from logger_util import get_logger
 
 logger = get_logger(context="GitDiffAnalyzer")
 
+# Keep pathspec argument lists well under ARG_MAX
+_MAX_PATHSPEC_BYTES = 64 * 1024
+
+
+def _parse_numstat_count(value: str) -> int:
+    """Numstat prints '-' for binary files."""
+    return int(value) if value != '-' else 0
+
+
+def parse_numstat_z(output: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Parse ``git diff --numstat -z`` output.
+
+    Each record is ``added\tremoved\tpath\0``; renames are
+    ``added\tremoved\t\0old_path\0new_path\0`` and are reported under
+    the new path.
+
+    Args:
+        output: Raw command output
+
+    Returns:
+        Dict mapping path to (lines_added, lines_removed)
+    """
+    stats: Dict[str, Tuple[int, int]] = {}
+    fields = output.split('\0')
+    i = 0
+    while i < len(fields):
+        record = fields[i]
+        i += 1
+        if not record:
+            continue
+        added, removed, path = record.split('\t', 2)
+        if not path:
+            # Rename/copy: old and new paths follow as separate fields
+            path = fields[i + 1] if i + 1 < len(fields) else ''
+            i += 2
+        if path:
+            stats[path] = (_parse_numstat_count(added), _parse_numstat_count(removed))
+    return stats
+
+
+def _chunk_pathspecs(paths: List[str]) -> List[List[str]]:
+    """Split paths into argument lists below _MAX_PATHSPEC_BYTES."""
+    chunks: List[List[str]] = []
+    current: List[str] = []
+    size = 0
+    for path in paths:
+        if current and size + len(path) + 1 > _MAX_PATHSPEC_BYTES:
+            chunks.append(current)
+            current, size = [], 0
+        current.append(path)
+        size += len(path) + 1
+    if current:
+        chunks.append(current)
+    return chunks
+
 
 class GitDiffAnalyzer:
     """
@@ -124,6 +182,81 @@ class GitDiffAnalyzer:
             )
             return 0, 0
     
+    @staticmethod
+    def get_batch_diff_stats(file_paths: Iterable[str], repo_root: Optional[str] = None) -> Dict[str, Tuple[int, int]]:
+        """
+        Get line count statistics for many files with one git diff.
+
+        Runs one ``git diff --numstat -z HEAD`` over all paths (split only if the
+        argument list would be too long) instead of one process per file.
+
+        Args:
+            file_paths: Relative paths from repository root
+            repo_root: Optional repository root path (auto-detected if None)
+
+        Returns:
+            Dict mapping every requested path to (lines_added, lines_removed);
+            (0, 0) for files without changes, untracked files and on errors
+        """
+        paths = list(dict.fromkeys(file_paths))
+        stats: Dict[str, Tuple[int, int]] = {path: (0, 0) for path in paths}
+        if not paths:
+            return stats
+        if repo_root is None:
+            repo_root = GitDiffAnalyzer.get_repo_root()
+            if repo_root is None:
+                return stats
+
+        for chunk in _chunk_pathspecs(paths):
+            try:
+                result = subprocess.run(
+                    ['git', '--literal-pathspecs', 'diff', '--numstat', '-z', 'HEAD', '--', *chunk],
+                    cwd=repo_root,
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                    timeout=30
+                )
+            except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+                logger.warn(
+                    "Batch git diff failed",
+                    operation="get_batch_diff_stats",
+                    error_code="GIT_DIFF_BATCH_FAILED",
+                    root_cause=str(e),
+                    file_count=len(chunk)
+                )
+                continue
+            if result.returncode != 0:
+                logger.warn(
+                    "Batch git diff returned an error",
+                    operation="get_batch_diff_stats",
+                    error_code="GIT_DIFF_BATCH_FAILED",
+                    root_cause=result.stderr.strip(),
+                    file_count=len(chunk)
+                )
+                continue
+            try:
+                parsed = parse_numstat_z(result.stdout)
+            except ValueError as e:
+                logger.warn(
+                    "Failed to parse batch git diff output",
+                    operation="get_batch_diff_stats",
+                    error_code="GIT_DIFF_PARSE_FAILED",
+                    root_cause=str(e),
+                    file_count=len(chunk)
+                )
+                continue
+            for path, counts in parsed.items():
+                if path in stats:
+                    stats[path] = counts
+
+        logger.debug(
+            "Batch git diff stats retrieved",
+            operation="get_batch_diff_stats",
+            file_count=len(paths)
+        )
+        return stats
+
     @staticmethod
     def is_git_ignored(file_path: str, repo_root: Optional[str] = None) -> bool:
         """
@@ -222,4 +355,98 @@ class GitDiffAnalyzer:
             return None
 
 
+class HeadCommitCache:
+    """
+    Caches the short HEAD commit hash for a repository.
+
+    ``git rev-parse HEAD`` only runs again when .git/HEAD, the ref it points
+    to or packed-refs changes on disk, so per-event lookups are a few stat()
+    calls instead of a subprocess.
+    """
+
+    def __init__(self, repo_root: Optional[str], short_length: int = 12):
+        """
+        Args:
+            repo_root: Repository root path (None disables lookups)
+            short_length: Length of the returned hash
+        """
+        self.repo_root = repo_root
+        self.short_length = short_length
+        self._git_dir: Optional[Path] = None
+        self._common_dir: Optional[Path] = None
+        self._signature: Optional[tuple] = None
+        self._commit_hash: Optional[str] = None
+        self._lock = threading.Lock()
 
+    def _locate_git_dirs(self) -> bool:
+        """Resolve the git directory (and common directory for worktrees)."""
+        if self._git_dir is not None:
+            return True
+        try:
+            result = subprocess.run(
+                ['git', 'rev-parse', '--absolute-git-dir', '--git-common-dir'],
+                cwd=self.repo_root,
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=5
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return False
+        lines = result.stdout.splitlines()
+        if result.returncode != 0 or len(lines) < 2:
+            return False
+        self._git_dir = Path(lines[0])
+        self._common_dir = Path(self.repo_root, lines[1]) if not os.path.isabs(lines[1]) else Path(lines[1])
+        return True
+
+    @staticmethod
+    def _stat_key(path: Path) -> Optional[tuple]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        # Refs are replaced via rename, so the inode changes on every update
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _current_signature(self) -> Optional[tuple]:
+        head_path = self._git_dir / 'HEAD'
+        try:
+            head = head_path.read_text(encoding='utf-8').strip()
+        except OSError:
+            return None
+        ref_key = None
+        if head.startswith('ref: '):
+            ref = head[5:]
+            ref_key = self._stat_key(self._git_dir / ref) or self._stat_key(self._common_dir / ref)
+        return (head, ref_key, self._stat_key(self._common_dir / 'packed-refs'))
+
+    def get(self) -> Optional[str]:
+        """
+        Get the short HEAD commit hash.
+
+        Returns:
+            Short hash, or None outside a git repository or before the first commit
+        """
+        if not self.repo_root:
+            return None
+        with self._lock:
+            if not self._locate_git_dirs():
+                return None
+            signature = self._current_signature()
+            if signature is not None and signature == self._signature:
+                return self._commit_hash
+            try:
+                result = subprocess.run(
+                    ['git', 'rev-parse', 'HEAD'],
+                    cwd=self.repo_root,
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                    timeout=5
+                )
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                return None
+            self._commit_hash = result.stdout.strip()[:self.short_length] if result.returncode == 0 else None
+            self._signature = signature
+            return self._commit_hash
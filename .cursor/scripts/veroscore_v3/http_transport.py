@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+PooledTransport - Shared keep-alive HTTP transport for VeroScore V3.
+
+supabase-py builds a new PostgREST client (and connection pool) every time
+``.schema("veroscore")`` is called, so each query paid for a new TCP/TLS
+connection. This transport keeps a bounded pool of HTTP/1.1 keep-alive
+connections per host, shared by every client in the process, and records
+request timing histograms.
+
+Last Updated: 2025-12-05
+"""
+
+import bisect
+import http.client
+import os
+import select
+import threading
+import time
+import urllib.parse
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+from logger_util import get_logger
+
+logger = get_logger(context="PooledTransport")
+
+
+# Upper bounds (ms) of the timing histogram buckets; the last bucket is open
+HISTOGRAM_BOUNDS_MS: Tuple[float, ...] = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 10
+DEFAULT_TIMEOUT = 30.0
+
+# Idle connections older than this are closed instead of reused
+DEFAULT_IDLE_TIMEOUT = 60.0
+
+# Errors meaning a reused keep-alive connection was closed by the server
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+# Methods safe to resend when the server may already have received them
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def _is_dropped(conn: http.client.HTTPConnection) -> bool:
+    """True if an idle connection is readable, i.e. the server closed it."""
+    if conn.sock is None:
+        return False  # Reconnects on the next request
+    try:
+        readable, _, _ = select.select([conn.sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+class TransportError(ConnectionError):
+    """
+    Raised when a request can't be sent or its response can't be read.
+
+    Attributes:
+        sent: True if the request was sent, so the server may have processed it
+    """
+
+    def __init__(self, message: str, sent: bool = True):
+        super().__init__(message)
+        self.sent = sent
+
+
+class TimingHistogram:
+    """Fixed-bucket latency histogram (thread-safe)."""
+
+    def __init__(self, bounds_ms: Tuple[float, ...] = HISTOGRAM_BOUNDS_MS):
+        self.bounds_ms = bounds_ms
+        self.counts = [0] * (len(bounds_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, elapsed_ms: float):
+        """Record one request duration."""
+        with self._lock:
+            self.counts[bisect.bisect_left(self.bounds_ms, elapsed_ms)] += 1
+            self.count += 1
+            self.total_ms += elapsed_ms
+            if elapsed_ms > self.max_ms:
+                self.max_ms = elapsed_ms
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound (ms) of the bucket holding the given fraction of requests."""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            target = fraction * self.count
+            seen = 0
+            for i, bucket_count in enumerate(self.counts):
+                seen += bucket_count
+                if seen >= target:
+                    return self.bounds_ms[i] if i < len(self.bounds_ms) else self.max_ms
+            return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get histogram contents.
+
+        Returns:
+            Dictionary with count, mean_ms, max_ms, p50_ms, p95_ms and
+            buckets (``"<=N"`` / ``">N"`` labels to counts)
+        """
+        p50 = self.percentile(0.5)
+        p95 = self.percentile(0.95)
+        with self._lock:
+            labels = [f"<={bound:g}" for bound in self.bounds_ms] + [f">{self.bounds_ms[-1]:g}"]
+            return {
+                'count': self.count,
+                'mean_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+                'max_ms': round(self.max_ms, 3),
+                'p50_ms': p50,
+                'p95_ms': p95,
+                'buckets': {label: n for label, n in zip(labels, self.counts) if n},
+            }
+
+
+class TransportResponse:
+    """A fully read HTTP response."""
+
+    __slots__ = ("status", "headers", "body")
+
+    def __init__(self, status: int, headers: Dict[str, str], body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+
+class _HostPool:
+    """Idle connections and a connection limit for one (scheme, host, port)."""
+
+    def __init__(self, max_connections: int):
+        self.slots = threading.BoundedSemaphore(max_connections)
+        self.idle: Deque[Tuple[http.client.HTTPConnection, float]] = deque()
+        self.lock = threading.Lock()
+        self.opened = 0
+        self.reused = 0
+        self.histogram = TimingHistogram()
+
+
+class PooledTransport:
+    """
+    Thread-safe HTTP/1.1 keep-alive connection pool.
+
+    Features:
+    - Per-host connection limit (callers wait for a free connection)
+    - Idle connection reuse with an idle timeout
+    - One transparent retry when a reused connection turns out to be closed
+    - Request timing histograms per host
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        timeout: float = DEFAULT_TIMEOUT,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT
+    ):
+        """
+        Initialize transport.
+
+        Args:
+            max_connections_per_host: Open connections allowed per host
+            timeout: Default socket timeout in seconds
+            idle_timeout: Close idle connections older than this (seconds)
+        """
+        self.max_connections_per_host = max(1, max_connections_per_host)
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self._pools: Dict[Tuple[str, str, int], _HostPool] = {}
+        self._pools_lock = threading.Lock()
+
+    def _pool(self, key: Tuple[str, str, int]) -> _HostPool:
+        with self._pools_lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = _HostPool(self.max_connections_per_host)
+            return pool
+
+    def _checkout(self, key: Tuple[str, str, int], pool: _HostPool, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """Return an idle connection (reused=True) or a new one (slot held)."""
+        now = time.monotonic()
+        with pool.lock:
+            while pool.idle:
+                conn, last_used = pool.idle.pop()
+                if now - last_used <= self.idle_timeout and not _is_dropped(conn):
+                    pool.reused += 1
+                    conn.timeout = timeout
+                    if conn.sock is not None:
+                        conn.sock.settimeout(timeout)
+                    return conn, True
+                conn.close()
+            pool.opened += 1
+        scheme, host, port = key
+        conn_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return conn_class(host, port, timeout=timeout), False
+
+    def _checkin(self, pool: _HostPool, conn: http.client.HTTPConnection, reusable: bool):
+        if reusable:
+            with pool.lock:
+                pool.idle.append((conn, time.monotonic()))
+        else:
+            conn.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[bytes] = None,
+        timeout: Optional[float] = None
+    ) -> TransportResponse:
+        """
+        Send a request and read the whole response.
+
+        Args:
+            method: HTTP method
+            url: Absolute http:// or https:// URL
+            headers: Request headers
+            body: Request body
+            timeout: Socket timeout (default: transport timeout)
+
+        Returns:
+            TransportResponse (any status; callers decide what is an error)
+
+        Raises:
+            TransportError: If the request can't be sent or the response read
+        """
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme or "http"
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname or "", port)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        timeout = self.timeout if timeout is None else timeout
+        pool = self._pool(key)
+
+        pool.slots.acquire()
+        start = time.perf_counter()
+        try:
+            for attempt in range(2):
+                conn, reused = self._checkout(key, pool, timeout)
+                sent = False
+                try:
+                    conn.request(method, target, body=body, headers=headers or {})
+                    sent = True
+                    response = conn.getresponse()
+                    data = response.read()
+                except _STALE_CONNECTION_ERRORS as e:
+                    conn.close()
+                    # Server closed the idle connection; retry on a new one unless
+                    # a non-idempotent request may already have been processed
+                    if reused and attempt == 0 and (method.upper() in _IDEMPOTENT_METHODS or not sent):
+                        continue
+                    raise TransportError(f"{method} {url} failed: {e}", sent=sent) from e
+                except (OSError, http.client.HTTPException) as e:
+                    conn.close()
+                    raise TransportError(f"{method} {url} failed: {e}", sent=sent) from e
+                self._checkin(pool, conn, not response.will_close)
+                return TransportResponse(response.status, dict(response.getheaders()), data)
+            raise TransportError(f"{method} {url} failed")  # pragma: no cover - loop always returns or raises
+        finally:
+            pool.histogram.observe((time.perf_counter() - start) * 1000)
+            pool.slots.release()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-host statistics.
+
+        Returns:
+            Dictionary keyed by ``scheme://host:port`` with connections_opened,
+            connections_reused, idle and timing (a TimingHistogram snapshot)
+        """
+        with self._pools_lock:
+            pools = list(self._pools.items())
+        result = {}
+        for (scheme, host, port), pool in pools:
+            with pool.lock:
+                opened, reused, idle = pool.opened, pool.reused, len(pool.idle)
+            result[f"{scheme}://{host}:{port}"] = {
+                'connections_opened': opened,
+                'connections_reused': reused,
+                'idle': idle,
+                'timing': pool.histogram.snapshot(),
+            }
+        return result
+
+    def close(self):
+        """Close all idle connections."""
+        with self._pools_lock:
+            pools = list(self._pools.values())
+        for pool in pools:
+            with pool.lock:
+                idle: List[Tuple[http.client.HTTPConnection, float]] = list(pool.idle)
+                pool.idle.clear()
+            for conn, _ in idle:
+                conn.close()
+
+
+_shared_transport: Optional[PooledTransport] = None
+_shared_lock = threading.Lock()
+
+
+def _positive_number_from_env(
+    name: str,
+    default: Union[int, float],
+    cast: Callable[[str], Union[int, float]] = int
+) -> Union[int, float]:
+    """Positive number from an env var; unset or invalid values give default."""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        number = cast(value)
+        if not number > 0:
+            raise ValueError(f"{number} is not positive")
+        return number
+    except ValueError as e:
+        logger.warn(
+            f"Invalid {name}={value!r}, using default {default}",
+            operation="_positive_number_from_env",
+            error_code="INVALID_ENV_SETTING",
+            root_cause=f"{name} must be a positive {cast.__name__}: {e}",
+            default=default
+        )
+        return default
+
+
+def get_shared_transport() -> PooledTransport:
+    """
+    Get the process-wide transport.
+
+    Limits can be tuned with VEROSCORE_HTTP_MAX_CONNECTIONS and
+    VEROSCORE_HTTP_TIMEOUT before first use.
+    """
+    global _shared_transport
+    with _shared_lock:
+        if _shared_transport is None:
+            _shared_transport = PooledTransport(
+                max_connections_per_host=_positive_number_from_env(
+                    "VEROSCORE_HTTP_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS_PER_HOST
+                ),
+                timeout=_positive_number_from_env("VEROSCORE_HTTP_TIMEOUT", DEFAULT_TIMEOUT, cast=float)
+            )
+            logger.debug(
+                "Shared HTTP transport created",
+                operation="get_shared_transport",
+                max_connections_per_host=_shared_transport.max_connections_per_host
+            )
+        return _shared_transport
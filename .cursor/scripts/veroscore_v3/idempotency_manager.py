@@ -8,6 +8,7 @@ Last Updated: 2025-12-05
 
 import os
 import hashlib
+from pathlib import Path
 from typing import Optional, Dict, Any, Tuple
 from datetime import datetime, timezone
 
@@ -16,10 +17,14 @@ try:
 except ImportError:
     Client = None
 
+from .ttl_cache import TTLCache
 from logger_util import get_logger, get_or_create_trace_context
 
 logger = get_logger(context="IdempotencyManager")
 
+# Seconds an idempotency key row is reused before it is read again
+DEFAULT_IDEMPOTENCY_CACHE_TTL = 60.0
+
 
 class IdempotencyManager:
     """
@@ -29,16 +34,27 @@ class IdempotencyManager:
     - PR creation attempts
     - Session operations
     - Other critical operations
+    
+    Key rows are cached for a short TTL; rows this manager writes are
+    written through to the cache, so repeated lookups skip the network.
     """
     
-    def __init__(self, supabase: Client):
+    def __init__(
+        self,
+        supabase: Client,
+        cache_ttl: float = DEFAULT_IDEMPOTENCY_CACHE_TTL,
+        cache_mirror_path: Optional[Path] = None
+    ):
         """
         Initialize idempotency manager.
         
         Args:
             supabase: Supabase client instance
+            cache_ttl: Seconds key rows are cached (0 disables)
+            cache_mirror_path: Optional SQLite file keeping cached rows across restarts
         """
         self.supabase = supabase
+        self.cache = TTLCache("idempotency_keys", cache_ttl, mirror_path=cache_mirror_path)
         self.trace_ctx = get_or_create_trace_context()
         
         logger.info(
@@ -81,6 +97,12 @@ class IdempotencyManager:
         try:
             key = self._generate_key(operation, identifier)
             
+            existing = self.cache.get(key)
+            if existing is not None:
+                resolved = self._resolve_existing(key, existing, operation)
+                if resolved is not None:
+                    return resolved
+            
             # Check for existing key using .schema() method
             if hasattr(self.supabase, 'schema'):
                 result = (
@@ -102,34 +124,10 @@ class IdempotencyManager:
             
             if result.data and len(result.data) > 0:
                 existing = result.data[0]
-                
-                # Check if operation completed
-                if existing.get("status") == "completed":
-                    logger.info(
-                        "Idempotency key found (completed)",
-                        operation="get_or_create_key",
-                        key=key[:16] + "...",
-                        operation_name=operation,
-                        **self.trace_ctx
-                    )
-                    # Return existing result
-                    result_data = existing.get("result")
-                    if isinstance(result_data, dict):
-                        return result_data, False
-                    return None, False
-                
-                # Check if operation in progress
-                if existing.get("status") == "processing":
-                    logger.warn(
-                        "Idempotency key found (in progress)",
-                        operation="get_or_create_key",
-                        key=key[:16] + "...",
-                        operation_name=operation,
-                        error_code="OPERATION_IN_PROGRESS",
-                        **self.trace_ctx
-                    )
-                    # Operation already in progress, return None to prevent duplicate
-                    return None, False
+                self.cache.put(key, existing)
+                resolved = self._resolve_existing(key, existing, operation)
+                if resolved is not None:
+                    return resolved
             
             # Create new key (match actual schema)
             now = datetime.now(timezone.utc)
@@ -158,6 +156,7 @@ class IdempotencyManager:
                 )
             
             if insert_result.data and len(insert_result.data) > 0:
+                self.cache.put(key, insert_result.data[0])
                 logger.info(
                     "Idempotency key created",
                     operation="get_or_create_key",
@@ -205,6 +204,50 @@ class IdempotencyManager:
             )
             return None, True
     
+    def _resolve_existing(
+        self,
+        key: str,
+        existing: Dict[str, Any],
+        operation: str
+    ) -> Optional[Tuple[Optional[Dict[str, Any]], bool]]:
+        """
+        Result for an existing key row, or None if a new key should be created.
+        
+        Args:
+            key: Idempotency key
+            existing: Key row
+            operation: Operation name
+        """
+        # Check if operation completed
+        if existing.get("status") == "completed":
+            logger.info(
+                "Idempotency key found (completed)",
+                operation="get_or_create_key",
+                key=key[:16] + "...",
+                operation_name=operation,
+                **self.trace_ctx
+            )
+            # Return existing result
+            result_data = existing.get("result")
+            if isinstance(result_data, dict):
+                return result_data, False
+            return None, False
+        
+        # Check if operation in progress
+        if existing.get("status") == "processing":
+            logger.warn(
+                "Idempotency key found (in progress)",
+                operation="get_or_create_key",
+                key=key[:16] + "...",
+                operation_name=operation,
+                error_code="OPERATION_IN_PROGRESS",
+                **self.trace_ctx
+            )
+            # Operation already in progress, return None to prevent duplicate
+            return None, False
+        
+        return None
+    
     def mark_completed(self, operation: str, identifier: str, result: Dict[str, Any]):
         """
         Mark idempotency key as completed with result.
@@ -228,6 +271,7 @@ class IdempotencyManager:
                 self.supabase.schema("veroscore").table("idempotency_keys").update(update_data).eq("key", key).execute()
             else:
                 self.supabase.table("veroscore.idempotency_keys").update(update_data).eq("key", key).execute()
+            self.cache.put(key, {"key": key, "operation_type": operation, **update_data})
             
             logger.info(
                 "Idempotency key marked as completed",
@@ -283,6 +327,7 @@ class IdempotencyManager:
                 self.supabase.schema("veroscore").table("idempotency_keys").update(update_data).eq("key", key).execute()
             else:
                 self.supabase.table("veroscore.idempotency_keys").update(update_data).eq("key", key).execute()
+            self.cache.invalidate(key)
             
             logger.info(
                 "Idempotency key marked as failed",
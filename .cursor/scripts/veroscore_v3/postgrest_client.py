@@ -8,21 +8,238 @@ using PostgREST with Accept-Profile header, maintaining RLS enforcement.
 Last Updated: 2025-12-05
 """
 
+import json
 import os
-from typing import Optional, List, Dict, Any
-
-try:
-    from postgrest import PostgrestClient
-    from postgrest import SyncPostgrestClient
-except ImportError:
-    PostgrestClient = None
-    SyncPostgrestClient = None
+import urllib.parse
+from typing import Optional, List, Dict, Any, Tuple
 
+from .http_transport import PooledTransport, get_shared_transport
 from logger_util import get_logger
 
 logger = get_logger(context="PostgRESTClient")
 
 
+class PostgRESTError(RuntimeError):
+    """PostgREST returned an error status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"PostgREST error {status}: {message}")
+        self.status = status
+
+
+class APIResponse:
+    """Query result (same attributes as the supabase-py response)."""
+
+    __slots__ = ("data", "count")
+
+    def __init__(self, data: Any, count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+
+def _format_value(value: Any) -> str:
+    """Render a filter value the way PostgREST expects it."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    return str(value)
+
+
+class PooledQueryBuilder:
+    """
+    Subset of the supabase-py query builder sent over a PooledTransport.
+
+    Supports select/insert/update/delete/rpc with eq/neq/gt/gte/lt/lte/in_
+    filters, order and limit, and ``count="exact"``.
+    """
+
+    def __init__(self, client: "PooledPostgRESTClient", path: str, schema: Optional[str]):
+        self._client = client
+        self._path = path
+        self._schema = schema
+        self._method = "GET"
+        self._body: Any = None
+        self._params: List[Tuple[str, str]] = []
+        self._prefer: List[str] = []
+
+    def select(self, columns: str = "*", count: Optional[str] = None) -> "PooledQueryBuilder":
+        self._params.append(("select", columns))
+        if count:
+            self._prefer.append(f"count={count}")
+        return self
+
+    def insert(self, rows: Dict[str, Any] | List[Dict[str, Any]]) -> "PooledQueryBuilder":
+        self._method, self._body = "POST", rows
+        self._prefer.append("return=representation")
+        return self
+
+    def update(self, data: Dict[str, Any]) -> "PooledQueryBuilder":
+        self._method, self._body = "PATCH", data
+        self._prefer.append("return=representation")
+        return self
+
+    def delete(self) -> "PooledQueryBuilder":
+        self._method = "DELETE"
+        self._prefer.append("return=representation")
+        return self
+
+    def _filter(self, column: str, operator: str, value: Any) -> "PooledQueryBuilder":
+        self._params.append((column, f"{operator}.{_format_value(value)}"))
+        return self
+
+    def eq(self, column: str, value: Any) -> "PooledQueryBuilder":
+        return self._filter(column, "eq", value)
+
+    def neq(self, column: str, value: Any) -> "PooledQueryBuilder":
+        return self._filter(column, "neq", value)
+
+    def gt(self, column: str, value: Any) -> "PooledQueryBuilder":
+        return self._filter(column, "gt", value)
+
+    def gte(self, column: str, value: Any) -> "PooledQueryBuilder":
+        return self._filter(column, "gte", value)
+
+    def lt(self, column: str, value: Any) -> "PooledQueryBuilder":
+        return self._filter(column, "lt", value)
+
+    def lte(self, column: str, value: Any) -> "PooledQueryBuilder":
+        return self._filter(column, "lte", value)
+
+    def in_(self, column: str, values: List[Any]) -> "PooledQueryBuilder":
+        return self._filter(column, "in", "(" + ",".join(_format_value(v) for v in values) + ")")
+
+    def order(self, column: str, desc: bool = False) -> "PooledQueryBuilder":
+        self._params.append(("order", f"{column}.{'desc' if desc else 'asc'}"))
+        return self
+
+    def limit(self, count: int) -> "PooledQueryBuilder":
+        self._params.append(("limit", str(count)))
+        return self
+
+    def execute(self) -> APIResponse:
+        """
+        Send the query.
+
+        Returns:
+            APIResponse with data (and count when requested)
+
+        Raises:
+            PostgRESTError: If PostgREST returns an error status
+            ConnectionError: If the request can't be sent
+        """
+        headers = dict(self._client.headers)
+        if self._schema:
+            profile = "Accept-Profile" if self._method == "GET" else "Content-Profile"
+            headers[profile] = self._schema
+        if self._prefer:
+            headers["Prefer"] = ",".join(self._prefer)
+        body = None
+        if self._body is not None:
+            body = json.dumps(self._body, default=str).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+
+        url = f"{self._client.base_url}/{self._path}"
+        if self._params:
+            url += "?" + urllib.parse.urlencode(self._params, safe="*(),.")
+        response = self._client.transport.request(self._method, url, headers=headers, body=body)
+
+        if response.status >= 400:
+            raise PostgRESTError(response.status, response.body.decode("utf-8", "replace"))
+        data: Any = json.loads(response.body) if response.body else []
+        count = None
+        content_range = response.headers.get("Content-Range") or response.headers.get("content-range")
+        if content_range and "/" in content_range:
+            total = content_range.rsplit("/", 1)[1]
+            count = int(total) if total.isdigit() else None
+        return APIResponse(data, count)
+
+
+class _SchemaScope:
+    """Tables of one schema (``client.schema(name)``)."""
+
+    def __init__(self, client: "PooledPostgRESTClient", name: str):
+        self._client = client
+        self._name = name
+
+    def table(self, table_name: str) -> PooledQueryBuilder:
+        return PooledQueryBuilder(self._client, table_name, self._name)
+
+    from_ = table
+
+    def rpc(self, function: str, params: Optional[Dict[str, Any]] = None) -> PooledQueryBuilder:
+        return self._client._rpc(function, params, self._name)
+
+
+class PooledPostgRESTClient:
+    """
+    Supabase-style PostgREST client on the shared keep-alive transport.
+
+    Drop-in for the parts of the supabase-py client VeroScore uses
+    (schema/table/from_/rpc query builders with ``.execute().data``).
+    Every instance shares one connection pool per host, so sessions,
+    idempotency checks, threshold checks and score writes reuse connections
+    instead of opening one per request.
+    """
+
+    def __init__(
+        self,
+        supabase_url: str,
+        supabase_key: str,
+        transport: Optional[PooledTransport] = None
+    ):
+        """
+        Initialize pooled client.
+
+        Args:
+            supabase_url: Supabase project URL
+            supabase_key: Supabase service role key
+            transport: Transport to use (default: the shared transport)
+        """
+        self.supabase_url = supabase_url.rstrip("/")
+        self.supabase_key = supabase_key
+        self.base_url = f"{self.supabase_url}/rest/v1"
+        self.transport = transport or get_shared_transport()
+        self.headers = {
+            "apikey": supabase_key,
+            "Authorization": f"Bearer {supabase_key}",
+            "Accept": "application/json",
+        }
+
+    def schema(self, name: str) -> _SchemaScope:
+        return _SchemaScope(self, name)
+
+    def table(self, table_name: str) -> PooledQueryBuilder:
+        return PooledQueryBuilder(self, table_name, None)
+
+    from_ = table
+
+    def rpc(self, function: str, params: Optional[Dict[str, Any]] = None) -> PooledQueryBuilder:
+        return self._rpc(function, params, None)
+
+    def _rpc(self, function: str, params: Optional[Dict[str, Any]], schema: Optional[str]) -> PooledQueryBuilder:
+        query = PooledQueryBuilder(self, f"rpc/{function}", schema)
+        query._method, query._body = "POST", params or {}
+        return query
+
+
+def create_pooled_client(
+    supabase_url: Optional[str] = None,
+    supabase_key: Optional[str] = None
+) -> PooledPostgRESTClient:
+    """
+    Create a pooled client from arguments or SUPABASE_URL/SUPABASE_SECRET_KEY.
+
+    Raises:
+        ValueError: If the URL or key is missing
+    """
+    supabase_url = supabase_url or os.getenv("SUPABASE_URL")
+    supabase_key = supabase_key or os.getenv("SUPABASE_SECRET_KEY")
+    if not supabase_url or not supabase_key:
+        raise ValueError("Missing SUPABASE_URL or SUPABASE_SECRET_KEY environment variables")
+    return PooledPostgRESTClient(supabase_url, supabase_key)
+
+
 class SecurePostgRESTClient:
     """
     Secure PostgREST client that accesses veroscore schema directly.
@@ -37,19 +254,10 @@ class SecurePostgRESTClient:
             supabase_url: Supabase project URL
             supabase_key: Supabase service role key
         """
-        if not PostgrestClient:
-            raise ImportError("postgrest package is required. Install with: pip install postgrest")
-        
         self.base_url = f"{supabase_url}/rest/v1"
-        self.client = PostgrestClient(
-            base_url=self.base_url,
-            headers={
-                "apikey": supabase_key,
-                "Authorization": f"Bearer {supabase_key}",
-                "Accept-Profile": "veroscore",  # Specify schema
-                "Content-Profile": "veroscore"   # For writes
-            }
-        )
+        # Accept-Profile/Content-Profile select the schema; requests share
+        # the pooled keep-alive transport
+        self.client = PooledPostgRESTClient(supabase_url, supabase_key).schema("veroscore")
         
         logger.info(
             "PostgREST client initialized with veroscore schema",
@@ -83,6 +291,3 @@ class SecurePostgRESTClient:
     def delete(self, table_name: str):
         """Delete from table."""
         return self.client.from_(table_name).delete()
-
-
-
@@ -585,6 +585,7 @@ class PRCreator:
                 self.supabase.schema("veroscore").table("sessions").update(update_data).eq("session_id", session_id).execute()
             else:
                 self.supabase.table("veroscore.sessions").update(update_data).eq("session_id", session_id).execute()
+            self.session_manager.schema_helper.session_cache.invalidate(session_id)
             
         except Exception as e:
             logger.error(
@@ -601,7 +602,8 @@ class PRCreator:
     def _update_session_with_pr(self, session_id: str, pr_result: Dict[str, Any]):
         """Update session with PR information."""
         try:
-            session = self.session_manager._get_session(session_id)
+            # Fresh read: the prs list is rewritten below
+            session = self.session_manager._get_session(session_id, use_cache=False)
             if not session:
                 return
             
@@ -627,6 +629,7 @@ class PRCreator:
                 self.supabase.schema("veroscore").table("sessions").update(update_data).eq("session_id", session_id).execute()
             else:
                 self.supabase.table("veroscore.sessions").update(update_data).eq("session_id", session_id).execute()
+            self.session_manager.schema_helper.session_cache.invalidate(session_id)
             
             logger.info(
                 "Session updated with PR info",
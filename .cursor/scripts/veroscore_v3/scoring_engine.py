@@ -33,6 +33,7 @@ from logger_util import get_logger, get_or_create_trace_context
 # Use absolute import only - relative imports fail when module is imported directly
 # The path should be set correctly by the caller (PYTHONPATH includes .cursor/scripts)
 from veroscore_v3.detection_functions import ViolationResult
+from veroscore_v3.postgrest_client import PooledPostgRESTClient
 
 logger = get_logger(context="ScoringEngine")
 
@@ -167,40 +168,288 @@ class StabilizationFunction:
                 return 0.0
 
 
+# Single-pass feature extraction.
+# Each pattern is compiled once and starts with a literal so the regex engine can
+# skip ahead; presence checks stay as plain substring tests, which run in C and
+# beat one combined alternation regex over the content.
+_DESCRIPTIVE_WORD = re.compile(r'\w{4,}')
+_COMMENT_LINE = re.compile(r'\n[^\S\n]*(?:#|//)')  # Comment lines after the first
+_FIRST_COMMENT_LINE = re.compile(r'[^\S\n]*(?:#|//)')
+_FUNCTION_MARKER = re.compile(r'def |function |= \(')
+_OLD_YEAR = re.compile(r'20[0-1][0-9]')
+_EXPORT = re.compile(r'export (?:class|function|const)')
+_BLOCK_COMMENT = re.compile(r'\/\*[\s\S]*?\*\/')
+
+# Descriptive words needed for the "good naming" signal
+_GOOD_NAMING_MIN_WORDS = 11
+# A function longer than this many lines counts as a long function
+_LONG_FUNCTION_LINES = 50
+
+_CODE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx', '.py')
+_DIRECTORY_EXTENSIONS = {
+    'components': ('.tsx', '.jsx'),
+    'api': ('.ts', '.js'),
+    'utils': ('.ts', '.js'),
+    'types': ('.ts', '.d.ts')
+}
+
+
+def _count_capped(pattern: re.Pattern, content: str, cap: int) -> int:
+    """Count matches of pattern, stopping at cap."""
+    count = 0
+    for _ in pattern.finditer(content):
+        count += 1
+        if count >= cap:
+            break
+    return count
+
+
+def _count_comment_lines(content: str) -> int:
+    """Count lines whose first non-blank characters are '#' or '//'."""
+    first_line = 1 if _FIRST_COMMENT_LINE.match(content) else 0
+    return len(_COMMENT_LINE.findall(content)) + first_line
+
+
+def _has_long_function(content: str, line_count: int) -> bool:
+    """
+    True if any function runs for more than _LONG_FUNCTION_LINES lines.
+
+    A function starts on a line containing 'def ', 'function ' or both
+    'const ' and '= (', and runs until the next start line or end of file.
+    """
+    start_line = -1
+    position = 0
+    line = 0
+    for match in _FUNCTION_MARKER.finditer(content):
+        line += content.count('\n', position, match.start())
+        position = match.start()
+        if line == start_line:
+            continue
+        if match.group() == '= (':
+            line_start = content.rfind('\n', 0, position) + 1
+            line_end = content.find('\n', position)
+            if content.find('const ', line_start, line_end if line_end >= 0 else len(content)) < 0:
+                continue
+        if start_line >= 0 and line - start_line > _LONG_FUNCTION_LINES:
+            return True
+        start_line = line
+    return start_line >= 0 and line_count - start_line > _LONG_FUNCTION_LINES
+
+
+def _is_in_correct_directory(file_path: str) -> bool:
+    """Check if file type matches directory."""
+    for dir_name, extensions in _DIRECTORY_EXTENSIONS.items():
+        if dir_name in file_path:
+            return file_path.endswith(extensions)
+    return True  # No specific pattern found
+
+
+def _has_large_comment_block(content: str) -> bool:
+    """Check for block comments longer than 100 characters (commented-out code)."""
+    if '/*' not in content:
+        return False
+    return any(len(block.group()) > 100 for block in _BLOCK_COMMENT.finditer(content))
+
+
+@dataclass(slots=True, frozen=True)
+class FileFeatures:
+    """
+    Feature vector for one changed file.
+
+    Extracted in one pass over the file by FileFeatures.extract(); the
+    category scores (score_code_quality() etc.) are pure functions of it.
+    """
+    line_count: int
+    comment_lines: int
+    descriptive_words: int  # Capped at _GOOD_NAMING_MIN_WORDS
+    export_count: int
+    is_test_file: bool
+    is_code_file: bool
+    is_readme: bool
+    in_correct_directory: bool
+    has_type_annotations: bool
+    has_mixed_indentation: bool
+    has_long_functions: bool
+    has_code_smells: bool
+    has_todos: bool
+    has_test_structure: bool
+    has_edge_case_tests: bool
+    has_docstrings: bool
+    has_outdated_comments: bool
+    has_markup: bool
+    has_db_access: bool
+    has_input_validation: bool
+    has_parameter_placeholders: bool
+    has_auth_checks: bool
+    has_console_logs: bool
+    has_commented_code: bool
+
+    @classmethod
+    def extract(cls, file_path: str, content: str) -> "FileFeatures":
+        """
+        Extract the feature vector for a file.
+
+        Args:
+            file_path: Path of the file in the repository
+            content: File content
+
+        Returns:
+            FileFeatures for the file
+        """
+        path_lower = file_path.lower()
+        line_count = content.count('\n') + 1
+        is_test_file = 'test' in path_lower or 'spec' in path_lower or '__tests__' in path_lower
+        has_todos = 'TODO' in content
+        return cls(
+            line_count=line_count,
+            comment_lines=_count_comment_lines(content),
+            descriptive_words=_count_capped(_DESCRIPTIVE_WORD, content, _GOOD_NAMING_MIN_WORDS),
+            export_count=len(_EXPORT.findall(content)),
+            is_test_file=is_test_file,
+            is_code_file=file_path.endswith(_CODE_EXTENSIONS),
+            is_readme='readme' in path_lower,
+            in_correct_directory=_is_in_correct_directory(file_path),
+            has_type_annotations=': ' in content and '->' in content,
+            has_mixed_indentation='  \t' in content or '\t  ' in content,
+            has_long_functions=_has_long_function(content, line_count),
+            has_code_smells=has_todos or 'FIXME' in content or 'HACK' in content or 'XXX' in content,
+            has_todos=has_todos,
+            # Test keywords only matter (and are only scanned for) in test files
+            has_test_structure=is_test_file and (
+                'describe' in content or 'it(' in content or 'test(' in content or 'def test_' in content
+            ),
+            has_edge_case_tests=is_test_file and (
+                'edge' in content or 'boundary' in content or 'null' in content or 'empty' in content
+            ),
+            has_docstrings='"""' in content or "'''" in content or '/**' in content,
+            has_outdated_comments=_OLD_YEAR.search(content) is not None,
+            has_markup='<' in content and '>' in content,
+            has_db_access=(
+                'SELECT' in content or 'INSERT' in content or 'UPDATE' in content or 'supabase' in content
+            ),
+            has_input_validation=(
+                'validate' in content or 'sanitize' in content or 'z.' in content or 'yup.' in content
+            ),
+            has_parameter_placeholders='$' in content or '?' in content,
+            has_auth_checks='auth' in content or 'session' in content or 'user_id' in content,
+            has_console_logs='console.log' in content,
+            has_commented_code=_has_large_comment_block(content),
+        )
+
+
+def score_code_quality(features: FileFeatures) -> float:
+    """Code quality score (-10 to +10)"""
+    score = 0.0
+
+    # Positive signals
+    if features.has_type_annotations:
+        score += 2.0
+    if features.descriptive_words >= _GOOD_NAMING_MIN_WORDS:
+        score += 2.0
+    if features.comment_lines > features.line_count * 0.1:
+        score += 1.0
+    if features.line_count < 300:  # Reasonable file size
+        score += 2.0
+    if not features.has_mixed_indentation:
+        score += 1.0
+
+    # Negative signals
+    if features.has_long_functions:
+        score -= 3.0
+    if features.has_code_smells:
+        score -= 2.0
+    if features.has_todos:
+        score -= 1.0
+
+    return max(-10, min(10, score))
+
+
+def score_test_coverage(features: FileFeatures) -> float:
+    """Test coverage indicators (-10 to +10)"""
+    score = 0.0
+
+    if features.is_test_file:
+        score += 5.0
+        if features.has_test_structure:
+            score += 3.0
+        if features.has_edge_case_tests:
+            score += 2.0
+    elif features.is_code_file:
+        # Code file with no test (corresponding test files need file system access)
+        score -= 5.0
+
+    return max(-10, min(10, score))
+
+
+def score_documentation(features: FileFeatures) -> float:
+    """Documentation quality (-10 to +10)"""
+    score = 0.0
+
+    if features.has_docstrings:
+        score += 4.0
+    if features.comment_lines > 5:
+        score += 2.0
+    if features.is_readme:
+        score += 2.0
+
+    # Comments mentioning old dates
+    if features.has_outdated_comments:
+        score -= 3.0
+
+    return max(-10, min(10, score))
+
+
+def score_architecture(features: FileFeatures) -> float:
+    """Architectural quality (-10 to +10)"""
+    score = 0.0
+
+    # Separation of concerns
+    if features.in_correct_directory:
+        score += 3.0
+    if features.export_count <= 3:  # Single responsibility
+        score += 3.0
+    score += 2.0  # Naming convention (simplified: always followed)
+
+    # Architectural violations (circular imports need a dependency graph)
+    if features.has_markup and features.has_db_access:  # UI mixed with data access
+        score -= 4.0
+
+    return max(-10, min(10, score))
+
+
+def score_security(features: FileFeatures) -> float:
+    """Security practices (-10 to +10)"""
+    score = 0.0
+
+    # Positive signals
+    if features.has_input_validation:
+        score += 3.0
+    if features.has_parameter_placeholders:  # Parameterized queries
+        score += 3.0
+    if features.has_auth_checks:
+        score += 2.0
+
+    # Negative signals (minor ones - major ones are in detectors)
+    if features.has_console_logs:
+        score -= 2.0
+    if features.has_commented_code:
+        score -= 1.0
+
+    return max(-10, min(10, score))
+
+
 class FileAnalyzer:
     """Analyzes individual files for scoring"""
     
     def __init__(self, file_path: str, content: str):
         self.file_path = file_path
         self.content = content
-        self.lines = content.split('\n')
+        self.features = FileFeatures.extract(file_path, content)
         
     def analyze_code_quality(self) -> float:
         """Analyze code quality (-10 to +10)"""
-        score = 0.0
         trace_ctx = get_or_create_trace_context()
-        
-        # Positive signals
-        if self._has_type_annotations():
-            score += 2.0
-        if self._has_good_naming():
-            score += 2.0
-        if self._has_comments():
-            score += 1.0
-        if len(self.lines) < 300:  # Reasonable file size
-            score += 2.0
-        if self._has_proper_formatting():
-            score += 1.0
-            
-        # Negative signals
-        if self._has_long_functions():
-            score -= 3.0
-        if self._has_code_smells():
-            score -= 2.0
-        if self._has_todos():
-            score -= 1.0
-            
-        result = max(-10, min(10, score))
+        result = score_code_quality(self.features)
         logger.debug(
             "Code quality analyzed",
             operation="analyze_code_quality",
@@ -212,190 +461,19 @@ class FileAnalyzer:
         
     def analyze_test_coverage(self) -> float:
         """Analyze test coverage indicators (-10 to +10)"""
-        score = 0.0
-        
-        # Is this a test file?
-        is_test = any(t in self.file_path.lower() for t in ['test', 'spec', '__tests__'])
-        
-        if is_test:
-            score += 5.0
-            if self._has_good_test_structure():
-                score += 3.0
-            if self._has_edge_case_tests():
-                score += 2.0
-        else:
-            # Check if there's a corresponding test file (would need file system access)
-            # For now, penalize if it's a code file with no test
-            if self.file_path.endswith(('.ts', '.tsx', '.js', '.jsx', '.py')):
-                score -= 5.0
-                
-        return max(-10, min(10, score))
+        return score_test_coverage(self.features)
         
     def analyze_documentation(self) -> float:
         """Analyze documentation quality (-10 to +10)"""
-        score = 0.0
-        
-        # Check for function/class docstrings
-        if self._has_docstrings():
-            score += 4.0
-        if self._has_inline_comments():
-            score += 2.0
-        if self._has_readme():
-            score += 2.0
-            
-        # Check for outdated comments
-        if self._has_outdated_comments():
-            score -= 3.0
-            
-        return max(-10, min(10, score))
+        return score_documentation(self.features)
         
     def analyze_architecture(self) -> float:
         """Analyze architectural quality (-10 to +10)"""
-        score = 0.0
-        
-        # Check proper separation of concerns
-        if self._is_in_correct_directory():
-            score += 3.0
-        if self._has_single_responsibility():
-            score += 3.0
-        if self._follows_naming_convention():
-            score += 2.0
-            
-        # Check for architectural violations
-        if self._has_circular_imports():
-            score -= 5.0
-        if self._mixes_concerns():
-            score -= 4.0
-            
-        return max(-10, min(10, score))
+        return score_architecture(self.features)
         
     def analyze_security(self) -> float:
         """Analyze security practices (-10 to +10)"""
-        score = 0.0
-        
-        # Positive signals
-        if self._has_input_validation():
-            score += 3.0
-        if self._uses_prepared_statements():
-            score += 3.0
-        if self._has_authentication_checks():
-            score += 2.0
-            
-        # Negative signals (minor ones - major ones are in detectors)
-        if self._has_console_logs():
-            score -= 2.0
-        if self._has_commented_code():
-            score -= 1.0
-            
-        return max(-10, min(10, score))
-    
-    # Helper methods (simplified implementations)
-    
-    def _has_type_annotations(self) -> bool:
-        return ': ' in self.content and '->' in self.content
-        
-    def _has_good_naming(self) -> bool:
-        # Check for descriptive variable names (not single letters)
-        words = re.findall(r'\b\w+\b', self.content)
-        return len([w for w in words if len(w) > 3]) > 10
-        
-    def _has_comments(self) -> bool:
-        comment_lines = [l for l in self.lines if l.strip().startswith(('#', '//'))]
-        return len(comment_lines) > len(self.lines) * 0.1
-        
-    def _has_proper_formatting(self) -> bool:
-        # Check for consistent indentation
-        return not any('  \t' in l or '\t  ' in l for l in self.lines)
-        
-    def _has_long_functions(self) -> bool:
-        # Simple heuristic: function with >50 lines
-        in_function = False
-        function_lines = 0
-        for line in self.lines:
-            if 'def ' in line or 'function ' in line or 'const ' in line and '= (' in line:
-                in_function = True
-                function_lines = 0
-            if in_function:
-                function_lines += 1
-            if function_lines > 50:
-                return True
-        return False
-        
-    def _has_code_smells(self) -> bool:
-        smells = ['TODO', 'FIXME', 'HACK', 'XXX']
-        return any(smell in self.content for smell in smells)
-        
-    def _has_todos(self) -> bool:
-        return 'TODO' in self.content
-        
-    def _has_good_test_structure(self) -> bool:
-        return any(keyword in self.content for keyword in ['describe', 'it(', 'test(', 'def test_'])
-        
-    def _has_edge_case_tests(self) -> bool:
-        return any(keyword in self.content for keyword in ['edge', 'boundary', 'null', 'empty'])
-        
-    def _has_docstrings(self) -> bool:
-        return '"""' in self.content or "'''" in self.content or '/**' in self.content
-        
-    def _has_inline_comments(self) -> bool:
-        return len([l for l in self.lines if l.strip().startswith(('#', '//'))]) > 5
-        
-    def _has_readme(self) -> bool:
-        return 'readme' in self.file_path.lower()
-        
-    def _has_outdated_comments(self) -> bool:
-        # Simple heuristic: comments mentioning old dates
-        return bool(re.search(r'20[0-1][0-9]', self.content))
-        
-    def _is_in_correct_directory(self) -> bool:
-        # Check if file type matches directory
-        valid_patterns = {
-            'components': ['.tsx', '.jsx'],
-            'api': ['.ts', '.js'],
-            'utils': ['.ts', '.js'],
-            'types': ['.ts', '.d.ts']
-        }
-        for dir_name, extensions in valid_patterns.items():
-            if dir_name in self.file_path:
-                return any(self.file_path.endswith(ext) for ext in extensions)
-        return True  # No specific pattern found
-        
-    def _has_single_responsibility(self) -> bool:
-        # Count number of exports - more than 1 might indicate mixed concerns
-        exports = len(re.findall(r'export (class|function|const)', self.content))
-        return exports <= 3
-        
-    def _follows_naming_convention(self) -> bool:
-        # Check if components are PascalCase, functions are camelCase
-        return True  # Simplified
-        
-    def _has_circular_imports(self) -> bool:
-        # Would need full dependency graph - simplified
-        return False
-        
-    def _mixes_concerns(self) -> bool:
-        # Check if file has both UI and business logic
-        has_jsx = '<' in self.content and '>' in self.content
-        has_db = any(keyword in self.content for keyword in ['SELECT', 'INSERT', 'UPDATE', 'supabase'])
-        return has_jsx and has_db
-        
-    def _has_input_validation(self) -> bool:
-        return any(keyword in self.content for keyword in ['validate', 'sanitize', 'z.', 'yup.'])
-        
-    def _uses_prepared_statements(self) -> bool:
-        # Check for parameterized queries
-        return '$' in self.content or '?' in self.content
-        
-    def _has_authentication_checks(self) -> bool:
-        return any(keyword in self.content for keyword in ['auth', 'session', 'user_id'])
-        
-    def _has_console_logs(self) -> bool:
-        return 'console.log' in self.content
-        
-    def _has_commented_code(self) -> bool:
-        # Check for large blocks of commented code
-        comment_blocks = re.findall(r'\/\*[\s\S]*?\*\/', self.content)
-        return any(len(block) > 100 for block in comment_blocks)
+        return score_security(self.features)
 
 
 class PipelineComplianceDetector:
@@ -483,6 +561,34 @@ class HybridScoringEngine:
             **get_or_create_trace_context()
         )
         
+    def score_files(self, changed_files: List[Dict]) -> Dict[str, List[float]]:
+        """
+        Score each changed file in the five file-level categories.
+        
+        Args:
+            changed_files: List of dicts with 'path' and 'content' keys
+            
+        Returns:
+            Dictionary mapping category name to per-file scores (input order)
+        """
+        file_scores = {
+            'code_quality': [],
+            'test_coverage': [],
+            'documentation': [],
+            'architecture': [],
+            'security': []
+        }
+        
+        for file_data in changed_files:
+            features = FileFeatures.extract(file_data['path'], file_data['content'])
+            file_scores['code_quality'].append(score_code_quality(features))
+            file_scores['test_coverage'].append(score_test_coverage(features))
+            file_scores['documentation'].append(score_documentation(features))
+            file_scores['architecture'].append(score_architecture(features))
+            file_scores['security'].append(score_security(features))
+            
+        return file_scores
+        
     def score_pr(
         self,
         pr_number: int,
@@ -491,7 +597,8 @@ class HybridScoringEngine:
         changed_files: List[Dict],  # {'path': str, 'content': str}
         pr_description: str,
         session_id: Optional[str] = None,
-        violations: List[ViolationResult] = None
+        violations: List[ViolationResult] = None,
+        file_scores: Optional[Dict[str, List[float]]] = None
     ) -> ScoreResult:
         """
         Score a PR using hybrid approach.
@@ -504,6 +611,8 @@ class HybridScoringEngine:
             pr_description: PR description text
             session_id: Optional session ID
             violations: Optional pre-computed violations (from detection functions)
+            file_scores: Optional pre-computed per-file scores (from score_files(),
+                e.g. computed while detection runs)
             
         Returns:
             ScoreResult object with complete scoring breakdown
@@ -526,21 +635,8 @@ class HybridScoringEngine:
             violations = []
             
         # Analyze each file
-        file_scores = {
-            'code_quality': [],
-            'test_coverage': [],
-            'documentation': [],
-            'architecture': [],
-            'security': []
-        }
-        
-        for file_data in changed_files:
-            analyzer = FileAnalyzer(file_data['path'], file_data['content'])
-            file_scores['code_quality'].append(analyzer.analyze_code_quality())
-            file_scores['test_coverage'].append(analyzer.analyze_test_coverage())
-            file_scores['documentation'].append(analyzer.analyze_documentation())
-            file_scores['architecture'].append(analyzer.analyze_architecture())
-            file_scores['security'].append(analyzer.analyze_security())
+        if file_scores is None:
+            file_scores = self.score_files(changed_files)
             
         # Average file scores
         avg_scores = {
@@ -802,20 +898,11 @@ class HybridScoringEngine:
             # Method 3: Use PostgREST client with Accept-Profile header
             if not response or not response.data:
                 try:
-                    from postgrest import SyncPostgrestClient
                     supabase_url = os.getenv("SUPABASE_URL")
                     supabase_key = os.getenv("SUPABASE_SECRET_KEY")
                     
                     if supabase_url and supabase_key:
-                        client = SyncPostgrestClient(
-                            base_url=f"{supabase_url}/rest/v1",
-                            headers={
-                                "apikey": supabase_key,
-                                "Authorization": f"Bearer {supabase_key}",
-                                "Accept-Profile": "veroscore",
-                                "Content-Profile": "veroscore"
-                            }
-                        )
+                        client = PooledPostgRESTClient(supabase_url, supabase_key).schema("veroscore")
                         response = client.from_("pr_scores").insert(insert_data).execute()
                         if response.data:
                             logger.info(
@@ -5,19 +5,20 @@ SessionManager - Supabase session management for VeroScore V3.
 Last Updated: 2025-12-05
 """
 
-import os
 import uuid
 from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
 try:
-    from supabase import create_client, Client
+    from supabase import Client
 except ImportError:
     Client = None  # Type hint fallback
 
 from .file_change import FileChange
-from .supabase_schema_helper import SupabaseSchemaHelper
+from .postgrest_client import create_pooled_client
+from .supabase_schema_helper import DEFAULT_SESSION_CACHE_TTL, SupabaseSchemaHelper
+from .bulk_writer import ChangeBulkWriter
 from logger_util import get_logger, get_or_create_trace_context
 
 logger = get_logger(context="SessionManager")
@@ -32,34 +33,43 @@ class SessionManager:
     - Add changes to queue
     - Update session stats
     - Mark sessions as reward-eligible
+    - Optional ChangeBulkWriter for buffered, retrying change writes
+    - Short-lived session row cache (see SupabaseSchemaHelper.session_cache)
     """
     
-    def __init__(self, supabase: Optional[Client] = None):
+    def __init__(
+        self,
+        supabase: Optional[Client] = None,
+        bulk_writer_options: Optional[Dict[str, Any]] = None,
+        session_cache_ttl: float = DEFAULT_SESSION_CACHE_TTL,
+        cache_mirror_path: Optional[Path] = None
+    ):
         """
         Initialize session manager.
         
         Args:
-            supabase: Optional Supabase client (created if not provided)
+            supabase: Optional Supabase client (a pooled keep-alive
+                PostgREST client is created if not provided)
+            bulk_writer_options: If given, add_changes_batch() queues changes on a
+                ChangeBulkWriter created with these keyword arguments
+                (e.g. spill_path, flush_interval) instead of writing them directly
+            session_cache_ttl: Seconds session rows are cached (0 disables)
+            cache_mirror_path: Optional SQLite file keeping cached rows across restarts
         """
         if supabase is None:
-            supabase_url = os.getenv("SUPABASE_URL")
-            supabase_key = os.getenv("SUPABASE_SECRET_KEY")
-            
-            if not supabase_url or not supabase_key:
-                raise ValueError(
-                    "Missing SUPABASE_URL or SUPABASE_SECRET_KEY environment variables"
-                )
-            
-            if Client is None:
-                raise ImportError(
-                    "supabase-py package required. Install with: pip install supabase"
-                )
-            
-            supabase = create_client(supabase_url, supabase_key)
+            # Raises ValueError if SUPABASE_URL/SUPABASE_SECRET_KEY are missing
+            supabase = create_pooled_client()
         
         self.supabase = supabase
-        self.schema_helper = SupabaseSchemaHelper(supabase)
+        self.schema_helper = SupabaseSchemaHelper(
+            supabase,
+            session_cache_ttl=session_cache_ttl,
+            cache_mirror_path=cache_mirror_path
+        )
         self._current_session_id: Optional[str] = None
+        self.bulk_writer: Optional[ChangeBulkWriter] = None
+        if bulk_writer_options is not None:
+            self.bulk_writer = ChangeBulkWriter(self.schema_helper, **bulk_writer_options)
         
         logger.info(
             "SessionManager initialized",
@@ -174,6 +184,9 @@ class SessionManager:
         """
         Add batch of changes to changes_queue.
         
+        With a bulk writer the changes are queued and written (together with
+        the session stats) on its next flush.
+        
         Args:
             session_id: Session ID
             changes: List of FileChange instances
@@ -202,6 +215,17 @@ class SessionManager:
                 total_added += change.lines_added
                 total_removed += change.lines_removed
             
+            if self.bulk_writer is not None:
+                self.bulk_writer.enqueue(session_id, changes_data)
+                logger.debug(
+                    "Queued changes batch for bulk write",
+                    operation="add_changes_batch",
+                    session_id=session_id,
+                    change_count=len(changes),
+                    **trace_ctx
+                )
+                return
+            
             # Insert changes using schema helper
             inserted_count = self.schema_helper.insert_changes(session_id, changes_data)
             
@@ -239,6 +263,13 @@ class SessionManager:
             )
             raise RuntimeError(f"Unexpected error adding changes batch: {e}") from e
     
+    def close(self):
+        """Flush and stop the bulk writer, if any, and report cache hit rates."""
+        if self.bulk_writer is not None:
+            self.bulk_writer.close()
+        self.schema_helper.session_cache.log_stats()
+        self.schema_helper.session_cache.close()
+    
     def _update_session_stats(
         self,
         session_id: str,
@@ -246,11 +277,12 @@ class SessionManager:
         lines_added: int,
         lines_removed: int
     ):
-        """Update session statistics."""
+        """Update session statistics (one atomic increment where available)."""
         try:
-            # Get current session
-            session = self._get_session(session_id)
-            if not session:
+            updated = self.schema_helper.increment_session_stats(
+                session_id, file_count, lines_added, lines_removed
+            )
+            if not updated:
                 logger.warn(
                     "Session not found for stats update",
                     operation="_update_session_stats",
@@ -259,32 +291,6 @@ class SessionManager:
                 )
                 return
             
-            # Update stats using RPC or direct access
-            if self.schema_helper._should_use_rpc():
-                # Use RPC function
-                result = self.supabase.rpc(
-                    "update_session_stats",
-                    {
-                        "p_session_id": session_id,
-                        "p_file_count": file_count,
-                        "p_lines_added": lines_added,
-                        "p_lines_removed": lines_removed
-                    }
-                ).execute()
-            else:
-                # Use direct table access with schema
-                update_data = {
-                    "total_files": (session.get("total_files", 0) or 0) + file_count,
-                    "total_lines_added": (session.get("total_lines_added", 0) or 0) + lines_added,
-                    "total_lines_removed": (session.get("total_lines_removed", 0) or 0) + lines_removed,
-                    "last_activity": datetime.now(timezone.utc).isoformat()
-                }
-                # Use .schema() method for direct access
-                if hasattr(self.supabase, 'schema'):
-                    result = self.supabase.schema("veroscore").table("sessions").update(update_data).eq("session_id", session_id).execute()
-                else:
-                    result = self.supabase.table("veroscore.sessions").update(update_data).eq("session_id", session_id).execute()
-            
             logger.debug(
                 "Updated session stats",
                 operation="_update_session_stats",
@@ -311,10 +317,10 @@ class SessionManager:
                 session_id=session_id
             )
     
-    def _get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
-        """Get session by ID."""
+    def _get_session(self, session_id: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+        """Get session by ID (use_cache=False before a read-modify-write)."""
         try:
-            return self.schema_helper.get_session(session_id)
+            return self.schema_helper.get_session(session_id, use_cache=use_cache)
         except (ValueError, RuntimeError, ConnectionError) as e:
             logger.error(
                 "Failed to get session",
@@ -435,6 +441,7 @@ class SessionManager:
                     result = self.supabase.schema("veroscore").table("sessions").update(update_data).eq("session_id", session_id).execute()
                 else:
                     result = self.supabase.table("veroscore.sessions").update(update_data).eq("session_id", session_id).execute()
+            self.schema_helper.session_cache.invalidate(session_id)
             
             logger.info(
                 "Marked session as reward-eligible",
@@ -9,20 +9,77 @@ Last Updated: 2025-12-05
 """
 
 import os
-from typing import Optional, List, Dict, Any
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime, timezone
 
 try:
     from supabase import Client
-    from postgrest import SyncPostgrestClient
 except ImportError:
     Client = None
-    SyncPostgrestClient = None
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    from postgrest.exceptions import APIError
+except ImportError:
+    APIError = None
+
+from .http_transport import TransportError
+from .postgrest_client import PooledPostgRESTClient, PostgRESTError
+from .ttl_cache import TTLCache
 from logger_util import get_logger
 
 logger = get_logger(context="SupabaseSchemaHelper")
 
+# Ways to reach a veroscore table when the schema is exposed, in the order
+# they are tried: client.schema("veroscore"), "veroscore.<table>", and a
+# PostgREST client with Accept-Profile/Content-Profile headers.
+TABLE_STRATEGIES = ("schema", "qualified", "postgrest")
+
+# changes_queue rows per multi-row insert
+DEFAULT_INSERT_CHUNK_SIZE = 500
+
+# Seconds a session row read by get_session() is reused
+DEFAULT_SESSION_CACHE_TTL = 10.0
+
+# Gateway errors returned while PostgREST may still commit the request
+_GATEWAY_ERROR_STATUSES = frozenset({502, 504})
+
+
+class TableAccessError(RuntimeError):
+    """Every table access strategy failed; sending the operation again is safe."""
+
+
+def safe_to_resend(error: BaseException) -> bool:
+    """
+    True if error shows that a write never took effect, so it can be sent again.
+
+    That holds when the request was never sent (e.g. connection refused)
+    or PostgREST answered with an error status, since it rolls back the
+    request's transaction on error. After a timeout or a dropped
+    connection the server may already have committed the write, so
+    sending it again could duplicate it.
+    """
+    while error is not None:
+        if isinstance(error, TableAccessError):
+            return True
+        if isinstance(error, TransportError):
+            return not error.sent
+        if isinstance(error, PostgRESTError):
+            return error.status not in _GATEWAY_ERROR_STATUSES
+        if isinstance(error, ConnectionRefusedError):
+            return True
+        if APIError is not None and isinstance(error, APIError):
+            return True
+        if httpx is not None and isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+            return True
+        error = error.__cause__
+    return False
+
 
 class SupabaseSchemaHelper:
     """
@@ -31,22 +88,36 @@ class SupabaseSchemaHelper:
     maintaining RLS enforcement (MOST SECURE).
     """
     
-    def __init__(self, supabase: Client):
+    def __init__(
+        self,
+        supabase: Client,
+        session_cache_ttl: float = DEFAULT_SESSION_CACHE_TTL,
+        cache_mirror_path: Optional[Path] = None
+    ):
         """
         Initialize schema helper.
         
         Args:
             supabase: Supabase client instance (used to get URL/key)
+            session_cache_ttl: Seconds session rows are cached (0 disables)
+            cache_mirror_path: Optional SQLite file keeping cached rows across restarts
         """
         self.supabase = supabase
+        # Invalidated by every session write made through this helper;
+        # code writing sessions directly must call session_cache.invalidate()
+        self.session_cache = TTLCache("sessions", session_cache_ttl, mirror_path=cache_mirror_path)
         self._postgrest_client = None  # Lazy initialization
         self._use_rpc = None  # Will be determined on first use
+        self._table_strategy: Optional[str] = None  # First strategy that worked
+        self._stats_rpc_available: Optional[bool] = None
     
     def _get_postgrest_client(self):
         """Get or create PostgREST client with veroscore schema."""
         if self._postgrest_client is None:
-            if not SyncPostgrestClient:
-                raise ImportError("postgrest package required for secure schema access")
+            if isinstance(self.supabase, PooledPostgRESTClient):
+                # Already on the shared keep-alive transport
+                self._postgrest_client = self.supabase.schema("veroscore")
+                return self._postgrest_client
             
             # Get URL and key from Supabase client or environment
             try:
@@ -66,15 +137,9 @@ class SupabaseSchemaHelper:
             if not supabase_url or not supabase_key:
                 raise ValueError("SUPABASE_URL and SUPABASE_SECRET_KEY must be set")
             
-            self._postgrest_client = SyncPostgrestClient(
-                base_url=f"{supabase_url}/rest/v1",
-                headers={
-                    "apikey": supabase_key,
-                    "Authorization": f"Bearer {supabase_key}",
-                    "Accept-Profile": "veroscore",  # Specify schema
-                    "Content-Profile": "veroscore"   # For writes
-                }
-            )
+            # Accept-Profile/Content-Profile select the schema; requests share
+            # the pooled keep-alive transport
+            self._postgrest_client = PooledPostgRESTClient(supabase_url, supabase_key).schema("veroscore")
             
             logger.info(
                 "PostgREST client initialized with veroscore schema",
@@ -185,6 +250,85 @@ class SupabaseSchemaHelper:
                 )
         return self._use_rpc
     
+    def _table_builder(self, strategy: str, table_name: str):
+        """Return a query builder for table_name using one access strategy."""
+        if strategy == "schema":
+            if not hasattr(self.supabase, 'schema'):
+                raise AttributeError("Supabase client has no .schema() method")
+            return self.supabase.schema("veroscore").table(table_name)
+        if strategy == "qualified":
+            return self.supabase.table(f"veroscore.{table_name}")
+        return self._get_postgrest_client().from_(table_name)
+    
+    def execute_table_operation(
+        self,
+        table_name: str,
+        build: Callable[[Any], Any],
+        operation: str,
+        idempotent: bool = True
+    ):
+        """
+        Run a query against a veroscore table, remembering which access strategy works.
+        
+        The strategy that last succeeded is tried first, so the fallbacks are
+        only probed again when it stops working.
+        
+        Args:
+            table_name: Table name without schema prefix
+            build: Turns a table query builder into an executable query
+                (e.g. ``lambda t: t.insert(rows)``)
+            operation: Operation name for logging
+            idempotent: False for writes that must not run twice; they are
+                only sent through the next strategy if safe_to_resend()
+                holds for the failure
+        
+        Returns:
+            Result of ``.execute()``
+        
+        Raises:
+            TableAccessError: If every strategy fails
+            RuntimeError: If a non-idempotent write fails in a way that may
+                have been applied
+        """
+        remembered = self._table_strategy
+        order = list(TABLE_STRATEGIES)
+        if remembered:
+            order.remove(remembered)
+            order.insert(0, remembered)
+        
+        last_error: Optional[Exception] = None
+        for strategy in order:
+            query = None
+            try:
+                query = build(self._table_builder(strategy, table_name))
+                result = query.execute()
+            except Exception as e:
+                # Client errors (e.g. postgrest APIError) don't share a base class.
+                # Nothing was sent if building the query failed.
+                if query is not None and not idempotent and not safe_to_resend(e):
+                    raise RuntimeError(f"{operation} on {table_name} may have been applied: {e}") from e
+                last_error = e
+                logger.debug(
+                    "Table access strategy failed",
+                    operation=operation,
+                    strategy=strategy,
+                    table_name=table_name,
+                    root_cause=str(e)
+                )
+                continue
+            if strategy != remembered:
+                logger.info(
+                    "Using table access strategy",
+                    operation=operation,
+                    strategy=strategy,
+                    table_name=table_name
+                )
+                self._table_strategy = strategy
+            return result
+        
+        self._table_strategy = None
+        raise TableAccessError(f"All table access strategies failed for {table_name}: {last_error}") from last_error
+    
     def insert_session(self, session_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Insert session using RPC or direct access.
@@ -268,16 +412,32 @@ class SupabaseSchemaHelper:
             )
             raise RuntimeError(f"Unexpected error inserting session: {e}") from e
     
-    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+    def get_session(self, session_id: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get session by ID.
         
+        Rows are served from session_cache for a short TTL; pass
+        use_cache=False before a read-modify-write so the write isn't based
+        on a stale row.
+        
         Args:
             session_id: Session ID
+            use_cache: Serve the row from the cache if present
         
         Returns:
             Session data or None if not found
         """
+        if use_cache:
+            cached = self.session_cache.get(session_id)
+            if cached is not None:
+                return cached
+        session = self._fetch_session(session_id)
+        if session is not None:
+            self.session_cache.put(session_id, session)
+        return session
+    
+    def _fetch_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Get session by ID from Supabase."""
         try:
             if self._should_use_rpc():
                 # Use RPC function (note: function name uses schema prefix)
@@ -368,13 +528,39 @@ class SupabaseSchemaHelper:
             )
             return None
     
-    def insert_changes(self, session_id: str, changes: List[Dict[str, Any]]) -> int:
+    @staticmethod
+    def build_change_rows(session_id: str, changes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Convert change dictionaries into changes_queue rows."""
+        return [
+            {
+                "session_id": session_id,
+                "file_path": change.get("path"),
+                "change_type": change.get("change_type"),
+                "old_path": change.get("old_path"),
+                "lines_added": change.get("lines_added", 0),
+                "lines_removed": change.get("lines_removed", 0),
+                "commit_hash": change.get("commit_hash"),
+                "processed": False,
+                "metadata": change.get("metadata", {})
+            }
+            for change in changes
+        ]
+    
+    def insert_changes(
+        self,
+        session_id: str,
+        changes: List[Dict[str, Any]],
+        chunk_size: int = DEFAULT_INSERT_CHUNK_SIZE
+    ) -> int:
         """
         Insert changes into changes_queue.
         
+        Rows are sent in multi-row inserts of at most chunk_size rows.
+        
         Args:
             session_id: Session ID
             changes: List of change dictionaries
+            chunk_size: Rows per insert request
         
         Returns:
             Number of changes inserted
@@ -384,71 +570,32 @@ class SupabaseSchemaHelper:
             if self._should_use_rpc():
                 # Use RPC function (note: function name uses schema prefix)
                 import json
-                result = self.supabase.rpc(
-                    "insert_changes",
-                    {
-                        "p_session_id": session_id,
-                        "p_changes": json.dumps(changes)
-                    }
-                ).execute()
-                if result.data:
-                    return result.data[0] if isinstance(result.data[0], int) else len(changes)
-                return len(changes)
+                inserted = 0
+                for start in range(0, len(changes), chunk_size):
+                    chunk = changes[start:start + chunk_size]
+                    result = self.supabase.rpc(
+                        "insert_changes",
+                        {
+                            "p_session_id": session_id,
+                            "p_changes": json.dumps(chunk)
+                        }
+                    ).execute()
+                    if result.data and isinstance(result.data[0], int):
+                        inserted += result.data[0]
+                    else:
+                        inserted += len(chunk)
+                return inserted
             else:
-                # Try multiple methods for direct access
-                changes_data = []
-                for change in changes:
-                    changes_data.append({
-                        "session_id": session_id,
-                        "file_path": change.get("path"),
-                        "change_type": change.get("change_type"),
-                        "old_path": change.get("old_path"),
-                        "lines_added": change.get("lines_added", 0),
-                        "lines_removed": change.get("lines_removed", 0),
-                        "commit_hash": change.get("commit_hash"),
-                        "processed": False,
-                        "metadata": change.get("metadata", {})
-                    })
-                
-                result = None
-                
-                # Method 1: Try .schema() method
-                if hasattr(self.supabase, 'schema'):
-                    try:
-                        result = self.supabase.schema("veroscore").table("changes_queue").insert(changes_data).execute()
-                        if result.data:
-                            return len(changes_data)
-                    except (RuntimeError, ConnectionError, ValueError) as e:
-                        logger.debug(
-                            ".schema() insert changes method failed, trying fallback",
-                            operation="insert_changes",
-                            root_cause=str(e),
-                            session_id=session_id
-                        )
-                        pass
-                
-                # Method 2: Try schema-qualified table name
-                if not result:
-                    try:
-                        result = self.supabase.table("veroscore.changes_queue").insert(changes_data).execute()
-                        if result.data:
-                            return len(changes_data)
-                    except (RuntimeError, ConnectionError, ValueError) as e:
-                        logger.debug(
-                            "Schema-qualified insert changes method failed, trying PostgREST",
-                            operation="insert_changes",
-                            root_cause=str(e),
-                            session_id=session_id
-                        )
-                        pass
-                
-                # Method 3: Use PostgREST client with Accept-Profile header
-                if not result:
-                    client = self._get_postgrest_client()
-                    result = client.from_("changes_queue").insert(changes_data).execute()
-                    return len(changes_data) if result.data else 0
-                
-                return 0
+                rows = self.build_change_rows(session_id, changes)
+                for start in range(0, len(rows), chunk_size):
+                    chunk = rows[start:start + chunk_size]
+                    self.execute_table_operation(
+                        "changes_queue",
+                        lambda table, chunk=chunk: table.insert(chunk),
+                        "insert_changes",
+                        idempotent=False
+                    )
+                return len(rows)
         except (ValueError, RuntimeError, ConnectionError) as e:
             logger.error(
                 "Failed to insert changes",
@@ -469,4 +616,88 @@ class SupabaseSchemaHelper:
                 change_count=len(changes)
             )
             raise RuntimeError(f"Unexpected error inserting changes: {e}") from e
-
+    
+    def increment_session_stats(
+        self,
+        session_id: str,
+        file_count: int,
+        lines_added: int,
+        lines_removed: int
+    ) -> bool:
+        """
+        Add to a session's file and line totals.
+        
+        Uses one atomic RPC (update_session_stats when the schema isn't
+        exposed, veroscore_increment_session_stats otherwise). If that RPC
+        isn't available the session row is read and updated, and the RPC
+        isn't tried again.
+        
+        Args:
+            session_id: Session ID
+            file_count: Files to add to total_files
+            lines_added: Lines to add to total_lines_added
+            lines_removed: Lines to add to total_lines_removed
+        
+        Returns:
+            True if the session was updated, False if it wasn't found
+        
+        Raises:
+            RuntimeError: If the update fails
+        """
+        if self._should_use_rpc():
+            self.supabase.rpc(
+                "update_session_stats",
+                {
+                    "p_session_id": session_id,
+                    "p_file_count": file_count,
+                    "p_lines_added": lines_added,
+                    "p_lines_removed": lines_removed
+                }
+            ).execute()
+            self.session_cache.invalidate(session_id)
+            return True
+        
+        if self._stats_rpc_available is not False:
+            try:
+                self.supabase.rpc(
+                    "veroscore_increment_session_stats",
+                    {
+                        "p_session_id": session_id,
+                        "p_files": file_count,
+                        "p_lines_added": lines_added,
+                        "p_lines_removed": lines_removed
+                    }
+                ).execute()
+                self._stats_rpc_available = True
+                self.session_cache.invalidate(session_id)
+                return True
+            except Exception as e:
+                if self._stats_rpc_available or not safe_to_resend(e):
+                    # The RPC worked before, or may have run; falling back
+                    # to read and update could count the totals twice
+                    raise RuntimeError(f"Failed to increment session stats: {e}") from e
+                logger.info(
+                    "Stats RPC unavailable, falling back to read and update",
+                    operation="increment_session_stats",
+                    root_cause=str(e)
+                )
+                self._stats_rpc_available = False
+        
+        # Never add to cached totals
+        session = self.get_session(session_id, use_cache=False)
+        if not session:
+            return False
+        update_data = {
+            "total_files": (session.get("total_files", 0) or 0) + file_count,
+            "total_lines_added": (session.get("total_lines_added", 0) or 0) + lines_added,
+            "total_lines_removed": (session.get("total_lines_removed", 0) or 0) + lines_removed,
+            "last_activity": datetime.now(timezone.utc).isoformat()
+        }
+        self.execute_table_operation(
+            "sessions",
+            lambda table: table.update(update_data).eq("session_id", session_id),
+            "increment_session_stats",
+            idempotent=False
+        )
+        self.session_cache.invalidate(session_id)
+        return True
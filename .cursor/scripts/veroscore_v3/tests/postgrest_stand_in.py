@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Local PostgREST stand-in for VeroScore V3 tests.
+
+Serves the slice of the PostgREST API the veroscore code uses (table
+select/insert/update with eq filters, RPC calls, Accept-Profile and
+Content-Profile headers) from in-memory tables, and a minimal client with
+the supabase-py query builder interface that talks to it over HTTP.
+
+Last Updated: 2025-12-05
+"""
+
+import json
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+from veroscore_v3.postgrest_client import PostgRESTError
+
+
+class PostgRESTStandIn:
+    """
+    In-memory PostgREST server on 127.0.0.1.
+
+    Attributes:
+        tables: Table name -> list of rows
+        requests: (method, path, profile header) for every request
+        fail_next: Number of upcoming requests to answer with 503
+        expose_schema: If False, requests with a profile header get 406
+            (the schema isn't exposed), as with a default Supabase project
+    """
+
+    def __init__(self, expose_schema: bool = True):
+        self.tables: Dict[str, List[Dict[str, Any]]] = {"sessions": [], "changes_queue": []}
+        self.requests: List[tuple] = []
+        self.fail_next = 0
+        self.expose_schema = expose_schema
+        self.lock = threading.Lock()
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, like PostgREST
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                stand_in._handle(self, "GET")
+
+            def do_POST(self):
+                stand_in._handle(self, "POST")
+
+            def do_PATCH(self):
+                stand_in._handle(self, "PATCH")
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def count(self, method: str, path_prefix: str) -> int:
+        """Count requests with the given method whose path starts with path_prefix."""
+        with self.lock:
+            return sum(1 for m, p, _ in self.requests if m == method and p.startswith(path_prefix))
+
+    def _handle(self, handler: BaseHTTPRequestHandler, method: str):
+        parsed = urllib.parse.urlsplit(handler.path)
+        path = parsed.path
+        profile = handler.headers.get("Content-Profile") or handler.headers.get("Accept-Profile")
+        length = int(handler.headers.get("Content-Length") or 0)
+        body = json.loads(handler.rfile.read(length) or b"null") if length else None
+
+        with self.lock:
+            self.requests.append((method, path, profile))
+            if self.fail_next > 0:
+                self.fail_next -= 1
+                return self._reply(handler, 503, {"message": "Service Unavailable"})
+            if profile and not self.expose_schema:
+                return self._reply(handler, 406, {"message": f"The schema must be one of: public (got {profile})"})
+
+            if not path.startswith("/rest/v1/"):
+                return self._reply(handler, 404, {"message": "Not found"})
+            name = path[len("/rest/v1/"):]
+            if name.startswith("rpc/"):
+                return self._rpc(handler, name[4:], body or {})
+
+            table = self.tables.get(name.split(".", 1)[-1])
+            if table is None:
+                return self._reply(handler, 404, {"message": f"relation {name} does not exist"})
+            filters = {
+                key: value[3:]
+                for key, value in urllib.parse.parse_qsl(parsed.query)
+                if value.startswith("eq.")
+            }
+            matching = [row for row in table if all(_filter_text(row.get(k)) == v for k, v in filters.items())]
+
+            if method == "GET":
+                total = str(len(matching)) if "count=exact" in (handler.headers.get("Prefer") or "") else "*"
+                content_range = f"0-{len(matching) - 1}/{total}" if matching else f"*/{total}"
+                return self._reply(handler, 200, matching, {"Content-Range": content_range})
+            if method == "POST":
+                rows = body if isinstance(body, list) else [body]
+                table.extend(dict(row) for row in rows)
+                return self._reply(handler, 201, rows)
+            for row in matching:
+                row.update(body)
+            return self._reply(handler, 200, matching)
+
+    def _rpc(self, handler: BaseHTTPRequestHandler, function: str, params: Dict[str, Any]):
+        if function != "veroscore_increment_session_stats":
+            return self._reply(handler, 404, {"message": f"function {function} does not exist"})
+        for row in self.tables["sessions"]:
+            if row["session_id"] == params["p_session_id"]:
+                row["total_files"] = row.get("total_files", 0) + params.get("p_files", 0)
+                row["total_lines_added"] = row.get("total_lines_added", 0) + params.get("p_lines_added", 0)
+                row["total_lines_removed"] = row.get("total_lines_removed", 0) + params.get("p_lines_removed", 0)
+        return self._reply(handler, 204, None)
+
+    @staticmethod
+    def _reply(handler: BaseHTTPRequestHandler, status: int, payload: Any, headers: Optional[Dict[str, str]] = None):
+        data = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.send_header("Content-Length", str(len(data)))
+        handler.end_headers()
+        handler.wfile.write(data)
+
+
+def _filter_text(value: Any) -> str:
+    """Render a row value the way PostgREST filter values are written."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+class _Result:
+    def __init__(self, data):
+        self.data = data
+
+
+class _Query:
+    """Subset of the supabase-py query builder, executed over HTTP."""
+
+    def __init__(self, base_url: str, path: str, profile: Optional[str]):
+        self.base_url = base_url
+        self.path = path
+        self.profile = profile
+        self.method = "GET"
+        self.body: Any = None
+        self.params: List[tuple] = []
+
+    def select(self, columns: str = "*"):
+        self.params.append(("select", columns))
+        return self
+
+    def eq(self, column: str, value: Any):
+        self.params.append((column, f"eq.{value}"))
+        return self
+
+    def limit(self, count: int):
+        self.params.append(("limit", str(count)))
+        return self
+
+    def order(self, column: str, desc: bool = False):
+        self.params.append(("order", f"{column}.{'desc' if desc else 'asc'}"))
+        return self
+
+    def insert(self, rows):
+        self.method, self.body = "POST", rows
+        return self
+
+    def update(self, data):
+        self.method, self.body = "PATCH", data
+        return self
+
+    def execute(self) -> _Result:
+        url = f"{self.base_url}/rest/v1/{self.path}"
+        if self.params:
+            url += "?" + urllib.parse.urlencode(self.params)
+        data = None if self.body is None else json.dumps(self.body).encode("utf-8")
+        request = urllib.request.Request(url, data=data, method=self.method)
+        request.add_header("Content-Type", "application/json")
+        if self.profile:
+            request.add_header("Accept-Profile", self.profile)
+            request.add_header("Content-Profile", self.profile)
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                raw = response.read()
+        except urllib.error.HTTPError as e:
+            raise PostgRESTError(e.code, e.read().decode("utf-8", "replace")) from e
+        except urllib.error.URLError as e:
+            raise ConnectionError(str(e)) from e
+        return _Result(json.loads(raw) if raw else [])
+
+
+class _Schema:
+    def __init__(self, base_url: str, name: str):
+        self.base_url = base_url
+        self.name = name
+
+    def table(self, table_name: str) -> _Query:
+        return _Query(self.base_url, table_name, self.name)
+
+
+class StandInClient:
+    """Supabase-style client for PostgRESTStandIn."""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.supabase_url = base_url
+
+    def schema(self, name: str) -> _Schema:
+        return _Schema(self.base_url, name)
+
+    def table(self, table_name: str) -> _Query:
+        return _Query(self.base_url, table_name, None)
+
+    def rpc(self, function: str, params: Dict[str, Any]) -> _Query:
+        query = _Query(self.base_url, f"rpc/{function}", None)
+        query.method, query.body = "POST", params
+        return query
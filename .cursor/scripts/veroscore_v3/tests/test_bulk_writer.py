@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Tests for ChangeBulkWriter against a local PostgREST stand-in.
+
+Last Updated: 2025-12-05
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from veroscore_v3.bulk_writer import ChangeBulkWriter
+from veroscore_v3.http_transport import TransportError
+from veroscore_v3.supabase_schema_helper import SupabaseSchemaHelper
+from veroscore_v3.tests.postgrest_stand_in import PostgRESTStandIn, StandInClient
+
+
+def make_changes(count, prefix="src/file"):
+    return [
+        {
+            "path": f"{prefix}{i}.py",
+            "change_type": "modified",
+            "old_path": None,
+            "lines_added": 2,
+            "lines_removed": 1,
+            "commit_hash": "abc123",
+            "metadata": {}
+        }
+        for i in range(count)
+    ]
+
+
+class TestChangeBulkWriter(unittest.TestCase):
+    """ChangeBulkWriter against PostgRESTStandIn."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.spill_path = Path(self.temp_dir) / "changes_spill.jsonl"
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _writer(self, stand_in, **kwargs):
+        stand_in.tables["sessions"] = [
+            {"session_id": sid, "total_files": 0, "total_lines_added": 0, "total_lines_removed": 0}
+            for sid in ("s1", "s2")
+        ]
+        helper = SupabaseSchemaHelper(StandInClient(stand_in.url))
+        options = {"spill_path": self.spill_path, "start": False, "retry_backoff": 0.01, "chunk_size": 500}
+        options.update(kwargs)
+        return ChangeBulkWriter(helper, **options)
+
+    def test_chunked_inserts_and_one_stats_call_per_session(self):
+        """Changes from several enqueues go out in chunked inserts plus one stats RPC per session."""
+        with PostgRESTStandIn() as stand_in:
+            writer = self._writer(stand_in)
+            for _ in range(3):
+                writer.enqueue("s1", make_changes(400))
+            writer.enqueue("s2", make_changes(10, prefix="lib/"))
+            writer.schema_helper._should_use_rpc()  # One-time schema exposure probe
+            requests_before = len(stand_in.requests)
+
+            self.assertEqual(writer.flush(), 1210)
+
+            self.assertEqual(len(stand_in.tables["changes_queue"]), 1210)
+            # s1: 1200 rows in chunks of 500, s2: one chunk
+            self.assertEqual(stand_in.count("POST", "/rest/v1/changes_queue"), 4)
+            self.assertEqual(stand_in.count("POST", "/rest/v1/rpc/veroscore_increment_session_stats"), 2)
+            self.assertEqual(len(stand_in.requests) - requests_before, 6)
+            s1 = stand_in.tables["sessions"][0]
+            self.assertEqual((s1["total_files"], s1["total_lines_added"], s1["total_lines_removed"]), (1200, 2400, 1200))
+            self.assertEqual(writer.pending_count(), 0)
+            self.assertEqual(self.spill_path.read_text(), "")
+
+    def test_spill_rewritten_once_per_phase(self):
+        """A flush rewrites the spill file once after the inserts and once after the stats, not per chunk."""
+        with PostgRESTStandIn() as stand_in:
+            writer = self._writer(stand_in, chunk_size=10)
+            writer.enqueue("s1", make_changes(95))
+            writer.enqueue("s2", make_changes(15, prefix="lib/"))
+
+            with mock.patch.object(writer, "_rewrite_spill", wraps=writer._rewrite_spill) as rewrite:
+                self.assertEqual(writer.flush(), 110)
+
+            self.assertEqual(rewrite.call_count, 2)
+            self.assertEqual(writer.stats()["insert_requests"], 12)
+            self.assertEqual(writer.pending_count(), 0)
+            self.assertEqual(self.spill_path.read_text(), "")
+
+    def test_remembers_working_access_strategy(self):
+        """After the schema route fails once, later flushes go straight to the working route."""
+        with PostgRESTStandIn(expose_schema=False) as stand_in:
+            writer = self._writer(stand_in)
+            writer.enqueue("s1", make_changes(5))
+            writer.flush()
+            profiled = sum(1 for _, _, profile in stand_in.requests if profile)
+
+            writer.enqueue("s1", make_changes(5))
+            writer.flush()
+
+            self.assertEqual(sum(1 for _, _, profile in stand_in.requests if profile), profiled)
+            self.assertEqual(writer.schema_helper._table_strategy, "qualified")
+            self.assertEqual(len(stand_in.tables["changes_queue"]), 10)
+
+    def test_retries_transient_failures(self):
+        """Requests failing on every access route are retried and nothing is lost."""
+        with PostgRESTStandIn() as stand_in:
+            writer = self._writer(stand_in)
+            writer.schema_helper._use_rpc = False
+            writer.schema_helper._table_strategy = "schema"
+            writer.enqueue("s1", make_changes(20))
+            # Both supabase-style routes fail once; the PostgREST route has no key here
+            stand_in.fail_next = 2
+
+            self.assertEqual(writer.flush(), 20)
+            self.assertGreaterEqual(writer.stats()["retries"], 1)
+            self.assertEqual(len(stand_in.tables["changes_queue"]), 20)
+
+    def test_write_that_may_have_been_applied_is_not_resent(self):
+        """An insert that timed out after it was sent is neither retried nor kept queued."""
+        with PostgRESTStandIn() as stand_in:
+            writer = self._writer(stand_in)
+            writer.enqueue("s1", make_changes(20))
+            error = RuntimeError("Failed to insert changes")
+            error.__cause__ = TransportError("POST changes_queue failed: timed out", sent=True)
+
+            with mock.patch.object(writer.schema_helper, "insert_changes", side_effect=error) as insert:
+                writer.flush()
+                writer.flush()
+
+            self.assertEqual(insert.call_count, 1)
+            self.assertEqual(writer.stats()["retries"], 0)
+            self.assertEqual(writer.stats()["unconfirmed"], 1)
+            self.assertEqual(writer.pending_count(), 0)
+
+    def test_unsent_write_is_retried(self):
+        """An insert that never left the client is retried."""
+        with PostgRESTStandIn() as stand_in:
+            writer = self._writer(stand_in)
+            writer.enqueue("s1", make_changes(20))
+            helper = writer.schema_helper
+            insert = helper.insert_changes
+            failures = [TransportError("POST changes_queue failed: refused", sent=False)]
+
+            def flaky_insert(*args, **kwargs):
+                if failures:
+                    raise failures.pop()
+                return insert(*args, **kwargs)
+
+            with mock.patch.object(helper, "insert_changes", side_effect=flaky_insert):
+                self.assertEqual(writer.flush(), 20)
+
+            self.assertEqual(writer.stats()["retries"], 1)
+            self.assertEqual(len(stand_in.tables["changes_queue"]), 20)
+
+    def test_insert_not_resent_through_other_strategy(self):
+        """A table write that may have been applied isn't repeated through the next access route."""
+        with PostgRESTStandIn() as stand_in:
+            helper = SupabaseSchemaHelper(StandInClient(stand_in.url))
+            attempts = []
+
+            class TimedOutQuery:
+                def execute(self):
+                    attempts.append(self)
+                    raise TransportError("POST changes_queue failed: timed out", sent=True)
+
+            def build(table):
+                return TimedOutQuery()
+
+            with self.assertRaises(RuntimeError):
+                helper.execute_table_operation("changes_queue", build, "insert_changes", idempotent=False)
+            self.assertEqual(len(attempts), 1)
+
+    def test_spill_file_survives_restart(self):
+        """Changes queued while the server is down are written by the next process."""
+        with PostgRESTStandIn() as stand_in:
+            writer = self._writer(stand_in, max_retries=0)
+            writer.schema_helper._use_rpc = False
+            stand_in.fail_next = 1000
+            writer.enqueue("s1", make_changes(30))
+            self.assertEqual(writer.flush(), 0)
+            self.assertEqual(len(self.spill_path.read_text().splitlines()), 30)
+
+            stand_in.fail_next = 0
+            restarted = self._writer(stand_in)
+            self.assertEqual(restarted.pending_count(), 30)
+            self.assertEqual(restarted.flush(), 30)
+            self.assertEqual(len(stand_in.tables["changes_queue"]), 30)
+            self.assertEqual(stand_in.tables["sessions"][0]["total_files"], 30)
+
+    def test_spill_file_is_bounded(self):
+        """The oldest changes are dropped once the spill file reaches its limit."""
+        line_size = len(json.dumps({"session_id": "s1", "change": make_changes(1)[0]})) + 1
+        with PostgRESTStandIn() as stand_in:
+            writer = self._writer(stand_in, max_spill_bytes=line_size * 50)
+            writer.enqueue("s1", make_changes(80))
+
+            self.assertLessEqual(self.spill_path.stat().st_size, line_size * 50)
+            dropped = writer.stats()["dropped"]
+            self.assertGreaterEqual(dropped, 30)
+            self.assertEqual(writer.pending_count(), 80 - dropped)
+            self.assertEqual(len(self.spill_path.read_text().splitlines()), 80 - dropped)
+
+
+if __name__ == '__main__':
+    unittest.main()
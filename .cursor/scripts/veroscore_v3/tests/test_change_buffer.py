@@ -6,6 +6,7 @@ Last Updated: 2025-12-05
 """
 
 import unittest
+import threading
 import time
 from datetime import datetime, timezone
 
@@ -27,6 +28,18 @@ class TestChangeBuffer(unittest.TestCase):
         """Set up test fixtures."""
         self.buffer = ChangeBuffer(debounce_seconds=0.1)  # Short debounce for testing
     
+    def tearDown(self):
+        """Stop the scheduler thread."""
+        self.buffer.close()
+    
+    def _change(self, path, **kwargs):
+        return FileChange(
+            path=path,
+            change_type="modified",
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            **kwargs
+        )
+    
     def test_add_change(self):
         """Test adding a change to buffer."""
         change = FileChange(
@@ -140,6 +153,86 @@ class TestChangeBuffer(unittest.TestCase):
         
         # Callback should have been called
         self.assertTrue(len(callback_called) > 0)
+    
+    def test_flush_callback_can_drain_buffer(self):
+        """Flush callbacks run outside the lock, so they can call get_all()."""
+        drained = []
+        flushed = threading.Event()
+        
+        def flush_callback():
+            drained.extend(self.buffer.get_all())
+            flushed.set()
+        
+        self.buffer.flush_callback = flush_callback
+        self.buffer.add_change(self._change("test.py"))
+        
+        self.assertTrue(flushed.wait(2))
+        self.assertEqual([c.path for c in drained], ["test.py"])
+    
+    def test_single_scheduler_thread_for_burst(self):
+        """A burst of changes uses one scheduler thread and flushes one coalesced batch."""
+        batches = []
+        done = threading.Event()
+        
+        def batch_callback(changes):
+            batches.append(changes)
+            if sum(len(b) for b in batches) == 300:
+                done.set()
+        
+        buffer = ChangeBuffer(debounce_seconds=0.5)
+        buffer.batch_callback = batch_callback
+        threads_before = threading.active_count()
+        try:
+            for i in range(300):
+                buffer.add_change(self._change(f"file{i}.py"))
+            self.assertLessEqual(threading.active_count(), threads_before + 1)
+            
+            self.assertTrue(done.wait(3))
+            metrics = buffer.metrics()
+        finally:
+            buffer.close()
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(metrics['batches'], 1)
+        self.assertEqual(metrics['last_batch_size'], 300)
+        self.assertEqual(metrics['queue_depth'], 0)
+        self.assertGreaterEqual(metrics['last_flush_latency_ms'], 500)
+    
+    def test_max_batch_size_flushes_early(self):
+        """Reaching max_batch_size flushes without waiting for the debounce."""
+        buffer = ChangeBuffer(debounce_seconds=60, max_batch_size=10)
+        batches = []
+        done = threading.Event()
+        
+        def batch_callback(changes):
+            batches.append([c.path for c in changes])
+            if len(batches) == 2:
+                done.set()
+        
+        buffer.batch_callback = batch_callback
+        try:
+            for i in range(25):
+                buffer.add_change(self._change(f"file{i}.py"))
+            self.assertTrue(done.wait(2))
+            self.assertEqual([len(b) for b in batches], [10, 10])
+            self.assertEqual(buffer.count(), 5)
+        finally:
+            buffer.close()
+    
+    def test_max_latency_bounds_continuous_edits(self):
+        """A file that keeps changing is still flushed after max_latency_seconds."""
+        buffer = ChangeBuffer(debounce_seconds=0.2, max_latency_seconds=0.3)
+        batches = []
+        buffer.batch_callback = batches.append
+        try:
+            start = time.monotonic()
+            while not batches and time.monotonic() - start < 2:
+                buffer.add_change(self._change("hot.py"))
+                time.sleep(0.02)
+            elapsed = time.monotonic() - start
+            self.assertEqual(len(batches), 1)
+            self.assertLess(elapsed, 0.6)
+        finally:
+            buffer.close()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Unit tests for VeroFieldChangeHandler.
+
+Last Updated: 2025-12-05
+"""
+
+import unittest
+import subprocess
+import tempfile
+import shutil
+import os
+from pathlib import Path
+from unittest import mock
+
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from veroscore_v3.change_buffer import ChangeBuffer
+from veroscore_v3.change_handler import VeroFieldChangeHandler
+from veroscore_v3.git_diff_analyzer import GitDiffAnalyzer
+
+
+class TestChangeHandlerLazyStats(unittest.TestCase):
+    """Diff stats are resolved in one batch when the buffer is flushed."""
+
+    def setUp(self):
+        """Set up a temporary repository with committed files."""
+        self.temp_dir = tempfile.mkdtemp()
+        try:
+            subprocess.run(['git', 'init', '-q'], cwd=self.temp_dir, check=True)
+            subprocess.run(['git', 'config', 'user.name', 'Test User'], cwd=self.temp_dir, check=True)
+            subprocess.run(['git', 'config', 'user.email', 'test@example.com'], cwd=self.temp_dir, check=True)
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            self.skipTest("Git not available")
+        for name in ('a.py', 'b.py'):
+            Path(self.temp_dir, name).write_text("1\n2\n3\n")
+        subprocess.run(['git', 'add', '.'], cwd=self.temp_dir, check=True)
+        subprocess.run(['git', 'commit', '-qm', 'base'], cwd=self.temp_dir, check=True)
+
+        self.buffer = ChangeBuffer(debounce_seconds=60)
+        self.handler = VeroFieldChangeHandler("session-1", {}, self.buffer, repo_root=self.temp_dir)
+
+    def tearDown(self):
+        """Clean up."""
+        self.buffer.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_events_do_not_run_git_diff(self):
+        """Events are buffered without diff stats; the flush resolves them in one call."""
+        Path(self.temp_dir, 'a.py').write_text("1\n2\n3\n4\n5\n")
+        Path(self.temp_dir, 'b.py').write_text("1\n")
+
+        with mock.patch.object(GitDiffAnalyzer, 'get_diff_stats') as per_file, \
+                mock.patch.object(GitDiffAnalyzer, 'get_batch_diff_stats',
+                                  wraps=GitDiffAnalyzer.get_batch_diff_stats) as batch:
+            for _ in range(3):
+                self.handler._process_change(os.path.join(self.temp_dir, 'a.py'), 'modified')
+                self.handler._process_change(os.path.join(self.temp_dir, 'b.py'), 'modified')
+            self.assertEqual(batch.call_count, 0)
+
+            changes = {change.path: change for change in self.buffer.get_all()}
+
+        per_file.assert_not_called()
+        self.assertEqual(batch.call_count, 1)
+        self.assertEqual((changes['a.py'].lines_added, changes['a.py'].lines_removed), (2, 0))
+        self.assertEqual((changes['b.py'].lines_added, changes['b.py'].lines_removed), (0, 2))
+        self.assertEqual(len(changes['a.py'].commit_hash), 12)
+
+    def test_deleted_change_replaces_pending_stats(self):
+        """A delete after a modify leaves the change without diff stats."""
+        Path(self.temp_dir, 'a.py').write_text("1\n")
+        self.handler._process_change(os.path.join(self.temp_dir, 'a.py'), 'modified')
+        os.remove(os.path.join(self.temp_dir, 'a.py'))
+        self.handler._process_change(os.path.join(self.temp_dir, 'a.py'), 'deleted')
+
+        changes = self.buffer.get_all()
+
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0].change_type, 'deleted')
+        self.assertEqual((changes[0].lines_added, changes[0].lines_removed), (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -24,7 +24,8 @@ from detection_functions import (
     HardcodedValueDetector,
     SecurityVulnerabilityDetector,
     LoggingComplianceDetector,
-    MasterDetector
+    MasterDetector,
+    DetectionSummary
 )
 
 
@@ -326,6 +327,81 @@ class TestMasterDetector(unittest.TestCase):
         self.assertIn('files_checked', summary)
 
 
+class TestMasterDetectorStreaming(unittest.TestCase):
+    """Test detect_iter streaming, process pool and result cache."""
+    
+    SAMPLES = [
+        "const users = await supabase.from('users').select()\nconsole.log('Debug')\n",
+        "console.log('test')\n",
+        "export const ok = 1;\n",
+    ]
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.files = []
+        for i in range(12):
+            test_file = Path(self.temp_dir) / f"test{i}.ts"
+            test_file.write_text(self.SAMPLES[i % len(self.SAMPLES)])
+            self.files.append(str(test_file))
+    
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir)
+    
+    @staticmethod
+    def _keys(violations):
+        return [(v.file_path, v.rule_id, v.line_number) for v in violations]
+    
+    def test_parallel_matches_serial(self):
+        """Results from the process pool match the serial run, in the same order."""
+        serial = MasterDetector().detect_all(self.files)
+        parallel = MasterDetector().detect_all(self.files, workers=2)
+        streamed = DetectionSummary()
+        for violation in MasterDetector().detect_iter(self.files, workers=2):
+            streamed.add(violation)
+        
+        self.assertEqual(self._keys(parallel['violations']), self._keys(serial['violations']))
+        self.assertEqual(self._keys(parallel['warnings']), self._keys(serial['warnings']))
+        self.assertEqual(parallel['summary'], serial['summary'])
+        self.assertEqual(streamed.as_dict(len(self.files)), serial['summary'])
+        self.assertGreater(serial['summary']['total_violations'], 0)
+    
+    def test_unchanged_files_reuse_results(self):
+        """A second scan only runs the detectors on files whose content changed."""
+        detector = MasterDetector()
+        detector.detect_all(self.files)
+        Path(self.files[1]).write_text("export const fixed = 1;\n")
+        
+        second = detector.detect_all(self.files)
+        
+        self.assertEqual(detector.cache_hits, len(self.files) - 1)
+        self.assertEqual(second['summary'], MasterDetector().detect_all(self.files)['summary'])
+    
+    def test_result_cache_survives_restart(self):
+        cache_path = Path(self.temp_dir) / "detect-cache.json"
+        detector = MasterDetector(cache_path=cache_path)
+        first = detector.detect_all(self.files)
+        detector.save_cache()
+        
+        restarted = MasterDetector(cache_path=cache_path)
+        second = restarted.detect_all(self.files)
+        
+        self.assertEqual(restarted.cache_hits, len(self.files))
+        self.assertEqual(second['summary'], first['summary'])
+    
+    def test_contents_map_replaces_disk_reads(self):
+        """Files in the caller's content map are not read again from disk."""
+        contents = {path: Path(path).read_bytes() for path in self.files}
+        expected = MasterDetector().detect_all(self.files)
+        for path in self.files:
+            Path(path).unlink()
+        
+        result = MasterDetector().detect_all(self.files, contents=contents)
+        
+        self.assertEqual(self._keys(result['violations']), self._keys(expected['violations']))
+        self.assertEqual(result['summary'], expected['summary'])
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -17,7 +17,7 @@ import sys
 project_root = Path(__file__).parent.parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from veroscore_v3.git_diff_analyzer import GitDiffAnalyzer
+from veroscore_v3.git_diff_analyzer import GitDiffAnalyzer, HeadCommitCache, parse_numstat_z
 
 
 class TestGitDiffAnalyzer(unittest.TestCase):
@@ -159,6 +159,65 @@ class TestGitDiffAnalyzerWithTempRepo(unittest.TestCase):
         is_ignored = analyzer.is_git_ignored("test.pyc", self.temp_dir)
         self.assertTrue(is_ignored)
 
+    
+    def _commit_files(self, count):
+        """Commit count three-line files and return their paths."""
+        paths = []
+        for i in range(count):
+            path = f"file {i}[x].py"
+            with open(path, 'w') as f:
+                f.write("a\nb\nc\n")
+            paths.append(path)
+        subprocess.run(['git', 'add', '.'], check=True)
+        subprocess.run(['git', 'commit', '-qm', 'base'], check=True)
+        return paths
+    
+    def test_get_batch_diff_stats_matches_per_file(self):
+        """Batch stats equal per-file stats, including paths with glob characters."""
+        analyzer = GitDiffAnalyzer()
+        paths = self._commit_files(5)
+        with open(paths[0], 'a') as f:
+            f.write("d\ne\n")
+        with open(paths[1], 'w') as f:
+            f.write("a\n")
+        
+        stats = analyzer.get_batch_diff_stats(paths + ["untracked.py"], self.temp_dir)
+        
+        self.assertEqual(stats[paths[0]], (2, 0))
+        self.assertEqual(stats[paths[1]], (0, 2))
+        self.assertEqual(stats[paths[2]], (0, 0))
+        self.assertEqual(stats["untracked.py"], (0, 0))
+        for path in paths:
+            self.assertEqual(stats[path], analyzer.get_diff_stats(path, self.temp_dir))
+    
+    def test_head_commit_cache_follows_new_commits(self):
+        """Cached HEAD hash changes after a commit or checkout."""
+        self._commit_files(1)
+        cache = HeadCommitCache(self.temp_dir)
+        first = cache.get()
+        self.assertEqual(len(first), 12)
+        self.assertEqual(cache.get(), first)
+        
+        subprocess.run(['git', 'commit', '-q', '--allow-empty', '-m', 'next'], check=True)
+        second = cache.get()
+        self.assertNotEqual(second, first)
+        
+        subprocess.run(['git', 'checkout', '-q', '--detach', 'HEAD~1'], check=True)
+        self.assertEqual(cache.get(), first)
+
+
+class TestParseNumstatZ(unittest.TestCase):
+    """Test cases for parse_numstat_z."""
+    
+    def test_parse_records_renames_and_binary(self):
+        """Renames are reported under the new path and binary counts as 0."""
+        output = "3\t1\ta.py\0" "-\t-\timg.png\0" "2\t0\t\0old.py\0new.py\0"
+        
+        self.assertEqual(
+            parse_numstat_z(output),
+            {"a.py": (3, 1), "img.png": (0, 0), "new.py": (2, 0)}
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Tests for PooledTransport and PooledPostgRESTClient.
+
+Last Updated: 2025-12-05
+"""
+
+import socket
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from veroscore_v3 import http_transport
+from veroscore_v3.http_transport import PooledTransport, TimingHistogram, TransportError
+from veroscore_v3.postgrest_client import PooledPostgRESTClient, PostgRESTError
+from veroscore_v3.supabase_schema_helper import SupabaseSchemaHelper
+from veroscore_v3.tests.postgrest_stand_in import PostgRESTStandIn
+
+
+class _EchoServer:
+    """HTTP/1.1 server answering "ok"; can drop connections or hold requests."""
+
+    def __init__(self, close_after_reply=False, delay=0.0):
+        self.active = 0
+        self.max_active = 0
+        self.posts = 0
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with server.lock:
+                    server.active += 1
+                    server.max_active = max(server.max_active, server.active)
+                time.sleep(delay)
+                with server.lock:
+                    server.active -= 1
+                self.send_response(200)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"ok")
+                # Advertise keep-alive but hang up, like a server idle timeout
+                self.close_connection = close_after_reply
+
+            def do_POST(self):
+                # Take the request, then hang up without replying
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with server.lock:
+                    server.posts += 1
+                self.close_connection = True
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestPooledTransport(unittest.TestCase):
+    """Connection reuse, limits and timing."""
+
+    def test_sequential_requests_reuse_one_connection(self):
+        server = _EchoServer()
+        transport = PooledTransport()
+        try:
+            for _ in range(20):
+                self.assertEqual(transport.request("GET", server.url).body, b"ok")
+            stats = next(iter(transport.stats().values()))
+            self.assertEqual(stats['connections_opened'], 1)
+            self.assertEqual(stats['connections_reused'], 19)
+            self.assertEqual(stats['timing']['count'], 20)
+        finally:
+            transport.close()
+            server.close()
+
+    def test_retries_connection_closed_by_server(self):
+        """A reused connection the server already closed is replaced transparently."""
+        server = _EchoServer(close_after_reply=True)
+        transport = PooledTransport()
+        try:
+            for _ in range(3):
+                self.assertEqual(transport.request("GET", server.url).status, 200)
+            self.assertEqual(next(iter(transport.stats().values()))['connections_opened'], 3)
+        finally:
+            transport.close()
+            server.close()
+
+    def test_post_is_not_resent_after_reaching_server(self):
+        """A POST lost on a reused connection after it was sent fails instead of being sent twice."""
+        server = _EchoServer()
+        transport = PooledTransport()
+        try:
+            transport.request("GET", server.url)
+            with self.assertRaises(TransportError) as raised:
+                transport.request("POST", server.url, body=b"{}")
+            self.assertTrue(raised.exception.sent)
+            self.assertEqual(server.posts, 1)
+        finally:
+            transport.close()
+            server.close()
+
+    def test_refused_connection_is_not_sent(self):
+        """A request that never reached a server is reported as unsent."""
+        listener = socket.socket()
+        listener.bind(("127.0.0.1", 0))
+        port = listener.getsockname()[1]
+        listener.close()
+        transport = PooledTransport()
+        try:
+            with self.assertRaises(TransportError) as raised:
+                transport.request("POST", f"http://127.0.0.1:{port}/", body=b"{}")
+            self.assertFalse(raised.exception.sent)
+        finally:
+            transport.close()
+
+    def test_per_host_connection_limit(self):
+        server = _EchoServer(delay=0.05)
+        transport = PooledTransport(max_connections_per_host=2)
+        try:
+            threads = [threading.Thread(target=transport.request, args=("GET", server.url)) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertLessEqual(server.max_active, 2)
+            self.assertLessEqual(next(iter(transport.stats().values()))['connections_opened'], 2)
+        finally:
+            transport.close()
+            server.close()
+
+    def test_histogram_percentiles(self):
+        histogram = TimingHistogram()
+        for elapsed in [0.5] * 90 + [150.0] * 10:
+            histogram.observe(elapsed)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot['p50_ms'], 1)
+        self.assertEqual(snapshot['p95_ms'], 200)
+        self.assertEqual(snapshot['buckets'], {"<=1": 90, "<=200": 10})
+
+    def test_invalid_env_limits_fall_back_to_defaults(self):
+        env = {"VEROSCORE_HTTP_MAX_CONNECTIONS": "ten", "VEROSCORE_HTTP_TIMEOUT": "-1"}
+        with mock.patch.dict("os.environ", env), mock.patch.object(http_transport, "_shared_transport", None):
+            transport = http_transport.get_shared_transport()
+        self.assertEqual(transport.max_connections_per_host, http_transport.DEFAULT_MAX_CONNECTIONS_PER_HOST)
+        self.assertEqual(transport.timeout, http_transport.DEFAULT_TIMEOUT)
+
+
+class TestPooledPostgRESTClient(unittest.TestCase):
+    """Query builder against PostgRESTStandIn."""
+
+    def test_query_builder_round_trip(self):
+        with PostgRESTStandIn() as stand_in:
+            transport = PooledTransport()
+            client = PooledPostgRESTClient(stand_in.url, "key", transport=transport)
+            table = client.schema("veroscore").table("changes_queue")
+
+            inserted = table.insert([{"id": i, "session_id": "s1", "processed": False} for i in range(3)]).execute()
+            client.schema("veroscore").table("changes_queue").update({"processed": True}).eq("id", 0).execute()
+            pending = (
+                client.schema("veroscore").table("changes_queue")
+                .select("id", count="exact")
+                .eq("session_id", "s1")
+                .eq("processed", False)
+                .execute()
+            )
+
+            self.assertEqual(len(inserted.data), 3)
+            self.assertEqual(pending.count, 2)
+            self.assertEqual(sorted(row["id"] for row in pending.data), [1, 2])
+            self.assertTrue(all(profile == "veroscore" for _, _, profile in stand_in.requests))
+            self.assertEqual(next(iter(transport.stats().values()))['connections_opened'], 1)
+            transport.close()
+
+    def test_error_status_raises(self):
+        with PostgRESTStandIn(expose_schema=False) as stand_in:
+            client = PooledPostgRESTClient(stand_in.url, "key", transport=PooledTransport())
+            with self.assertRaises(PostgRESTError) as ctx:
+                client.schema("veroscore").table("sessions").select("*").execute()
+            self.assertEqual(ctx.exception.status, 406)
+            self.assertIsInstance(ctx.exception, RuntimeError)
+
+    def test_schema_helper_writes_over_one_connection(self):
+        """Session writes through SupabaseSchemaHelper share a keep-alive connection."""
+        with PostgRESTStandIn() as stand_in:
+            stand_in.tables["sessions"] = [{"session_id": "s1", "total_files": 0, "total_lines_added": 0, "total_lines_removed": 0}]
+            transport = PooledTransport()
+            helper = SupabaseSchemaHelper(PooledPostgRESTClient(stand_in.url, "key", transport=transport))
+
+            for _ in range(5):
+                helper.insert_changes("s1", [{"path": "a.py", "lines_added": 1, "lines_removed": 0}])
+                helper.increment_session_stats("s1", 1, 1, 0)
+
+            self.assertEqual(len(stand_in.tables["changes_queue"]), 5)
+            self.assertEqual(stand_in.tables["sessions"][0]["total_files"], 5)
+            self.assertEqual(next(iter(transport.stats().values()))['connections_opened'], 1)
+            transport.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
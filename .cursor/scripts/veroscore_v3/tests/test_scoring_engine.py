@@ -6,6 +6,7 @@ Tests all components:
 - CategoryScore
 - StabilizationFunction
 - FileAnalyzer
+- FileFeatures
 - PipelineComplianceDetector
 - HybridScoringEngine
 """
@@ -30,8 +31,11 @@ from veroscore_v3.scoring_engine import (
     ScoringWeights,
     StabilizationFunction,
     FileAnalyzer,
+    FileFeatures,
     PipelineComplianceDetector,
-    HybridScoringEngine
+    HybridScoringEngine,
+    score_code_quality,
+    score_documentation
 )
 from veroscore_v3.detection_functions import ViolationResult
 
@@ -133,6 +137,40 @@ def validate_input(data: str) -> bool:
         self.assertGreater(score, 0)
 
 
+class TestFileFeatures(unittest.TestCase):
+    """Test FileFeatures extraction and the scoring functions built on it"""
+    
+    def test_line_features(self):
+        """Comment lines, long functions and mixed indentation"""
+        content = "# header\n  // note\nx = 1  # trailing\n\tdef short():\n    pass\n"
+        features = FileFeatures.extract("app.py", content)
+        self.assertEqual(features.line_count, 6)
+        self.assertEqual(features.comment_lines, 2)
+        self.assertFalse(features.has_long_functions)
+        self.assertFalse(features.has_mixed_indentation)
+        
+        # 51 lines from "def" to end of file (including the empty last line) is long
+        self.assertTrue(FileFeatures.extract("app.py", "def run():\n" + "    step()\n" * 49).has_long_functions)
+        self.assertFalse(FileFeatures.extract("app.py", "def run():\n" + "    step()\n" * 48).has_long_functions)
+        
+    def test_const_arrow_function_needs_const_on_same_line(self):
+        body = "    step();\n" * 55
+        self.assertTrue(FileFeatures.extract("a.ts", "const run = () => {\n" + body).has_long_functions)
+        self.assertFalse(FileFeatures.extract("a.ts", "let run = () => {\n" + body).has_long_functions)
+        
+    def test_test_keywords_only_for_test_files(self):
+        content = "describe('edge cases', () => {})"
+        self.assertTrue(FileFeatures.extract("user.spec.ts", content).has_test_structure)
+        self.assertFalse(FileFeatures.extract("user.ts", content).has_test_structure)
+        
+    def test_scores_match_file_analyzer(self):
+        content = "# 2019 TODO\n" + "def handler(request):\n    return validate(request.session)\n" * 4
+        analyzer = FileAnalyzer("api/handler.py", content)
+        self.assertEqual(analyzer.analyze_code_quality(), score_code_quality(analyzer.features))
+        self.assertEqual(analyzer.analyze_code_quality(), 2.0)
+        self.assertEqual(score_documentation(analyzer.features), -3.0)
+
+
 class TestPipelineComplianceDetector(unittest.TestCase):
     """Test PipelineComplianceDetector"""
     
@@ -206,6 +244,21 @@ class TestHybridScoringEngine(unittest.TestCase):
         self.assertGreaterEqual(result.stabilized_score, 0.0)
         self.assertLessEqual(result.stabilized_score, 10.0)
         
+    def test_precomputed_file_scores(self):
+        """score_pr with file_scores from score_files matches scoring inline"""
+        changed_files = [
+            {'path': 'src/api/users.ts', 'content': 'export function list(): string[] { return []; }'},
+            {'path': 'tests/test_users.py', 'content': 'def test_empty():\n    assert list() == []\n'}
+        ]
+        kwargs = dict(pr_number=2, repository='test/repo', author='testuser',
+                      changed_files=changed_files, pr_description="Test PR")
+        
+        inline = self.engine.score_pr(**kwargs)
+        precomputed = self.engine.score_pr(**kwargs, file_scores=self.engine.score_files(changed_files))
+        
+        self.assertEqual(precomputed.raw_score, inline.raw_score)
+        self.assertEqual(precomputed.code_quality, inline.code_quality)
+        
     def test_score_pr_with_violations(self):
         """Test PR scoring with violations"""
         changed_files = [
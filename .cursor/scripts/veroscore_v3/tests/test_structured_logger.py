@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for StructuredLogger level gating, lazy formatting and the async sink.
+
+Last Updated: 2025-12-05
+"""
+
+import io
+import json
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import logger_util
+from logger_util import StructuredFormatter, StructuredLogger
+
+
+class _Counted:
+    """Argument that counts how often it's formatted."""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "counted"
+
+
+class TestStructuredLogger(unittest.TestCase):
+    """Gating, JSON output and the batching sink."""
+
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.log = StructuredLogger(f"test.{self._testMethodName}")
+        self.log.logger.propagate = False
+        self.log.logger.handlers[0].setStream(self.stream)
+
+    def _entries(self):
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    def test_suppressed_levels_do_no_work(self):
+        arg = _Counted()
+        self.log.debug("Checked %s", arg, operation="test", payload=arg)
+        self.assertFalse(self.log.is_enabled_for("DEBUG"))
+        self.assertEqual(self.stream.getvalue(), "")
+        self.assertEqual(arg.formatted, 0)
+
+    def test_emitted_record_is_structured_json(self):
+        self.log.warning("Read %s files", 3, operation="scan", error_code="SLOW", extra_field={"a": 1})
+        entry, = self._entries()
+        self.assertEqual(entry["message"], "Read 3 files")
+        self.assertEqual(entry["level"], "WARN")
+        self.assertEqual(entry["operation"], "scan")
+        self.assertEqual(entry["errorCode"], "SLOW")
+        self.assertEqual(entry["extra_field"], {"a": 1})
+        self.assertIn("traceId", entry)
+        self.assertEqual(list(entry)[:3], ["timestamp", "level", "message"])
+
+    def test_async_sink_batches_lines_to_file(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            log_file = Path(temp_dir) / "log.jsonl"
+            sink = logger_util.enable_async_logging(file_path=log_file)
+            try:
+                for i in range(200):
+                    self.log.info("line %d", i, operation="test")
+            finally:
+                logger_util.disable_async_logging()
+
+            messages = [json.loads(line)["message"] for line in log_file.read_text().splitlines()]
+            self.assertEqual(messages, [f"line {i}" for i in range(200)])
+            self.assertEqual(sink.lines_written, 200)
+            self.assertLessEqual(sink.batches_written, 200)
+            # Synchronous handler restored
+            self.log.info("after", operation="test")
+            self.assertEqual(self._entries()[-1]["message"], "after")
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs os.fork")
+    def test_forked_child_logs_synchronously(self):
+        """A forked worker writes through the console handler, not the parent's queue."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            logger_util.enable_async_logging(file_path=Path(temp_dir) / "log.jsonl")
+            try:
+                read_fd, write_fd = os.pipe()
+                pid = os.fork()
+                if pid == 0:  # pragma: no cover - runs in the child
+                    try:
+                        self.log.info("from child", operation="test")
+                        ok = logger_util._async_sink is None and self.stream.getvalue() != ""
+                        os.write(write_fd, b"1" if ok else b"0")
+                    finally:
+                        os._exit(0)
+                os.close(write_fd)
+                result = os.read(read_fd, 1)
+                os.close(read_fd)
+                os.waitpid(pid, 0)
+                self.assertEqual(result, b"1")
+                self.assertIsNotNone(logger_util._async_sink)
+            finally:
+                logger_util.disable_async_logging()
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_formatter_passes_plain_records_through(self):
+        record = logging.LogRecord("plain", logging.INFO, __file__, 1, "hello %s", ("you",), None)
+        self.assertEqual(json.loads(StructuredFormatter().format(record))["message"], "hello you")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Tests for TTLCache and the session / idempotency key caches.
+
+Last Updated: 2025-12-05
+"""
+
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from veroscore_v3.http_transport import PooledTransport
+from veroscore_v3.idempotency_manager import IdempotencyManager
+from veroscore_v3.postgrest_client import PooledPostgRESTClient
+from veroscore_v3.supabase_schema_helper import SupabaseSchemaHelper
+from veroscore_v3.tests.postgrest_stand_in import PostgRESTStandIn
+from veroscore_v3.ttl_cache import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    """Expiry, eviction, invalidation and the SQLite mirror."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_hit_miss_and_expiry(self):
+        cache = TTLCache("test", ttl_seconds=0.05)
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", {"n": 1})
+        self.assertEqual(cache.get("a"), {"n": 1})
+        time.sleep(0.06)
+        self.assertIsNone(cache.get("a"))
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['expirations']), (1, 2, 1))
+
+    def test_values_are_copies(self):
+        """Modifying a returned row doesn't change the cached row."""
+        cache = TTLCache("test", ttl_seconds=60)
+        cache.put("s", {"prs": [1]})
+        cache.get("s")["prs"].append(2)
+        self.assertEqual(cache.get("s"), {"prs": [1]})
+
+    def test_lru_eviction_and_invalidate(self):
+        cache = TTLCache("test", ttl_seconds=60, max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        cache.invalidate("a")
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_mirror_survives_restart(self):
+        mirror = Path(self.temp_dir) / "cache.db"
+        first = TTLCache("keys", ttl_seconds=60, mirror_path=mirror)
+        first.put("k1", {"status": "completed"})
+        first.put("k2", {"status": "processing"})
+        first.invalidate("k2")
+        first.close()
+
+        second = TTLCache("keys", ttl_seconds=60, mirror_path=mirror)
+        self.assertEqual(second.get("k1"), {"status": "completed"})
+        self.assertIsNone(second.get("k2"))
+        self.assertEqual(second.stats()['mirror_hits'], 1)
+        self.assertIsNone(TTLCache("other", ttl_seconds=60, mirror_path=mirror).get("k1"))
+
+    def test_mirror_reads_respect_max_entries(self):
+        mirror = Path(self.temp_dir) / "cache.db"
+        first = TTLCache("keys", ttl_seconds=60, mirror_path=mirror)
+        for i in range(5):
+            first.put(f"k{i}", i)
+        first.close()
+
+        second = TTLCache("keys", ttl_seconds=60, max_entries=2, mirror_path=mirror)
+        for i in range(5):
+            self.assertEqual(second.get(f"k{i}"), i)
+        self.assertEqual(second.stats()['size'], 2)
+        self.assertEqual(second.stats()['evictions'], 3)
+        second.close()
+
+
+class TestRowCaches(unittest.TestCase):
+    """Session and idempotency key lookups against PostgRESTStandIn."""
+
+    def _client(self, stand_in):
+        return PooledPostgRESTClient(stand_in.url, "key", transport=PooledTransport())
+
+    def test_session_reads_are_cached_and_writes_invalidate(self):
+        with PostgRESTStandIn() as stand_in:
+            stand_in.tables["sessions"] = [{"session_id": "s1", "total_files": 0, "total_lines_added": 0, "total_lines_removed": 0}]
+            helper = SupabaseSchemaHelper(self._client(stand_in))
+            helper._should_use_rpc()  # One-time schema exposure probe
+
+            for _ in range(5):
+                helper.get_session("s1")
+            self.assertEqual(stand_in.count("GET", "/rest/v1/sessions"), 2)  # Probe + one read
+
+            helper.increment_session_stats("s1", 3, 10, 2)
+            self.assertEqual(helper.get_session("s1")["total_files"], 3)
+            self.assertEqual(stand_in.count("GET", "/rest/v1/sessions"), 3)
+            self.assertEqual(helper.session_cache.stats()['hits'], 4)
+
+    def test_stats_fallback_reads_uncached_row(self):
+        """The read-and-update fallback never adds to a cached total."""
+        with PostgRESTStandIn() as stand_in:
+            stand_in.tables["sessions"] = [{"session_id": "s1", "total_files": 0, "total_lines_added": 0, "total_lines_removed": 0}]
+            helper = SupabaseSchemaHelper(self._client(stand_in))
+            helper._use_rpc = False
+            helper._stats_rpc_available = False
+            helper.get_session("s1")
+            stand_in.tables["sessions"][0]["total_files"] = 7  # Written by another process
+
+            helper.increment_session_stats("s1", 1, 0, 0)
+
+            self.assertEqual(stand_in.tables["sessions"][0]["total_files"], 8)
+
+    def test_idempotency_lookups_are_cached(self):
+        with PostgRESTStandIn() as stand_in:
+            stand_in.tables["idempotency_keys"] = []
+            manager = IdempotencyManager(self._client(stand_in))
+
+            self.assertEqual(manager.get_or_create_key("create_pr", "s1"), (None, True))
+            self.assertEqual(manager.get_or_create_key("create_pr", "s1"), (None, False))
+            manager.mark_completed("create_pr", "s1", {"pr_number": 42})
+            self.assertEqual(manager.get_or_create_key("create_pr", "s1"), ({"pr_number": 42}, False))
+
+            self.assertEqual(stand_in.count("GET", "/rest/v1/idempotency_keys"), 1)
+            self.assertEqual(stand_in.tables["idempotency_keys"][0]["status"], "completed")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -177,38 +177,8 @@ class ThresholdChecker:
             return False, f"Threshold check failed: {str(e)}"
     
     def _get_session_data(self, session_id: str) -> Optional[Dict[str, Any]]:
-        """Get session data from Supabase."""
-        try:
-            # Use .schema() method for direct access
-            if hasattr(self.session_manager.supabase, 'schema'):
-                result = (
-                    self.session_manager.supabase.schema("veroscore")
-                    .table("sessions")
-                    .select("*")
-                    .eq("session_id", session_id)
-                    .limit(1)
-                    .execute()
-                )
-            else:
-                result = (
-                    self.session_manager.supabase.table("veroscore.sessions")
-                    .select("*")
-                    .eq("session_id", session_id)
-                    .limit(1)
-                    .execute()
-                )
-            if result.data and len(result.data) > 0:
-                return result.data[0]
-            return None
-        except Exception as e:
-            logger.error(
-                "Failed to get session data",
-                operation="_get_session_data",
-                error_code="SESSION_DATA_GET_FAILED",
-                root_cause=str(e),
-                session_id=session_id
-            )
-            return None
+        """Get session data (served from the session cache within its TTL)."""
+        return self.session_manager._get_session(session_id)
     
     def _get_pending_changes_count(self, session_id: str) -> int:
         """Get count of pending changes in queue."""
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+TTLCache - Process-local cache for Supabase rows (sessions, idempotency keys).
+
+Threshold checks, idempotency lookups and session stats updates in the
+auto-PR loop re-read the same rows many times a minute. Rows are kept for a
+short TTL and invalidated (or overwritten) by the code that writes them, so
+repeated reads within the window cost no network round trip. An optional
+SQLite mirror keeps entries across restarts.
+
+Last Updated: 2025-12-05
+"""
+
+import copy
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from logger_util import get_logger
+
+logger = get_logger(context="TTLCache")
+
+
+# Lookups between hit-rate reports through the structured logger
+DEFAULT_REPORT_EVERY = 500
+
+
+class TTLCache:
+    """
+    Thread-safe TTL + LRU cache with optional SQLite mirror.
+
+    Features:
+    - Entries expire ttl_seconds after they were stored
+    - Least recently used entries are evicted beyond max_entries
+    - invalidate()/put() for explicit invalidation and write-through on writes
+    - Hit/miss counters, reported through the structured logger
+    - Optional SQLite mirror (mirror_path) that survives restarts
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: float,
+        max_entries: int = 1024,
+        mirror_path: Optional[Path] = None,
+        report_every: int = DEFAULT_REPORT_EVERY
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            name: Cache name (used in log records and as the mirror namespace)
+            ttl_seconds: Seconds an entry stays valid (0 disables caching)
+            max_entries: Maximum in-memory entries
+            mirror_path: SQLite file mirroring the cache (None: memory only)
+            report_every: Log hit rates every this many lookups (0: never)
+        """
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self.report_every = report_every
+        # key -> (monotonic expiry, value)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._mirror: Optional[sqlite3.Connection] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.mirror_hits = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+        if mirror_path is not None and ttl_seconds > 0:
+            self._open_mirror(Path(mirror_path))
+
+    def _open_mirror(self, path: Path):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, PRIMARY KEY (namespace, key))"
+            )
+            conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),))
+            self._mirror = conn
+        except (sqlite3.Error, OSError) as e:
+            logger.warn(
+                "Cache mirror unavailable, caching in memory only",
+                operation="_open_mirror",
+                error_code="CACHE_MIRROR_UNAVAILABLE",
+                root_cause=str(e),
+                cache=self.name,
+                mirror_path=str(path)
+            )
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss (None values are not cached)
+        """
+        if self.ttl_seconds <= 0:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    self._maybe_report()
+                    # Callers may modify rows (e.g. append to a list column)
+                    return copy.deepcopy(entry[1])
+                del self._entries[key]
+                self.expirations += 1
+            value = self._mirror_get(key, now)
+            if value is not None:
+                self.hits += 1
+                self.mirror_hits += 1
+            else:
+                self.misses += 1
+            self._maybe_report()
+            return copy.deepcopy(value)
+
+    def put(self, key: str, value: Any):
+        """
+        Store a value (write-through after a successful remote write or read).
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value (None invalidates the key)
+        """
+        if value is None:
+            self.invalidate(key)
+            return
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._store(key, time.monotonic() + self.ttl_seconds, copy.deepcopy(value))
+            if self._mirror is not None:
+                try:
+                    self._mirror.execute(
+                        "INSERT OR REPLACE INTO cache_entries VALUES (?, ?, ?, ?)",
+                        (self.name, key, json.dumps(value, default=str), time.time() + self.ttl_seconds)
+                    )
+                except (sqlite3.Error, TypeError, ValueError) as e:
+                    logger.debug(
+                        "Cache mirror write failed",
+                        operation="put",
+                        cache=self.name,
+                        root_cause=str(e)
+                    )
+
+    def _store(self, key: str, expires: float, value: Any):
+        """Insert an entry as most recently used, evicting beyond max_entries (lock held)."""
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: str):
+        """Drop a key (call after writing the row it caches)."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self.invalidations += 1
+            if self._mirror is not None:
+                try:
+                    self._mirror.execute(
+                        "DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (self.name, key)
+                    )
+                except sqlite3.Error:
+                    pass
+
+    def clear(self):
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            if self._mirror is not None:
+                try:
+                    self._mirror.execute("DELETE FROM cache_entries WHERE namespace = ?", (self.name,))
+                except sqlite3.Error:
+                    pass
+
+    def _mirror_get(self, key: str, now: float) -> Optional[Any]:
+        """Read a key from the SQLite mirror into memory (lock held)."""
+        if self._mirror is None:
+            return None
+        try:
+            row = self._mirror.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.name, key)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        remaining = row[1] - time.time()
+        if remaining <= 0:
+            return None
+        value = json.loads(row[0])
+        self._store(key, now + remaining, value)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, mirror_hits, size,
+            expirations, evictions and invalidations
+        """
+        with self._lock:
+            return self._stats()
+
+    def _stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'mirror_hits': self.mirror_hits,
+            'size': len(self._entries),
+            'expirations': self.expirations,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+        }
+
+    def _maybe_report(self):
+        """Log hit rates every report_every lookups (lock held)."""
+        lookups = self.hits + self.misses
+        if self.report_every and lookups % self.report_every == 0:
+            logger.info("Cache hit rate", operation="cache_stats", cache=self.name, **self._stats())
+
+    def log_stats(self):
+        """Log hit rates now (e.g. on shutdown)."""
+        logger.info("Cache hit rate", operation="cache_stats", cache=self.name, **self.stats())
+
+    def close(self):
+        """Close the SQLite mirror."""
+        with self._lock:
+            if self._mirror is not None:
+                self._mirror.close()
+                self._mirror = None
@@ -19,8 +19,8 @@ import time
 import signal
 import subprocess
 from pathlib import Path
-from typing import Optional
-from threading import Timer
+from typing import Optional, Set
+from threading import Lock, Timer
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -42,6 +42,13 @@ except ImportError:
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger("watch_files")
 
+# Import enforcer daemon client (optional)
+try:
+    from enforcement.core.enforcer_daemon import daemon_supported, get_daemon_socket_path, request_check
+    DAEMON_CLIENT_AVAILABLE = daemon_supported()
+except ImportError:
+    DAEMON_CLIENT_AVAILABLE = False
+
 # Import workflow tracker (optional)
 try:
     context_manager_path = project_root / ".cursor" / "context_manager"
@@ -76,6 +83,7 @@ class EnforcementHandler(FileSystemEventHandler):
     - Debouncing to prevent excessive enforcement runs
     - Filters for relevant file types
     - Logs file change events
+    - Sends runs to a warm enforcer daemon when one is running
     """
     
     def __init__(self, debounce_seconds: float = 2.0):
@@ -91,6 +99,11 @@ class EnforcementHandler(FileSystemEventHandler):
         self.project_root = Path(__file__).parent.parent.parent
         self.enforcer_script = self.project_root / ".cursor" / "scripts" / "auto-enforcer.py"
         
+        # Files changed since the last run (sent to the enforcer daemon)
+        self.pending_paths: Set[str] = set()
+        self.pending_lock = Lock()
+        self.use_daemon = DAEMON_CLIENT_AVAILABLE and os.getenv("ENFORCER_DAEMON", "1") != "0"
+        
         # Initialize workflow tracker (if available)
         self.workflow_tracker = None
         if WORKFLOW_TRACKER_AVAILABLE:
@@ -183,6 +196,13 @@ class EnforcementHandler(FileSystemEventHandler):
                     root_cause=str(e)
                 )
         
+        try:
+            changed_path = str(Path(event.src_path).relative_to(self.project_root))
+        except ValueError:
+            changed_path = event.src_path
+        with self.pending_lock:
+            self.pending_paths.add(changed_path.replace('\\', '/'))
+        
         # Cancel existing timer if present
         if self.debounce_timer and self.debounce_timer.is_alive():
             self.debounce_timer.cancel()
@@ -192,7 +212,14 @@ class EnforcementHandler(FileSystemEventHandler):
         self.debounce_timer.start()
     
     def run_enforcer(self):
-        """Run the auto-enforcer script."""
+        """Run the auto-enforcer (via the daemon if one is running, else as a subprocess)."""
+        with self.pending_lock:
+            changed_paths = sorted(self.pending_paths)
+            self.pending_paths.clear()
+        
+        if self.use_daemon and self._run_enforcer_via_daemon(changed_paths):
+            return
+        
         try:
             logger.info(
                 "Running auto-enforcer",
@@ -237,6 +264,52 @@ class EnforcementHandler(FileSystemEventHandler):
             )
 
 
+    def _run_enforcer_via_daemon(self, changed_paths) -> bool:
+        """
+        Ask a running enforcer daemon to check the files changed since the last run.
+        
+        Returns:
+            True if the daemon took the request, False to fall back to a subprocess
+        """
+        try:
+            response = request_check(
+                get_daemon_socket_path(self.project_root),
+                paths=changed_paths or None,
+                changed_paths=changed_paths,
+                timeout=180
+            )
+        except (OSError, ValueError) as e:
+            # The request was sent, so the daemon may still be running it; a
+            # subprocess now would write the session concurrently with it
+            logger.error(
+                "Enforcer daemon did not return a result, not re-running the check",
+                operation="run_enforcer",
+                error_code="ENFORCER_DAEMON_FAILED",
+                root_cause=str(e)
+            )
+            return True
+        
+        if response is None:
+            return False
+        if not response.get('ok'):
+            logger.warn(
+                "Enforcer daemon returned an error, falling back to subprocess",
+                operation="run_enforcer",
+                error_code="ENFORCER_DAEMON_FAILED",
+                root_cause=str(response.get('error'))
+            )
+            return False
+        
+        logger.info(
+            "Auto-enforcer completed via daemon",
+            operation="run_enforcer",
+            return_code=response.get('exit_code'),
+            duration_ms=response.get('duration_ms'),
+            changed_files=len(changed_paths)
+        )
+        return True
+
+
 class RuleFileUpdateHandler(FileSystemEventHandler):
     """
     File system event handler that updates rule files when core context source files change.
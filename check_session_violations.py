@@ -1,14 +1,15 @@
 #!/usr/bin/env python3
 """Check session violations structure."""
-import json
 from pathlib import Path
 
-session_file = Path('.cursor/enforcement/session.json')
-if session_file.exists():
-    with open(session_file, 'r') as f:
-        data = json.load(f)
+from enforcement.core.session_state import load_session, session_mtime_ns
+
+# session.db; a legacy session.json is migrated on load
+enforcement_dir = Path('.cursor/enforcement')
+if session_mtime_ns(enforcement_dir) is not None:
+    session, _ = load_session(enforcement_dir)
     
-    violations = data.get('violations', [])
+    violations = session.violations
     date_violations = [v for v in violations if '02-core' in v.get('rule_ref', '')]
     
     print(f'Total violations in session: {len(violations)}')
@@ -4,17 +4,18 @@
 import json
 from pathlib import Path
 
-# Check session state
-session_file = Path('.cursor/enforcement/session.json')
-if session_file.exists():
-    with open(session_file, 'r', encoding='utf-8') as f:
-        session = json.load(f)
+from enforcement.core.session_state import load_session, session_mtime_ns
+
+# Check session state (session.db; a legacy session.json is migrated on load)
+enforcement_dir = Path('.cursor/enforcement')
+if session_mtime_ns(enforcement_dir) is not None:
+    session, _ = load_session(enforcement_dir)
     
     print("=== Session State ===")
-    print(f"Session violations: {len(session.get('violations', []))}")
-    print(f"Session start: {session.get('start_time', 'N/A')}")
-    print(f"File hashes count: {len(session.get('file_hashes', {}))}")
-    print(f"Session version: {session.get('version', 'N/A')}")
+    print(f"Session violations: {len(session.violations)}")
+    print(f"Session start: {session.start_time or 'N/A'}")
+    print(f"File hashes count: {len(session.file_hashes or {})}")
+    print(f"Session version: {session.version or 'N/A'}")
     print()
 
 # Check report
@@ -86,7 +86,8 @@ def cmd_compile(args):
         str(input_path),
         str(output_path),
         diagnostics_path=args.diagnostics,
-        namespace=namespace
+        namespace=namespace,
+        workers=args.workers
     )
     
     if exit_code != 0:
@@ -334,6 +335,7 @@ def main():
     compile_parser.add_argument('output', help='Output SSM file')
     compile_parser.add_argument('--namespace', help='Namespace for compilation')
     compile_parser.add_argument('--diagnostics', help='Path to diagnostics JSON file')
+    compile_parser.add_argument('--workers', type=int, help='Processes for chapter extraction (default: serial)')
     compile_parser.set_defaults(func=cmd_compile)
     
     # Validate command
@@ -53,17 +53,13 @@ if str(current_dir) not in sys.path:
     sys.path.insert(0, str(current_dir))
 
 from modules.parser_markdown import parse_markdown_to_ast
-from modules.extractor_terms import extract_terms_from_ast as extract_terms
-
-# Solution 3: AST-Based Term Extraction
-try:
-    from modules.extractor_terms_v3 import extract_terms_from_ast_v3
-    USE_V3_TERM_EXTRACTION = True
-except ImportError:
-    extract_terms_from_ast_v3 = None  # type: ignore
-    USE_V3_TERM_EXTRACTION = False
-from modules.extractor_code import extract_code_entries
-from modules.extractor_relations import extract_relations_from_ast
+from modules.chapter_extraction import (
+    partition_chapters,
+    extract_chapters,
+    extract_chapters_late,
+    merge_chapter_extractions,
+    merge_late_extractions,
+)
 
 # Solution 2: Semantic Relation Extraction
 try:
@@ -71,8 +67,6 @@ try:
 except ImportError:
     SemanticRelationExtractor = None  # type: ignore
 from modules.enrichment_v3.concept_graph import enrich_concept_graph
-from modules.extractor_diagrams import extract_diagrams_from_ast
-from modules.extractor_tables import extract_tables_from_ast
 from modules.parser_ssm import ast_to_ssm_blocks, build_block_index
 
 # Solution 4: Missing block type extractors (optional)
@@ -113,7 +107,7 @@ except ImportError:
 
 # Phase 9: Incremental Builds (Cache)
 try:
-    from runtime.cache import CompileCache, CompileState, ChapterHash, compute_content_hash, compute_chapter_hash
+    from runtime.cache import CHAPTER_CACHE_DIR, CompileCache, CompileState, ChapterHash, compute_content_hash, compute_chapter_hash
 except ImportError:
     CompileCache = None  # type: ignore
     CompileState = None  # type: ignore
@@ -149,6 +143,7 @@ def compile_markdown_to_ssm_v3(
     compiler_version: str = "3.0.0",  # NEW - Phase 5
     ssm_schema_version: str = "1.0.0",  # NEW - Phase 5
     source_file: Optional[str] = None,  # NEW - Solution 5
+    workers: Optional[int] = None,
 ) -> Tuple[str, Diagnostics]:
     """
     Compile markdown to SSM v3 format.
@@ -165,6 +160,8 @@ def compile_markdown_to_ssm_v3(
         input_text: Raw markdown text
         errors: ErrorBus instance (optional, creates new if None)
         symbols: SymbolTable instance (optional, creates new if None)
+        workers: Processes for chapter extraction (None or 1 = serial);
+            the output is identical either way
     
     Returns:
         Tuple of (ssm_output, diagnostics_dict)
@@ -188,7 +185,13 @@ def compile_markdown_to_ssm_v3(
     if source_file and CompileCache is not None:
         try:
             from pathlib import Path
-            cache = CompileCache(Path(source_file).parent / ".biblec.state.json")
+            source_path = Path(source_file)
+            # One chapter directory per source: prune_chapters() deletes
+            # every record this compile didn't use
+            cache = CompileCache(
+                source_path.parent / ".biblec.state.json",
+                chapter_dir=source_path.parent / CHAPTER_CACHE_DIR / source_path.name
+            )
             cache.load()
         except (FileNotFoundError, json.JSONDecodeError, KeyError, ValueError) as e:
             # Cache loading is optional, but log the error for debugging
@@ -249,74 +252,32 @@ def compile_markdown_to_ssm_v3(
                     context="Semantic validation phase"
                 )
     
-    # Step 2: Extract terms, code, relations, diagrams
-    if logger:
-        logger.progress("Extracting terms", operation="extract_blocks", stage="terms")
-    # Solution 3: Use AST-based term extraction if available
-    if USE_V3_TERM_EXTRACTION and extract_terms_from_ast_v3 is not None:
-        terms = extract_terms_from_ast_v3(ast, errors=errors, symbols=symbols)
-    else:
-        terms = extract_terms(ast)
-    if logger:
-        logger.progress(
-            "Extracted terms",
-            operation="extract_blocks",
-            stage="terms_complete",
-            current=len(terms)
-        )
-    
-    if logger:
-        logger.progress("Extracting code blocks", operation="extract_blocks", stage="code")
-    codes = extract_code_entries(ast)
-    if logger:
-        logger.progress(
-            "Extracted code blocks",
-            operation="extract_blocks",
-            stage="code_complete",
-            current=len(codes)
-        )
-    
-    if logger:
-        logger.progress("Extracting relations", operation="extract_blocks", stage="relations")
-    rels = extract_relations_from_ast(ast, errors=errors, symbols=symbols, namespace=namespace)
-    if logger:
-        logger.progress(
-            "Extracted relations",
-            operation="extract_blocks",
-            stage="relations_complete",
-            current=len(rels)
-        )
-    
+    # Step 2: Extract terms, code, relations, diagrams, tables per chapter
+    # (chapters whose nodes are unchanged reuse cached results)
     if logger:
-        logger.progress("Extracting diagrams", operation="extract_blocks", stage="diagrams")
-    diags = extract_diagrams_from_ast(ast, errors=errors, symbols=symbols)
-    if logger:
-        logger.progress(
-            "Extracted diagrams",
-            operation="extract_blocks",
-            stage="diagrams_complete",
-            current=len(diags)
-        )
-    
-    if logger:
-        logger.progress("Extracting tables", operation="extract_blocks", stage="tables")
-    tables = extract_tables_from_ast(ast, errors=errors, symbols=symbols)
+        logger.progress("Extracting chapters", operation="extract_blocks", stage="chapters")
+    chapter_units = partition_chapters(
+        ast, salt=f"{compiler_version}|{ssm_schema_version}|{namespace}"
+    )
+    chapter_extractions, chapter_hits = extract_chapters(
+        chapter_units, errors=errors, namespace=namespace, cache=cache, workers=workers
+    )
+    terms, codes, rels, diags, tables = merge_chapter_extractions(chapter_extractions)
     if logger:
         logger.progress(
-            "Extracted tables",
+            "Extracted chapters",
             operation="extract_blocks",
-            stage="tables_complete",
-            current=len(tables)
+            stage="chapters_complete",
+            current=len(chapter_units) - chapter_hits,
+            total=len(chapter_units),
+            cached=chapter_hits,
+            terms=len(terms),
+            code_blocks=len(codes),
+            relations=len(rels),
+            diagrams=len(diags),
+            tables=len(tables)
         )
     
-    # Solution 6: Enrich diagrams with metadata and chapter attachment
-    try:
-        from modules.extractor_diagrams_enhanced import DiagramEnricher
-        enricher = DiagramEnricher()
-        diags = enricher.enrich_diagrams(diags, ast)
-    except ImportError:
-        pass  # Diagram enricher not available
-    
     # Step 3: Convert AST → SSM v3 blocks (with part-meta and section-meta)
     if logger:
         logger.progress("Converting AST to SSM blocks", operation="convert_ast", stage="conversion")
@@ -395,11 +356,13 @@ def compile_markdown_to_ssm_v3(
             blocks.append(relation_block)
     
     # Solution 4: Extract missing block types (antipattern, rationale, contrast)
+    # Runs after ast_to_ssm_blocks, which renames duplicate chapter codes
     from modules.ast_nodes import SSMBlock
+    late_extractions, _ = extract_chapters_late(chapter_units, errors=errors, cache=cache, workers=workers)
+    antipatterns, rationales, contrasts = merge_late_extractions(late_extractions)
     
     # Extract antipatterns
     if extract_antipatterns_from_ast is not None:
-        antipatterns = extract_antipatterns_from_ast(ast, errors=errors, symbols=symbols)
         for ap in antipatterns:
             # Ensure problem and solution are valid (not truncated)
             problem = ap.problem.strip() if ap.problem else ""
@@ -442,8 +405,6 @@ def compile_markdown_to_ssm_v3(
     
     # Extract rationales
     if RationaleExtractor is not None:
-        rationale_extractor = RationaleExtractor(errors=errors, symbols=symbols)
-        rationales = rationale_extractor.extract(ast)
         for rat in rationales:
             rationale_block = SSMBlock(
                 block_type="rationale",
@@ -460,8 +421,6 @@ def compile_markdown_to_ssm_v3(
     
     # Extract contrasts
     if ContrastExtractor is not None:
-        contrast_extractor = ContrastExtractor(errors=errors, symbols=symbols)
-        contrasts = contrast_extractor.extract(ast)
         for cont in contrasts:
             contrast_block = SSMBlock(
                 block_type="contrast",
@@ -606,12 +565,14 @@ def compile_markdown_to_ssm_v3(
         logger.progress("Ensuring unique IDs", operation="ensure_ids", stage="id_uniqueness")
     ensure_ids_unique(blocks)
     
-    # Phase 5: Validate SSM blocks
+    # Phase 5: Validate SSM blocks once; the ErrorBus, metrics and diagnostics
+    # all read this report
+    validation_report = None
     try:
-        from validation.validate_ssm import validate_ssm
-        validation_errors = validate_ssm(blocks, symbols=symbols)
-        if validation_errors and errors:
-            for val_err in validation_errors:
+        from validation.validate_ssm import validate_ssm_report
+        validation_report = validate_ssm_report(blocks, symbols=symbols)
+        if validation_report.issues and errors:
+            for val_err in validation_report.issues:
                 if val_err.severity == "error":
                     errors.error(
                         code=val_err.code,
@@ -648,39 +609,28 @@ def compile_markdown_to_ssm_v3(
         metrics.record_blocks(blocks)
         metrics.record_errors(errors)
         metrics.record_symbols(symbols)
-        try:
-            from validation.validate_ssm import validate_ssm
-            validation_errors = validate_ssm(blocks, symbols=symbols)
-            metrics.record_validation(validation_errors)
-        except ImportError:
-            pass
+        if validation_report is not None:
+            metrics.record_validation(validation_report.issues)
         metrics.stop()
     
     # Build diagnostics if runtime components are available
     if errors and symbols:
-        try:
-            from validation.validate_ssm import validate_ssm
-            validation_errors = validate_ssm(blocks, symbols=symbols)
-            validation_error_count = len([e for e in validation_errors if e.severity == "error"])
-            validation_warning_count = len([e for e in validation_errors if e.severity == "warning"])
-        except ImportError:
-            validation_errors = []
-            validation_error_count = 0
-            validation_warning_count = 0
+        validation_errors = validation_report.errors if validation_report is not None else []
+        validation_warnings = validation_report.warnings if validation_report is not None else []
         
         diagnostics = {
             "errors": errors.to_dict(),
             "warnings": [e.__dict__ for e in errors.warnings()],
             "symbols": symbols.to_dict(),
-            "validation_errors": [e.__dict__ for e in validation_errors if e.severity == "error"] if 'validation_errors' in locals() else [],
-            "validation_warnings": [e.__dict__ for e in validation_errors if e.severity == "warning"] if 'validation_errors' in locals() else [],
+            "validation_errors": [e.__dict__ for e in validation_errors],
+            "validation_warnings": [e.__dict__ for e in validation_warnings],
             "metrics": metrics.get_metrics().to_dict() if metrics else None,
             "summary": {
                 "total_blocks": len(blocks),
                 "error_count": len(errors.errors()),
                 "warning_count": len(errors.warnings()),
-                "validation_error_count": validation_error_count,
-                "validation_warning_count": validation_warning_count,
+                "validation_error_count": len(validation_errors),
+                "validation_warning_count": len(validation_warnings),
                 "symbol_stats": symbols.stats(),
                 "compiler_version": compiler_version,
                 "ssm_schema_version": ssm_schema_version,
@@ -743,8 +693,9 @@ def compile_markdown_to_ssm_v3(
                 cached_blocks=cached_blocks
             )
             
-            # Save cache
+            # Save cache and drop records of chapters that no longer exist
             cache.save(compile_state)
+            cache.prune_chapters()
             if logger:
                 logger.info(
                     "Cache saved",
@@ -799,7 +750,8 @@ def compile_document(
     input_path: str,
     output_path: str,
     diagnostics_path: Optional[str] = None,
-    namespace: str = "default"
+    namespace: str = "default",
+    workers: Optional[int] = None
 ) -> Tuple[int, Optional[Diagnostics]]:
     """
     Compile a markdown document to SSM v3.
@@ -808,6 +760,7 @@ def compile_document(
         input_path: Path to input markdown file
         output_path: Path to output SSM file
         diagnostics_path: Optional path for diagnostics JSON (default: output_path + ".diagnostics.json")
+        workers: Processes for chapter extraction (None or 1 = serial)
     
     Returns:
         Tuple of (exit_code, diagnostics_dict)
@@ -827,7 +780,8 @@ def compile_document(
         errors=errors,
         symbols=symbols,
         namespace=namespace,
-        source_file=input_path  # Pass source file for V3 metadata
+        source_file=input_path,  # Pass source file for V3 metadata
+        workers=workers
     )
     
     # Write SSM output
@@ -879,7 +833,7 @@ if __name__ == "__main__":
                 operation="main",
                 error_code="INVALID_USAGE",
                 root_cause="Missing required arguments",
-                usage="python compiler.py input.md output.ssm.md [diagnostics.json] [--namespace <name>]"
+                usage="python compiler.py input.md output.ssm.md [diagnostics.json] [--namespace <name>] [--workers <n>]"
             )
         sys.exit(1)
     
@@ -887,11 +841,25 @@ if __name__ == "__main__":
     output_path = sys.argv[2]
     diagnostics_path = None
     namespace = "default"
+    workers = None
     
     # Parse optional arguments
     i = 3
     while i < len(sys.argv):
-        if sys.argv[i] == "--namespace":
+        if sys.argv[i] == "--workers":
+            if i + 1 < len(sys.argv) and sys.argv[i + 1].isdigit():
+                workers = int(sys.argv[i + 1])
+                i += 2
+            else:
+                if logger:
+                    logger.error(
+                        "Missing workers argument",
+                        operation="main",
+                        error_code="MISSING_ARGUMENT",
+                        root_cause="--workers requires a number"
+                    )
+                sys.exit(1)
+        elif sys.argv[i] == "--namespace":
             if i + 1 < len(sys.argv):
                 namespace = sys.argv[i + 1]
                 i += 2
@@ -928,7 +896,9 @@ if __name__ == "__main__":
             )
         sys.exit(1)
     
-    exit_code, diagnostics = compile_document(input_path, output_path, diagnostics_path, namespace=namespace)
+    exit_code, diagnostics = compile_document(
+        input_path, output_path, diagnostics_path, namespace=namespace, workers=workers
+    )
     
     if exit_code == 0:
         if logger:
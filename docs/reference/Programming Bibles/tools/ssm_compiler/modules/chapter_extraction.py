@@ -0,0 +1,512 @@
+"""
+Chapter-Level Extraction (Incremental Builds)
+
+Splits the AST into chapter units and runs the extractors that only read a
+chapter's own nodes (terms, code, relations, diagrams, tables, antipatterns,
+rationale, contrast) once per unit. With a CompileCache, a unit whose nodes
+are unchanged since the last compile reuses the stored results instead of
+being extracted again, even if edits elsewhere shifted its line numbers.
+
+Units can also be extracted in a process pool (workers > 1). Each worker
+gets a detached copy of its unit and its own ErrorBus; the parent re-emits
+the captured events in unit order. The chapter extractors neither read nor
+write the SymbolTable (only the parser populates it), so workers get none.
+
+Merging the per-unit results reproduces the lists the extractors return for
+the whole document (same entries, same order), so block construction,
+indexing and enrichment run exactly as in a full build, serial or parallel.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .ast_nodes import ASTDocument, ASTNode
+from .extractor_terms import TermEntry, extract_terms_from_ast as extract_terms
+from .extractor_code import CodeEntry, extract_code_entries
+from .extractor_relations import RelationEntry, extract_relations_from_ast
+from .extractor_diagrams import DiagramEntry, extract_diagrams_from_ast
+from .extractor_tables import TableEntry, extract_tables_from_ast
+from .plugins import CodeClassification
+
+try:
+    from .extractor_terms_v3 import extract_terms_from_ast_v3
+    USE_V3_TERM_EXTRACTION = True
+except ImportError:
+    extract_terms_from_ast_v3 = None  # type: ignore
+    USE_V3_TERM_EXTRACTION = False
+
+try:
+    from .extractor_diagrams_enhanced import DiagramEnricher, EnrichedDiagramEntry
+except ImportError:
+    DiagramEnricher = None  # type: ignore
+    EnrichedDiagramEntry = None  # type: ignore
+
+try:
+    from .extractor_antipatterns import AntipatternEntry, extract_antipatterns_from_ast
+except ImportError:
+    AntipatternEntry = None  # type: ignore
+    extract_antipatterns_from_ast = None  # type: ignore
+
+try:
+    from .extractor_rationale import RationaleEntry, RationaleExtractor
+except ImportError:
+    RationaleEntry = None  # type: ignore
+    RationaleExtractor = None  # type: ignore
+
+try:
+    from .extractor_contrast import ContrastEntry, ContrastExtractor
+except ImportError:
+    ContrastEntry = None  # type: ignore
+    ContrastExtractor = None  # type: ignore
+
+# Import runtime components (optional)
+try:
+    from runtime.error_bus import ErrorBus
+except ImportError:
+    ErrorBus = None  # type: ignore
+
+
+# Bump when the stored record layout changes
+RECORD_VERSION = 1
+
+_ENTRY_TYPES: Dict[str, type] = {
+    cls.__name__: cls
+    for cls in (
+        TermEntry, CodeEntry, RelationEntry, DiagramEntry, TableEntry,
+        EnrichedDiagramEntry, AntipatternEntry, RationaleEntry, ContrastEntry,
+    )
+    if cls is not None
+}
+
+_extractor_version: Optional[str] = None
+
+
+@dataclass
+class ChapterUnit:
+    """A chapter (or the preamble before the first chapter) and its nodes."""
+    doc: ASTDocument  # Shares node objects with the full AST
+    chapter: Optional[ASTNode]
+    base_line: int  # line_no of the unit's first node
+    fingerprint: str  # Content hash, independent of base_line
+
+
+@dataclass
+class ChapterExtraction:
+    """Extractor results for one unit, before AST → SSM conversion."""
+    terms: List[TermEntry] = field(default_factory=list)
+    codes: List[CodeEntry] = field(default_factory=list)
+    relations: List[RelationEntry] = field(default_factory=list)
+    code_diagrams: List[DiagramEntry] = field(default_factory=list)
+    node_diagrams: List[DiagramEntry] = field(default_factory=list)
+    node_tables: List[TableEntry] = field(default_factory=list)
+    paragraph_tables: List[TableEntry] = field(default_factory=list)
+    code_tables: List[TableEntry] = field(default_factory=list)
+    events: List[Dict[str, Any]] = field(default_factory=list)  # ErrorBus events emitted
+
+
+@dataclass
+class LateChapterExtraction:
+    """Extractor results for one unit that need final chapter codes."""
+    antipatterns: List[Any] = field(default_factory=list)
+    rationales: List[Any] = field(default_factory=list)
+    contrasts: List[Any] = field(default_factory=list)
+    events: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def extractor_version() -> str:
+    """
+    Hash of the extractor sources, so cached results expire with the code.
+
+    Covers every module in this package directory plus plugins/ and utils/
+    (computed once per process).
+    """
+    global _extractor_version
+    if _extractor_version is None:
+        root = Path(__file__).parent
+        digest = hashlib.sha256()
+        digest.update(f"record={RECORD_VERSION};v3_terms={USE_V3_TERM_EXTRACTION};".encode())
+        digest.update(",".join(sorted(_ENTRY_TYPES)).encode())
+        for pattern in ("*.py", "plugins/*.py", "utils/*.py"):
+            for path in sorted(root.glob(pattern)):
+                digest.update(path.relative_to(root).as_posix().encode())
+                digest.update(path.read_bytes())
+        _extractor_version = digest.hexdigest()
+    return _extractor_version
+
+
+def _fingerprint(nodes: List[ASTNode], base_line: int, salt: str) -> str:
+    """Hash of the unit's nodes with line numbers relative to base_line."""
+    positions = {id(node): i for i, node in enumerate(nodes)}
+    digest = hashlib.sha256(salt.encode())
+    for node in nodes:
+        parent = node.parent
+        if parent is None:
+            parent_ref = None
+        elif id(parent) in positions:
+            parent_ref = positions[id(parent)]
+        else:
+            parent_ref = parent.type  # Outside the unit (e.g. a part)
+        record = [
+            node.type, node.text, node.level, node.lang, node.code,
+            node.line_no - base_line, parent_ref, node.meta,
+        ]
+        digest.update(json.dumps(record, sort_keys=True, default=str).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def partition_chapters(ast: ASTDocument, salt: str = "") -> List[ChapterUnit]:
+    """
+    Split the AST's flat node list at each chapter node.
+
+    Nodes before the first chapter form a preamble unit. Each unit keeps
+    the original node objects (parents, children and siblings intact).
+
+    Args:
+        ast: AST document (after semantic validation)
+        salt: Extra key material (compiler/schema version, namespace)
+
+    Returns:
+        Units in document order
+    """
+    groups: List[List[ASTNode]] = []
+    for node in ast.nodes:
+        if node.type == "chapter" or not groups:
+            groups.append([])
+        groups[-1].append(node)
+
+    salt = f"{extractor_version()}|{salt}"
+    units = []
+    for nodes in groups:
+        chapter = nodes[0] if nodes[0].type == "chapter" else None
+        base_line = nodes[0].line_no
+        units.append(ChapterUnit(
+            doc=ASTDocument(nodes=nodes, chapters=[chapter] if chapter else [], parts=[]),
+            chapter=chapter,
+            base_line=base_line,
+            fingerprint=_fingerprint(nodes, base_line, salt),
+        ))
+    return units
+
+
+def _nodes_of_type(unit: ChapterUnit, node_type: str) -> ASTDocument:
+    """The unit restricted to one node type (one extractor pass)."""
+    return ASTDocument(
+        nodes=[node for node in unit.doc.nodes if node.type == node_type],
+        chapters=unit.doc.chapters,
+    )
+
+
+def _capture(errors: Optional["ErrorBus"], extract: Callable[[Optional["ErrorBus"]], Any]) -> Tuple[Any, List[Dict[str, Any]]]:
+    """Run extract(errors) and return its result plus the events it emitted."""
+    bus = errors if errors is not None else (ErrorBus() if ErrorBus is not None else None)
+    start = len(bus.events) if bus is not None else 0
+    result = extract(bus)
+    events = [asdict(evt) for evt in bus.events[start:]] if bus is not None else []
+    return result, events
+
+
+def extract_chapter(unit: ChapterUnit, errors: Optional["ErrorBus"] = None, namespace: str = "default") -> ChapterExtraction:
+    """
+    Run the pre-conversion extractors on one unit.
+
+    Diagrams and tables are collected per extractor pass (code nodes,
+    diagram nodes / table, paragraph, code nodes) so merging keeps the
+    whole-document order.
+    """
+    def extract(bus):
+        doc = unit.doc
+        if USE_V3_TERM_EXTRACTION and extract_terms_from_ast_v3 is not None:
+            terms = extract_terms_from_ast_v3(doc, errors=bus)
+        else:
+            terms = extract_terms(doc)
+        code_diagrams = extract_diagrams_from_ast(_nodes_of_type(unit, "code"), errors=bus)
+        node_diagrams = extract_diagrams_from_ast(_nodes_of_type(unit, "diagram"), errors=bus)
+        if DiagramEnricher is not None:
+            enricher = DiagramEnricher()
+            code_diagrams = enricher.enrich_diagrams(code_diagrams, doc)
+            node_diagrams = enricher.enrich_diagrams(node_diagrams, doc)
+        return ChapterExtraction(
+            terms=terms,
+            codes=extract_code_entries(doc),
+            relations=extract_relations_from_ast(doc, errors=bus, namespace=namespace),
+            code_diagrams=code_diagrams,
+            node_diagrams=node_diagrams,
+            node_tables=extract_tables_from_ast(_nodes_of_type(unit, "table"), errors=bus),
+            paragraph_tables=extract_tables_from_ast(_nodes_of_type(unit, "paragraph"), errors=bus),
+            code_tables=extract_tables_from_ast(_nodes_of_type(unit, "code"), errors=bus),
+        )
+
+    extraction, events = _capture(errors, extract)
+    extraction.events = events
+    return extraction
+
+
+def extract_chapter_late(unit: ChapterUnit, errors: Optional["ErrorBus"] = None) -> LateChapterExtraction:
+    """Run the extractors that read final chapter codes on one unit."""
+    def extract(bus):
+        doc = unit.doc
+        return LateChapterExtraction(
+            antipatterns=extract_antipatterns_from_ast(doc, errors=bus) if extract_antipatterns_from_ast else [],
+            rationales=RationaleExtractor(errors=bus).extract(doc) if RationaleExtractor else [],
+            contrasts=ContrastExtractor(errors=bus).extract(doc) if ContrastExtractor else [],
+        )
+
+    extraction, events = _capture(errors, extract)
+    extraction.events = events
+    return extraction
+
+
+def _encode(entry: Any) -> Dict[str, Any]:
+    data = asdict(entry)
+    data["__type__"] = type(entry).__name__
+    return data
+
+
+def _decode(data: Dict[str, Any], line_delta: int) -> Any:
+    data = dict(data)
+    cls = _ENTRY_TYPES[data.pop("__type__")]
+    if cls is CodeEntry:
+        data["classification"] = CodeClassification(**data["classification"])
+    line_field = "first_line" if cls is TermEntry else "line_no"
+    data[line_field] += line_delta
+    return cls(**data)
+
+
+def _to_record(extraction: Any, unit: ChapterUnit) -> Dict[str, Any]:
+    record: Dict[str, Any] = {"record_version": RECORD_VERSION, "base_line": unit.base_line}
+    for name, value in vars(extraction).items():
+        record[name] = value if name == "events" else [_encode(entry) for entry in value]
+    return record
+
+
+def _from_record(record: Dict[str, Any], cls: type, unit: ChapterUnit) -> Optional[Any]:
+    """Rebuild a stored extraction at the unit's current position."""
+    if record.get("record_version") != RECORD_VERSION:
+        return None
+    line_delta = unit.base_line - record["base_line"]
+    if record["events"] and line_delta:
+        return None  # Event messages embed absolute line numbers
+    values = {}
+    for name in cls.__dataclass_fields__:
+        if name == "events":
+            values[name] = record[name]
+        else:
+            values[name] = [_decode(entry, line_delta) for entry in record[name]]
+    return cls(**values)
+
+
+def _late_key(unit: ChapterUnit) -> str:
+    code = unit.chapter.meta.get("code", "") if unit.chapter is not None else ""
+    return hashlib.sha256(f"{unit.fingerprint}|late|{code}".encode()).hexdigest()
+
+
+def _detached(unit: ChapterUnit) -> ChapterUnit:
+    """
+    Copy of the unit that pickles without the rest of the AST.
+
+    Nodes outside the unit that its nodes reference (a part parent, a part's
+    later chapters) become stubs; a stub parent keeps its full child list,
+    so parent and sibling lookups see the same node types and positions as
+    in the full AST.
+    """
+    in_unit = {id(node) for node in unit.doc.nodes}
+    copies: Dict[int, ASTNode] = {
+        id(node): ASTNode(
+            type=node.type, text=node.text, level=node.level, lang=node.lang, code=node.code,
+            meta=node.meta, line_no=node.line_no, errors=list(node.errors),
+        )
+        for node in unit.doc.nodes
+    }
+
+    def ref(node: ASTNode) -> ASTNode:
+        if id(node) not in copies:
+            copies[id(node)] = ASTNode(type=node.type, text=node.text, level=node.level, meta=node.meta, line_no=node.line_no)
+        return copies[id(node)]
+
+    outside_parents: Dict[int, ASTNode] = {}
+    for node in unit.doc.nodes:
+        copy = copies[id(node)]
+        copy.children = [ref(child) for child in node.children]
+        if node.parent is not None:
+            copy.parent = ref(node.parent)
+            if id(node.parent) not in in_unit:
+                outside_parents[id(node.parent)] = node.parent
+    for parent in outside_parents.values():
+        copies[id(parent)].children = [ref(child) for child in parent.children]
+
+    chapter = copies[id(unit.chapter)] if unit.chapter is not None else None
+    return ChapterUnit(
+        doc=ASTDocument(nodes=[copies[id(node)] for node in unit.doc.nodes], chapters=[chapter] if chapter else []),
+        chapter=chapter,
+        base_line=unit.base_line,
+        fingerprint=unit.fingerprint,
+    )
+
+
+def _extract_task(task: Tuple[bool, ChapterUnit, str]) -> Any:
+    """Process pool entry point: extract one detached unit."""
+    late, unit, namespace = task
+    if late:
+        return extract_chapter_late(unit)
+    return extract_chapter(unit, namespace=namespace)
+
+
+def _quiet_worker() -> None:
+    # Events are re-emitted (and logged) through the parent's ErrorBus
+    logging.disable(logging.WARNING)
+
+
+def _extract_units(
+    units: List[ChapterUnit],
+    late: bool,
+    errors: Optional["ErrorBus"],
+    namespace: str,
+    cache: Optional[Any],
+    workers: Optional[int],
+) -> Tuple[List[Any], int]:
+    """
+    Extract each unit or reuse its cached record.
+
+    With workers > 1, units that need extracting run in a process pool on
+    detached copies. Events are emitted into errors in unit order either way,
+    so serial and parallel runs produce the same diagnostics.
+
+    Returns:
+        Tuple of (results in unit order, cache hits)
+    """
+    cls = LateChapterExtraction if late else ChapterExtraction
+    key = _late_key if late else (lambda unit: unit.fingerprint)
+    results: List[Optional[Any]] = [None] * len(units)
+    if cache is not None:
+        for i, unit in enumerate(units):
+            record = cache.load_chapter(key(unit))
+            if record is not None:
+                try:
+                    results[i] = _from_record(record, cls, unit)
+                except (KeyError, TypeError, ValueError):
+                    results[i] = None
+    pending = [i for i, extraction in enumerate(results) if extraction is None]
+    hits = len(units) - len(pending)
+
+    if workers and workers > 1 and len(pending) > 1:
+        tasks = [(late, _detached(units[i]), namespace) for i in pending]
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks)), initializer=_quiet_worker) as pool:
+            for i, extraction in zip(pending, pool.map(_extract_task, tasks)):
+                results[i] = extraction
+
+    fresh = set(pending)
+    for i, unit in enumerate(units):
+        if results[i] is None:
+            # Serial: the extractors emit into errors directly
+            if late:
+                results[i] = extract_chapter_late(unit, errors=errors)
+            else:
+                results[i] = extract_chapter(unit, errors=errors, namespace=namespace)
+        elif errors is not None:
+            for event in results[i].events:
+                errors.emit(**event)
+        if cache is not None and i in fresh:
+            cache.save_chapter(key(unit), _to_record(results[i], unit))
+    return results, hits
+
+
+def extract_chapters(
+    units: List[ChapterUnit],
+    errors: Optional["ErrorBus"] = None,
+    namespace: str = "default",
+    cache: Optional[Any] = None,
+    workers: Optional[int] = None,
+) -> Tuple[List[ChapterExtraction], int]:
+    """
+    Pre-conversion extraction for all units.
+
+    Args:
+        units: Units from partition_chapters()
+        errors: ErrorBus instance (optional); cached events are re-emitted
+        namespace: Namespace for relations
+        cache: CompileCache with chapter storage (optional)
+        workers: Extraction processes (None or 1 = serial)
+
+    Returns:
+        Tuple of (per-unit results, number of units reused from cache)
+    """
+    return _extract_units(units, False, errors, namespace, cache, workers)
+
+
+def extract_chapters_late(
+    units: List[ChapterUnit],
+    errors: Optional["ErrorBus"] = None,
+    cache: Optional[Any] = None,
+    workers: Optional[int] = None,
+) -> Tuple[List[LateChapterExtraction], int]:
+    """
+    Antipattern, rationale and contrast extraction for all units.
+
+    Must run after ast_to_ssm_blocks(), which renames duplicate chapter codes.
+    """
+    return _extract_units(units, True, errors, "default", cache, workers)
+
+
+def _term_key(term: TermEntry) -> Tuple[str, str]:
+    """Dedup key of the active term extractor."""
+    if USE_V3_TERM_EXTRACTION and extract_terms_from_ast_v3 is not None:
+        return (term.name.lower(), term.definition.lower()[:100])
+    return (term.name.lower(), term.definition.lower())
+
+
+def merge_chapter_extractions(
+    extractions: List[ChapterExtraction],
+) -> Tuple[List[TermEntry], List[CodeEntry], List[RelationEntry], List[DiagramEntry], List[TableEntry]]:
+    """
+    Combine per-unit results into whole-document extractor output.
+
+    Terms and relations are deduplicated across chapters with the
+    extractors' own keys (first occurrence wins).
+
+    Returns:
+        Tuple of (terms, codes, relations, diagrams, tables)
+    """
+    terms: List[TermEntry] = []
+    seen_terms = set()
+    relations: List[RelationEntry] = []
+    seen_relations = set()
+    for extraction in extractions:
+        for term in extraction.terms:
+            key = _term_key(term)
+            if key not in seen_terms:
+                seen_terms.add(key)
+                terms.append(term)
+        for rel in extraction.relations:
+            key = (rel.from_ref, rel.to_ref, rel.relation_type)
+            if key not in seen_relations:
+                seen_relations.add(key)
+                relations.append(rel)
+
+    codes = [code for extraction in extractions for code in extraction.codes]
+    diagrams = [d for extraction in extractions for d in extraction.code_diagrams]
+    diagrams += [d for extraction in extractions for d in extraction.node_diagrams]
+    tables = [t for extraction in extractions for t in extraction.node_tables]
+    tables += [t for extraction in extractions for t in extraction.paragraph_tables]
+    tables += [t for extraction in extractions for t in extraction.code_tables]
+    return terms, codes, relations, diagrams, tables
+
+
+def merge_late_extractions(extractions: List[LateChapterExtraction]) -> Tuple[List[Any], List[Any], List[Any]]:
+    """
+    Combine per-unit late results.
+
+    Returns:
+        Tuple of (antipatterns, rationales, contrasts)
+    """
+    return (
+        [ap for extraction in extractions for ap in extraction.antipatterns],
+        [rat for extraction in extractions for rat in extraction.rationales],
+        [cont for extraction in extractions for cont in extraction.contrasts],
+    )
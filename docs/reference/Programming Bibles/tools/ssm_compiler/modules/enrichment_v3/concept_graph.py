@@ -2,12 +2,15 @@
 Concept Graph / Multi-hop Relationships (Phase 3)
 
 Builds concept graph with multi-hop relationships between concepts, terms, patterns, and chapters.
+Mentions are found with one Aho-Corasick pass per concept body rather than a
+substring scan per concept pair.
 """
 from __future__ import annotations
 
-from typing import List, Dict, Set, Any
+from typing import List, Dict, Set, Any, Tuple
 from collections import defaultdict
 from ..ast_nodes import SSMBlock
+from ..utils.phrase_matcher import PhraseMatcher
 
 
 def build_concept_graph(blocks: List[SSMBlock], idx: Dict[str, Any]) -> Dict[str, Set[str]]:
@@ -35,37 +38,46 @@ def build_concept_graph(blocks: List[SSMBlock], idx: Dict[str, Any]) -> Dict[str
     code_patterns = {b.id: b for b in blocks if b.block_type == "code-pattern"}
     chapter_meta = {b.id: b for b in blocks if b.block_type == "chapter-meta"}
     
-    # Extract concept mentions from concept bodies
+    # One automaton per target kind finds every mention in a single pass over
+    # each concept body. Matches are replayed in block order so every
+    # adjacency set is filled in the same order as a pairwise scan would.
+    concept_pos = {block_id: pos for pos, block_id in enumerate(concepts)}
+    term_pos = {block_id: pos for pos, block_id in enumerate(terms)}
+    code_pos = {block_id: pos for pos, block_id in enumerate(code_patterns)}
+    title_matcher = PhraseMatcher(
+        (other_block.meta.get("title", "").lower(), other_id) for other_id, other_block in concepts.items()
+    )
+    term_matcher = PhraseMatcher(
+        (term_block.meta.get("name", "").lower(), term_id) for term_id, term_block in terms.items()
+    )
+    # pattern_type is matched as written against the lowercased body
+    pattern_matcher = PhraseMatcher(
+        (code_block.meta.get("pattern_type", ""), code_id) for code_id, code_block in code_patterns.items()
+    )
+
     for concept_id, concept_block in concepts.items():
         body = (concept_block.body or "").lower()
-        
-        # Find mentions of other concepts (by title or key phrase)
-        for other_id, other_block in concepts.items():
+
+        # Concepts whose title appears in this concept's body
+        for other_id in sorted(title_matcher.matches(body), key=concept_pos.__getitem__):
             if other_id == concept_id:
                 continue
-            
-            # Check if other concept's title/keywords appear in this concept
-            other_title = other_block.meta.get("title", "").lower()
-            other_keywords = other_block.meta.get("keywords", [])
-            
-            if other_title and other_title in body:
-                graph[concept_id].add(other_id)
-                graph[other_id].add(concept_id)  # Bidirectional
-        
+            graph[concept_id].add(other_id)
+            graph[other_id].add(concept_id)  # Bidirectional
+
         # Link concepts to terms they mention
-        for term_id, term_block in terms.items():
-            term_name = term_block.meta.get("name", "").lower()
-            if term_name and term_name in body:
-                graph[concept_id].add(term_id)
-        
-        # Link concepts to code patterns
-        for code_id, code_block in code_patterns.items():
-            code_lang = code_block.meta.get("language", "")
-            pattern_type = code_block.meta.get("pattern_type", "")
-            # Check if concept mentions this pattern type
-            if pattern_type and pattern_type in body:
-                graph[concept_id].add(code_id)
-    
+        for term_id in sorted(term_matcher.matches(body), key=term_pos.__getitem__):
+            graph[concept_id].add(term_id)
+
+        # Link concepts to code patterns whose type they mention
+        for code_id in sorted(pattern_matcher.matches(body), key=code_pos.__getitem__):
+            graph[concept_id].add(code_id)
+
+    # Chapter code -> chapter ids, in block order
+    chapters_by_code: Dict[str, List[str]] = defaultdict(list)
+    for ch_id, ch_block in chapter_meta.items():
+        chapters_by_code[ch_block.meta.get("code", "")].append(ch_id)
+
     # Add chapter prerequisite edges from relations
     relations = {b.id: b for b in blocks if b.block_type == "relation"}
     for rel_id, rel_block in relations.items():
@@ -73,15 +85,9 @@ def build_concept_graph(blocks: List[SSMBlock], idx: Dict[str, Any]) -> Dict[str
         to_ref = rel_block.meta.get("to", "")
         rel_type = rel_block.meta.get("type", "")
         
-        # Find chapter blocks by code
-        from_ch = None
-        to_ch = None
-        for ch_id, ch_block in chapter_meta.items():
-            ch_code = ch_block.meta.get("code", "")
-            if ch_code == from_ref:
-                from_ch = ch_id
-            if ch_code == to_ref:
-                to_ch = ch_id
+        # Last chapter block with the code wins
+        from_ch = chapters_by_code[from_ref][-1] if from_ref in chapters_by_code else None
+        to_ch = chapters_by_code[to_ref][-1] if to_ref in chapters_by_code else None
         
         if from_ch and to_ch:
             if rel_type == "prerequisite":
@@ -95,10 +101,8 @@ def build_concept_graph(blocks: List[SSMBlock], idx: Dict[str, Any]) -> Dict[str
         prereqs = ch_block.meta.get("prerequisites", [])
         if isinstance(prereqs, list):
             for prereq_code in prereqs:
-                # Find chapter with this code
-                for other_ch_id, other_ch_block in chapter_meta.items():
-                    if other_ch_block.meta.get("code") == prereq_code:
-                        graph[ch_id].add(other_ch_id)
+                for other_ch_id in chapters_by_code.get(prereq_code, ()):
+                    graph[ch_id].add(other_ch_id)
     
     return dict(graph)
 
@@ -125,21 +129,31 @@ def enrich_concept_graph(blocks: List[SSMBlock], idx: Dict[str, Any]) -> None:
             neighbors = list(graph[block.id])
             block.meta["graph_neighbors"] = neighbors
             block.meta["graph_degree"] = len(neighbors)
-            
-            # Multi-hop paths (2-3 hops)
-            two_hop = set()
-            three_hop = set()
-            for neighbor_id in neighbors:
-                if neighbor_id in graph:
-                    for two_hop_neighbor in graph[neighbor_id]:
-                        if two_hop_neighbor != block.id:
-                            two_hop.add(two_hop_neighbor)
-                            # Three-hop
-                            if two_hop_neighbor in graph:
-                                for three_hop_neighbor in graph[two_hop_neighbor]:
-                                    if three_hop_neighbor != block.id and three_hop_neighbor not in neighbors:
-                                        three_hop.add(three_hop_neighbor)
-            
+            two_hop, three_hop = _multi_hop(graph, block.id, neighbors)
             block.meta["graph_two_hop"] = list(two_hop)
             block.meta["graph_three_hop"] = list(three_hop)
 
+
+def _multi_hop(graph: Dict[str, Set[str]], node_id: str, neighbors: List[str]) -> Tuple[Set[str], Set[str]]:
+    """
+    Collect the nodes two and three hops from node_id.
+
+    Walk bounded at three hops. Each second-hop node is expanded once (repeat
+    visits through other neighbors would only re-add the same nodes), so the
+    work grows with the edges reached rather than with the number of paths,
+    and the sets are filled in the same order as a walk over every path.
+    """
+    neighbor_set = set(neighbors)
+    two_hop: Set[str] = set()
+    three_hop: Set[str] = set()
+    expanded: Set[str] = set()
+    for neighbor_id in neighbors:
+        for two_hop_neighbor in graph.get(neighbor_id, ()):
+            if two_hop_neighbor == node_id or two_hop_neighbor in expanded:
+                continue
+            expanded.add(two_hop_neighbor)
+            two_hop.add(two_hop_neighbor)
+            for three_hop_neighbor in graph.get(two_hop_neighbor, ()):
+                if three_hop_neighbor != node_id and three_hop_neighbor not in neighbor_set:
+                    three_hop.add(three_hop_neighbor)
+    return two_hop, three_hop
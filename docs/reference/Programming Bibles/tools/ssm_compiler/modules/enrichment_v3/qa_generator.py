@@ -6,6 +6,7 @@ Generates Q/A pairs from content.
 from __future__ import annotations
 
 import re
+from collections import defaultdict
 from typing import List, Dict, Any
 from ..ast_nodes import SSMBlock
 from ..utils.hashing import sha1_id
@@ -84,6 +85,36 @@ def clean_answer_text(text: str) -> str:
     return clean_text(text, max_length=500)
 
 
+class _QuestionIndex:
+    """
+    Lowercased questions indexed by character trigram.
+
+    mentions(name) answers "does any indexed question contain name?" by
+    checking only the questions that share the name's rarest trigram, so a
+    pass over all blocks stays linear instead of rescanning every QA per name.
+    Names shorter than three characters fall back to a scan.
+    """
+
+    def __init__(self) -> None:
+        self._questions: List[str] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+
+    def add(self, question: str) -> None:
+        q = question.lower()
+        qid = len(self._questions)
+        self._questions.append(q)
+        for gram in {q[i:i + 3] for i in range(len(q) - 2)}:
+            self._postings[gram].append(qid)
+
+    def mentions(self, name: str) -> bool:
+        name = name.lower()
+        if len(name) < 3:
+            return any(name in q for q in self._questions)
+        postings = [self._postings.get(name[i:i + 3], ()) for i in range(len(name) - 2)]
+        rarest = min(postings, key=len)
+        return any(name in self._questions[qid] for qid in rarest)
+
+
 def enrich_qa(blocks: List[SSMBlock], idx: Dict[str, Any]) -> None:
     """
     Enrich blocks with Q/A pairs.
@@ -93,12 +124,19 @@ def enrich_qa(blocks: List[SSMBlock], idx: Dict[str, Any]) -> None:
     - "How does Y work?" questions
     - "X vs Y" comparison questions
     
+    A name is skipped when any QA question already mentions it, including
+    QAs generated earlier in this pass.
+    
     Args:
         blocks: List of SSM blocks (modified in place)
         idx: Index of blocks by ID
     """
     new_qas: List[SSMBlock] = []
     seen_qa_content: Dict[str, int] = {}  # For deduplication
+    questions = _QuestionIndex()
+    for other in blocks:
+        if other.block_type == "qa":
+            questions.add(str(other.meta.get("q", "")))
     
     for b in blocks:
         if b.block_type not in {"term", "concept", "fact"}:
@@ -117,15 +155,7 @@ def enrich_qa(blocks: List[SSMBlock], idx: Dict[str, Any]) -> None:
             continue
         
         # avoid duplicates if a QA already mentions this name
-        exists = False
-        for other in blocks:
-            if other.block_type == "qa":
-                q = str(other.meta.get("q", "")).lower()
-                if name.lower() in q:
-                    exists = True
-                    break
-        
-        if exists:
+        if questions.mentions(name):
             continue
         
         q = f"What is {name} in the context of Rego/OPA?"
@@ -188,5 +218,6 @@ def enrich_qa(blocks: List[SSMBlock], idx: Dict[str, Any]) -> None:
                 chapter=chapter,  # Ensure chapter is set
             )
         )
+        questions.add(q)
     
     blocks.extend(new_qas)
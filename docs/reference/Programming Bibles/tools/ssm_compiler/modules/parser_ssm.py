@@ -7,7 +7,7 @@ This is the SSM emitter (Version 2).
 from __future__ import annotations
 
 from typing import List, Dict, Any, Optional, Tuple
-from .ast_nodes import ASTDocument, SSMBlock
+from .ast_nodes import ASTDocument, ASTNode, SSMBlock
 from .extractor_terms import TermEntry
 from .extractor_code import CodeEntry
 from .extractor_relations import RelationEntry
@@ -733,6 +733,12 @@ def ast_to_ssm_blocks(
             blocks.append(blk)
             idx += 1
     
+    # First node on each line, so source nodes are found without rescanning doc.nodes per block
+    nodes_by_line: Dict[int, ASTNode] = {}
+    for node in doc.nodes:
+        if hasattr(node, 'line_no'):
+            nodes_by_line.setdefault(node.line_no, node)
+    
     # FIX 4 & 5: Generate v3 metadata for all blocks (symbol_refs, semantic_role, etc.)
     # FIX VALIDATION: Ensure all blocks have IDs before metadata generation
     for block in blocks:
@@ -752,11 +758,7 @@ def ast_to_ssm_blocks(
         source_node = None
         # Try to find node by line number or ID
         if hasattr(block, 'meta') and 'line_no' in block.meta:
-            line_no = block.meta['line_no']
-            for node in doc.nodes:
-                if hasattr(node, 'line_no') and node.line_no == line_no:
-                    source_node = node
-                    break
+            source_node = nodes_by_line.get(block.meta['line_no'])
         
         generate_v3_metadata(block, source_node=source_node, symbols=symbols, source_file=None)
     
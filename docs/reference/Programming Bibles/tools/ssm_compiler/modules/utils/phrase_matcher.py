@@ -0,0 +1,65 @@
+"""
+Multi-phrase substring matching (Aho-Corasick)
+
+Finds every occurrence of any of a set of phrases in one pass over a text,
+instead of one `phrase in text` scan per phrase.
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Dict, Hashable, Iterable, List, Set, Tuple
+
+
+class PhraseMatcher:
+    """
+    Aho-Corasick automaton over (phrase, value) pairs.
+
+    matches(text) returns the values of every phrase that occurs in text as
+    a substring, the same set a `phrase in text` check per phrase gives.
+    Several values may share one phrase; empty phrases never match.
+    """
+
+    def __init__(self, phrases: Iterable[Tuple[str, Hashable]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._output: List[List[Any]] = [[]]
+        for phrase, value in phrases:
+            if not phrase:
+                continue
+            state = 0
+            for ch in phrase:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._output.append([])
+                state = nxt
+            self._output[state].append(value)
+
+        # Failure links, breadth first so a state's fallback is finished
+        # before its children are linked
+        self._fail: List[int] = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(ch, 0)
+                if self._output[self._fail[nxt]]:
+                    self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+    def matches(self, text: str) -> Set[Any]:
+        """Return the values of all phrases occurring in text."""
+        goto, fail, output = self._goto, self._fail, self._output
+        found: Set[Any] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
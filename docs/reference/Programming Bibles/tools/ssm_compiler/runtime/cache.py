@@ -7,6 +7,8 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import shutil
 import sys
 import importlib.util
 from pathlib import Path
@@ -140,20 +142,35 @@ def compute_chapter_hash(chapter_lines: list[str], chapter_code: str) -> Chapter
     )
 
 
+CHAPTER_CACHE_DIR = ".biblec.chapters"
+
+
 class CompileCache:
-    """Manages compilation cache for incremental builds."""
+    """
+    Manages compilation cache for incremental builds.
+    
+    Besides the compile state, stores per-chapter extraction records (JSON,
+    one file per content key) in a directory next to the state file.
+    """
     
-    def __init__(self, cache_file: Optional[Path] = None):
+    def __init__(self, cache_file: Optional[Path] = None, chapter_dir: Optional[Path] = None):
         """
         Initialize cache.
         
         Args:
             cache_file: Path to cache file (default: .biblec.state.json)
+            chapter_dir: Directory for chapter records (default: .biblec.chapters
+                next to cache_file); give each source its own, since
+                prune_chapters() removes records other sources still need
         """
         if cache_file is None:
             cache_file = Path(".biblec.state.json")
         self.cache_file = Path(cache_file)
+        if chapter_dir is None:
+            chapter_dir = self.cache_file.parent / CHAPTER_CACHE_DIR
+        self.chapter_dir = Path(chapter_dir)
         self.state: Optional[CompileState] = None
+        self._chapter_keys_used: Set[str] = set()
     
     def load(self) -> Optional[CompileState]:
         """
@@ -235,11 +252,14 @@ class CompileCache:
             # No cache, all chapters need compilation
             return set(chapter_hashes.keys())
         
-        # Check if source file changed
-        if self.state.source_file != source_file or self.state.source_hash != source_hash:
-            # Source changed, all chapters need recompilation
+        if self.state.source_file != source_file:
+            # Different source, all chapters need compilation
             return set(chapter_hashes.keys())
         
+        # Fast path: identical source, nothing changed
+        if self.state.source_hash == source_hash:
+            return {code for code in chapter_hashes if code not in self.state.chapter_hashes}
+        
         # Check individual chapters
         changed = set()
         for code, current_hash in chapter_hashes.items():
@@ -260,9 +280,85 @@ class CompileCache:
             return set()
         return self.state.cached_blocks.copy()
     
+    def load_chapter(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a chapter extraction record.
+        
+        Args:
+            key: Chapter content key
+            
+        Returns:
+            Stored record, or None if missing or unreadable
+        """
+        try:
+            with open(self.chapter_dir / f"{key}.json", 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError) as e:
+            if logger:
+                logger.warn(
+                    "Could not load chapter record",
+                    operation="load_chapter",
+                    error_code="CACHE_LOAD_FAILED",
+                    root_cause=str(e),
+                    chapter_key=key
+                )
+            return None
+        self._chapter_keys_used.add(key)
+        return record
+    
+    def save_chapter(self, key: str, record: Dict[str, Any]) -> None:
+        """
+        Store a chapter extraction record (written atomically).
+        
+        Args:
+            key: Chapter content key
+            record: JSON-serializable record
+        """
+        self._chapter_keys_used.add(key)
+        path = self.chapter_dir / f"{key}.json"
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            self.chapter_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(record, f, default=str)
+            os.replace(tmp_path, path)
+        except (IOError, OSError, TypeError, ValueError) as e:
+            if logger:
+                logger.warn(
+                    "Could not save chapter record",
+                    operation="save_chapter",
+                    error_code="CACHE_SAVE_FAILED",
+                    root_cause=str(e),
+                    chapter_key=key
+                )
+    
+    def prune_chapters(self) -> int:
+        """
+        Delete chapter records not loaded or saved through this cache.
+        
+        Returns:
+            Number of records deleted
+        """
+        if not self.chapter_dir.is_dir():
+            return 0
+        removed = 0
+        for path in self.chapter_dir.glob("*.json"):
+            if path.stem not in self._chapter_keys_used:
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+    
     def clear(self) -> None:
         """Clear cache."""
         if self.cache_file.exists():
             self.cache_file.unlink()
+        if self.chapter_dir.is_dir():
+            shutil.rmtree(self.chapter_dir, ignore_errors=True)
         self.state = None
+        self._chapter_keys_used = set()
 
@@ -0,0 +1,82 @@
+"""
+Concept Graph Tests
+
+The Aho-Corasick mention index must find exactly the edges a substring scan
+per concept pair finds.
+"""
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+test_dir = Path(__file__).parent.parent
+if str(test_dir) not in sys.path:
+    sys.path.insert(0, str(test_dir))
+
+from modules.ast_nodes import SSMBlock
+from modules.enrichment_v3.concept_graph import build_concept_graph, enrich_concept_graph
+from modules.utils.phrase_matcher import PhraseMatcher
+
+
+def test_phrase_matcher_matches_substring_scan():
+    rng = random.Random(7)
+    phrases = ["".join(rng.choice("abc") for _ in range(rng.randint(0, 4))) for _ in range(40)]
+    matcher = PhraseMatcher((phrase, i) for i, phrase in enumerate(phrases))
+    for _ in range(200):
+        text = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 30)))
+        assert matcher.matches(text) == {i for i, phrase in enumerate(phrases) if phrase and phrase in text}
+
+
+def _concept(block_id: str, title: str, body: str) -> SSMBlock:
+    return SSMBlock(block_type="concept", meta={"title": title}, body=body, index=0, id=block_id)
+
+
+def _pairwise_edges(blocks):
+    """Expected edges, computed with the substring scan the index replaces."""
+    edges = set()
+    concepts = [b for b in blocks if b.block_type == "concept"]
+    for concept in concepts:
+        body = concept.body.lower()
+        for other in concepts:
+            title = other.meta.get("title", "").lower()
+            if other.id != concept.id and title and title in body:
+                edges |= {(concept.id, other.id), (other.id, concept.id)}
+        for block in blocks:
+            if block.block_type == "term" and block.meta["name"].lower() in body:
+                edges.add((concept.id, block.id))
+            if block.block_type == "code-pattern" and block.meta["pattern_type"] in body:
+                edges.add((concept.id, block.id))
+    return edges
+
+
+def test_concept_edges_match_pairwise_scan():
+    blocks = [
+        _concept("c1", "Policy", "A policy bundle holds rules; see Rule Set and the decision log."),
+        _concept("c2", "Rule Set", "Rule sets group a policy's rules."),
+        _concept("c3", "Rule", "A rule evaluates to a decision."),
+        _concept("c4", "Rule", "Duplicate title, mentions nothing else."),
+        _concept("c5", "", "An untitled concept about policy."),
+        SSMBlock(block_type="term", meta={"name": "Decision Log"}, body="", index=0, id="t1"),
+        SSMBlock(block_type="code-pattern", meta={"pattern_type": "bundle"}, body="", index=0, id="p1"),
+        SSMBlock(block_type="code-pattern", meta={"pattern_type": "Rules"}, body="", index=0, id="p2"),
+    ]
+    graph = build_concept_graph(blocks, {})
+    assert {(a, b) for a, targets in graph.items() for b in targets} == _pairwise_edges(blocks)
+    # Mixed-case pattern types never match the lowercased body
+    assert "p2" not in graph["c1"]
+
+
+def test_multi_hop_neighborhoods():
+    blocks = [
+        _concept("a", "Alpha", "alpha links beta"),
+        _concept("b", "Beta", "beta links gamma"),
+        _concept("c", "Gamma", "gamma links delta"),
+        _concept("d", "Delta", "delta stands alone"),
+    ]
+    enrich_concept_graph(blocks, {})
+    a = blocks[0].meta
+    assert set(a["graph_neighbors"]) == {"b"}
+    assert set(a["graph_two_hop"]) == {"c"}
+    assert set(a["graph_three_hop"]) == {"d"}
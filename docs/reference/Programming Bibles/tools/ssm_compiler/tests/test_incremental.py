@@ -0,0 +1,111 @@
+"""
+Incremental Build Tests (Phase 9)
+
+Per-chapter extraction cache: an edit recompiles only the edited chapter and
+the output matches a full compile.
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+test_dir = Path(__file__).parent.parent
+if str(test_dir) not in sys.path:
+    sys.path.insert(0, str(test_dir))
+
+import importlib.util
+compiler_spec = importlib.util.spec_from_file_location("compiler_module", test_dir / "compiler.py")
+compiler_module = importlib.util.module_from_spec(compiler_spec)
+compiler_spec.loader.exec_module(compiler_module)
+compile_markdown_to_ssm_v3 = compiler_module.compile_markdown_to_ssm_v3
+
+from modules.parser_markdown import parse_markdown_to_ast
+from modules.chapter_extraction import extract_chapter, extract_chapters, partition_chapters
+from runtime.cache import CompileCache
+from runtime.error_bus import ErrorBus
+
+
+def _chapter(number: int, extra: str = "", table: str = "| a | b |\n|---|---|\n| 1 | 2 |") -> str:
+    return f"""# Chapter {number} - Topic {number}
+
+**Policy{number}**: a rule set that decides access for chapter {number}.
+{extra}
+Avoid using wildcard grants because they are dangerous and never safe.
+
+{table}
+
+```python
+def handler_{number}(event):
+    return event
+```
+
+See Chapter {number % 3 + 1} for details.
+
+"""
+
+
+def _document(extra: str = "") -> str:
+    # Chapter 3's header-only table emits WARN_TABLE_PARSE_FAILED
+    return "Preamble paragraph.\n\n" + _chapter(1, extra) + _chapter(2) + _chapter(3, table="| a | b |\n| c |")
+
+
+def _warnings(diagnostics):
+    return [(w["code"], w["line"], w["message"]) for w in diagnostics["warnings"]]
+
+
+def test_edit_matches_full_compile(tmp_path):
+    source = tmp_path / "bible.md"
+    compile_markdown_to_ssm_v3(_document(), source_file=str(source))
+    assert (tmp_path / ".biblec.chapters" / "bible.md").is_dir()
+
+    edited = _document("\n**Grant**: a permission given to a role.\n\n")
+    incremental, incremental_diag = compile_markdown_to_ssm_v3(edited, source_file=str(source))
+    full, full_diag = compile_markdown_to_ssm_v3(edited)
+    assert incremental == full
+    assert _warnings(incremental_diag) == _warnings(full_diag)
+    assert any(code == "WARN_TABLE_PARSE_FAILED" for code, _, _ in _warnings(full_diag))
+
+
+def test_only_changed_chapters_are_extracted(tmp_path):
+    cache = CompileCache(tmp_path / ".biblec.state.json")
+
+    units = partition_chapters(parse_markdown_to_ast(_document()))
+    _, hits = extract_chapters(units, errors=ErrorBus(), cache=cache)
+    assert len(units) == 4  # preamble + 3 chapters
+    assert hits == 0
+
+    # Lines inserted in chapter 1 shift chapters 2 and 3. Chapter 2 is reused
+    # with relocated line numbers; chapter 3's warning embeds its old line,
+    # so it is extracted again.
+    units = partition_chapters(parse_markdown_to_ast(_document("\nAn extra line.\n")))
+    extractions, hits = extract_chapters(units, errors=ErrorBus(), cache=cache)
+    assert hits == 2
+
+    fresh = extract_chapter(units[2], errors=ErrorBus())
+    assert extractions[2].terms == fresh.terms
+    assert extractions[2].codes == fresh.codes
+    assert extractions[2].node_tables == fresh.node_tables
+    assert extractions[3].events[0]["line"] == units[3].doc.nodes[3].line_no
+
+
+def test_prune_drops_stale_records(tmp_path):
+    cache = CompileCache(tmp_path / ".biblec.state.json")
+    extract_chapters(partition_chapters(parse_markdown_to_ast(_document())), cache=cache)
+
+    cache = CompileCache(tmp_path / ".biblec.state.json")
+    extract_chapters(partition_chapters(parse_markdown_to_ast(_document("\nChanged.\n"))), cache=cache)
+    assert cache.prune_chapters() == 1
+    assert len(list(cache.chapter_dir.glob("*.json"))) == 4
+
+
+def test_prune_keeps_other_sources_records(tmp_path):
+    first, second = tmp_path / "first.md", tmp_path / "second.md"
+    compile_markdown_to_ssm_v3(_document(), source_file=str(first))
+    first_records = set((tmp_path / ".biblec.chapters" / "first.md").glob("*.json"))
+
+    compile_markdown_to_ssm_v3(_document("\nOnly in the second bible.\n"), source_file=str(second))
+
+    assert first_records
+    assert set((tmp_path / ".biblec.chapters" / "first.md").glob("*.json")) == first_records
+    assert list((tmp_path / ".biblec.chapters" / "second.md").glob("*.json"))
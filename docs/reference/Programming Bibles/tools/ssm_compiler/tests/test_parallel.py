@@ -0,0 +1,127 @@
+"""
+Parallel Extraction Golden Tests
+
+Chapter extraction in a process pool must produce exactly the serial
+results: the same extractor entries, the same ErrorBus events in the same
+order, and byte-identical SSM output on the Rego and Python bibles.
+
+Serial and parallel compiles are both checked against SHA-256 hashes of
+known-good output in golden/parallel_sha256.json, so a change that alters
+both modes the same way is caught too. Output depends on set iteration
+order, so compiles run in a subprocess with PYTHONHASHSEED=0. After an
+intended output change, run with SSM_UPDATE_GOLDEN=1 to rewrite the hashes.
+
+The Python bible takes about half a minute per compile; set SSM_SLOW_TESTS=1
+to run it.
+"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+test_dir = Path(__file__).parent.parent
+if str(test_dir) not in sys.path:
+    sys.path.insert(0, str(test_dir))
+
+import importlib.util
+compiler_spec = importlib.util.spec_from_file_location("compiler_module", test_dir / "compiler.py")
+compiler_module = importlib.util.module_from_spec(compiler_spec)
+compiler_spec.loader.exec_module(compiler_module)
+compile_markdown_to_ssm_v3 = compiler_module.compile_markdown_to_ssm_v3
+
+from modules.parser_markdown import parse_markdown_to_ast
+from modules.chapter_extraction import (
+    extract_chapters,
+    extract_chapters_late,
+    merge_chapter_extractions,
+    merge_late_extractions,
+    partition_chapters,
+)
+from runtime.error_bus import ErrorBus
+
+
+REPO_ROOT = test_dir.parents[4]
+REGO_BIBLE = REPO_ROOT / "docs" / "reference" / "Rego_OPM_BIBLE" / "rego_opa_bible.md"
+PYTHON_BIBLE = REPO_ROOT / "knowledge" / "bibles" / "python" / "cursor" / "Python_Bible.cursor.md"
+
+BIBLES = [
+    pytest.param(REGO_BIBLE, id="rego"),
+    pytest.param(PYTHON_BIBLE, id="python"),
+]
+
+
+def _read(path: Path) -> str:
+    if not path.exists():
+        pytest.skip(f"{path.name} not available")
+    return path.read_text(encoding="utf-8")
+
+
+def _extract(text: str, workers):
+    errors = ErrorBus()
+    units = partition_chapters(parse_markdown_to_ast(text))
+    early, _ = extract_chapters(units, errors=errors, workers=workers)
+    late, _ = extract_chapters_late(units, errors=errors, workers=workers)
+    return merge_chapter_extractions(early), merge_late_extractions(late), [vars(e) for e in errors.events]
+
+
+@pytest.mark.parametrize("bible", BIBLES)
+def test_parallel_extraction_matches_serial(bible):
+    text = _read(bible)
+    assert _extract(text, workers=2) == _extract(text, workers=None)
+
+
+GOLDEN_HASHES = Path(__file__).parent / "golden" / "parallel_sha256.json"
+
+# Compiles a bible and prints the output and diagnostics hashes as JSON
+_COMPILE_SCRIPT = """
+import hashlib, importlib.util, json, sys
+from pathlib import Path
+sys.path.insert(0, sys.argv[1])
+spec = importlib.util.spec_from_file_location("compiler_module", Path(sys.argv[1]) / "compiler.py")
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+text = Path(sys.argv[2]).read_text(encoding="utf-8")
+output, diagnostics = module.compile_markdown_to_ssm_v3(text, namespace="golden", workers=int(sys.argv[3]) or None)
+diagnostics = json.dumps([diagnostics["warnings"], diagnostics["errors"]], sort_keys=True, default=str)
+print(json.dumps({
+    "ssm": hashlib.sha256(output.encode("utf-8")).hexdigest(),
+    "diagnostics": hashlib.sha256(diagnostics.encode("utf-8")).hexdigest(),
+}))
+"""
+
+
+def _compile_hashes(path: Path, workers) -> dict:
+    env = dict(os.environ, PYTHONHASHSEED="0")
+    result = subprocess.run(
+        [sys.executable, "-c", _COMPILE_SCRIPT, str(test_dir), str(path), str(workers or 0)],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _check_golden(name: str, path: Path):
+    _read(path)
+    golden = json.loads(GOLDEN_HASHES.read_text(encoding="utf-8")) if GOLDEN_HASHES.exists() else {}
+    serial = _compile_hashes(path, workers=None)
+    if os.environ.get("SSM_UPDATE_GOLDEN"):
+        golden[name] = serial
+        GOLDEN_HASHES.parent.mkdir(exist_ok=True)
+        GOLDEN_HASHES.write_text(json.dumps(golden, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    assert name in golden, f"no golden hashes for {name}; run with SSM_UPDATE_GOLDEN=1"
+    assert serial == golden[name]
+    assert _compile_hashes(path, workers=2) == golden[name]
+
+
+def test_compile_matches_golden_rego():
+    _check_golden("rego", REGO_BIBLE)
+
+
+@pytest.mark.skipif(not os.environ.get("SSM_SLOW_TESTS"), reason="set SSM_SLOW_TESTS=1 for the full Python bible compile")
+def test_compile_matches_golden_python():
+    _check_golden("python", PYTHON_BIBLE)
@@ -0,0 +1,63 @@
+"""
+Validation Report Tests
+
+A compile validates once and shares the report, which holds the same
+issues as validate_ssm().
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+test_dir = Path(__file__).parent.parent
+if str(test_dir) not in sys.path:
+    sys.path.insert(0, str(test_dir))
+
+import importlib.util
+compiler_spec = importlib.util.spec_from_file_location("compiler_module", test_dir / "compiler.py")
+compiler_module = importlib.util.module_from_spec(compiler_spec)
+compiler_spec.loader.exec_module(compiler_module)
+compile_markdown_to_ssm_v3 = compiler_module.compile_markdown_to_ssm_v3
+
+import validation.validate_ssm as validate_module
+from modules.ast_nodes import SSMBlock
+from validation.validate_ssm import validate_ssm, validate_ssm_report
+
+
+def _blocks():
+    return [
+        SSMBlock(block_type="chapter-meta", meta={"code": "CH-01", "number": 1, "title": "Intro"}, body="", index=0, id="ch-01"),
+        SSMBlock(block_type="relation", meta={"from": "CH-01", "to": "CH-09", "type": "reference"}, body="", index=1, id="rel-1"),
+        SSMBlock(block_type="term", meta={"name": "Rule"}, body="", index=2, id="term-1"),
+        SSMBlock(block_type="table", meta={"headers": ["a", "b"], "rows": [["1", "2"]]}, body="", index=3, id="tbl-1"),
+        SSMBlock(block_type="concept", meta={}, body="Duplicate", index=4, id="term-1"),
+    ]
+
+
+def _issues(issues):
+    return [vars(issue) for issue in issues]
+
+
+def test_report_matches_validate_ssm():
+    blocks = _blocks()
+    report = validate_ssm_report(blocks)
+    assert _issues(report.issues) == _issues(validate_ssm(blocks))
+    assert {e.code for e in report.errors} == {"VAL_DUPLICATE_ID", "VAL_MISSING_FIELD"}
+    assert [e.code for e in report.warnings] == ["VAL_UNRESOLVED_REFERENCE"]
+
+
+def test_compile_validates_once(monkeypatch):
+    calls = []
+    original = validate_module.validate_ssm_report
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(validate_module, "validate_ssm_report", counting)
+    _, diagnostics = compile_markdown_to_ssm_v3("# Chapter 1 - Intro\n\n**Rule**: a policy statement.\n")
+    assert len(calls) == 1
+    summary = diagnostics["summary"]
+    assert summary["validation_error_count"] == len(diagnostics["validation_errors"])
+    assert diagnostics["metrics"]["validation_errors"] == summary["validation_error_count"]
@@ -6,11 +6,14 @@ Validates SSM content for:
 - Required fields per block type
 - Reference resolution
 - Schema compliance
+
+A compile validates once into a ValidationReport that the ErrorBus, metrics
+and diagnostics share.
 """
 from __future__ import annotations
 
 from typing import List, Dict, Any, Optional, Set
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import re
 import sys
 from pathlib import Path
@@ -34,6 +37,20 @@ class ValidationError:
     severity: str = "error"  # error | warning
 
 
+@dataclass
+class ValidationReport:
+    """Result of one validation pass over a block list."""
+    issues: List[ValidationError] = field(default_factory=list)
+    
+    @property
+    def errors(self) -> List[ValidationError]:
+        return [e for e in self.issues if e.severity == "error"]
+    
+    @property
+    def warnings(self) -> List[ValidationError]:
+        return [e for e in self.issues if e.severity == "warning"]
+
+
 def validate_ssm(blocks: List[SSMBlock], symbols: Optional[Any] = None) -> List[ValidationError]:
     """
     Validate SSM blocks.
@@ -51,7 +68,22 @@ def validate_ssm(blocks: List[SSMBlock], symbols: Optional[Any] = None) -> List[
     Returns:
         List of ValidationError objects
     """
-    errors: List[ValidationError] = []
+    return validate_ssm_report(blocks, symbols=symbols).issues
+
+
+def validate_ssm_report(blocks: List[SSMBlock], symbols: Optional[Any] = None) -> ValidationReport:
+    """
+    Validate SSM blocks into a shareable report.
+    
+    Args:
+        blocks: List of SSM blocks
+        symbols: SymbolTable instance (optional)
+    
+    Returns:
+        ValidationReport with the issues validate_ssm() returns
+    """
+    report = ValidationReport()
+    errors = report.issues
     
     # Build block index
     by_id: Dict[str, SSMBlock] = {}
@@ -84,7 +116,7 @@ def validate_ssm(blocks: List[SSMBlock], symbols: Optional[Any] = None) -> List[
         block_errors = validate_block(block, by_id, chapter_codes, symbols)
         errors.extend(block_errors)
     
-    return errors
+    return report
 
 
 def validate_block(
@@ -0,0 +1,6 @@
+"""
+Micro-benchmarks for enforcement hot paths.
+
+Each module is runnable with ``python -m enforcement.benchmarks.<name>`` and
+prints timings for the optimized path next to the original implementation.
+"""
@@ -0,0 +1,130 @@
+"""
+Benchmark ChangeBuffer under a mass edit.
+
+Feeds N file changes into the original timer-per-path buffer (one
+threading.Timer started per change, flush callback run under the lock) and
+into ChangeBuffer's single scheduler thread, and reports ingest time, extra
+threads, number of flushes and when the last change was delivered.
+
+Usage:
+    python -m enforcement.benchmarks.bench_change_buffer [--files N] [--debounce S]
+"""
+
+import argparse
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / '.cursor' / 'scripts'
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from veroscore_v3.change_buffer import ChangeBuffer  # noqa: E402
+from veroscore_v3.file_change import FileChange  # noqa: E402
+
+
+class TimerPerPathBuffer:
+    """The original design: one Timer per path, flush under the lock."""
+
+    def __init__(self, debounce_seconds: float):
+        self.changes = {}
+        self.timers = {}
+        self.lock = threading.Lock()
+        self.debounce_seconds = debounce_seconds
+        self.flush_callback = None
+
+    def add_change(self, change):
+        with self.lock:
+            if change.path in self.timers:
+                self.timers.pop(change.path).cancel()
+            self.changes[change.path] = change
+            timer = threading.Timer(self.debounce_seconds, self._process_change, args=[change.path])
+            self.timers[change.path] = timer
+            timer.start()
+
+    def _process_change(self, file_path):
+        with self.lock:
+            self.timers.pop(file_path, None)
+            if self.flush_callback and self.changes:
+                self.flush_callback()
+
+    def take_all(self):
+        """Drain while the lock is already held by _process_change."""
+        for timer in self.timers.values():
+            timer.cancel()
+        self.timers.clear()
+        changes = list(self.changes.values())
+        self.changes.clear()
+        return changes
+
+
+def run(buffer, drain, changes, expected: int) -> dict:
+    delivered = []
+    flushes = []
+    done = threading.Event()
+
+    def on_flush(batch):
+        flushes.append(len(batch))
+        delivered.extend(batch)
+        if len(delivered) >= expected:
+            done.set()
+
+    drain(buffer, on_flush)
+    baseline_threads = threading.active_count()
+    peak_threads = baseline_threads
+    start = time.perf_counter()
+    for change in changes:
+        buffer.add_change(change)
+        peak_threads = max(peak_threads, threading.active_count())
+    ingest = time.perf_counter() - start
+    done.wait(60)
+    finished = time.perf_counter() - start
+    metrics = buffer.metrics() if hasattr(buffer, 'metrics') else None
+    if hasattr(buffer, 'close'):
+        buffer.close()
+    while threading.active_count() > baseline_threads:
+        time.sleep(0.01)  # Let cancelled timers exit before the next run
+    return {
+        'ingest_ms': ingest * 1000,
+        'delivered_ms': finished * 1000,
+        'peak_threads': peak_threads - baseline_threads,
+        'flushes': sum(1 for size in flushes if size),
+        'delivered': len(delivered),
+        'metrics': metrics,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--files', type=int, default=2000)
+    parser.add_argument('--debounce', type=float, default=0.2)
+    parser.add_argument('--batch', type=int, default=None, help='max_batch_size (default: larger than --files)')
+    args = parser.parse_args()
+
+    timestamp = datetime.now(timezone.utc).isoformat()
+    changes = [FileChange(path=f'src/file{i}.py', change_type='modified', timestamp=timestamp)
+               for i in range(args.files)]
+
+    def drain_original(buffer, on_flush):
+        buffer.flush_callback = lambda: on_flush(buffer.take_all())
+
+    def drain_scheduler(buffer, on_flush):
+        buffer.batch_callback = on_flush
+
+    original = run(TimerPerPathBuffer(args.debounce), drain_original, changes, args.files)
+    scheduled_buffer = ChangeBuffer(
+        debounce_seconds=args.debounce,
+        max_batch_size=args.batch or args.files + 1,
+    )
+    scheduled = run(scheduled_buffer, drain_scheduler, changes, args.files)
+
+    print(f"{args.files} changes, {args.debounce}s debounce")
+    for name, result in (('timer per path', original), ('single scheduler', scheduled)):
+        print(f"  {name:<17} ingest {result['ingest_ms']:8.1f} ms   delivered {result['delivered_ms']:8.1f} ms   "
+              f"extra threads {result['peak_threads']:5d}   flushes {result['flushes']:4d}")
+    print(f"  scheduler metrics: {scheduled['metrics']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark diff-stat resolution for a burst of file events.
+
+Builds a throwaway git repository, modifies N committed files (a branch
+checkout or formatter run) and compares the original per-event work (one
+``git diff --numstat`` and one ``git rev-parse HEAD`` per event) with
+VeroFieldChangeHandler, which records events without git calls and resolves
+every buffered change's stats in one batch when the ChangeBuffer is flushed.
+
+Usage:
+    python -m enforcement.benchmarks.bench_change_handler_flush [--files N]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / '.cursor' / 'scripts'
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from veroscore_v3.change_buffer import ChangeBuffer  # noqa: E402
+from veroscore_v3.change_handler import VeroFieldChangeHandler  # noqa: E402
+from veroscore_v3.git_diff_analyzer import GitDiffAnalyzer  # noqa: E402
+
+
+def git(root: Path, *args: str) -> None:
+    subprocess.run(['git', *args], cwd=root, check=True, capture_output=True)
+
+
+def build_repo(root: Path, files: int) -> list:
+    src = root / 'src'
+    src.mkdir(parents=True)
+    paths = []
+    for i in range(files):
+        path = src / f'module_{i}.py'
+        path.write_text(''.join(f'line {n}\n' for n in range(20)))
+        paths.append(str(path))
+    git(root, 'init', '-q')
+    git(root, 'config', 'user.email', 'bench@example.com')
+    git(root, 'config', 'user.name', 'bench')
+    git(root, 'add', '.')
+    git(root, 'commit', '-qm', 'baseline')
+    for i, path in enumerate(paths):
+        with open(path, 'a') as f:
+            f.write('added\n' * (i % 5 + 1))
+    return paths
+
+
+def original_burst(root: Path, paths: list) -> dict:
+    """What _process_change used to do for every event."""
+    stats = {}
+    for path in paths:
+        rel_path = os.path.relpath(path, root)
+        stats[rel_path] = GitDiffAnalyzer.get_diff_stats(rel_path, str(root))
+        subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=root, capture_output=True, text=True, check=False, timeout=5)
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--files', type=int, default=2000)
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix='chflush')
+    try:
+        root = Path(tmp)
+        paths = build_repo(root, args.files)
+        print(f"{len(paths)}-file burst")
+
+        start = time.perf_counter()
+        expected = original_burst(root, paths)
+        old = time.perf_counter() - start
+
+        buffer = ChangeBuffer(debounce_seconds=3600)
+        handler = VeroFieldChangeHandler('bench', {}, buffer, repo_root=str(root))
+        start = time.perf_counter()
+        for path in paths:
+            handler._process_change(path, 'modified')
+        ingest = time.perf_counter() - start
+        start = time.perf_counter()
+        changes = buffer.get_all()
+        flush = time.perf_counter() - start
+
+        resolved = {change.path: (change.lines_added, change.lines_removed) for change in changes}
+        assert resolved == expected, "batch stats differ from per-file stats"
+
+        print(f"  original per-event git calls  {old * 1000:9.1f} ms")
+        print(f"  lazy: record {len(paths)} events    {ingest * 1000:9.1f} ms")
+        print(f"  lazy: flush (one numstat)     {flush * 1000:9.1f} ms")
+        print(f"  speedup                       {old / (ingest + flush):9.1f}x")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+Benchmark checker routing for a large change set.
+
+Routes N changed files against the rules directory (default: .ai/rules, or
+synthetic rules with --rules) and compares the original per-rule loop (glob
+the rules directory, then fnmatch + recursive component matching for every
+file/pattern pair) with CheckerRouter's cached GlobIndex.
+
+Usage:
+    python -m enforcement.benchmarks.bench_checker_routing [--files N] [--rules N] [--rules-dir DIR]
+"""
+
+import argparse
+import fnmatch
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from enforcement.checkers.base_checker import BaseChecker
+from enforcement.checkers.checker_router import CheckerRouter
+from enforcement.checkers.rule_metadata import get_rule_metadata
+from enforcement.checkers.exceptions import RuleMetadataError
+
+
+TOP_DIRS = ['docs', 'scripts', 'deploy', 'apps', 'libs', 'frontend', 'tools', 'data']
+EXTENSIONS = ['.md', '.json', '.sh', '.yml', '.sql', '.txt', '.csv', '.ts']
+
+
+class NullChecker(BaseChecker):
+    def check(self, changed_files, user_message=None):
+        raise NotImplementedError
+
+
+def original_match(path_parts: List[str], pattern_parts: List[str]) -> bool:
+    """The pre-optimization recursive component matcher."""
+    if not pattern_parts:
+        return not path_parts
+    if not path_parts:
+        return all(p == '**' for p in pattern_parts)
+    pattern = pattern_parts[0]
+    if pattern == '**':
+        return original_match(path_parts, pattern_parts[1:]) or original_match(path_parts[1:], pattern_parts)
+    if pattern == '*' or pattern == path_parts[0]:
+        return original_match(path_parts[1:], pattern_parts[1:])
+    return False
+
+
+def original_route(rules_dir: Path, changed_files: List[str], available: dict) -> List[str]:
+    selected = []
+    for rule_file in rules_dir.glob('*.mdc'):
+        if rule_file.name not in available:
+            continue
+        try:
+            metadata = get_rule_metadata(rule_file)
+        except RuleMetadataError:
+            continue
+        patterns = metadata.get('globs', []) or metadata.get('filePatterns', [])
+        if metadata.get('alwaysApply', False) or not patterns:
+            selected.append(rule_file.name)
+            continue
+        for file_path in changed_files:
+            path = file_path.replace('\\', '/')
+            if any(
+                p.strip() and (
+                    fnmatch.fnmatch(path, p.strip()) or
+                    original_match(path.split('/'), p.strip().split('/'))
+                )
+                for p in patterns
+            ):
+                selected.append(rule_file.name)
+                break
+    return selected
+
+
+def write_rules(rules_dir: Path, count: int) -> None:
+    rules_dir.mkdir()
+    for i in range(count):
+        top = TOP_DIRS[i % len(TOP_DIRS)]
+        globs = f"{top}/**/rule{i}/**/*.ts,**/*.rule{i}.ts,{top}/*/src/**/*.gen{i}.py"
+        (rules_dir / f"{i:02d}-rule.mdc").write_text(f'---\nalwaysApply: false\nglobs: "{globs}"\n---\n')
+
+
+def changed_files(count: int) -> List[str]:
+    rng = random.Random(7)
+    files = []
+    for i in range(count):
+        depth = rng.randint(1, 6)
+        parts = [rng.choice(TOP_DIRS)] + [f"d{rng.randint(0, 30)}" for _ in range(depth)]
+        files.append('/'.join(parts) + f"/file{i}" + rng.choice(EXTENSIONS))
+    return files
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--files', type=int, default=10000)
+    parser.add_argument('--rules', type=int, default=20)
+    parser.add_argument('--rules-dir', type=Path, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rules_dir = args.rules_dir
+        if rules_dir is None:
+            rules_dir = Path(tmp) / 'rules'
+            write_rules(rules_dir, args.rules)
+        available = {rule_file.name: NullChecker for rule_file in rules_dir.glob('*.mdc')}
+        files = changed_files(args.files)
+        router = CheckerRouter(Path(tmp), rules_dir)
+
+        def routed():
+            return [checker.rule_ref for checker in router.get_checkers_to_run(files, available)]
+
+        print(f"{len(files)} changed files, {len(available)} rules in {rules_dir}")
+        start = time.perf_counter()
+        expected = original_route(rules_dir, files, available)
+        old = time.perf_counter() - start
+        start = time.perf_counter()
+        first = routed()
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        warm_result = routed()
+        warm = time.perf_counter() - start
+        assert expected == first == warm_result, (expected, first)
+
+        print(f"  original         {old * 1000:9.1f} ms   ({len(expected)} rules selected)")
+        print(f"  router (cold)    {cold * 1000:9.1f} ms   ({old / cold:.0f}x)")
+        print(f"  router (cached)  {warm * 1000:9.1f} ms   ({old / warm:.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
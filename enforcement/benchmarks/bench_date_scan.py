@@ -0,0 +1,85 @@
+"""
+Benchmark the date checker's file scan stage over many files.
+
+Writes synthetic source files (a small fraction containing dates) and times
+reading + date detection per file: the original path (text-mode read, every
+line through HARDCODED_DATE_PATTERN) against the byte-prefiltered path
+(read_date_candidate, then find_dates on candidate lines only).
+
+Usage:
+    python -m enforcement.benchmarks.bench_date_scan [--files N] [--lines N] [--dated-every N]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from enforcement.checks.date_checker import read_date_candidate
+from enforcement.date_detector import DateDetector
+
+
+def write_files(root: Path, count: int, lines: int, dated_every: int) -> List[Path]:
+    paths = []
+    (root / 'src').mkdir()
+    for i in range(count):
+        body = [f'export const value_{n} = compute({n}, "item-{n}");\n' for n in range(lines)]
+        if i % dated_every == 0:
+            body[lines // 2] = "// Last Updated: 2025-12-04\n"
+        path = root / 'src' / f'module_{i:05d}.ts'
+        path.write_text(''.join(body))
+        paths.append(path)
+    return paths
+
+
+def original_find_dates(detector: DateDetector, text: str) -> int:
+    """The pre-optimization find_dates loop (every line scanned)."""
+    found = 0
+    for line in text.split('\n'):
+        for match in detector.HARDCODED_DATE_PATTERN.findall(line):
+            if detector._normalize_date_match(match):
+                found += 1
+    return found
+
+
+def scan_original(detector: DateDetector, paths: List[Path]) -> int:
+    found = 0
+    for path in paths:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            found += original_find_dates(detector, f.read())
+    return found
+
+
+def scan_prefiltered(detector: DateDetector, paths: List[Path]) -> int:
+    found = 0
+    for path in paths:
+        text = read_date_candidate(path)
+        if text is not None:
+            found += len(detector.find_dates(text))
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--files', type=int, default=5000)
+    parser.add_argument('--lines', type=int, default=200)
+    parser.add_argument('--dated-every', type=int, default=20)
+    args = parser.parse_args()
+
+    detector = DateDetector(current_date='2025-12-05')
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_files(Path(tmp), args.files, args.lines, args.dated_every)
+        print(f"{args.files} files x {args.lines} lines, 1 in {args.dated_every} with a date")
+        for name, scan in (('original', scan_original), ('prefiltered', scan_prefiltered)):
+            start = time.perf_counter()
+            found = scan(detector, paths)
+            elapsed = time.perf_counter() - start
+            print(
+                f"  {name:<12} {elapsed * 1000:8.1f} ms  "
+                f"{args.files / elapsed:9.0f} files/s  ({found} dates)"
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""
+Benchmark cold enforcer runs against warm daemon requests.
+
+Copies the enforcer (.cursor/scripts, enforcement/, .ai/rules) into a
+throwaway git repository with a few hundred changed service files, then
+times ``auto-enforcer.py --no-daemon`` subprocess runs (what the file
+watcher used to do after every debounce) against the same check sent to a
+``--daemon`` process over its Unix socket. The real repository's status
+files are never touched.
+
+Usage:
+    python -m enforcement.benchmarks.bench_enforcer_daemon [--runs N] [--files N] [--paths N]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from enforcement.core.enforcer_daemon import DaemonUnavailable, request_check, send_request
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+IGNORE = shutil.ignore_patterns('__pycache__', '*.pyc', 'Cursor', 'benchmarks', 'tests', '.pytest_cache')
+
+
+def git(root: Path, *args: str) -> None:
+    subprocess.run(['git', *args], cwd=root, check=True, capture_output=True)
+
+
+def build_project(root: Path, files: int) -> List[str]:
+    shutil.copytree(REPO_ROOT / '.cursor' / 'scripts', root / '.cursor' / 'scripts', ignore=IGNORE)
+    shutil.copytree(REPO_ROOT / 'enforcement', root / 'enforcement', ignore=IGNORE)
+    shutil.copytree(REPO_ROOT / '.ai' / 'rules', root / '.ai' / 'rules')
+    service_dir = root / 'apps' / 'api' / 'src' / 'orders'
+    service_dir.mkdir(parents=True)
+    paths = []
+    for i in range(files):
+        path = service_dir / f'order{i}.service.ts'
+        path.write_text(
+            "@Injectable()\n"
+            f"export class Order{i}Service {{\n"
+            "  constructor(private prisma: PrismaService) {}\n"
+            "  async find(tenantId: string, id: string) {\n"
+            "    return this.prisma.order.findFirst({ where: { tenantId, id } });\n"
+            "  }\n"
+            "}\n"
+        )
+        paths.append(str(path.relative_to(root)))
+    git(root, 'init', '-q')
+    git(root, 'config', 'user.email', 'bench@example.com')
+    git(root, 'config', 'user.name', 'bench')
+    git(root, 'add', '.')
+    git(root, 'commit', '-qm', 'baseline')
+    for path in paths:
+        with open(root / path, 'a') as f:
+            f.write("// touched\n")
+    return paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--files', type=int, default=300)
+    parser.add_argument('--paths', type=int, default=20, help='Files named in each check request')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='enfd') as tmp:
+        root = Path(tmp) / 'p'
+        paths = build_project(root, args.files)[:args.paths]
+        script = root / '.cursor' / 'scripts' / 'auto-enforcer.py'
+        env = dict(os.environ, ENFORCER_DAEMON_SOCKET=str(Path(tmp) / 'd.sock'))
+        socket_path = Path(env['ENFORCER_DAEMON_SOCKET'])
+        print(f"{args.files} changed files, {len(paths)} per request, {args.runs} runs each")
+
+        cold = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            subprocess.run(
+                [sys.executable, str(script), '--no-daemon', '--paths', *paths],
+                cwd=root, env=env, capture_output=True, check=False,
+            )
+            cold.append(time.perf_counter() - start)
+
+        daemon = subprocess.Popen(
+            [sys.executable, str(script), '--daemon'],
+            cwd=root, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            deadline = time.time() + 60
+            while True:
+                try:
+                    send_request(socket_path, {'op': 'ping'}, timeout=2)
+                    break
+                except (DaemonUnavailable, OSError):
+                    if time.time() > deadline or daemon.poll() is not None:
+                        raise SystemExit("Enforcer daemon failed to start")
+                    time.sleep(0.05)
+
+            warm = []
+            first = None
+            for i in range(args.runs + 1):
+                start = time.perf_counter()
+                response = request_check(socket_path, paths=paths)
+                elapsed = time.perf_counter() - start
+                if not response or not response.get('ok'):
+                    raise SystemExit(f"Daemon request failed: {response}")
+                if i == 0:
+                    first = elapsed  # Loads checkers and fills caches
+                else:
+                    warm.append(elapsed)
+        finally:
+            daemon.terminate()
+            daemon.wait(10)
+
+        def report(name: str, samples: List[float]) -> None:
+            print(f"  {name:<22} median {statistics.median(samples) * 1000:8.1f} ms   "
+                  f"min {min(samples) * 1000:8.1f} ms")
+
+        report('cold subprocess', cold)
+        print(f"  {'daemon first request':<22}        {first * 1000:8.1f} ms")
+        report('daemon warm request', warm)
+        print(f"  speedup (median)       {statistics.median(cold) / statistics.median(warm):.1f}x")
+
+
+if __name__ == '__main__':
+    main()
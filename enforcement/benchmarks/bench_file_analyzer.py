@@ -0,0 +1,190 @@
+"""
+Benchmark per-file scoring on a large PR.
+
+Scores N files taken from this repository (cycled to reach N) with the
+previous FileAnalyzer, which re-scanned the content once per predicate and
+split it into lines twice per comment check, and with FileFeatures.extract()
+followed by the pure category scoring functions. Both must produce identical
+scores for every file.
+
+Usage:
+    python -m enforcement.benchmarks.bench_file_analyzer [--files N] [--repeat R]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS_DIR = REPO_ROOT / '.cursor' / 'scripts'
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from veroscore_v3.scoring_engine import (  # noqa: E402
+    FileFeatures,
+    score_architecture,
+    score_code_quality,
+    score_documentation,
+    score_security,
+    score_test_coverage,
+)
+
+SOURCE_SUFFIXES = ('.py', '.ts', '.tsx', '.js', '.md')
+
+
+class LegacyFileAnalyzer:
+    """FileAnalyzer before feature extraction (logging removed), for comparison."""
+
+    def __init__(self, file_path, content):
+        self.file_path = file_path
+        self.content = content
+        self.lines = content.split('\n')
+
+    def scores(self):
+        return (self.code_quality(), self.test_coverage(), self.documentation(),
+                self.architecture(), self.security())
+
+    def code_quality(self):
+        score = 0.0
+        if ': ' in self.content and '->' in self.content:
+            score += 2.0
+        if len([w for w in re.findall(r'\b\w+\b', self.content) if len(w) > 3]) > 10:
+            score += 2.0
+        if len([l for l in self.lines if l.strip().startswith(('#', '//'))]) > len(self.lines) * 0.1:
+            score += 1.0
+        if len(self.lines) < 300:
+            score += 2.0
+        if not any('  \t' in l or '\t  ' in l for l in self.lines):
+            score += 1.0
+        if self._has_long_functions():
+            score -= 3.0
+        if any(smell in self.content for smell in ['TODO', 'FIXME', 'HACK', 'XXX']):
+            score -= 2.0
+        if 'TODO' in self.content:
+            score -= 1.0
+        return max(-10, min(10, score))
+
+    def _has_long_functions(self):
+        in_function = False
+        function_lines = 0
+        for line in self.lines:
+            if 'def ' in line or 'function ' in line or 'const ' in line and '= (' in line:
+                in_function = True
+                function_lines = 0
+            if in_function:
+                function_lines += 1
+            if function_lines > 50:
+                return True
+        return False
+
+    def test_coverage(self):
+        score = 0.0
+        if any(t in self.file_path.lower() for t in ['test', 'spec', '__tests__']):
+            score += 5.0
+            if any(k in self.content for k in ['describe', 'it(', 'test(', 'def test_']):
+                score += 3.0
+            if any(k in self.content for k in ['edge', 'boundary', 'null', 'empty']):
+                score += 2.0
+        elif self.file_path.endswith(('.ts', '.tsx', '.js', '.jsx', '.py')):
+            score -= 5.0
+        return max(-10, min(10, score))
+
+    def documentation(self):
+        score = 0.0
+        if '"""' in self.content or "'''" in self.content or '/**' in self.content:
+            score += 4.0
+        if len([l for l in self.lines if l.strip().startswith(('#', '//'))]) > 5:
+            score += 2.0
+        if 'readme' in self.file_path.lower():
+            score += 2.0
+        if re.search(r'20[0-1][0-9]', self.content):
+            score -= 3.0
+        return max(-10, min(10, score))
+
+    def architecture(self):
+        score = 0.0
+        if self._is_in_correct_directory():
+            score += 3.0
+        if len(re.findall(r'export (class|function|const)', self.content)) <= 3:
+            score += 3.0
+        score += 2.0
+        has_jsx = '<' in self.content and '>' in self.content
+        if has_jsx and any(k in self.content for k in ['SELECT', 'INSERT', 'UPDATE', 'supabase']):
+            score -= 4.0
+        return max(-10, min(10, score))
+
+    def _is_in_correct_directory(self):
+        valid_patterns = {
+            'components': ['.tsx', '.jsx'],
+            'api': ['.ts', '.js'],
+            'utils': ['.ts', '.js'],
+            'types': ['.ts', '.d.ts']
+        }
+        for dir_name, extensions in valid_patterns.items():
+            if dir_name in self.file_path:
+                return any(self.file_path.endswith(ext) for ext in extensions)
+        return True
+
+    def security(self):
+        score = 0.0
+        if any(k in self.content for k in ['validate', 'sanitize', 'z.', 'yup.']):
+            score += 3.0
+        if '$' in self.content or '?' in self.content:
+            score += 3.0
+        if any(k in self.content for k in ['auth', 'session', 'user_id']):
+            score += 2.0
+        if 'console.log' in self.content:
+            score -= 2.0
+        if any(len(b) > 100 for b in re.findall(r'\/\*[\s\S]*?\*\/', self.content)):
+            score -= 1.0
+        return max(-10, min(10, score))
+
+
+def feature_scores(path, content):
+    features = FileFeatures.extract(path, content)
+    return (score_code_quality(features), score_test_coverage(features), score_documentation(features),
+            score_architecture(features), score_security(features))
+
+
+def load_files(count):
+    sources = []
+    for path in sorted(REPO_ROOT.rglob('*')):
+        if path.suffix in SOURCE_SUFFIXES and path.is_file() and '.git' not in path.parts:
+            try:
+                sources.append((str(path.relative_to(REPO_ROOT)), path.read_text(encoding='utf-8')))
+            except (UnicodeDecodeError, OSError):
+                continue
+    return [sources[i % len(sources)] for i in range(count)]
+
+
+def best_of(repeat, fn):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--files', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    files = load_files(args.files)
+    size_kib = sum(len(content) for _, content in files) / 1024
+
+    legacy, legacy_ms = best_of(args.repeat, lambda: [LegacyFileAnalyzer(p, c).scores() for p, c in files])
+    current, current_ms = best_of(args.repeat, lambda: [feature_scores(p, c) for p, c in files])
+    mismatches = [path for (path, _), old, new in zip(files, legacy, current) if old != new]
+    assert not mismatches, f'scores differ for {mismatches[:5]}'
+
+    print(f"{args.files} files, {size_kib:.0f} KiB, best of {args.repeat}")
+    print(f"  per-predicate FileAnalyzer   {legacy_ms:9.1f} ms")
+    print(f"  FileFeatures + score_*       {current_ms:9.1f} ms   ({legacy_ms / current_ms:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
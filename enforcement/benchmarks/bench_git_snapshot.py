@@ -0,0 +1,97 @@
+"""
+Benchmark GitSnapshot lookups against per-file git subprocesses.
+
+Builds a throwaway repository, modifies a batch of files (real and
+whitespace-only changes) and times is_file_modified_in_session over all of
+them, with and without the snapshot.
+
+Usage:
+    python -m enforcement.benchmarks.bench_git_snapshot [--files N] [--changed N]
+"""
+
+import argparse
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from enforcement.core.file_scanner import is_file_modified_in_session
+from enforcement.core.git_utils import GitUtils, run_git_command_cached
+from enforcement.core.session_state import EnforcementSession
+
+
+def git(repo: Path, *args: str) -> None:
+    subprocess.run(['git', *args], cwd=repo, check=True, capture_output=True)
+
+
+def build_repo(repo: Path, total: int, changed: int) -> List[str]:
+    """Create a repository with ``total`` files and modify the first ``changed``."""
+    git(repo, 'init', '-q')
+    git(repo, 'config', 'user.email', 'bench@example.com')
+    git(repo, 'config', 'user.name', 'bench')
+    paths = [f'src/module_{i:05d}.ts' for i in range(total)]
+    (repo / 'src').mkdir()
+    for path in paths:
+        (repo / path).write_text(f'export const value = {path!r};\n')
+    git(repo, 'add', '.')
+    git(repo, 'commit', '-qm', 'init')
+
+    for i, path in enumerate(paths[:changed]):
+        if i % 4 == 0:
+            (repo / path).write_text(f'export  const value = {path!r};\n')  # whitespace only
+        else:
+            (repo / path).write_text(f'export const value = {path!r} + 1;\n')
+    return paths[:changed]
+
+
+def make_session() -> EnforcementSession:
+    return EnforcementSession(
+        session_id='bench',
+        start_time='2000-01-01T00:00:00+00:00',
+        last_check='2000-01-01T00:00:00+00:00',
+        violations=[],
+        checks_passed=[],
+        checks_failed=[],
+        auto_fixes=[],
+        file_hashes={},
+        version=2,
+    )
+
+
+def run(repo: Path, files: List[str], use_snapshot: bool) -> tuple:
+    run_git_command_cached.cache_clear()
+    git_utils = GitUtils(repo, use_snapshot=use_snapshot)
+    session = make_session()
+
+    start = time.perf_counter()
+    first = None
+    results = []
+    for path in files:
+        results.append(is_file_modified_in_session(path, session, repo, git_utils))
+        if first is None:
+            first = time.perf_counter() - start
+    return results, first, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--files', type=int, default=2000)
+    parser.add_argument('--changed', type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = Path(tmp)
+        files = build_repo(repo, args.files, args.changed)
+
+        per_file, per_file_first, per_file_total = run(repo, files, use_snapshot=False)
+        snapshot, snapshot_first, snapshot_total = run(repo, files, use_snapshot=True)
+
+    assert per_file == snapshot, 'results differ'
+    print(f'{args.changed} changed files in a {args.files}-file repository')
+    print(f'per-file git: first answer {per_file_first * 1000:8.1f} ms  total {per_file_total * 1000:9.1f} ms')
+    print(f'snapshot:     first answer {snapshot_first * 1000:8.1f} ms  total {snapshot_total * 1000:9.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
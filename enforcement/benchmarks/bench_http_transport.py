@@ -0,0 +1,157 @@
+"""
+Benchmark Supabase requests with and without the pooled keep-alive transport.
+
+Sends the requests a watcher session makes (session lookup, changes_queue
+insert, stats RPC) to a local mock PostgREST server, first opening a new
+connection per request as supabase-py does when ``.schema()`` builds a fresh
+client, then through PooledPostgRESTClient on one shared PooledTransport.
+Reports per-request latency for a sequential run and a concurrent run.
+
+--connect-delay-ms adds a pause before the server accepts each new
+connection, standing in for the TCP+TLS handshake to a remote project
+(localhost makes connection setup nearly free).
+
+Usage:
+    python -m enforcement.benchmarks.bench_http_transport [--requests N] [--threads T] [--connect-delay-ms MS]
+"""
+
+import argparse
+import http.client
+import json
+import sys
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / '.cursor' / 'scripts'
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from veroscore_v3.http_transport import PooledTransport, TimingHistogram  # noqa: E402
+from veroscore_v3.postgrest_client import PooledPostgRESTClient  # noqa: E402
+
+SESSION = [{"session_id": "s1", "status": "active", "total_files": 0}]
+
+
+def start_server(connect_delay: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True  # As PostgREST does; avoids delayed-ACK stalls
+
+        def log_message(self, *args):
+            pass
+
+        def setup(self):
+            time.sleep(connect_delay)  # Once per connection
+            super().setup()
+
+        def _reply(self, status: int, payload):
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            self._reply(200, SESSION)
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            self._reply(201, json.loads(body or b"[]"))
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def workload():
+    """(method, path, body) for one watcher flush."""
+    change = {"session_id": "s1", "file_path": "src/a.py", "lines_added": 3, "lines_removed": 1}
+    return [
+        ("GET", "/rest/v1/sessions?" + urllib.parse.urlencode({"select": "*", "session_id": "eq.s1", "limit": "1"}), None),
+        ("POST", "/rest/v1/changes_queue", [change] * 10),
+        ("POST", "/rest/v1/rpc/veroscore_increment_session_stats", {"p_session_id": "s1", "p_files": 10}),
+    ]
+
+
+def new_connection_request(host: str, port: int, method: str, path: str, body) -> None:
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    try:
+        data = None if body is None else json.dumps(body).encode("utf-8")
+        conn.request(method, path, body=data, headers={
+            "apikey": "key", "Authorization": "Bearer key",
+            "Accept-Profile": "veroscore", "Content-Type": "application/json",
+        })
+        conn.getresponse().read()
+    finally:
+        conn.close()
+
+
+def pooled_request(client: PooledPostgRESTClient, method: str, path: str, body) -> None:
+    scope = client.schema("veroscore")
+    if path.startswith("/rest/v1/rpc/"):
+        scope.rpc(path.rsplit("/", 1)[1], body).execute()
+    elif method == "GET":
+        scope.table("sessions").select("*").eq("session_id", "s1").limit(1).execute()
+    else:
+        scope.table("changes_queue").insert(body).execute()
+
+
+def run(send, calls, requests: int, threads: int) -> dict:
+    histogram = TimingHistogram()
+    per_thread = max(1, requests // threads)
+
+    def worker():
+        for i in range(per_thread):
+            method, path, body = calls[i % len(calls)]
+            start = time.perf_counter()
+            send(method, path, body)
+            histogram.observe((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    snapshot = histogram.snapshot()
+    snapshot['throughput'] = snapshot['count'] / elapsed
+    return snapshot
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=600)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--connect-delay-ms', type=float, default=5.0)
+    args = parser.parse_args()
+
+    server = start_server(args.connect_delay_ms / 1000)
+    host, port = server.server_address[:2]
+    calls = workload()
+
+    print(f"{args.requests} requests, connect delay {args.connect_delay_ms} ms")
+    for threads in (1, args.threads):
+        transport = PooledTransport(max_connections_per_host=threads)
+        client = PooledPostgRESTClient(f"http://{host}:{port}", "key", transport=transport)
+        results = (
+            ('new connection', run(lambda m, p, b: new_connection_request(host, port, m, p, b), calls, args.requests, threads)),
+            ('pooled', run(lambda m, p, b: pooled_request(client, m, p, b), calls, args.requests, threads)),
+        )
+        print(f"  {threads} thread(s)")
+        for name, result in results:
+            print(f"    {name:<15} mean {result['mean_ms']:7.2f} ms   p50 <= {result['p50_ms']:g} ms   "
+                  f"p95 <= {result['p95_ms']:g} ms   {result['throughput']:8.0f} req/s")
+        pool_stats = next(iter(transport.stats().values()))
+        print(f"    pooled connections opened {pool_stats['connections_opened']}, "
+              f"reused {pool_stats['connections_reused']}")
+        transport.close()
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark offset-to-line conversion on a large service file.
+
+Generates a NestJS-style service with many Prisma calls and times
+parse_prisma_calls plus the raw line-number mapping of every call, comparing
+``content[:offset].count('\\n')`` per match with a LineIndex.
+
+Usage:
+    python -m enforcement.benchmarks.bench_line_index [--lines N] [--call-every N]
+"""
+
+import argparse
+import re
+import time
+from pathlib import Path
+
+from enforcement.core.line_index import LineIndex
+from enforcement.prisma_query_parser import parse_prisma_calls
+
+
+CALL_PATTERN = re.compile(r'tx\.(\w+)\.(\w+)\s*\(')
+
+
+def build_service(lines: int, call_every: int) -> str:
+    body = ["@Injectable()\n", "export class BigService {\n"]
+    while len(body) < lines - 1:
+        n = len(body)
+        if n % call_every == 0:
+            body.append(f"    const row{n} = await tx.customer.findMany({{ where: {{ tenantId, id: {n} }} }});\n")
+        else:
+            body.append(f"    const value{n} = compute({n});\n")
+    body.append("}\n")
+    return ''.join(body)
+
+
+def timed(fn, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--lines', type=int, default=10000)
+    parser.add_argument('--call-every', type=int, default=10)
+    args = parser.parse_args()
+
+    content = build_service(args.lines, args.call_every)
+    offsets = [m.end() - 1 for m in CALL_PATTERN.finditer(content)]
+    print(f"{args.lines}-line service, {len(offsets)} Prisma calls")
+
+    def prefix_count():
+        return [content[:offset].count('\n') + 1 for offset in offsets]
+
+    def line_index():
+        index = LineIndex(content)
+        return [index.line_number(offset) for offset in offsets]
+
+    assert prefix_count() == line_index()
+    old = timed(prefix_count)
+    new = timed(line_index)
+    print(f"  line mapping   prefix count {old * 1000:8.2f} ms   LineIndex {new * 1000:6.2f} ms   ({old / new:.0f}x)")
+
+    parse = timed(lambda: parse_prisma_calls(Path('big.service.ts'), content))
+    print(f"  parse_prisma_calls (with LineIndex) {parse * 1000:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark StructuredLogger per-call overhead.
+
+Times suppressed logger.debug() calls at INFO level and emitted logger.info()
+calls, comparing the previous _log (which built the entry, fetched the trace
+context and ran json.dumps before the level check) with the level-gated
+logger, and the synchronous console handler with the batching async sink.
+Emitted records go to a file so terminal speed doesn't dominate.
+
+Usage:
+    python -m enforcement.benchmarks.bench_logger [--calls N]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / '.cursor' / 'scripts'
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import logger_util  # noqa: E402
+from logger_util import StructuredFormatter, StructuredLogger, get_or_create_trace_context  # noqa: E402
+
+
+class LegacyLogger(StructuredLogger):
+    """StructuredLogger._log before level gating, for comparison."""
+
+    def _log(self, level, message, *args, operation=None, error_code=None, root_cause=None,
+             tenant_id=None, user_id=None, **additional_data):
+        trace_ctx = get_or_create_trace_context()
+        log_entry = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "level": level,
+            "message": message,
+            "context": self.context,
+            "operation": operation or "unknown",
+            "severity": level.lower(),
+            "traceId": trace_ctx.get("traceId"),
+            "spanId": trace_ctx.get("spanId"),
+            "requestId": trace_ctx.get("requestId"),
+        }
+        if error_code:
+            log_entry["errorCode"] = error_code
+        if additional_data:
+            log_entry.update(additional_data)
+        getattr(self.logger, level.lower(), self.logger.info)(json.dumps(log_entry))
+
+    def debug(self, message, *args, operation=None, **kwargs):
+        self._log("DEBUG", message, operation=operation, **kwargs)
+
+    def info(self, message, *args, operation=None, **kwargs):
+        self._log("INFO", message, operation=operation, **kwargs)
+
+
+def per_call_us(calls, fn):
+    start = time.perf_counter()
+    for i in range(calls):
+        fn(i)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def file_logger(cls, name, path):
+    log = cls(name)
+    log.logger.propagate = False
+    for handler in list(log.logger.handlers):
+        log.logger.removeHandler(handler)
+    handler = logging.FileHandler(path)
+    handler.setFormatter(StructuredFormatter())
+    log.logger.addHandler(handler)
+    return log, handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=50000)
+    args = parser.parse_args()
+    calls = args.calls
+    tmp = Path(tempfile.mkdtemp(prefix='bench_logger_'))
+
+    legacy, legacy_handler = file_logger(LegacyLogger, 'bench.legacy', tmp / 'legacy.log')
+    gated, gated_handler = file_logger(StructuredLogger, 'bench.gated', tmp / 'gated.log')
+
+    def debug_call(log):
+        return lambda i: log.debug("Checked %s", i, operation="bench", file_path="src/a.ts", cache_key="k")
+
+    def info_call(log):
+        return lambda i: log.info("Checked %s", i, operation="bench", file_path="src/a.ts", cache_key="k")
+
+    rows = [
+        ("suppressed debug, previous", per_call_us(calls, debug_call(legacy))),
+        ("suppressed debug, gated", per_call_us(calls, debug_call(gated))),
+        ("emitted info, previous", per_call_us(calls, info_call(legacy))),
+        ("emitted info, sync handler", per_call_us(calls, info_call(gated))),
+    ]
+    legacy_handler.close()
+    gated_handler.close()
+
+    # Async sink: the caller only serializes and enqueues; the sink thread writes batches
+    async_log = StructuredLogger('bench.async')
+    async_log.logger.propagate = False
+    sink = logger_util.enable_async_logging(file_path=tmp / 'async.log')
+    start = time.perf_counter()
+    per_call = per_call_us(calls, info_call(async_log))
+    logger_util.disable_async_logging()
+    drained_us = (time.perf_counter() - start) / calls * 1e6
+    rows.append(("emitted info, async sink", per_call))
+    rows.append(("  ... including drain", drained_us))
+
+    print(f"{calls} calls per case, microseconds per call")
+    for label, us in rows:
+        print(f"  {label:30s} {us:8.2f}")
+    print(f"  async sink wrote {sink.lines_written} lines in {sink.batches_written} batches")
+    for path in tmp.iterdir():
+        os.unlink(path)
+    tmp.rmdir()
+
+
+if __name__ == '__main__':
+    main()
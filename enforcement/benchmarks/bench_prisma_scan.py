@@ -0,0 +1,157 @@
+"""
+Benchmark Prisma call extraction on a large service file.
+
+Times the original extraction (three header regexes over the file, then a
+character loop per call for the argument block, the top-level where key and
+the where object) against scan_prisma_calls, which finds calls, argument
+spans and where objects in one tokenizer pass. Also reports a repeat scan of
+the same content, which is what the second checker to look at a file pays.
+
+Usage:
+    python -m enforcement.benchmarks.bench_prisma_scan [--methods N] [--filler N]
+"""
+
+import argparse
+import re
+import time
+
+from enforcement.prisma_query_parser import _tokenize_prisma_calls, scan_prisma_calls
+
+
+HEADER_PATTERNS = [
+    re.compile(r'this\.(?:prisma|db)\.(\w+)\.(\w+)\s*\('),
+    re.compile(r'tx\.(\w+)\.(\w+)\s*\('),
+    re.compile(r'(?:await\s+)?prisma\.(\w+)\.(\w+)\s*\('),
+]
+WHERE_PATTERN = re.compile(r'\bwhere\s*:', re.IGNORECASE)
+
+
+def build_service(methods: int, filler: int) -> str:
+    body = ["@Injectable()\nexport class BigService {\n"]
+    for n in range(methods):
+        fields = ''.join(f"      field{k}: 'value {k} (x)',\n" for k in range(filler))
+        body.append(
+            f"  async update{n}(id: string, dto: UpdateDto) {{\n"
+            f"    const existing = await prisma.order.findFirst({{\n"
+            f"      where: {{ tenantId: dto.tenantId, id, OR: [{{ status: 'open' }}, {{ status: 'held' }}] }},\n"
+            f"      include: {{ lines: {{ where: {{ active: true }} }} }},\n"
+            f"    }});\n"
+            f"    return tx.order.update({{\n"
+            f"      data: {{\n{fields}      }},\n"
+            f"      where: {{ id: existing.id }},\n"
+            f"    }});\n"
+            f"  }}\n\n"
+        )
+    body.append("}\n")
+    return ''.join(body)
+
+
+def match_block(text: str, start: int, opener: str, closer: str):
+    """Original string-aware bracket matcher (one character per iteration)."""
+    depth = 0
+    in_string = None
+    escape = False
+    for pos in range(start, len(text)):
+        char = text[pos]
+        if escape:
+            escape = False
+        elif char == '\\':
+            escape = True
+        elif in_string:
+            if char == in_string:
+                in_string = None
+        elif char in ('"', "'", '`'):
+            in_string = char
+        elif char == opener:
+            depth += 1
+        elif char == closer:
+            depth -= 1
+            if depth == 0:
+                return text[start + 1:pos]
+    return None
+
+
+def top_level(prefix: str) -> bool:
+    """Original nesting check: rescans everything before a where key."""
+    depth = 0
+    in_string = None
+    escape = False
+    for char in prefix:
+        if escape:
+            escape = False
+        elif char == '\\':
+            escape = True
+        elif in_string:
+            if char == in_string:
+                in_string = None
+        elif char in ('"', "'", '`'):
+            in_string = char
+        elif char in '{[(':
+            depth += 1
+        elif char in '}])':
+            depth -= 1
+    return depth == 0
+
+
+def original_scan(content: str):
+    seen = set()
+    matches = []
+    for pattern in HEADER_PATTERNS:
+        for match in pattern.finditer(content):
+            if match.span() not in seen:
+                seen.add(match.span())
+                matches.append(match)
+    matches.sort(key=lambda m: m.start())
+    found = []
+    for match in matches:
+        args = match_block(content, match.end() - 1, '(', ')')
+        if args is None:
+            continue
+        inner = args.strip()
+        if inner.startswith('{'):
+            inner = match_block(inner, 0, '{', '}') or inner
+        where = None
+        for key in WHERE_PATTERN.finditer(inner):
+            if top_level(inner[:key.start()]):
+                rest = inner[key.end():].lstrip()
+                if rest.startswith('{'):
+                    where = match_block(rest, 0, '{', '}')
+                    if where:
+                        break
+        found.append((match.group(1), match.group(2), where))
+    return found
+
+
+def timed(fn, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--methods', type=int, default=500)
+    parser.add_argument('--filler', type=int, default=20)
+    args = parser.parse_args()
+
+    content = build_service(args.methods, args.filler)
+    single = _tokenize_prisma_calls(content)
+    original = original_scan(content)
+    print(f"{len(content.splitlines())}-line service, {len(single)} Prisma calls")
+    assert [(s.model, s.op) for s in single] == [(m, o) for m, o, _ in original]
+    assert [content[s.where_start + 1:s.where_end] for s in single] == [w for _, _, w in original]
+
+    old = timed(lambda: original_scan(content))
+    new = timed(lambda: _tokenize_prisma_calls(content))
+    scan_prisma_calls(content)
+    cached = timed(lambda: scan_prisma_calls(content))
+    print(f"  original multi-pass  {old * 1000:8.2f} ms")
+    print(f"  single tokenizer     {new * 1000:8.2f} ms   ({old / new:.1f}x)")
+    print(f"  repeat (cached)      {cached * 1000:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
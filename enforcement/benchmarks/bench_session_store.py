@@ -0,0 +1,113 @@
+"""
+Benchmark session persistence: session.json rewrite vs. SessionStore.
+
+Builds a session at the prune caps (2,000 violations, 10,000 file hashes)
+and times a load plus a save that appends a few violations and hashes, using
+the previous load/save (json.load of the whole file and json.dump with
+indent=2) and the incremental SQLite store.
+
+Usage:
+    python -m enforcement.benchmarks.bench_session_store [--runs N] [--appends N]
+"""
+
+import argparse
+import json
+import shutil
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+from enforcement.core.session_state import (
+    EnforcementSession,
+    get_session_store,
+    load_session,
+    prune_session_data,
+    save_session,
+)
+
+
+def build_session(violations: int, hashes: int) -> EnforcementSession:
+    session = EnforcementSession.create_new()
+    session.violations = [
+        {
+            "rule": "date",
+            "severity": "BLOCKED",
+            "file_path": f"frontend/src/components/Widget{i}.tsx",
+            "line_number": i % 400 + 1,
+            "message": f"Hardcoded date 2025-11-{i % 28 + 1:02d} found",
+            "timestamp": "2025-12-05T10:00:00+00:00",
+        }
+        for i in range(violations)
+    ]
+    session.checks_passed = [f"check_{i}" for i in range(200)]
+    session.file_hashes = {f"/repo/src/file{i}.ts:1733390000.{i}": f"{i:064x}" for i in range(hashes)}
+    return session
+
+
+def append_work(session: EnforcementSession, run: int, appends: int) -> None:
+    for i in range(appends):
+        session.violations.append({
+            "rule": "security",
+            "severity": "WARNING",
+            "file_path": f"backend/src/run{run}.ts",
+            "line_number": i + 1,
+            "message": "New violation",
+            "timestamp": "2025-12-05T10:00:00+00:00",
+        })
+        session.file_hashes[f"/repo/src/run{run}_{i}.ts:1733390001.0"] = f"{run * 100 + i:064x}"
+
+
+def legacy_load(session_file: Path) -> EnforcementSession:
+    with open(session_file, 'r', encoding='utf-8') as f:
+        return EnforcementSession(**json.load(f))
+
+
+def legacy_save(session: EnforcementSession, session_file: Path) -> None:
+    prune_session_data(session)
+    with open(session_file, 'w', encoding='utf-8') as f:
+        json.dump(asdict(session), f, indent=2)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--appends', type=int, default=5)
+    args = parser.parse_args()
+    tmp = Path(tempfile.mkdtemp(prefix='bench_session_'))
+    try:
+        json_file = tmp / 'session.json'
+        legacy_save(build_session(2000, 10000), json_file)
+        start = time.perf_counter()
+        for run in range(args.runs):
+            session = legacy_load(json_file)
+            append_work(session, run, args.appends)
+            legacy_save(session, json_file)
+        legacy_ms = (time.perf_counter() - start) / args.runs * 1000
+
+        store_dir = tmp / 'store'
+        store_dir.mkdir()
+        save_session(build_session(2000, 10000), store_dir)
+        store = get_session_store(store_dir)
+        written = deleted = 0
+        start = time.perf_counter()
+        for run in range(args.runs):
+            session, _ = load_session(store_dir)
+            append_work(session, run, args.appends)
+            save_session(session, store_dir)
+            written += store.last_save["rows_written"]
+            deleted += store.last_save["rows_deleted"]
+        store_ms = (time.perf_counter() - start) / args.runs * 1000
+
+        print(f"{args.runs} load+save runs, {args.appends} violations and hashes appended per run")
+        print(f"  session.json rewrite   {legacy_ms:8.2f} ms/run  ({json_file.stat().st_size / 1e6:.1f} MB written per save)")
+        print(f"  SessionStore           {store_ms:8.2f} ms/run  "
+              f"({written / args.runs:.0f} rows written, {deleted / args.runs:.0f} deleted per save)")
+        print(f"  speedup                {legacy_ms / store_ms:8.1f}x")
+        store.close()
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark incremental SSM compiles after a one-chapter edit.
+
+Compiles a bible without the compile cache, warms the cache, then edits one
+chapter (inserting a definition near its start, which also shifts every later
+chapter) and compiles again. Reports the chapter extraction stage (terms,
+code, relations, diagrams, tables, antipatterns, rationale, contrast) and
+the whole compile, which still rebuilds blocks and runs every enrichment pass
+over the full document. With --workers N the full extraction is also timed
+in a process pool of N workers.
+
+Usage:
+    python -m enforcement.benchmarks.bench_ssm_incremental [--source PATH] [--runs N] [--workers N]
+"""
+
+import argparse
+import importlib.util
+import logging
+import re
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+COMPILER_DIR = REPO_ROOT / 'docs' / 'reference' / 'Programming Bibles' / 'tools' / 'ssm_compiler'
+DEFAULT_SOURCE = REPO_ROOT / 'docs' / 'reference' / 'Rego_OPM_BIBLE' / 'rego_opa_bible.md'
+sys.path.insert(0, str(COMPILER_DIR))
+
+# compiler.py is shadowed by the compiler/ package, load it by path
+_spec = importlib.util.spec_from_file_location('compiler_module', COMPILER_DIR / 'compiler.py')
+compiler_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(compiler_module)
+
+from modules.chapter_extraction import (  # noqa: E402
+    extract_chapters,
+    extract_chapters_late,
+    partition_chapters,
+)
+from modules.parser_markdown import parse_markdown_to_ast  # noqa: E402
+from runtime.cache import CompileCache  # noqa: E402
+from runtime.error_bus import ErrorBus  # noqa: E402
+
+
+def edit_chapter(text: str, run: int) -> str:
+    """Insert a term definition after the heading of the middle chapter."""
+    lines = text.splitlines(keepends=True)
+    headings = [i for i, line in enumerate(lines) if re.match(r'^#+\s*Chapter\s+\d+', line)]
+    at = headings[len(headings) // 2] + 1
+    return ''.join(lines[:at] + [f'\n**Edit{run}**: an inserted definition for run {run}.\n\n'] + lines[at:])
+
+
+def time_extraction(text: str, cache, workers=None) -> float:
+    ast = parse_markdown_to_ast(text)
+    start = time.perf_counter()
+    units = partition_chapters(ast)
+    extract_chapters(units, errors=ErrorBus(), cache=cache, workers=workers)
+    extract_chapters_late(units, errors=ErrorBus(), cache=cache, workers=workers)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--source', type=Path, default=DEFAULT_SOURCE)
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)  # Progress logging would dominate the timings
+
+    text = args.source.read_text(encoding='utf-8')
+    tmp = Path(tempfile.mkdtemp(prefix='bench_ssm_'))
+    try:
+        source_file = str(tmp / args.source.name)
+        cache = CompileCache(tmp / '.biblec.state.json')
+        time_extraction(text, cache)
+        full_extract = sum(time_extraction(edit_chapter(text, run), None) for run in range(args.runs)) / args.runs
+        edit_extract = sum(time_extraction(edit_chapter(text, run), cache) for run in range(args.runs)) / args.runs
+
+        compile_ssm = compiler_module.compile_markdown_to_ssm_v3
+        start = time.perf_counter()
+        compile_ssm(text, namespace='bench')
+        full_compile = time.perf_counter() - start
+        compile_ssm(text, namespace='bench', source_file=source_file)
+        start = time.perf_counter()
+        compile_ssm(edit_chapter(text, 0), namespace='bench', source_file=source_file)
+        edit_compile = time.perf_counter() - start
+
+        chapters = len(partition_chapters(parse_markdown_to_ast(text)))
+        print(f"{args.source.name}: {len(text.splitlines())} lines, {chapters} units (chapters + preamble)")
+        print(f"  extraction, full          {full_extract * 1000:9.1f} ms")
+        print(f"  extraction, 1 chapter     {edit_extract * 1000:9.1f} ms  ({full_extract / edit_extract:.1f}x)")
+        if args.workers:
+            pool_extract = sum(
+                time_extraction(edit_chapter(text, run), None, args.workers) for run in range(args.runs)
+            ) / args.runs
+            print(f"  extraction, {args.workers:>2} workers    {pool_extract * 1000:9.1f} ms  ({full_extract / pool_extract:.2f}x)")
+        print(f"  compile, full             {full_compile * 1000:9.1f} ms")
+        print(f"  compile, 1 chapter        {edit_compile * 1000:9.1f} ms  ({full_compile / edit_compile:.2f}x)")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
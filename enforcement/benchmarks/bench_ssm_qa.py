@@ -0,0 +1,97 @@
+"""
+Benchmark SSM QA generation on a large synthetic bible.
+
+Builds N blocks (terms, concepts and facts mixed with section metadata, like
+a compiled bible) and runs enrich_qa with its trigram question index, then
+again with a question index that rescans every stored question per name.
+The original pass rescanned every block, which is slower still.
+
+Usage:
+    python -m enforcement.benchmarks.bench_ssm_qa [--blocks N] [--seed S]
+"""
+
+import argparse
+import copy
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+COMPILER_DIR = REPO_ROOT / 'docs' / 'reference' / 'Programming Bibles' / 'tools' / 'ssm_compiler'
+sys.path.insert(0, str(COMPILER_DIR))
+
+from modules.ast_nodes import SSMBlock  # noqa: E402
+from modules.enrichment_v3 import qa_generator  # noqa: E402
+
+WORDS = (
+    'policy rule bundle decision query input data module package import default '
+    'partial virtual document function iteration comprehension set object array '
+    'string number boolean null test coverage trace profile cache index schema '
+    'annotation metadata scope binding unification negation aggregate builtin'
+).split()
+
+
+class RescanQuestionIndex:
+    """Question lookup by scanning every stored question."""
+
+    def __init__(self):
+        self.questions = []
+
+    def add(self, question):
+        self.questions.append(question.lower())
+
+    def mentions(self, name):
+        name = name.lower()
+        return any(name in q for q in self.questions)
+
+
+def make_blocks(count: int, rng: random.Random):
+    blocks = []
+    for i in range(count):
+        kind = ('term', 'concept', 'fact', 'section-meta')[i % 4]
+        name = ' '.join(rng.sample(WORDS, 3)) + f' {i}'
+        text = f'{name.capitalize()} describes how {rng.choice(WORDS)} relates to {rng.choice(WORDS)} in block {i}.'
+        if kind == 'term':
+            meta = {'name': name, 'definition': text}
+            body = ''
+        else:
+            meta = {'summary': f'{name}: {text}'}
+            body = text
+        blocks.append(SSMBlock(block_type=kind, meta=meta, body=body, index=i, id=f'B{i}', chapter=f'CH-{i % 30:02d}'))
+    return blocks
+
+
+def time_pass(blocks, index_cls):
+    blocks = copy.deepcopy(blocks)
+    original = qa_generator._QuestionIndex
+    qa_generator._QuestionIndex = index_cls
+    try:
+        start = time.perf_counter()
+        qa_generator.enrich_qa(blocks, {})
+        elapsed = time.perf_counter() - start
+    finally:
+        qa_generator._QuestionIndex = original
+    return elapsed, sum(1 for b in blocks if b.block_type == 'qa')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--blocks', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    blocks = make_blocks(args.blocks, random.Random(args.seed))
+    indexed, indexed_qas = time_pass(blocks, qa_generator._QuestionIndex)
+    rescan, rescan_qas = time_pass(blocks, RescanQuestionIndex)
+    assert indexed_qas == rescan_qas
+
+    print(f"{args.blocks} blocks, {indexed_qas} QAs generated")
+    print(f"  enrich_qa, trigram index   {indexed * 1000:9.1f} ms")
+    print(f"  enrich_qa, rescan          {rescan * 1000:9.1f} ms  ({rescan / indexed:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -13,8 +13,11 @@ from .exceptions import (
     CheckerExecutionError
 )
 from .rule_metadata import get_rule_metadata, parse_rule_metadata
-from .pattern_matcher import match_file_patterns, get_matching_files
+from .pattern_matcher import match_file_patterns, get_matching_files, GlobIndex
 from .checker_router import CheckerRouter
+from .file_content_store import FileContentStore, FileContent
+from .parallel_runner import run_checkers_in_process_pool, merge_checker_results
+from .result_cache import ViolationCache
 
 # Import all checkers
 from .enforcement_checker import EnforcementChecker
@@ -59,7 +62,13 @@ __all__ = [
     'parse_rule_metadata',
     'match_file_patterns',
     'get_matching_files',
+    'GlobIndex',
     'CheckerRouter',
+    'FileContentStore',
+    'FileContent',
+    'run_checkers_in_process_pool',
+    'merge_checker_results',
+    'ViolationCache',
     # Checkers
     'EnforcementChecker',
     'CoreChecker',
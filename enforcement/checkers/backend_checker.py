@@ -27,6 +27,7 @@ from ..autofix_suggestions import (
     heavy_body_no_dto_hint,
     mutating_no_auth_guard_hint
 )
+from ..core.line_index import LineIndex
 
 
 class BackendChecker(BaseChecker):
@@ -40,6 +41,8 @@ class BackendChecker(BaseChecker):
     - Authentication guard presence
     """
     
+    supports_file_sharding = True
+    
     # Minimum number of @Body() params to trigger "heavy usage" smell
     HEAVY_BODY_USAGE_THRESHOLD = 3
     
@@ -80,9 +83,8 @@ class BackendChecker(BaseChecker):
                     continue
                 
                 try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                        lines = f.readlines()
+                    lines = self._read_lines(file_path)
+                    content = ''.join(lines)
                     
                     # Only check files with @Controller decorator
                     if '@Controller' not in content:
@@ -235,6 +237,8 @@ class BackendChecker(BaseChecker):
             List of Violation objects
         """
         violations = []
+        content = ''.join(lines)
+        line_index = None
         
         # Check each mutating method
         for method in controller_info['mutating_methods']:
@@ -248,10 +252,11 @@ class BackendChecker(BaseChecker):
                 if not controller_info['has_auth_guard']:
                     # Find line number for method
                     line_num = None
-                    content = ''.join(lines)
                     method_pos = method['position']
                     if method_pos < len(content):
-                        line_num = content[:method_pos].count('\n') + 1
+                        if line_index is None:
+                            line_index = LineIndex(content)
+                        line_num = line_index.line_number(method_pos)
                     
                     violations.append(Violation(
                         severity='WARNING',
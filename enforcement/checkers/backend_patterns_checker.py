@@ -25,6 +25,13 @@ from ..autofix_suggestions import (
     pass_through_service_fix_hint
 )
 from .backend_utils import parse_controller_structure
+from ..core.line_index import LineIndex
+from ..prisma_query_parser import scan_prisma_calls
+
+
+PRISMA_MUTATION_OPS = frozenset({
+    'create', 'update', 'delete', 'upsert', 'createMany', 'updateMany', 'deleteMany',
+})
 
 
 class ControllerAnalyzer:
@@ -199,10 +206,11 @@ class ControllerAnalyzer:
             re.DOTALL
         )
         
+        line_index = LineIndex(self.content)
         for match in method_pattern.finditer(self.content):
             method_name = match.group(1)
             method_body = match.group(2)
-            method_line = self.content[:match.start()].count('\n') + 1
+            method_line = line_index.line_number(match.start())
             
             methods.append({
                 'name': method_name,
@@ -250,24 +258,19 @@ class ServiceAnalyzer:
         violations = []
         
         methods = self._extract_methods()
+        prisma_calls = scan_prisma_calls(self.content) if methods else ()
         
         for method in methods:
             method_body = method['body']
             method_name = method['name']
             method_line = method['line']
             
-            # Find all Prisma mutation operations
-            mutation_patterns = [
-                r'prisma\.\w+\.(create|update|delete|upsert|createMany|updateMany|deleteMany)\s*\(',
-                r'this\.prisma\.\w+\.(create|update|delete|upsert|createMany|updateMany|deleteMany)\s*\(',
-                r'this\.db\.\w+\.(create|update|delete|upsert|createMany|updateMany|deleteMany)\s*\(',
-                r'tx\.\w+\.(create|update|delete|upsert|createMany|updateMany|deleteMany)\s*\(',
-            ]
-            
-            mutation_count = 0
-            for pattern in mutation_patterns:
-                mutations = re.findall(pattern, method_body)
-                mutation_count += len(mutations)
+            # Count Prisma mutation operations inside the method body
+            mutation_count = sum(
+                1 for call in prisma_calls
+                if call.op in PRISMA_MUTATION_OPS
+                and method['body_start'] <= call.start < method['body_end']
+            )
             
             # Check if $transaction is used
             has_transaction = (
@@ -368,7 +371,7 @@ class ServiceAnalyzer:
         Extract service methods for analysis.
         
         Returns:
-            List of method dictionaries with name, line, and body
+            List of method dictionaries with name, line, body and body offsets
         """
         methods = []
         
@@ -378,15 +381,18 @@ class ServiceAnalyzer:
             re.DOTALL
         )
         
+        line_index = LineIndex(self.content)
         for match in method_pattern.finditer(self.content):
             method_name = match.group(1)
             method_body = match.group(2)
-            method_line = self.content[:match.start()].count('\n') + 1
+            method_line = line_index.line_number(match.start())
             
             methods.append({
                 'name': method_name,
                 'line': method_line,
                 'body': method_body,
+                'body_start': match.start(2),
+                'body_end': match.end(2),
             })
         
         return methods
@@ -403,6 +409,9 @@ class BackendPatternsChecker(BaseChecker):
     - Domain logic in services (not pass-through)
     """
     
+    supports_file_sharding = True
+    supports_result_cache = True
+    
     def check(self, changed_files: List[str], user_message: Optional[str] = None) -> CheckerResult:
         """
         Execute backend patterns checks.
@@ -448,9 +457,8 @@ class BackendPatternsChecker(BaseChecker):
                     continue
                 
                 try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        lines = f.readlines()
-                        content = ''.join(lines)
+                    lines = self._read_lines(file_path)
+                    content = self._read_text(file_path)
                     
                     # Only check files with @Controller decorator
                     if '@Controller' in content:
@@ -472,9 +480,8 @@ class BackendPatternsChecker(BaseChecker):
                     continue
                 
                 try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        lines = f.readlines()
-                        content = ''.join(lines)
+                    lines = self._read_lines(file_path)
+                    content = self._read_text(file_path)
                     
                     # Only check files with @Injectable decorator
                     if '@Injectable' in content:
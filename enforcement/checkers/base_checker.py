@@ -8,11 +8,14 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, TYPE_CHECKING
 from enum import Enum
 
 from .exceptions import CheckerExecutionError
 
+if TYPE_CHECKING:
+    from .file_content_store import FileContentStore
+
 
 class CheckerStatus(Enum):
     """Status of a checker execution."""
@@ -63,6 +66,15 @@ class BaseChecker(ABC):
     Each checker is responsible for enforcing a specific rule file.
     """
     
+    # True if check() treats each file independently, so the changed file list
+    # can be split into batches and the partial results merged (parallel runner)
+    supports_file_sharding: bool = False
+    
+    # True if check() on a single file depends only on that file's path and
+    # content, the rule file and result_cache_dependencies(), so per-file results
+    # can be reused across runs (persistent violation cache)
+    supports_result_cache: bool = False
+    
     def __init__(
         self,
         project_root: Path,
@@ -83,6 +95,17 @@ class BaseChecker(ABC):
         self.rule_file = rule_file
         self.rule_ref = rule_ref
         self.always_apply = always_apply
+        # Run-scoped shared file cache (set by the enforcer for each run)
+        self.content_store: Optional["FileContentStore"] = None
+    
+    def bind_run_state(self, session=None, git_utils=None) -> None:
+        """
+        Receive the enforcer's session and git state for the coming run.
+        
+        The router caches checker instances across daemon requests, so checkers
+        that consult the session or git must take them from here rather than
+        keep what they loaded at construction. The default ignores both.
+        """
         
     @abstractmethod
     def check(self, changed_files: List[str], user_message: Optional[str] = None) -> CheckerResult:
@@ -119,6 +142,52 @@ class BaseChecker(ABC):
         # This will be implemented by subclasses or pattern_matcher
         return True  # Default: run if not always_apply (will be refined by pattern matching)
     
+    def result_cache_dependencies(self) -> List[Path]:
+        """
+        Extra input files (besides the rule file) whose contents affect results.
+        
+        Returns:
+            Paths hashed into the result cache key; changing any of them
+            invalidates this checker's cached results
+        """
+        return []
+    
+    def _read_text(self, file_path: Path) -> str:
+        """
+        Read a file's decoded text, using the shared content store when available.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            File content (utf-8, undecodable bytes ignored)
+            
+        Raises:
+            OSError: If the file cannot be read
+        """
+        if self.content_store is not None:
+            return self.content_store.read_text(file_path)
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            return f.read()
+    
+    def _read_lines(self, file_path: Path) -> List[str]:
+        """
+        Read a file's lines (line endings preserved), using the shared content store when available.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            List of lines, as returned by readlines()
+            
+        Raises:
+            OSError: If the file cannot be read
+        """
+        if self.content_store is not None:
+            return self.content_store.read_lines(file_path)
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            return f.readlines()
+    
     def _create_result(self, status: CheckerStatus, **kwargs) -> CheckerResult:
         """
         Create a CheckerResult with default values.
@@ -5,15 +5,23 @@ Python Bible Chapter 12: Performance optimization.
 """
 
 from pathlib import Path
-from typing import List, Dict, Optional, Set
-from collections import defaultdict
+from typing import List, Dict, Optional, Set, Tuple
 
 from .base_checker import BaseChecker, CheckerResult
-from .rule_metadata import get_rule_metadata
-from .pattern_matcher import match_file_patterns, get_matching_files
+from .rule_metadata import get_rule_metadata, parse_rule_metadata
+from .pattern_matcher import GlobIndex
 from .exceptions import RuleMetadataError
 
 
+class _RoutingTable:
+    """Rule files, metadata and compiled glob index for one state of the rules directory."""
+
+    def __init__(self, rules: List[Tuple[str, Path, Dict]], always_run: Set[str], index: GlobIndex):
+        self.rules = rules  # (rule_ref, rule_file, metadata) in rules_dir.glob() order
+        self.always_run = always_run  # alwaysApply rules and rules without patterns
+        self.index = index
+
+
 class CheckerRouter:
     """
     Routes checkers to run based on changed files and rule metadata.
@@ -21,6 +29,9 @@ class CheckerRouter:
     Implements intelligent routing:
     - Always runs checkers with alwaysApply: true
     - Only runs other checkers if their file patterns match changed files
+    
+    Rule globs are compiled into a GlobIndex once and reused until the rules
+    directory's mtime changes (a rule file added, removed or replaced).
     """
     
     def __init__(self, project_root: Path, rules_dir: Path):
@@ -35,6 +46,8 @@ class CheckerRouter:
         self.rules_dir = rules_dir
         self._checker_cache: Dict[str, BaseChecker] = {}
         self._metadata_cache: Dict[str, Dict] = {}
+        self._routing_table: Optional[_RoutingTable] = None
+        self._routing_mtime: Optional[int] = None
     
     def get_checkers_to_run(
         self,
@@ -51,49 +64,69 @@ class CheckerRouter:
         Returns:
             List of checker instances that should run
         """
+        table = self._get_routing_table()
+        
+        # One pass over changed files for all pattern-routed rules
+        wanted = {rule_ref for rule_ref, _, _ in table.rules if rule_ref in available_checkers}
+        selected = table.always_run & wanted
+        selected |= table.index.match_owners(changed_files, wanted - selected)
+        
         checkers_to_run = []
+        for rule_ref, rule_file, metadata in table.rules:
+            if rule_ref in selected:
+                # Get or create checker instance
+                checker = self._get_checker(rule_ref, rule_file, metadata, available_checkers)
+                if checker:
+                    checkers_to_run.append(checker)
         
-        # Load metadata for all rules
-        rule_files = list(self.rules_dir.glob("*.mdc"))
+        return checkers_to_run
+    
+    def _get_routing_table(self) -> _RoutingTable:
+        """Return the routing table, rebuilding it if the rules directory changed."""
+        try:
+            mtime = self.rules_dir.stat().st_mtime_ns
+        except OSError:
+            mtime = None
         
-        for rule_file in rule_files:
+        if self._routing_table is None or mtime != self._routing_mtime:
+            if self._routing_table is not None:
+                # Rule files were replaced; drop metadata parsed from the old ones
+                self._metadata_cache.clear()
+                parse_rule_metadata.cache_clear()
+            self._routing_table = self._build_routing_table()
+            self._routing_mtime = mtime
+        return self._routing_table
+    
+    def _build_routing_table(self) -> _RoutingTable:
+        """Load metadata for all rules and compile their globs into an index."""
+        rules = []
+        always_run: Set[str] = set()
+        index = GlobIndex()
+        
+        for rule_file in self.rules_dir.glob("*.mdc"):
             rule_ref = rule_file.name
             
-            # Skip if no checker available for this rule
-            if rule_ref not in available_checkers:
-                continue
-            
             # Get metadata (cached)
             try:
                 metadata = self._get_rule_metadata(rule_file)
             except RuleMetadataError:
                 # Skip if metadata cannot be parsed
                 continue
-            
-            # Check if should run
-            should_run = False
+            rules.append((rule_ref, rule_file, metadata))
             
             if metadata.get('alwaysApply', False):
                 # Always run if alwaysApply is true
-                should_run = True
-            else:
-                # Check if any changed files match the rule's patterns
-                patterns = metadata.get('globs', []) or metadata.get('filePatterns', [])
-                if patterns:
-                    matching_files = get_matching_files(changed_files, patterns)
-                    if matching_files:
-                        should_run = True
-                else:
-                    # No patterns specified - run by default (conservative)
-                    should_run = True
+                always_run.add(rule_ref)
+                continue
             
-            if should_run:
-                # Get or create checker instance
-                checker = self._get_checker(rule_ref, rule_file, metadata, available_checkers)
-                if checker:
-                    checkers_to_run.append(checker)
+            patterns = metadata.get('globs', []) or metadata.get('filePatterns', [])
+            if patterns:
+                index.add(rule_ref, patterns)
+            else:
+                # No patterns specified - run by default (conservative)
+                always_run.add(rule_ref)
         
-        return checkers_to_run
+        return _RoutingTable(rules, always_run, index)
     
     def _get_rule_metadata(self, rule_file: Path) -> Dict:
         """Get rule metadata (with caching)."""
@@ -123,9 +156,11 @@ class CheckerRouter:
         return self._checker_cache[rule_ref]
     
     def clear_cache(self):
-        """Clear checker and metadata caches."""
+        """Clear checker, metadata and routing caches."""
         self._checker_cache.clear()
         self._metadata_cache.clear()
+        self._routing_table = None
+        self._routing_mtime = None
 
 
 
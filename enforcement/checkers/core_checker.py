@@ -12,6 +12,7 @@ from datetime import datetime, timezone
 
 from .base_checker import BaseChecker, CheckerResult, CheckerStatus
 from enforcement.core.historical import is_historical_path
+from enforcement.core.pattern_set import PatternSet
 from .exceptions import CheckerExecutionError
 
 # Import session and git utilities for modification checking
@@ -64,14 +65,14 @@ class CoreChecker(BaseChecker):
         # Document structure
         re.compile(r'^#{1,6}\s+.*\d{4}', re.IGNORECASE | re.MULTILINE),
     ]
+    HISTORICAL_PATTERN_SET = PatternSet(HISTORICAL_DATE_PATTERNS)
     
     def __init__(self, *args, **kwargs):
         """Initialize core checker."""
         super().__init__(*args, **kwargs)
-        self.current_date = datetime.now().strftime("%Y-%m-%d")
+        self.current_date = None
         self.detector = None
-        if DATE_DETECTOR_AVAILABLE and DateDetector:
-            self.detector = DateDetector(current_date=self.current_date)
+        self._refresh_current_date()
         
         # Load session and git_utils for modification checking
         self.session = None
@@ -87,6 +88,22 @@ class CoreChecker(BaseChecker):
                 # (will skip modification checks)
                 pass
     
+    def _refresh_current_date(self) -> None:
+        """Re-read the system date, rebuilding the detector when the day changed."""
+        today = datetime.now().strftime("%Y-%m-%d")
+        if today == self.current_date:
+            return
+        self.current_date = today
+        if DATE_DETECTOR_AVAILABLE and DateDetector:
+            self.detector = DateDetector(current_date=today)
+    
+    def bind_run_state(self, session=None, git_utils=None) -> None:
+        """Use the enforcer's session and git state instead of the ones loaded at init."""
+        if session is not None:
+            self.session = session
+        if git_utils is not None:
+            self.git_utils = git_utils
+    
     def check(self, changed_files: List[str], user_message: Optional[str] = None, classification_map: Optional[dict] = None) -> CheckerResult:
         """
         Execute core checks (hardcoded date detection).
@@ -103,6 +120,8 @@ class CoreChecker(BaseChecker):
             CheckerResult with violations and status
         """
         start_time = datetime.now(timezone.utc)
+        # A cached checker outlives the day it was created on (daemon mode)
+        self._refresh_current_date()
         violations = []
         checks_passed = []
         checks_failed = []
@@ -425,11 +444,10 @@ class CoreChecker(BaseChecker):
                 # Check if file has "Last Updated" field (must always be checked)
                 has_last_updated = False
                 try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        first_lines = [f.readline() for _ in range(10)]
-                        content_preview = '\n'.join(first_lines)
-                        if re.search(r'last\s+updated\s*:', content_preview, re.IGNORECASE):
-                            has_last_updated = True
+                    first_lines = self._read_lines(file_path)[:10]
+                    content_preview = '\n'.join(first_lines)
+                    if re.search(r'last\s+updated\s*:', content_preview, re.IGNORECASE):
+                        has_last_updated = True
                 except:
                     pass
                 
@@ -482,24 +500,23 @@ class CoreChecker(BaseChecker):
                             })
             else:
                 # Fallback: simple regex-based detection
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    for line_num, line in enumerate(f, 1):
-                        # Check for date patterns
-                        date_matches = self.HARDCODED_DATE_PATTERN.findall(line)
-                        if date_matches:
-                            # Check if it's a historical date pattern
-                            if not self._is_historical_date_pattern(line):
-                                # Extract date string
-                                date_str = self._extract_date_from_match(date_matches[0])
-                                if date_str and date_str != self.current_date:
-                                    violations.append({
-                                        'severity': 'BLOCKED',
-                                        'rule_ref': '02-core.mdc',
-                                        'message': f"Hardcoded date detected: {date_str} (should be {self.current_date})",
-                                        'file_path': file_path_str,
-                                        'line_number': line_num,
-                                        'session_scope': 'current_session'
-                                    })
+                for line_num, line in enumerate(self._read_lines(file_path), 1):
+                    # Check for date patterns
+                    date_matches = self.HARDCODED_DATE_PATTERN.findall(line)
+                    if date_matches:
+                        # Check if it's a historical date pattern
+                        if not self._is_historical_date_pattern(line):
+                            # Extract date string
+                            date_str = self._extract_date_from_match(date_matches[0])
+                            if date_str and date_str != self.current_date:
+                                violations.append({
+                                    'severity': 'BLOCKED',
+                                    'rule_ref': '02-core.mdc',
+                                    'message': f"Hardcoded date detected: {date_str} (should be {self.current_date})",
+                                    'file_path': file_path_str,
+                                    'line_number': line_num,
+                                    'session_scope': 'current_session'
+                                })
         
         except (OSError, UnicodeDecodeError) as e:
             # Skip files that can't be read
@@ -529,51 +546,47 @@ class CoreChecker(BaseChecker):
         context_buffer = []  # Sliding window buffer for context
         max_buffer_size = context_lines * 2 + 1  # Keep enough lines for context
         
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line_num, line in enumerate(f, start=1):
-                # Add current line to buffer
-                context_buffer.append((line_num, line))
-                
-                # Maintain buffer size (remove oldest lines)
-                if len(context_buffer) > max_buffer_size:
-                    context_buffer.pop(0)
-                
-                # Find date matches in current line
-                date_matches = self.detector.HARDCODED_DATE_PATTERN.findall(line)
-                
-                for match_tuple in date_matches:
-                    # Normalize date using detector's method
-                    date_str = self.detector._normalize_date_match(match_tuple)
-                    if not date_str:
-                        continue
-                    
-                    # Get context from buffer
-                    # Find current line index in buffer
-                    current_idx = len(context_buffer) - 1
-                    start_idx = max(0, current_idx - context_lines)
-                    end_idx = min(len(context_buffer), current_idx + context_lines + 1)
-                    
-                    # Build context from buffer
-                    context_lines_list = [buf_line for _, buf_line in context_buffer[start_idx:end_idx]]
-                    context = '\n'.join(context_lines_list)
-                    
-                    # Create DateMatch object (matching DateDetector.find_dates() format)
-                    from enforcement.date_detector import DateMatch
-                    matches.append(DateMatch(
-                        date_str=date_str,
-                        line_number=line_num,
-                        line_content=line.rstrip('\n\r'),
-                        context=context
-                    ))
-        
+        for line_num, line in enumerate(self._read_lines(file_path), start=1):
+            # Add current line to buffer
+            context_buffer.append((line_num, line))
+            
+            # Maintain buffer size (remove oldest lines)
+            if len(context_buffer) > max_buffer_size:
+                context_buffer.pop(0)
+            
+            # Find date matches in current line
+            date_matches = self.detector.HARDCODED_DATE_PATTERN.findall(line)
+            
+            for match_tuple in date_matches:
+                # Normalize date using detector's method
+                date_str = self.detector._normalize_date_match(match_tuple)
+                if not date_str:
+                    continue
+            
+                # Get context from buffer
+                # Find current line index in buffer
+                current_idx = len(context_buffer) - 1
+                start_idx = max(0, current_idx - context_lines)
+                end_idx = min(len(context_buffer), current_idx + context_lines + 1)
+            
+                # Build context from buffer
+                context_lines_list = [buf_line for _, buf_line in context_buffer[start_idx:end_idx]]
+                context = '\n'.join(context_lines_list)
+            
+                # Create DateMatch object (matching DateDetector.find_dates() format)
+                from enforcement.date_detector import DateMatch
+                matches.append(DateMatch(
+                    date_str=date_str,
+                    line_number=line_num,
+                    line_content=line.rstrip('\n\r'),
+                    context=context
+                ))
+            
         return matches
     
     def _is_historical_date_pattern(self, line: str) -> bool:
         """Check if line matches a historical date pattern."""
-        for pattern in self.HISTORICAL_DATE_PATTERNS:
-            if pattern.search(line):
-                return True
-        return False
+        return self.HISTORICAL_PATTERN_SET.search(line)
     
     def _extract_date_from_match(self, match: tuple) -> Optional[str]:
         """Extract ISO date string from regex match tuple."""
@@ -23,6 +23,7 @@ from ..autofix_suggestions import (
     dto_missing_file_hint,
     dto_no_validators_hint
 )
+from ..core.line_index import LineIndex
 
 
 class DtoEnforcementChecker(BaseChecker):
@@ -35,6 +36,8 @@ class DtoEnforcementChecker(BaseChecker):
     - DTO files must use class-validator decorators
     """
     
+    supports_file_sharding = True
+    
     # HTTP decorators that typically use @Body()
     HTTP_METHOD_DECORATORS = ['@Post', '@Put', '@Patch', '@Delete']
     
@@ -99,37 +102,36 @@ class DtoEnforcementChecker(BaseChecker):
                     continue
                 
                 try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        lines = f.readlines()
-                        content = ''.join(lines)
-                        
-                        # Only check files with @Controller decorator
-                        if '@Controller' not in content:
-                            continue
-                        
-                        # Find all @Body() parameters
-                        body_params = self._find_body_parameters(lines, content)
+                    lines = self._read_lines(file_path)
+                    content = self._read_text(file_path)
+                    
+                    # Only check files with @Controller decorator
+                    if '@Controller' not in content:
+                        continue
+                    
+                    # Find all @Body() parameters
+                    body_params = self._find_body_parameters(lines, content)
+                    
+                    for param_info in body_params:
+                        # Check for missing/invalid DTO type
+                        violations.extend(
+                            self._check_dto_type(
+                                file_path_str, 
+                                param_info, 
+                                lines
+                            )
+                        )
                         
-                        for param_info in body_params:
-                            # Check for missing/invalid DTO type
+                        # If DTO type exists, check if file exists and is valid
+                        if param_info['type_name'] and param_info['type_name'].endswith('Dto'):
                             violations.extend(
-                                self._check_dto_type(
-                                    file_path_str, 
-                                    param_info, 
-                                    lines
+                                self._check_dto_file(
+                                    file_path_str,
+                                    param_info,
+                                    file_path
                                 )
                             )
-                            
-                            # If DTO type exists, check if file exists and is valid
-                            if param_info['type_name'] and param_info['type_name'].endswith('Dto'):
-                                violations.extend(
-                                    self._check_dto_file(
-                                        file_path_str,
-                                        param_info,
-                                        file_path
-                                    )
-                                )
-                        
+                    
                 except (FileNotFoundError, PermissionError, OSError, UnicodeDecodeError):
                     continue
             
@@ -181,13 +183,14 @@ class DtoEnforcementChecker(BaseChecker):
             r'@Body\s*\((?:\s*["\']([^"\']+)["\']\s*)?\)\s+(\w+)\s*:\s*([^,)\n]+)'
         )
         
+        line_index = LineIndex(content)
         for match in body_pattern.finditer(content):
             field_selector = match.group(1)  # e.g., 'field' in @Body('field')
             param_name = match.group(2)  # e.g., 'data' in @Body() data: any
             type_expr = match.group(3).strip()  # e.g., 'any', 'CreateUserDto', 'string'
             
             # Get line number
-            line_num = content[:match.start()].count('\n') + 1
+            line_num = line_index.line_number(match.start())
             
             # Check if this is in a method with HTTP decorator
             # Look backwards for method decorator
@@ -333,43 +336,42 @@ class DtoEnforcementChecker(BaseChecker):
         
         # Check DTO file content
         try:
-            with open(dto_file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                dto_content = f.read()
-                
-                # Check if class exists
-                class_pattern = rf'export\s+class\s+{re.escape(dto_type_name)}'
-                if not re.search(class_pattern, dto_content):
-                    violations.append(Violation(
-                        severity='WARNING',
-                        rule_ref='BACKEND-R08-DTO-002',
-                        message=f'DTO file {dto_file_path.relative_to(self.project_root)} does not export class {dto_type_name}.',
-                        file_path=file_path,
-                        line_number=param_info['line_number'],
-                        fix_hint=f'Ensure {dto_file_path.name} exports class {dto_type_name}.',
-                        session_scope='current_session'
-                    ))
-                    return violations
-                
-                # Check for type annotations (properties with types)
-                has_typed_properties = re.search(r'\w+\s*:\s*[^,;=]+[;,]', dto_content)
-                
-                # Check for class-validator decorators
-                has_validators = any(
-                    re.search(pattern, dto_content)
-                    for pattern in self.VALIDATOR_DECORATORS
-                )
-                
-                if has_typed_properties and not has_validators:
-                    violations.append(Violation(
-                        severity='WARNING',
-                        rule_ref='BACKEND-R08-DTO-003',
-                        message=f'DTO "{dto_type_name}" has no class-validator decorators; request payload is not validated.',
-                        file_path=str(dto_file_path.relative_to(self.project_root)),
-                        line_number=None,  # Could parse to find class line
-                        fix_hint=dto_no_validators_hint(dto_type_name, dto_file_path),
-                        session_scope='current_session'
-                    ))
-                
+            dto_content = self._read_text(dto_file_path)
+            
+            # Check if class exists
+            class_pattern = rf'export\s+class\s+{re.escape(dto_type_name)}'
+            if not re.search(class_pattern, dto_content):
+                violations.append(Violation(
+                    severity='WARNING',
+                    rule_ref='BACKEND-R08-DTO-002',
+                    message=f'DTO file {dto_file_path.relative_to(self.project_root)} does not export class {dto_type_name}.',
+                    file_path=file_path,
+                    line_number=param_info['line_number'],
+                    fix_hint=f'Ensure {dto_file_path.name} exports class {dto_type_name}.',
+                    session_scope='current_session'
+                ))
+                return violations
+            
+            # Check for type annotations (properties with types)
+            has_typed_properties = re.search(r'\w+\s*:\s*[^,;=]+[;,]', dto_content)
+            
+            # Check for class-validator decorators
+            has_validators = any(
+                re.search(pattern, dto_content)
+                for pattern in self.VALIDATOR_DECORATORS
+            )
+            
+            if has_typed_properties and not has_validators:
+                violations.append(Violation(
+                    severity='WARNING',
+                    rule_ref='BACKEND-R08-DTO-003',
+                    message=f'DTO "{dto_type_name}" has no class-validator decorators; request payload is not validated.',
+                    file_path=str(dto_file_path.relative_to(self.project_root)),
+                    line_number=None,  # Could parse to find class line
+                    fix_hint=dto_no_validators_hint(dto_type_name, dto_file_path),
+                    session_scope='current_session'
+                ))
+            
         except (FileNotFoundError, PermissionError, OSError, UnicodeDecodeError):
             # File exists but couldn't read it - skip
             pass
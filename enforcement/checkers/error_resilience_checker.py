@@ -22,6 +22,9 @@ class ErrorResilienceChecker(BaseChecker):
     - Error-prone operations have proper error handling
     """
     
+    supports_file_sharding = True
+    supports_result_cache = True
+    
     # Patterns to check for (language-agnostic)
     ERROR_PRONE_PATTERNS = [
         (r'await\s+\w+\(', None),  # Async operations should have error handling
@@ -73,32 +76,31 @@ class ErrorResilienceChecker(BaseChecker):
                     error_handling_patterns = []
                 
                 try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        lines = list(f)
-                        
-                        for pattern, _ in self.ERROR_PRONE_PATTERNS:
-                            for line_num, line in enumerate(lines, 1):
-                                if re.search(pattern, line):
-                                    # Check if there's error handling nearby (within 10 lines)
-                                    context_start = max(0, line_num - 10)
-                                    context_end = min(len(lines), line_num + 10)
-                                    context = '\n'.join(lines[context_start:context_end])
-                                    
-                                    # Check if any error handling pattern is present
-                                    has_error_handling = any(
-                                        re.search(eh_pattern, context, re.MULTILINE)
-                                        for eh_pattern in error_handling_patterns
-                                    )
-                                    
-                                    if not has_error_handling:
-                                        violations.append({
-                                            'severity': 'WARNING',
-                                            'rule_ref': '06-error-resilience.mdc',
-                                            'message': f"Error-prone operation without error handling: {pattern}",
-                                            'file_path': file_path_str,
-                                            'line_number': line_num,
-                                            'session_scope': 'current_session'
-                                        })
+                    lines = self._read_lines(file_path)
+                    
+                    for pattern, _ in self.ERROR_PRONE_PATTERNS:
+                        for line_num, line in enumerate(lines, 1):
+                            if re.search(pattern, line):
+                                # Check if there's error handling nearby (within 10 lines)
+                                context_start = max(0, line_num - 10)
+                                context_end = min(len(lines), line_num + 10)
+                                context = '\n'.join(lines[context_start:context_end])
+                                
+                                # Check if any error handling pattern is present
+                                has_error_handling = any(
+                                    re.search(eh_pattern, context, re.MULTILINE)
+                                    for eh_pattern in error_handling_patterns
+                                )
+                                
+                                if not has_error_handling:
+                                    violations.append({
+                                        'severity': 'WARNING',
+                                        'rule_ref': '06-error-resilience.mdc',
+                                        'message': f"Error-prone operation without error handling: {pattern}",
+                                        'file_path': file_path_str,
+                                        'line_number': line_num,
+                                        'session_scope': 'current_session'
+                                    })
                 except (FileNotFoundError, PermissionError, OSError, UnicodeDecodeError):
                     # Skip files that can't be read
                     continue
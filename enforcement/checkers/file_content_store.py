@@ -0,0 +1,188 @@
+"""
+Run-scoped file content store shared by modular checkers.
+
+Each changed file is read from disk once per enforcement run, decoded with the
+same semantics as ``open(path, 'r', encoding='utf-8', errors='ignore')`` and
+kept (text plus pre-split lines) under an LRU memory budget so every checker
+that inspects the file reuses the same decoded content.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+# Default memory budget for cached decoded content (approximate, in bytes)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _decode(raw: bytes) -> str:
+    """
+    Decode raw bytes the way text-mode ``open()`` would.
+
+    Mirrors ``encoding='utf-8', errors='ignore'`` with universal newlines so
+    checkers see byte-for-byte the same text as when they opened files directly.
+    """
+    text = raw.decode('utf-8', errors='ignore')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _split_lines(text: str) -> List[str]:
+    """Split text into lines keeping line endings (``readlines()`` semantics)."""
+    if not text:
+        return []
+    parts = text.split('\n')
+    lines = [part + '\n' for part in parts[:-1]]
+    if parts[-1]:
+        lines.append(parts[-1])
+    return lines
+
+
+@dataclass(slots=True)
+class FileContent:
+    """Decoded content of a single file."""
+    path: Path
+    text: str
+    lines: List[str]
+    size: int
+    mtime_ns: int
+
+    @property
+    def footprint(self) -> int:
+        """Approximate memory held by this entry (text plus split lines)."""
+        return len(self.text) * 2
+
+
+class FileContentStore:
+    """
+    Read-once, LRU-bounded cache of decoded file contents.
+
+    Entries are keyed by (path, mtime, size) so a file rewritten during the run
+    is transparently re-read. Safe to share between threads.
+    """
+
+    def __init__(self, project_root: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the store.
+
+        Args:
+            project_root: Root directory used to resolve relative paths
+            max_bytes: Approximate memory budget for cached content
+        """
+        self.project_root = project_root
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, int, int], FileContent]" = OrderedDict()
+        self._key_by_path: Dict[str, Tuple[str, int, int]] = {}
+        self._cached_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bytes_read = 0
+        self.evictions = 0
+
+    def get(self, file_path) -> FileContent:
+        """
+        Get decoded content for a file, reading it from disk on first access.
+
+        Args:
+            file_path: Absolute path or path relative to project_root
+
+        Returns:
+            FileContent for the file
+
+        Raises:
+            OSError: If the file cannot be stat'ed or read
+        """
+        path = Path(file_path)
+        if not path.is_absolute():
+            path = self.project_root / path
+        stat = path.stat()
+        path_key = str(path)
+        key = (path_key, stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        raw = path.read_bytes()
+        text = _decode(raw)
+        entry = FileContent(
+            path=path,
+            text=text,
+            lines=_split_lines(text),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+        )
+
+        with self._lock:
+            self.misses += 1
+            self.bytes_read += len(raw)
+            self._insert(path_key, key, entry)
+        return entry
+
+    def read_text(self, file_path) -> str:
+        """Return the decoded text of a file."""
+        return self.get(file_path).text
+
+    def read_lines(self, file_path) -> List[str]:
+        """Return the lines of a file (line endings preserved)."""
+        return self.get(file_path).lines
+
+    def _insert(self, path_key: str, key: Tuple[str, int, int], entry: FileContent) -> None:
+        """Insert an entry and evict least-recently-used entries over budget (lock held)."""
+        stale_key = self._key_by_path.get(path_key)
+        if stale_key is not None and stale_key != key:
+            self._drop(stale_key)
+
+        if entry.footprint > self.max_bytes or key in self._entries:
+            # Too large to keep (or raced with another reader) - serve uncached
+            return
+
+        self._entries[key] = entry
+        self._key_by_path[path_key] = key
+        self._cached_bytes += entry.footprint
+
+        while self._cached_bytes > self.max_bytes and self._entries:
+            oldest_key = next(iter(self._entries))
+            self._drop(oldest_key)
+            self.evictions += 1
+
+    def _drop(self, key: Tuple[str, int, int]) -> None:
+        """Remove a cached entry (lock held)."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._cached_bytes -= entry.footprint
+        if self._key_by_path.get(key[0]) == key:
+            del self._key_by_path[key[0]]
+
+    def clear(self) -> None:
+        """Drop all cached content (statistics are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._key_by_path.clear()
+            self._cached_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics for the run summary.
+
+        Returns:
+            Dictionary with hits, misses, bytes_read, evictions, entries and cached_bytes
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'bytes_read': self.bytes_read,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'cached_bytes': self._cached_bytes,
+            }
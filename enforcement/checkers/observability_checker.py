@@ -42,6 +42,9 @@ class ObservabilityChecker(BaseChecker):
     - Structured logging (no console.log or print statements in production code)
     """
     
+    supports_file_sharding = True
+    supports_result_cache = True
+    
     # Patterns to check for
     CONSOLE_LOG_PATTERNS = [
         r'console\.(log|error|warn|debug)',
@@ -100,8 +103,7 @@ class ObservabilityChecker(BaseChecker):
                     debug_logger.debug(f"CHECK: {file_path}")
                 
                 try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        lines = list(f)
+                    lines = self._read_lines(file_path)
                     
                     console_matches = 0
                     
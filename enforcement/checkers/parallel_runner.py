@@ -0,0 +1,365 @@
+"""
+Process-pool execution of modular checkers with deterministic result merging.
+
+Checkers are regex-bound and CPU-heavy, so threads barely help. This module
+shards the routed checkers into (checker, file-batch) work units, runs them in
+a process pool and merges the partial CheckerResults back in routing order so
+the enforcer sees exactly what a serial run would have produced.
+"""
+
+import concurrent.futures
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from .base_checker import BaseChecker, CheckerResult, CheckerStatus
+from .checker_registry import get_checker_class
+from .file_content_store import FileContentStore
+
+if TYPE_CHECKING:
+    from .result_cache import ViolationCache
+
+
+# Default number of files per work unit for shardable checkers
+DEFAULT_BATCH_SIZE = 50
+
+# Default time limit in seconds for all work units of one run together
+DEFAULT_TIMEOUT = 300.0
+
+
+@dataclass(slots=True)
+class WorkUnit:
+    """A (checker, file-batch) unit of work executed in a worker process."""
+    index: int
+    rule_ref: str
+    rule_file: str
+    project_root: str
+    always_apply: bool
+    files: List[str]
+    user_message: Optional[str] = None
+    classification_map: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class UnitOutcome:
+    """Result of a work unit: either a CheckerResult or an error description."""
+    result: Optional[CheckerResult] = None
+    error: Optional[str] = None
+    error_type: Optional[str] = None
+
+
+# Per-process state (populated lazily inside worker processes)
+_WORKER_CHECKERS: Dict[str, BaseChecker] = {}
+_WORKER_STORES: Dict[str, FileContentStore] = {}
+
+
+def _execute_work_unit(unit: WorkUnit) -> CheckerResult:
+    """
+    Run one work unit inside a worker process.
+
+    Checker instances and the file content store are cached per process so
+    consecutive batches of the same checker reuse warm state.
+    """
+    checker = _WORKER_CHECKERS.get(unit.rule_ref)
+    if checker is None:
+        checker_class = get_checker_class(unit.rule_ref)
+        if checker_class is None:
+            raise LookupError(f"No checker registered for {unit.rule_ref}")
+        checker = checker_class(
+            project_root=Path(unit.project_root),
+            rule_file=Path(unit.rule_file),
+            rule_ref=unit.rule_ref,
+            always_apply=unit.always_apply,
+        )
+        _WORKER_CHECKERS[unit.rule_ref] = checker
+
+    store = _WORKER_STORES.get(unit.project_root)
+    if store is None:
+        store = FileContentStore(Path(unit.project_root))
+        _WORKER_STORES[unit.project_root] = store
+    checker.content_store = store
+
+    try:
+        return checker.check(unit.files, unit.user_message, classification_map=unit.classification_map)
+    except TypeError:
+        return checker.check(unit.files, unit.user_message)
+
+
+def build_work_units(
+    checkers: List[BaseChecker],
+    changed_files: List[str],
+    user_message: Optional[str] = None,
+    classification_map: Optional[Dict[str, str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    files_by_checker: Optional[Dict[str, List[str]]] = None,
+) -> Dict[str, List[WorkUnit]]:
+    """
+    Shard checkers into work units.
+
+    Checkers that declare ``supports_file_sharding`` are split into contiguous
+    file batches (preserving file order); all others run as a single unit.
+    Checkers listed in ``files_by_checker`` check only the listed files, one
+    unit per file, so each unit's result is a single-file result.
+
+    Returns:
+        Dictionary mapping rule_ref to its ordered list of work units
+    """
+    units_by_checker: Dict[str, List[WorkUnit]] = {}
+    batch_size = max(1, batch_size)
+    next_index = 0
+
+    for checker in checkers:
+        if files_by_checker is not None and checker.rule_ref in files_by_checker:
+            batches = [[file_path] for file_path in files_by_checker[checker.rule_ref]]
+        elif checker.supports_file_sharding and len(changed_files) > batch_size:
+            batches = [
+                changed_files[start:start + batch_size]
+                for start in range(0, len(changed_files), batch_size)
+            ]
+        else:
+            batches = [list(changed_files)]
+
+        units = []
+        for batch in batches:
+            units.append(WorkUnit(
+                index=next_index,
+                rule_ref=checker.rule_ref,
+                rule_file=str(checker.rule_file),
+                project_root=str(checker.project_root),
+                always_apply=checker.always_apply,
+                files=batch,
+                user_message=user_message,
+                classification_map=classification_map or {},
+            ))
+            next_index += 1
+        units_by_checker[checker.rule_ref] = units
+
+    return units_by_checker
+
+
+def _run_in_pool(
+    units: List[WorkUnit],
+    max_workers: int,
+    deadline: float,
+    timeout: float,
+    outcomes: Dict[int, UnitOutcome],
+) -> List[WorkUnit]:
+    """
+    Run units in one process pool until they finish or the deadline passes.
+
+    Args:
+        deadline: ``time.monotonic()`` value after which unfinished units fail
+        timeout: The overall timeout, for error messages
+
+    Returns:
+        Units left unfinished because the pool broke (a worker crashed)
+    """
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    futures = [(unit, executor.submit(_execute_work_unit, unit)) for unit in units]
+    unfinished: List[WorkUnit] = []
+    timed_out = False
+
+    try:
+        concurrent.futures.wait(
+            [future for _, future in futures],
+            timeout=max(0.0, deadline - time.monotonic()),
+        )
+        for unit, future in futures:
+            if not future.done():
+                timed_out = True
+                future.cancel()
+                outcomes[unit.index] = UnitOutcome(
+                    error=f"Checker {unit.rule_ref} did not finish within the {timeout:.0f}s timeout",
+                    error_type="TimeoutError",
+                )
+                continue
+            try:
+                outcomes[unit.index] = UnitOutcome(result=future.result())
+            except BrokenProcessPool:
+                unfinished.append(unit)
+            except Exception as e:
+                outcomes[unit.index] = UnitOutcome(error=str(e), error_type=type(e).__name__)
+    finally:
+        if timed_out:
+            # Hung workers never return; terminate them instead of blocking shutdown
+            for process in list((executor._processes or {}).values()):
+                process.terminate()
+        executor.shutdown(wait=not timed_out, cancel_futures=True)
+
+    return unfinished
+
+
+def run_work_units(
+    units: List[WorkUnit],
+    max_workers: int,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> Dict[int, UnitOutcome]:
+    """
+    Execute work units across a process pool with crash isolation.
+
+    If a worker process dies, the pool breaks and every pending unit fails with
+    BrokenProcessPool. Those units are re-run one at a time in fresh
+    single-worker pools so only the unit that actually crashes is reported.
+
+    Args:
+        units: Work units to execute
+        max_workers: Number of worker processes
+        timeout: Seconds to wait for all units (re-runs included); units
+            still running after that fail with TimeoutError
+
+    Returns:
+        Dictionary mapping unit index to its outcome
+    """
+    outcomes: Dict[int, UnitOutcome] = {}
+    if not units:
+        return outcomes
+
+    deadline = time.monotonic() + timeout
+    unfinished = _run_in_pool(units, max_workers, deadline, timeout, outcomes)
+
+    for unit in unfinished:
+        if _run_in_pool([unit], 1, deadline, timeout, outcomes):
+            outcomes[unit.index] = UnitOutcome(
+                error=f"Worker process crashed while running {unit.rule_ref}",
+                error_type="BrokenProcessPool",
+            )
+
+    return outcomes
+
+
+def merge_checker_results(results: List[CheckerResult]) -> CheckerResult:
+    """
+    Merge per-batch results of one checker into the result a serial run produces.
+
+    Batches that checked no files (e.g. a batch without Python files for the
+    Python Bible checker) only contribute when every batch was empty, so their
+    placeholder "no files" check names don't leak into the merged result.
+
+    Args:
+        results: Partial results in batch order
+
+    Returns:
+        Merged CheckerResult
+    """
+    if len(results) == 1:
+        return results[0]
+
+    relevant = [r for r in results if r.files_checked] or results[:1]
+
+    violations: List[Dict] = []
+    checks_failed: List[str] = []
+    checks_passed: List[str] = []
+    metadata: Dict = {}
+    error_message = None
+    for result in relevant:
+        violations.extend(result.violations)
+        for name in result.checks_failed:
+            if name not in checks_failed:
+                checks_failed.append(name)
+        for name in result.checks_passed:
+            if name not in checks_passed:
+                checks_passed.append(name)
+        metadata.update(result.metadata)
+        error_message = error_message or result.error_message
+    checks_passed = [name for name in checks_passed if name not in checks_failed]
+
+    statuses = {r.status for r in relevant}
+    if CheckerStatus.ERROR in statuses:
+        status = CheckerStatus.ERROR
+    elif CheckerStatus.FAILED in statuses:
+        status = CheckerStatus.FAILED
+    elif statuses == {CheckerStatus.SKIPPED}:
+        status = CheckerStatus.SKIPPED
+    else:
+        status = CheckerStatus.SUCCESS
+
+    return CheckerResult(
+        status=status,
+        rule_ref=relevant[0].rule_ref,
+        violations=violations,
+        checks_passed=checks_passed,
+        checks_failed=checks_failed,
+        execution_time_ms=sum(r.execution_time_ms for r in results),
+        files_checked=sum(r.files_checked for r in results),
+        error_message=error_message,
+        metadata=metadata,
+        timestamp=relevant[0].timestamp,
+    )
+
+
+class CheckerExecutionFailure(Exception):
+    """Raised in the parent process for a checker whose work unit failed."""
+
+    def __init__(self, message: str, error_type: Optional[str] = None):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+def run_checkers_in_process_pool(
+    checkers: List[BaseChecker],
+    changed_files: List[str],
+    user_message: Optional[str] = None,
+    classification_map: Optional[Dict[str, str]] = None,
+    max_workers: int = 2,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    timeout: float = DEFAULT_TIMEOUT,
+    result_cache: Optional['ViolationCache'] = None,
+    file_hasher: Optional[Callable[[str], Optional[str]]] = None,
+) -> Dict[str, object]:
+    """
+    Run checkers in a process pool and merge results per checker.
+
+    A checker whose any unit failed (exception, timeout or crash) is reported
+    as failed as a whole, mirroring the serial path where an exception aborts
+    the checker.
+
+    With a ``result_cache``, checkers that declare ``supports_result_cache``
+    are looked up in this process first; only the files that miss are sent
+    to the pool (one unit per file) and their results are stored.
+
+    Returns:
+        Dictionary mapping rule_ref to either a merged CheckerResult or a
+        CheckerExecutionFailure
+    """
+    checkers_by_ref = {checker.rule_ref: checker for checker in checkers}
+    cached_by_checker: Dict[str, Dict[str, CheckerResult]] = {}
+    missed_by_checker: Dict[str, Dict[str, Optional[str]]] = {}
+    if result_cache is not None and changed_files:
+        for checker in checkers:
+            if checker.supports_result_cache:
+                cached, missed = result_cache.lookup(checker, changed_files, file_hasher)
+                cached_by_checker[checker.rule_ref] = cached
+                missed_by_checker[checker.rule_ref] = missed
+
+    units_by_checker = build_work_units(
+        checkers,
+        changed_files,
+        user_message=user_message,
+        classification_map=classification_map,
+        batch_size=batch_size,
+        files_by_checker={rule_ref: list(missed) for rule_ref, missed in missed_by_checker.items()},
+    )
+    all_units = [unit for units in units_by_checker.values() for unit in units]
+    outcomes = run_work_units(all_units, max_workers=max_workers, timeout=timeout)
+
+    merged: Dict[str, object] = {}
+    for rule_ref, units in units_by_checker.items():
+        unit_outcomes = [outcomes[unit.index] for unit in units]
+        failure = next((o for o in unit_outcomes if o.error is not None), None)
+        if failure is not None:
+            merged[rule_ref] = CheckerExecutionFailure(failure.error, failure.error_type)
+        elif rule_ref in cached_by_checker:
+            results = cached_by_checker[rule_ref]
+            missed = missed_by_checker[rule_ref]
+            for unit, outcome in zip(units, unit_outcomes):
+                file_path = unit.files[0]
+                if missed[file_path]:
+                    result_cache.put(checkers_by_ref[rule_ref], file_path, missed[file_path], outcome.result)
+                results[file_path] = outcome.result
+            merged[rule_ref] = merge_checker_results([results[file_path] for file_path in changed_files])
+        else:
+            merged[rule_ref] = merge_checker_results([o.result for o in unit_outcomes])
+    return merged
@@ -1,127 +1,203 @@
 """
 File pattern matching for intelligent checker routing.
 
+Each glob is compiled once into a regex that accepts exactly the paths the
+fnmatch + path-component rules accept, and GlobIndex buckets compiled
+patterns by the top-level directory and extension every match must have, so
+routing many files against many rules only tries plausible patterns.
+
 Python Bible Chapter 12: Performance optimization.
 """
 
 import fnmatch
-from pathlib import Path
-from typing import List, Set
+import re
+from functools import lru_cache
+from typing import Dict, Hashable, Iterable, List, Optional, Pattern, Set, Tuple
+
+
+# Characters that give a glob component wildcard meaning under fnmatch
+_GLOB_MAGIC = re.compile(r'[*?[]')
+
+
+def _normalize_patterns(patterns: Iterable[str]) -> List[str]:
+    """Strip patterns, drop empty ones and normalize path separators."""
+    normalized = []
+    for pattern in patterns:
+        pattern = pattern.strip()
+        if pattern:
+            normalized.append(pattern.replace('\\', '/'))
+    return normalized
+
+
+@lru_cache(maxsize=1024)
+def _glob_regex(pattern: str) -> str:
+    """
+    Translate a normalized glob into regex source matched against '/' + path.
+
+    The first alternative is fnmatch semantics (``*`` crosses directories).
+    The second is path-component semantics: ``**`` matches any number of
+    components, ``*`` exactly one component and anything else must equal the
+    component literally.
+    """
+    components = []
+    for part in pattern.split('/'):
+        if part == '**':
+            components.append('(?:/[^/]*)*')
+        elif part == '*':
+            components.append('/[^/]*')
+        else:
+            components.append('/' + re.escape(part))
+    return '/' + fnmatch.translate(pattern) + '|' + ''.join(components)
+
+
+@lru_cache(maxsize=256)
+def compile_patterns(patterns: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """
+    Compile glob patterns into one regex.
+
+    Args:
+        patterns: Glob patterns (as a tuple so the result can be cached)
+
+    Returns:
+        Compiled regex to ``fullmatch`` against ``'/' + path``, or None if
+        there are no non-empty patterns
+    """
+    sources = [_glob_regex(pattern) for pattern in _normalize_patterns(patterns)]
+    if not sources:
+        return None
+    return re.compile('|'.join(f'(?:{source})' for source in sources))
+
+
+def pattern_route_key(pattern: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Return the (top-level directory, extension) every path matching pattern has.
+
+    Either element is None when the pattern doesn't pin it down. Keys are
+    computed the same way as path_route_key() so they can be compared.
+
+    Args:
+        pattern: Normalized glob pattern
+    """
+    first = pattern.split('/', 1)[0]
+    top = None if _GLOB_MAGIC.search(first) else first
+
+    # Literal text after the last wildcard is a suffix of every match
+    tail = _GLOB_MAGIC.split(pattern)[-1]
+    ext = None
+    if '/' not in tail and ']' not in tail and '.' in tail:
+        ext = tail[tail.rindex('.'):]
+    return top, ext
+
+
+def path_route_key(file_path: str) -> Tuple[str, str]:
+    """Return the (top-level directory, extension) of a normalized path."""
+    top = file_path.split('/', 1)[0]
+    name = file_path.rsplit('/', 1)[-1]
+    dot = name.rfind('.')
+    return top, name[dot:] if dot >= 0 else ''
 
 
 def match_file_patterns(file_path: str, patterns: List[str]) -> bool:
     """
     Check if a file path matches any of the given patterns.
-    
+
     Supports:
     - Glob patterns (e.g., "**/*.ts", "apps/*/src/**/*.ts")
     - Simple patterns (e.g., "*.py", "**/test/**")
-    
+
     Python Bible Chapter 12: Performance optimization with early exit.
-    
+
     Args:
         file_path: File path to check (relative to project root)
         patterns: List of glob patterns to match against
-        
+
     Returns:
         True if file matches any pattern, False otherwise
     """
     if not patterns:
         return False
-    
-    # Normalize path separators
-    normalized_path = file_path.replace('\\', '/')
-    
-    for pattern in patterns:
-        pattern = pattern.strip()
-        if not pattern:
-            continue
-        
-        # Normalize pattern separators
-        normalized_pattern = pattern.replace('\\', '/')
-        
-        # Use fnmatch for glob pattern matching
-        if fnmatch.fnmatch(normalized_path, normalized_pattern):
-            return True
-        
-        # Also try matching against path components
-        # e.g., "apps/api/src" should match pattern "apps/*/src/**"
-        path_parts = normalized_path.split('/')
-        pattern_parts = normalized_pattern.split('/')
-        
-        # Simple wildcard matching for path components
-        if _match_path_components(path_parts, pattern_parts):
-            return True
-    
-    return False
-
-
-def _match_path_components(path_parts: List[str], pattern_parts: List[str]) -> bool:
-    """
-    Match path components against pattern components.
-    
-    Supports:
-    - * matches any single component
-    - ** matches any number of components
-    - Exact matches
-    
-    Args:
-        path_parts: List of path components
-        pattern_parts: List of pattern components
-        
-    Returns:
-        True if path matches pattern
-    """
-    if not pattern_parts:
-        return not path_parts
-    
-    if not path_parts:
-        # Path exhausted - pattern must be all ** or empty
-        return all(p == '**' for p in pattern_parts)
-    
-    pattern = pattern_parts[0]
-    path = path_parts[0]
-    
-    if pattern == '**':
-        # ** matches zero or more components
-        # Try matching remaining pattern against current position
-        if _match_path_components(path_parts, pattern_parts[1:]):
-            return True
-        # Try matching ** against next path component
-        if _match_path_components(path_parts[1:], pattern_parts):
-            return True
-        return False
-    elif pattern == '*':
-        # * matches any single component
-        return _match_path_components(path_parts[1:], pattern_parts[1:])
-    elif pattern == path:
-        # Exact match
-        return _match_path_components(path_parts[1:], pattern_parts[1:])
-    else:
-        # No match
+
+    regex = compile_patterns(tuple(patterns))
+    if regex is None:
         return False
+    return regex.fullmatch('/' + file_path.replace('\\', '/')) is not None
 
 
 def get_matching_files(changed_files: List[str], patterns: List[str]) -> Set[str]:
     """
     Get all files from changed_files that match any of the patterns.
-    
+
     Args:
         changed_files: List of file paths
         patterns: List of glob patterns
-        
+
     Returns:
         Set of matching file paths
     """
-    matching = set()
-    for file_path in changed_files:
-        if match_file_patterns(file_path, patterns):
-            matching.add(file_path)
-    return matching
+    regex = compile_patterns(tuple(patterns)) if patterns else None
+    if regex is None:
+        return set()
+    return {
+        file_path for file_path in changed_files
+        if regex.fullmatch('/' + file_path.replace('\\', '/')) is not None
+    }
+
+
+class GlobIndex:
+    """
+    Inverted index from (top-level directory, extension) to compiled patterns.
+
+    Each owner (e.g. a rule) registers its globs once; matching a batch of
+    paths only tries the owners whose patterns could match each path.
+    """
 
+    def __init__(self):
+        self._buckets: Dict[Tuple[Optional[str], Optional[str]], Dict[Hashable, Pattern[str]]] = {}
+        self._owners: Set[Hashable] = set()
 
+    def add(self, owner: Hashable, patterns: Iterable[str]) -> None:
+        """
+        Register an owner's glob patterns.
 
+        Args:
+            owner: Value reported by match_owners() when a pattern matches
+            patterns: Glob patterns
+        """
+        grouped: Dict[Tuple[Optional[str], Optional[str]], List[str]] = {}
+        for pattern in _normalize_patterns(patterns):
+            grouped.setdefault(pattern_route_key(pattern), []).append(pattern)
+        for key, key_patterns in grouped.items():
+            self._buckets.setdefault(key, {})[owner] = compile_patterns(tuple(key_patterns))
+            self._owners.add(owner)
 
+    def match_owners(self, file_paths: Iterable[str], wanted: Optional[Set[Hashable]] = None) -> Set[Hashable]:
+        """
+        Find owners with a pattern matching any of the paths.
 
+        Stops as soon as every wanted owner has matched.
 
+        Args:
+            file_paths: File paths (relative to project root)
+            wanted: Owners to look for (default: all registered owners)
 
+        Returns:
+            Set of matching owners
+        """
+        pending = set(self._owners if wanted is None else wanted & self._owners)
+        matched: Set[Hashable] = set()
+        buckets = self._buckets
+        for file_path in file_paths:
+            if not pending:
+                break
+            normalized = file_path.replace('\\', '/')
+            top, ext = path_route_key(normalized)
+            subject = '/' + normalized
+            for key in ((top, ext), (top, None), (None, ext), (None, None)):
+                bucket = buckets.get(key)
+                if not bucket:
+                    continue
+                for owner, regex in bucket.items():
+                    if owner in pending and regex.fullmatch(subject) is not None:
+                        pending.discard(owner)
+                        matched.add(owner)
+        return matched
@@ -22,6 +22,9 @@ class PythonBibleChecker(BaseChecker):
     - Python Bible best practices
     """
     
+    supports_file_sharding = True
+    supports_result_cache = True
+    
     # Python Bible anti-patterns
     ANTI_PATTERNS = [
         (r'def\s+\w+\([^)]*=\s*\[', "Mutable default arguments"),
@@ -65,18 +68,17 @@ class PythonBibleChecker(BaseChecker):
                     continue
                 
                 try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        for line_num, line in enumerate(f, 1):
-                            for pattern, description in self.ANTI_PATTERNS:
-                                if re.search(pattern, line):
-                                    violations.append({
-                                        'severity': 'WARNING',
-                                        'rule_ref': 'python_bible.mdc',
-                                        'message': f"Python Bible violation: {description}",
-                                        'file_path': file_path_str,
-                                        'line_number': line_num,
-                                        'session_scope': 'current_session'
-                                    })
+                    for line_num, line in enumerate(self._read_lines(file_path), 1):
+                        for pattern, description in self.ANTI_PATTERNS:
+                            if re.search(pattern, line):
+                                violations.append({
+                                    'severity': 'WARNING',
+                                    'rule_ref': 'python_bible.mdc',
+                                    'message': f"Python Bible violation: {description}",
+                                    'file_path': file_path_str,
+                                    'line_number': line_num,
+                                    'session_scope': 'current_session'
+                                })
                 except (FileNotFoundError, PermissionError, OSError, UnicodeDecodeError):
                     # Skip files that can't be read
                     continue
@@ -0,0 +1,413 @@
+"""
+Persistent, content-addressed cache of per-file checker results.
+
+Most enforcer runs re-check files whose bytes haven't changed since the
+previous run. For checkers whose verdict on a file depends only on that file
+(``supports_result_cache``), the result of checking a single file is stored
+in SQLite under ``.cursor/enforcement/`` keyed by
+
+    (content hash, file path, rule_ref, checker version, rule file hash)
+
+and later runs only re-check files that miss. Per-file results are merged
+with :func:`merge_checker_results`, exactly like process-pool batches, so a
+cached run reports what a fresh run would.
+
+- The checker version hashes the source of the checker module and every
+  in-tree module it (transitively) references, so editing checker code
+  invalidates its entries.
+- The rule hash covers the ``.mdc`` rule file plus any extra inputs the
+  checker declares via ``result_cache_dependencies()``.
+- Total payload size is capped; least recently used entries are evicted.
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import sqlite3
+import sys
+import sysconfig
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .base_checker import BaseChecker, CheckerResult, CheckerStatus
+from .parallel_runner import merge_checker_results
+from ..config_paths import get_cursor_enforcer_root
+
+
+logger = logging.getLogger(__name__)
+
+# Default cap on stored result payloads (bytes)
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# Cache file name inside the cursor enforcement directory
+CACHE_FILENAME = 'violation_cache.sqlite'
+
+# Bump when the stored payload format changes
+CACHE_SCHEMA_VERSION = 1
+
+# Directories holding third-party/stdlib code (never part of a checker version)
+_EXTERNAL_DIRS = tuple(
+    str(Path(p).resolve())
+    for p in {sysconfig.get_paths().get(key) for key in ('stdlib', 'platstdlib', 'purelib', 'platlib')}
+    if p
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    rule_ref TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    checker_version TEXT NOT NULL,
+    rule_hash TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (rule_ref, file_path, content_hash, checker_version, rule_hash)
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+CREATE TABLE IF NOT EXISTS checkers (
+    rule_ref TEXT PRIMARY KEY,
+    checker_version TEXT NOT NULL,
+    rule_hash TEXT NOT NULL
+);
+"""
+
+
+def _is_in_tree(module) -> bool:
+    """True for modules loaded from source files outside stdlib/site-packages."""
+    file = getattr(module, '__file__', None)
+    if not file or not file.endswith('.py'):
+        return False
+    return not str(Path(file).resolve()).startswith(_EXTERNAL_DIRS)
+
+
+@lru_cache(maxsize=None)
+def checker_version(checker_class: type) -> str:
+    """
+    Hash the source code a checker class runs.
+
+    Walks the checker's module and, transitively, every in-tree module whose
+    objects it references (base classes, helpers, pattern tables, hints).
+    """
+    root = sys.modules.get(checker_class.__module__)
+    seen = {}
+    pending = [root] if root is not None else []
+    while pending:
+        module = pending.pop()
+        if module.__name__ in seen or not _is_in_tree(module):
+            continue
+        seen[module.__name__] = Path(module.__file__)
+        for value in vars(module).values():
+            if inspect.ismodule(value):
+                pending.append(value)
+            else:
+                owner = sys.modules.get(getattr(value, '__module__', None) or '')
+                if owner is not None:
+                    pending.append(owner)
+
+    hasher = hashlib.sha256(f'schema:{CACHE_SCHEMA_VERSION}\0{checker_class.__qualname__}\0'.encode('utf-8'))
+    for name in sorted(seen):
+        hasher.update(name.encode('utf-8') + b'\0')
+        try:
+            hasher.update(seen[name].read_bytes())
+        except OSError:
+            hasher.update(b'<unreadable>')
+    return hasher.hexdigest()
+
+
+def rule_hash(checker: BaseChecker) -> str:
+    """Hash the checker's rule file and declared extra inputs (missing files included)."""
+    hasher = hashlib.sha256()
+    for path in [Path(checker.rule_file)] + list(checker.result_cache_dependencies()):
+        hasher.update(str(path).encode('utf-8') + b'\0')
+        try:
+            hasher.update(Path(path).read_bytes())
+        except OSError:
+            hasher.update(b'<missing>')
+    return hasher.hexdigest()
+
+
+def hash_file(path: Path) -> Optional[str]:
+    """SHA-256 of a file's bytes, or None if it can't be read."""
+    hasher = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                hasher.update(chunk)
+    except OSError:
+        return None
+    return hasher.hexdigest()
+
+
+def _encode_result(result: CheckerResult) -> str:
+    """Serialize the parts of a single-file result that a rerun would reproduce."""
+    return json.dumps({
+        'status': result.status.value,
+        'violations': result.violations,
+        'checks_passed': result.checks_passed,
+        'checks_failed': result.checks_failed,
+        'files_checked': result.files_checked,
+        'metadata': result.metadata,
+    }, separators=(',', ':'))
+
+
+def _decode_result(rule_ref: str, payload: str) -> CheckerResult:
+    """Rebuild a CheckerResult stored by _encode_result."""
+    data = json.loads(payload)
+    return CheckerResult(
+        status=CheckerStatus(data['status']),
+        rule_ref=rule_ref,
+        violations=data['violations'],
+        checks_passed=data['checks_passed'],
+        checks_failed=data['checks_failed'],
+        files_checked=data['files_checked'],
+        metadata=data['metadata'],
+    )
+
+
+class ViolationCache:
+    """
+    SQLite-backed store of per-file CheckerResults shared across enforcer runs.
+
+    Any SQLite error disables the cache for the rest of the run; checks then
+    simply run uncached.
+    """
+
+    def __init__(self, db_path: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            db_path: SQLite file location
+            max_bytes: Cap on total stored payload size; LRU entries beyond it are evicted
+        """
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._checker_keys: Dict[str, Tuple[str, str]] = {}
+        self._touched: List[Tuple[int, str, str, str, str, str]] = []
+        # Results stored since the last flush(): key -> (payload, stored at)
+        self._pending: Dict[Tuple[str, str, str, str, str], Tuple[str, int]] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            self._conn = self._connect()
+        except sqlite3.DatabaseError as e:
+            # Corrupt or foreign file: start over rather than running uncached forever
+            logger.warning(f"Resetting unreadable violation cache {self.db_path}: {e}")
+            try:
+                self.db_path.unlink()
+                self._conn = self._connect()
+            except (OSError, sqlite3.Error) as retry_error:
+                logger.warning(f"Violation cache disabled: {retry_error}")
+
+    @classmethod
+    def for_project(cls, project_root: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> 'ViolationCache':
+        """Open the cache stored in the project's cursor enforcement directory."""
+        return cls(get_cursor_enforcer_root(project_root) / CACHE_FILENAME, max_bytes=max_bytes)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=5.0)
+        try:
+            conn.executescript(_SCHEMA)
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    @property
+    def enabled(self) -> bool:
+        return self._conn is not None
+
+    def _disable(self, error: Exception) -> None:
+        logger.warning(f"Violation cache disabled for this run: {error}")
+        try:
+            self._conn.close()
+        except sqlite3.Error:
+            pass
+        self._conn = None
+
+    def _checker_key(self, checker: BaseChecker) -> Tuple[str, str]:
+        """
+        Return (checker version, rule hash) and drop entries made with older ones.
+        """
+        key = self._checker_keys.get(checker.rule_ref)
+        if key is not None:
+            return key
+        key = (checker_version(type(checker)), rule_hash(checker))
+        row = self._conn.execute(
+            'SELECT checker_version, rule_hash FROM checkers WHERE rule_ref = ?', (checker.rule_ref,)
+        ).fetchone()
+        if row != key:
+            with self._conn:
+                deleted = self._conn.execute('DELETE FROM results WHERE rule_ref = ?', (checker.rule_ref,)).rowcount
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO checkers (rule_ref, checker_version, rule_hash) VALUES (?, ?, ?)',
+                    (checker.rule_ref, key[0], key[1])
+                )
+            self.evictions += max(deleted, 0)
+        self._checker_keys[checker.rule_ref] = key
+        return key
+
+    def get(self, checker: BaseChecker, file_path: str, content_hash: str) -> Optional[CheckerResult]:
+        """Return the stored single-file result, or None on a miss."""
+        if self._conn is None:
+            return None
+        try:
+            version, rules = self._checker_key(checker)
+            key = (checker.rule_ref, file_path, content_hash, version, rules)
+            pending = self._pending.get(key)
+            if pending is not None:
+                self.hits += 1
+                return _decode_result(checker.rule_ref, pending[0])
+            row = self._conn.execute(
+                'SELECT payload FROM results WHERE rule_ref = ? AND file_path = ? AND content_hash = ? '
+                'AND checker_version = ? AND rule_hash = ?',
+                key
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._disable(e)
+            return None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._touched.append((time.time_ns(),) + key)
+        return _decode_result(checker.rule_ref, row[0])
+
+    def put(self, checker: BaseChecker, file_path: str, content_hash: str, result: CheckerResult) -> None:
+        """
+        Store a single-file result (errored results are never stored).
+
+        Results are written to the database in one transaction by flush().
+        """
+        if self._conn is None or result.status == CheckerStatus.ERROR:
+            return
+        try:
+            version, rules = self._checker_key(checker)
+        except sqlite3.Error as e:
+            self._disable(e)
+            return
+        key = (checker.rule_ref, file_path, content_hash, version, rules)
+        self._pending[key] = (_encode_result(result), time.time_ns())
+        self.stores += 1
+
+    def lookup(
+        self,
+        checker: BaseChecker,
+        changed_files: List[str],
+        file_hasher: Optional[Callable[[str], Optional[str]]] = None,
+    ) -> Tuple[Dict[str, CheckerResult], Dict[str, Optional[str]]]:
+        """
+        Split files into cached results and misses without running the checker.
+
+        Args:
+            checker: A checker with ``supports_result_cache``
+            changed_files: Files to look up (relative to project_root)
+            file_hasher: Maps a relative path to its content hash
+                (default: SHA-256 of the file's bytes)
+
+        Returns:
+            (cached result per file, content hash per missed file). The hash
+            is None for files that can't be hashed; those are never stored.
+        """
+        if file_hasher is None:
+            file_hasher = lambda path: hash_file(checker.project_root / path)
+
+        cached: Dict[str, CheckerResult] = {}
+        missed: Dict[str, Optional[str]] = {}
+        for file_path in changed_files:
+            content_hash = file_hasher(file_path) if self._conn is not None else None
+            result = self.get(checker, file_path, content_hash) if content_hash else None
+            if result is None:
+                missed[file_path] = content_hash
+            else:
+                cached[file_path] = result
+        return cached, missed
+
+    def check(
+        self,
+        checker: BaseChecker,
+        changed_files: List[str],
+        user_message: Optional[str] = None,
+        file_hasher: Optional[Callable[[str], Optional[str]]] = None,
+    ) -> CheckerResult:
+        """
+        Run ``checker.check(changed_files)``, reusing cached per-file results.
+
+        Files that miss are checked one at a time and stored; files that can't
+        be hashed (deleted, unreadable) are checked uncached. The per-file
+        results are merged in file order.
+
+        Args:
+            checker: A checker with ``supports_result_cache``
+            changed_files: Files to check (relative to project_root)
+            user_message: Passed through to the checker
+            file_hasher: Maps a relative path to its content hash
+                (default: SHA-256 of the file's bytes)
+        """
+        if self._conn is None or not changed_files:
+            return checker.check(changed_files, user_message)
+
+        results, missed = self.lookup(checker, changed_files, file_hasher)
+        for file_path, content_hash in missed.items():
+            result = checker.check([file_path], user_message)
+            if content_hash:
+                self.put(checker, file_path, content_hash, result)
+            results[file_path] = result
+        return merge_checker_results([results[file_path] for file_path in changed_files])
+
+    def flush(self) -> None:
+        """Write stored results, record hit times for LRU ordering and evict entries over the size cap."""
+        if self._conn is None:
+            return
+        try:
+            with self._conn:
+                if self._pending:
+                    self._conn.executemany(
+                        'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                        [key + (payload, len(payload), stored_at)
+                         for key, (payload, stored_at) in self._pending.items()]
+                    )
+                    self._pending = {}
+                if self._touched:
+                    self._conn.executemany(
+                        'UPDATE results SET last_used = ? WHERE rule_ref = ? AND file_path = ? '
+                        'AND content_hash = ? AND checker_version = ? AND rule_hash = ?',
+                        self._touched
+                    )
+                    self._touched = []
+                total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+                if total > self.max_bytes:
+                    victims = []
+                    for rowid, size in self._conn.execute('SELECT rowid, size FROM results ORDER BY last_used'):
+                        if total <= self.max_bytes:
+                            break
+                        victims.append((rowid,))
+                        total -= size
+                    self._conn.executemany('DELETE FROM results WHERE rowid = ?', victims)
+                    self.evictions += len(victims)
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def close(self) -> None:
+        """Flush and close the database."""
+        self.flush()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/store/eviction counters for this run."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'stores': self.stores,
+            'evictions': self.evictions,
+        }
@@ -18,6 +18,8 @@ from .base_checker import BaseChecker, CheckerResult, CheckerStatus
 from .models import Violation
 from .exceptions import CheckerExecutionError
 from .backend_utils import is_test_file
+from ..core.pattern_set import PatternSet
+from ..core.line_index import LineIndex
 from ..autofix_suggestions import secret_fix_hint
 
 
@@ -30,6 +32,9 @@ class SecretScannerChecker(BaseChecker):
     - Secrets must come from environment variables or ConfigService
     """
     
+    supports_file_sharding = True
+    supports_result_cache = True
+    
     # File extensions to scan
     CODE_FILE_EXTENSIONS = {'.ts', '.tsx', '.js', '.jsx', '.py'}
     
@@ -59,6 +64,11 @@ class SecretScannerChecker(BaseChecker):
         r'os\.getenv\(',
     ]
     
+    # Rule lists merged into single-pass pattern sets
+    SECRET_VARIABLE_SET = PatternSet(SECRET_VARIABLE_PATTERNS)
+    SECRET_CONTEXT_SET = PatternSet(SECRET_VARIABLE_PATTERNS, re.IGNORECASE)
+    ENV_VARIABLE_SET = PatternSet(ENV_VARIABLE_PATTERNS, re.IGNORECASE)
+    
     # Pattern for long random-looking strings (base64-like, hex, etc.)
     RANDOM_STRING_PATTERN = re.compile(
         r'["\']([A-Za-z0-9+/]{24,}={0,2})["\']|'  # Base64-like
@@ -102,20 +112,19 @@ class SecretScannerChecker(BaseChecker):
                     continue
                 
                 try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        lines = f.readlines()
-                        content = ''.join(lines)
-                        
-                        # Check for suspicious variable names with string literals
-                        violations.extend(
-                            self._check_secret_variables(file_path_str, lines, content)
-                        )
-                        
-                        # Check for long random-looking strings
-                        violations.extend(
-                            self._check_random_strings(file_path_str, lines, content)
-                        )
-                        
+                    lines = self._read_lines(file_path)
+                    content = self._read_text(file_path)
+                    
+                    # Check for suspicious variable names with string literals
+                    violations.extend(
+                        self._check_secret_variables(file_path_str, lines, content)
+                    )
+                    
+                    # Check for long random-looking strings
+                    violations.extend(
+                        self._check_random_strings(file_path_str, lines, content)
+                    )
+                    
                 except (FileNotFoundError, PermissionError, OSError, UnicodeDecodeError):
                     continue
             
@@ -163,48 +172,45 @@ class SecretScannerChecker(BaseChecker):
         """
         violations = []
         
-        for pattern in self.SECRET_VARIABLE_PATTERNS:
-            # Find all matches of the pattern
-            for match in re.finditer(pattern, content):
-                line_num = content[:match.start()].count('\n') + 1
-                line = lines[line_num - 1] if line_num <= len(lines) else ''
-                
-                # Skip if in comment
-                if line.strip().startswith('//') or line.strip().startswith('#'):
-                    continue
-                
-                # Check if this variable is assigned a string literal
-                # Look for pattern: VARIABLE_NAME = "value" or VARIABLE_NAME: "value"
-                var_name = match.group()
-                
-                # Find assignment on same line or nearby lines
-                context_start = max(0, line_num - 3)
-                context_end = min(len(lines), line_num + 3)
-                context = '\n'.join(lines[context_start:context_end])
-                
-                # Check if there's a string literal assignment
-                assignment_pattern = rf'{re.escape(var_name)}\s*[=:]\s*["\']([^"\']+)["\']'
-                assignment_match = re.search(assignment_pattern, context)
+        # Find all matches of every pattern (files without any hit are rejected in one pass)
+        line_index = LineIndex(content)
+        for _, match in self.SECRET_VARIABLE_SET.finditer(content):
+            line_num = line_index.line_number(match.start())
+            line = lines[line_num - 1] if line_num <= len(lines) else ''
+            
+            # Skip if in comment
+            if line.strip().startswith('//') or line.strip().startswith('#'):
+                continue
+            
+            # Check if this variable is assigned a string literal
+            # Look for pattern: VARIABLE_NAME = "value" or VARIABLE_NAME: "value"
+            var_name = match.group()
+            
+            # Find assignment on same line or nearby lines
+            context_start = max(0, line_num - 3)
+            context_end = min(len(lines), line_num + 3)
+            context = '\n'.join(lines[context_start:context_end])
+            
+            # Check if there's a string literal assignment
+            assignment_pattern = rf'{re.escape(var_name)}\s*[=:]\s*["\']([^"\']+)["\']'
+            assignment_match = re.search(assignment_pattern, context)
+            
+            if assignment_match:
+                # Check if value comes from environment variable
+                is_env_var = self.ENV_VARIABLE_SET.search(context)
                 
-                if assignment_match:
-                    # Check if value comes from environment variable
-                    is_env_var = any(
-                        re.search(env_pattern, context, re.IGNORECASE)
-                        for env_pattern in self.ENV_VARIABLE_PATTERNS
-                    )
-                    
-                    if not is_env_var:
-                        # Extract variable name without word boundaries for display
-                        var_display = var_name.replace('\\b', '').strip()
-                        violations.append(Violation(
-                            severity='BLOCKING',
-                            rule_ref='SEC-R03-001',
-                            message=f'Hardcoded secret value detected for {var_display}.',
-                            file_path=file_path,
-                            line_number=line_num,
-                            fix_hint=secret_fix_hint(var_display),
-                            session_scope='current_session'
-                        ))
+                if not is_env_var:
+                    # Extract variable name without word boundaries for display
+                    var_display = var_name.replace('\\b', '').strip()
+                    violations.append(Violation(
+                        severity='BLOCKING',
+                        rule_ref='SEC-R03-001',
+                        message=f'Hardcoded secret value detected for {var_display}.',
+                        file_path=file_path,
+                        line_number=line_num,
+                        fix_hint=secret_fix_hint(var_display),
+                        session_scope='current_session'
+                    ))
         
         return violations
     
@@ -228,8 +234,9 @@ class SecretScannerChecker(BaseChecker):
         violations = []
         
         # Find all matches of random-looking strings
+        line_index = LineIndex(content)
         for match in self.RANDOM_STRING_PATTERN.finditer(content):
-            line_num = content[:match.start()].count('\n') + 1
+            line_num = line_index.line_number(match.start())
             line = lines[line_num - 1] if line_num <= len(lines) else ''
             
             # Skip if in comment
@@ -245,16 +252,10 @@ class SecretScannerChecker(BaseChecker):
             context = '\n'.join(lines[context_start:context_end])
             
             # Check if context contains secret-related variable names
-            has_secret_context = any(
-                re.search(pattern, context, re.IGNORECASE)
-                for pattern in self.SECRET_VARIABLE_PATTERNS
-            )
+            has_secret_context = self.SECRET_CONTEXT_SET.search(context)
             
             # Check if it's an environment variable reference
-            is_env_var = any(
-                re.search(env_pattern, context, re.IGNORECASE)
-                for env_pattern in self.ENV_VARIABLE_PATTERNS
-            )
+            is_env_var = self.ENV_VARIABLE_SET.search(context)
             
             # Only flag if it looks like a secret and isn't from env
             if has_secret_context and not is_env_var:
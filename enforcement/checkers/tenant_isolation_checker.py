@@ -21,17 +21,14 @@ from .models import Violation
 from .exceptions import CheckerExecutionError
 from .backend_utils import is_test_file
 
-# Import Prisma query parser
-# Note: Using absolute import to avoid linter warnings
-import sys
-from pathlib import Path
-_enforcement_dir = Path(__file__).parent.parent
-if str(_enforcement_dir) not in sys.path:
-    sys.path.insert(0, str(_enforcement_dir))
-from prisma_query_parser import parse_prisma_calls, PrismaCall
+# Import Prisma query parser (same module object as backend_patterns_checker,
+# so both checkers share its scan cache)
+from ..prisma_query_parser import parse_prisma_calls, PrismaCall
 
 # Import auto-fix suggestions
 from ..autofix_suggestions import tenant_filter_fix_hint, client_tenant_fix_hint
+from ..core.pattern_set import PatternSet
+from ..core.line_index import LineIndex
 
 # Debug logging setup
 DEBUG_ENABLED = os.getenv("VEROFIELD_ENFORCER_DEBUG") == "1"
@@ -57,6 +54,9 @@ class TenantIsolationChecker(BaseChecker):
     - Tenant_id must come from authenticated JWT, not client input
     """
     
+    supports_file_sharding = True
+    supports_result_cache = True
+    
     # Operations that should be tenant-scoped
     TENANT_SCOPED_OPERATIONS = {
         'findMany', 'findFirst', 'findUnique', 'update', 'delete', 'upsert', 'create'
@@ -72,6 +72,7 @@ class TenantIsolationChecker(BaseChecker):
         r'@Query\(["\']tenant[Ii]d["\']\)',
         r'@Param\(["\']tenant[Ii]d["\']\)',
     ]
+    CLIENT_TENANT_ID_SET = PatternSet(CLIENT_TENANT_ID_PATTERNS)
     
     # Patterns for allowed tenant_id sources (from JWT/auth)
     ALLOWED_TENANT_ID_PATTERNS = [
@@ -88,6 +89,14 @@ class TenantIsolationChecker(BaseChecker):
         super().__init__(*args, **kwargs)
         self.tenant_scoped_tables: Set[str] = self._load_tenant_tables()
     
+    def _tenant_tables_file(self) -> Path:
+        """Path of the tenant-scoped tables config file."""
+        return self.project_root / '.cursor' / 'enforcement' / 'tenant_tables.json'
+    
+    def result_cache_dependencies(self) -> List[Path]:
+        """Cached results depend on the tenant-scoped tables config."""
+        return [self._tenant_tables_file()]
+    
     def _load_tenant_tables(self) -> Set[str]:
         """
         Load list of tenant-scoped tables from config file.
@@ -95,7 +104,7 @@ class TenantIsolationChecker(BaseChecker):
         Returns:
             Set of table names that require tenant filtering
         """
-        tenant_tables_file = self.project_root / '.cursor' / 'enforcement' / 'tenant_tables.json'
+        tenant_tables_file = self._tenant_tables_file()
         
         if tenant_tables_file.exists():
             try:
@@ -147,9 +156,8 @@ class TenantIsolationChecker(BaseChecker):
                     continue
                 
                 try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                        lines = content.split('\n')
+                    content = self._read_text(file_path)
+                    lines = content.split('\n')
                     
                     if DEBUG_ENABLED and debug_logger:
                         debug_logger.debug(f"CHECK: {file_path}")
@@ -290,45 +298,43 @@ class TenantIsolationChecker(BaseChecker):
                 continue
             
             # Check if where clause contains client-provided tenantId patterns
-            for pattern in self.CLIENT_TENANT_ID_PATTERNS:
-                if re.search(pattern, call.where_text):
-                    violations.append(Violation(
-                        severity='BLOCKING',
-                        rule_ref='SEC-R01-002',
-                        message='Tenant ID must be derived from authenticated identity (JWT/current user), not client input.',
-                        file_path=file_path,
-                        line_number=call.line_number,
-                        fix_hint=client_tenant_fix_hint(),
-                        session_scope='current_session'
-                    ))
-                    break  # Only report once per call
+            if self.CLIENT_TENANT_ID_SET.search(call.where_text):
+                violations.append(Violation(
+                    severity='BLOCKING',
+                    rule_ref='SEC-R01-002',
+                    message='Tenant ID must be derived from authenticated identity (JWT/current user), not client input.',
+                    file_path=file_path,
+                    line_number=call.line_number,
+                    fix_hint=client_tenant_fix_hint(),
+                    session_scope='current_session'
+                ))
         
         # Also check file-level patterns (for cases where tenantId is extracted before the query)
-        for pattern in self.CLIENT_TENANT_ID_PATTERNS:
-            for match in re.finditer(pattern, content):
-                line_num = content[:match.start()].count('\n') + 1
-                line = lines[line_num - 1] if line_num <= len(lines) else ''
-                
-                # Skip if in comment
-                if line.strip().startswith('//') or line.strip().startswith('#'):
-                    continue
-                
-                # Check if there's a Prisma call nearby (within 20 lines)
-                nearby_calls = [
-                    call for call in prisma_calls
-                    if abs(call.line_number - line_num) <= 20
-                ]
-                
-                if nearby_calls:
-                    violations.append(Violation(
-                        severity='BLOCKING',
-                        rule_ref='SEC-R01-002',
-                        message='Tenant ID must be derived from authenticated identity (JWT/current user), not client input.',
-                        file_path=file_path,
-                        line_number=line_num,
-                        fix_hint=client_tenant_fix_hint(),
-                        session_scope='current_session'
-                    ))
+        line_index = LineIndex(content)
+        for _, match in self.CLIENT_TENANT_ID_SET.finditer(content):
+            line_num = line_index.line_number(match.start())
+            line = lines[line_num - 1] if line_num <= len(lines) else ''
+            
+            # Skip if in comment
+            if line.strip().startswith('//') or line.strip().startswith('#'):
+                continue
+            
+            # Check if there's a Prisma call nearby (within 20 lines)
+            nearby_calls = [
+                call for call in prisma_calls
+                if abs(call.line_number - line_num) <= 20
+            ]
+            
+            if nearby_calls:
+                violations.append(Violation(
+                    severity='BLOCKING',
+                    rule_ref='SEC-R01-002',
+                    message='Tenant ID must be derived from authenticated identity (JWT/current user), not client input.',
+                    file_path=file_path,
+                    line_number=line_num,
+                    fix_hint=client_tenant_fix_hint(),
+                    session_scope='current_session'
+                ))
         
         return violations
 
@@ -0,0 +1,80 @@
+import os
+
+from enforcement.checkers.base_checker import BaseChecker, CheckerResult, CheckerStatus
+from enforcement.checkers.checker_router import CheckerRouter
+from enforcement.checkers.pattern_matcher import GlobIndex, match_file_patterns
+
+
+class StubChecker(BaseChecker):
+    def check(self, changed_files, user_message=None):
+        return CheckerResult(
+            rule_ref=self.rule_ref,
+            status=CheckerStatus.SUCCESS,
+        )
+
+
+def write_rule(rules_dir, name, globs=None, always_apply=False):
+    lines = ["---", f"alwaysApply: {'true' if always_apply else 'false'}"]
+    if globs is not None:
+        lines.append(f'globs: "{globs}"')
+    lines.extend(["---", "", "# Rule", ""])
+    (rules_dir / name).write_text("\n".join(lines))
+
+
+def routed(router, files, checkers):
+    return sorted(checker.rule_ref for checker in router.get_checkers_to_run(files, checkers))
+
+
+def test_routes_by_globs_and_always_apply(tmp_path):
+    rules_dir = tmp_path / "rules"
+    rules_dir.mkdir()
+    write_rule(rules_dir, "00-core.mdc", always_apply=True)
+    write_rule(rules_dir, "01-backend.mdc", "apps/*/src/**/*.ts")
+    write_rule(rules_dir, "02-frontend.mdc", "frontend/**/*.tsx, **/*.css")
+    write_rule(rules_dir, "03-python.mdc", "*.py")
+    write_rule(rules_dir, "04-any.mdc")
+    checkers = {name: StubChecker for name in (
+        "00-core.mdc", "01-backend.mdc", "02-frontend.mdc", "03-python.mdc", "04-any.mdc",
+    )}
+    router = CheckerRouter(tmp_path, rules_dir)
+
+    assert routed(router, ["apps/api/src/a/b.service.ts"], checkers) == [
+        "00-core.mdc", "01-backend.mdc", "04-any.mdc",
+    ]
+    assert routed(router, ["libs/ui/theme.css", ".cursor/scripts/x.py"], checkers) == [
+        "00-core.mdc", "02-frontend.mdc", "03-python.mdc", "04-any.mdc",
+    ]
+    assert routed(router, ["README.md"], {"01-backend.mdc": StubChecker}) == []
+
+
+def test_rules_dir_change_rebuilds_index(tmp_path):
+    rules_dir = tmp_path / "rules"
+    rules_dir.mkdir()
+    write_rule(rules_dir, "01-backend.mdc", "apps/**/*.ts")
+    checkers = {"01-backend.mdc": StubChecker, "02-docs.mdc": StubChecker}
+    router = CheckerRouter(tmp_path, rules_dir)
+    assert routed(router, ["docs/guide.md"], checkers) == []
+
+    write_rule(rules_dir, "02-docs.mdc", "docs/**")
+    stat = rules_dir.stat()
+    os.utime(rules_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert routed(router, ["docs/guide.md"], checkers) == ["02-docs.mdc"]
+
+
+def test_glob_index_matches_match_file_patterns():
+    patterns = {
+        "ts": ["**/*.ts", "apps/*/src/**"],
+        "docs": ["docs/*.md"],
+        "star": ["*"],
+        "blank": [" "],
+    }
+    index = GlobIndex()
+    for owner, owner_patterns in patterns.items():
+        index.add(owner, owner_patterns)
+
+    paths = ["a.ts", "x/y.ts", "apps/api/src", "docs/a/b.md", "docs/readme.md", "Makefile", ""]
+    for path in paths:
+        expected = {owner for owner, owner_patterns in patterns.items() if match_file_patterns(path, owner_patterns)}
+        assert index.match_owners([path]) == expected, path
+    assert "blank" not in index.match_owners(paths)
@@ -44,3 +44,14 @@ def test_rename_only_skipped(tmp_path):
     assert res.status == CheckerStatus.SUCCESS
     assert len(res.violations) == 0
 
+
+
+def test_current_date_refreshed_per_check(tmp_path):
+    from datetime import datetime
+
+    checker = make_checker(tmp_path)
+    checker.current_date = "2020-01-01"  # created on an earlier day, e.g. by a daemon
+    f = tmp_path / "doc3.md"
+    f.write_text("nothing dated here")
+    res = checker.check([str(f.relative_to(tmp_path))], classification_map={str(f.relative_to(tmp_path)): "CONTENT_CHANGED"})
+    assert res.metadata["current_date"] == datetime.now().strftime("%Y-%m-%d")
@@ -0,0 +1,78 @@
+import os
+
+from enforcement.checkers.file_content_store import FileContentStore
+from enforcement.checkers.secret_scanner_checker import SecretScannerChecker
+from enforcement.checkers.base_checker import CheckerStatus
+
+
+def test_matches_text_mode_open(tmp_path):
+    f = tmp_path / "a.ts"
+    f.write_bytes(b"one\r\ntwo\rthree\nbad\xff byte")
+    store = FileContentStore(tmp_path)
+
+    with open(f, 'r', encoding='utf-8', errors='ignore') as fh:
+        expected_lines = fh.readlines()
+
+    assert store.read_lines("a.ts") == expected_lines
+    assert store.read_text(f) == ''.join(expected_lines)
+
+
+def test_reads_each_file_once(tmp_path):
+    f = tmp_path / "a.ts"
+    f.write_text("const x = 1;\n")
+    store = FileContentStore(tmp_path)
+
+    store.read_text("a.ts")
+    store.read_lines("a.ts")
+    store.read_text(f)
+
+    stats = store.stats()
+    assert stats['misses'] == 1
+    assert stats['hits'] == 2
+    assert stats['bytes_read'] == f.stat().st_size
+
+
+def test_rereads_modified_file(tmp_path):
+    f = tmp_path / "a.ts"
+    f.write_text("old\n")
+    store = FileContentStore(tmp_path)
+    assert store.read_text("a.ts") == "old\n"
+
+    f.write_text("newer\n")
+    st = f.stat()
+    os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert store.read_text("a.ts") == "newer\n"
+    assert store.stats()['entries'] == 1
+
+
+def test_lru_budget_evicts_oldest(tmp_path):
+    for name in ("a", "b", "c"):
+        (tmp_path / name).write_text("x" * 100)
+    store = FileContentStore(tmp_path, max_bytes=450)
+
+    store.read_text("a")
+    store.read_text("b")
+    store.read_text("c")
+
+    stats = store.stats()
+    assert stats['evictions'] == 1
+    assert stats['cached_bytes'] <= 450
+    store.read_text("a")
+    assert store.stats()['misses'] == 4
+
+
+def test_checker_uses_shared_store(tmp_path):
+    src = tmp_path / "config.ts"
+    src.write_text('const JWT_SECRET = "supersecretvalue";\n')
+    rule_file = tmp_path / "rule.mdc"
+    rule_file.write_text("")
+    checker = SecretScannerChecker(project_root=tmp_path, rule_file=rule_file, rule_ref="03-security-secrets.mdc")
+
+    direct = checker.check(["config.ts"])
+    checker.content_store = FileContentStore(tmp_path)
+    cached = checker.check(["config.ts"])
+
+    assert cached.status == direct.status == CheckerStatus.FAILED
+    assert cached.violations == direct.violations
+    assert checker.content_store.stats()['misses'] == 1
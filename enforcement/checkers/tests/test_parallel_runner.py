@@ -0,0 +1,106 @@
+import os
+import time
+
+from enforcement.checkers import checker_registry
+from enforcement.checkers.base_checker import BaseChecker, CheckerStatus
+from enforcement.checkers.parallel_runner import (
+    CheckerExecutionFailure,
+    merge_checker_results,
+    run_checkers_in_process_pool,
+)
+from enforcement.checkers.python_bible_checker import PythonBibleChecker
+from enforcement.checkers.secret_scanner_checker import SecretScannerChecker
+
+
+class CrashingChecker(BaseChecker):
+    def check(self, changed_files, user_message=None):
+        os._exit(1)
+
+
+class HangingChecker(BaseChecker):
+    def check(self, changed_files, user_message=None):
+        time.sleep(30)
+
+
+def make_checker(cls, tmp_path, rule_ref):
+    rule_file = tmp_path / f"{rule_ref}"
+    rule_file.write_text("")
+    return cls(project_root=tmp_path, rule_file=rule_file, rule_ref=rule_ref)
+
+
+def write_sources(tmp_path, count):
+    files = []
+    for i in range(count):
+        name = f"src/config{i}.ts"
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        secret = 'const API_KEY = "hardcodedvalue";\n' if i % 2 == 0 else "const x = 1;\n"
+        path.write_text(secret)
+        files.append(name)
+    return files
+
+
+def test_process_pool_matches_serial(tmp_path):
+    files = write_sources(tmp_path, 7)
+    checker = make_checker(SecretScannerChecker, tmp_path, "03-security-secrets.mdc")
+
+    serial = checker.check(files)
+    parallel = run_checkers_in_process_pool([checker], files, max_workers=2, batch_size=2)
+
+    merged = parallel["03-security-secrets.mdc"]
+    assert merged.status == serial.status == CheckerStatus.FAILED
+    assert merged.violations == serial.violations
+    assert merged.checks_failed == serial.checks_failed
+    assert merged.checks_passed == serial.checks_passed
+    assert merged.files_checked == serial.files_checked
+
+
+def test_merge_ignores_empty_batches(tmp_path):
+    (tmp_path / "a.py").write_text("x = 1\n")
+    (tmp_path / "b.ts").write_text("x\n")
+    checker = make_checker(PythonBibleChecker, tmp_path, "python_bible.mdc")
+
+    serial = checker.check(["b.ts", "a.py"])
+    merged = merge_checker_results([checker.check(["b.ts"]), checker.check(["a.py"])])
+
+    assert merged.checks_passed == serial.checks_passed
+    assert merged.status == serial.status
+
+
+def test_crash_is_isolated(tmp_path, monkeypatch):
+    files = write_sources(tmp_path, 2)
+    monkeypatch.setitem(checker_registry.CHECKER_REGISTRY, "crash.mdc", CrashingChecker)
+    good = make_checker(SecretScannerChecker, tmp_path, "03-security-secrets.mdc")
+    bad = make_checker(CrashingChecker, tmp_path, "crash.mdc")
+
+    results = run_checkers_in_process_pool([bad, good], files, max_workers=2)
+
+    assert isinstance(results["crash.mdc"], CheckerExecutionFailure)
+    assert results["03-security-secrets.mdc"].status == CheckerStatus.FAILED
+
+
+def test_timeout_reports_failure(tmp_path, monkeypatch):
+    files = write_sources(tmp_path, 1)
+    monkeypatch.setitem(checker_registry.CHECKER_REGISTRY, "hang.mdc", HangingChecker)
+    hang = make_checker(HangingChecker, tmp_path, "hang.mdc")
+
+    start = time.perf_counter()
+    results = run_checkers_in_process_pool([hang], files, max_workers=2, timeout=1)
+
+    assert isinstance(results["hang.mdc"], CheckerExecutionFailure)
+    assert results["hang.mdc"].error_type == "TimeoutError"
+    assert time.perf_counter() - start < 15
+
+
+def test_timeout_is_one_deadline_for_all_units(tmp_path, monkeypatch):
+    files = write_sources(tmp_path, 1)
+    hangs = []
+    for i in range(3):
+        monkeypatch.setitem(checker_registry.CHECKER_REGISTRY, f"hang{i}.mdc", HangingChecker)
+        hangs.append(make_checker(HangingChecker, tmp_path, f"hang{i}.mdc"))
+
+    start = time.perf_counter()
+    results = run_checkers_in_process_pool(hangs, files, max_workers=1, timeout=1)
+
+    assert all(results[f"hang{i}.mdc"].error_type == "TimeoutError" for i in range(3))
+    assert time.perf_counter() - start < 2.5
@@ -0,0 +1,181 @@
+from enforcement.checkers import parallel_runner
+from enforcement.checkers.base_checker import CheckerStatus
+from enforcement.checkers.result_cache import ViolationCache
+from enforcement.checkers.secret_scanner_checker import SecretScannerChecker
+from enforcement.checkers.tenant_isolation_checker import TenantIsolationChecker
+
+
+RULE_REF = "03-security-secrets.mdc"
+
+
+def make_checker(cls, tmp_path, rule_ref=RULE_REF):
+    rule_file = tmp_path / rule_ref
+    if not rule_file.exists():
+        rule_file.write_text("rule v1")
+    return cls(project_root=tmp_path, rule_file=rule_file, rule_ref=rule_ref)
+
+
+def write_sources(tmp_path, count):
+    files = []
+    for i in range(count):
+        name = f"src/config{i}.ts"
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        secret = 'const API_KEY = "hardcodedvalue";\n' if i % 2 == 0 else "const x = 1;\n"
+        path.write_text(secret)
+        files.append(name)
+    return files
+
+
+def open_cache(tmp_path, **kwargs):
+    return ViolationCache(tmp_path / "cache" / "violations.sqlite", **kwargs)
+
+
+def assert_same(result, expected):
+    assert result.status == expected.status
+    assert result.violations == expected.violations
+    assert result.checks_passed == expected.checks_passed
+    assert result.checks_failed == expected.checks_failed
+    assert result.files_checked == expected.files_checked
+
+
+def test_cached_run_matches_fresh_run(tmp_path):
+    files = write_sources(tmp_path, 5)
+    checker = make_checker(SecretScannerChecker, tmp_path)
+    fresh = checker.check(files)
+
+    cache = open_cache(tmp_path)
+    assert_same(cache.check(checker, files), fresh)
+    cache.close()
+
+    cache = open_cache(tmp_path)
+    assert_same(cache.check(checker, files), fresh)
+    assert cache.stats()["hits"] == len(files)
+    assert cache.stats()["misses"] == 0
+    cache.close()
+    assert fresh.status == CheckerStatus.FAILED
+
+
+def test_content_change_misses(tmp_path):
+    files = write_sources(tmp_path, 2)
+    checker = make_checker(SecretScannerChecker, tmp_path)
+    cache = open_cache(tmp_path)
+    cache.check(checker, files)
+
+    (tmp_path / files[0]).write_text("const x = 2;\n")
+    result = cache.check(checker, files)
+
+    assert cache.stats()["hits"] == 1
+    assert result.status == CheckerStatus.SUCCESS
+    assert_same(result, checker.check(files))
+
+
+def test_process_pool_sends_only_misses(tmp_path, monkeypatch):
+    files = write_sources(tmp_path, 6)
+    checker = make_checker(SecretScannerChecker, tmp_path)
+    fresh = checker.check(files)
+    cache = open_cache(tmp_path)
+    cache.check(checker, files[:4])
+
+    sent = []
+    run_work_units = parallel_runner.run_work_units
+
+    def recording(units, **kwargs):
+        sent.extend(file_path for unit in units for file_path in unit.files)
+        return run_work_units(units, **kwargs)
+
+    monkeypatch.setattr(parallel_runner, "run_work_units", recording)
+    results = parallel_runner.run_checkers_in_process_pool([checker], files, max_workers=2, result_cache=cache)
+
+    assert sent == files[4:]
+    assert_same(results[RULE_REF], fresh)
+    assert cache.stats()["hits"] == 4
+    assert cache.stats()["stores"] == len(files)
+    cache.close()
+
+
+def test_rule_file_change_invalidates(tmp_path):
+    files = write_sources(tmp_path, 2)
+    checker = make_checker(SecretScannerChecker, tmp_path)
+    cache = open_cache(tmp_path)
+    cache.check(checker, files)
+    cache.close()
+
+    checker.rule_file.write_text("rule v2")
+    cache = open_cache(tmp_path)
+    cache.check(checker, files)
+
+    assert cache.stats()["hits"] == 0
+    assert cache.stats()["evictions"] == len(files)
+
+
+def test_declared_dependency_change_invalidates(tmp_path):
+    path = tmp_path / "apps/api/src/orders.service.ts"
+    path.parent.mkdir(parents=True)
+    path.write_text("await this.prisma.widget.findMany({ where: { id } });\n")
+    files = ["apps/api/src/orders.service.ts"]
+    config = tmp_path / ".cursor" / "enforcement" / "tenant_tables.json"
+    config.parent.mkdir(parents=True)
+    config.write_text('{"tenant_scoped_tables": []}')
+
+    cache = open_cache(tmp_path)
+    cache.check(make_checker(TenantIsolationChecker, tmp_path, "tenant.mdc"), files)
+    cache.close()
+
+    config.write_text('{"tenant_scoped_tables": ["widget"]}')
+    checker = make_checker(TenantIsolationChecker, tmp_path, "tenant.mdc")
+    cache = open_cache(tmp_path)
+    result = cache.check(checker, files)
+
+    assert cache.stats()["hits"] == 0
+    assert_same(result, checker.check(files))
+
+
+def test_lru_eviction_respects_size_cap(tmp_path):
+    files = write_sources(tmp_path, 6)
+    checker = make_checker(SecretScannerChecker, tmp_path)
+    cache = open_cache(tmp_path)
+    cache.check(checker, files)
+    cache.close()
+
+    # Touch the first file so it is the most recently used entry
+    cache = open_cache(tmp_path)
+    cache.check(checker, files[:1])
+    cache.flush()
+    sizes = dict(cache._conn.execute("SELECT file_path, size FROM results"))
+    cache.max_bytes = sizes[files[0]] + sizes[files[1]]
+    cache.close()
+
+    cache = open_cache(tmp_path)
+    remaining = {row[0] for row in cache._conn.execute("SELECT file_path FROM results")}
+    assert files[0] in remaining
+    assert sum(sizes[f] for f in remaining) <= sizes[files[0]] + sizes[files[1]]
+
+
+def test_corrupt_database_is_reset(tmp_path):
+    files = write_sources(tmp_path, 1)
+    db_path = tmp_path / "cache" / "violations.sqlite"
+    db_path.parent.mkdir()
+    db_path.write_bytes(b"not a database" * 100)
+
+    cache = ViolationCache(db_path)
+    assert cache.enabled
+    cache.check(make_checker(SecretScannerChecker, tmp_path), files)
+    assert cache.stats()["stores"] == 1
+
+
+def test_results_are_written_in_one_transaction_on_flush(tmp_path):
+    import sqlite3
+
+    files = write_sources(tmp_path, 4)
+    cache = open_cache(tmp_path)
+    cache.check(make_checker(SecretScannerChecker, tmp_path), files)
+
+    reader = sqlite3.connect(str(cache.db_path))
+    try:
+        assert reader.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 0
+        cache.flush()
+        assert reader.execute("SELECT COUNT(*) FROM results").fetchone()[0] == len(files)
+    finally:
+        reader.close()
+        cache.close()
@@ -15,6 +15,7 @@ from enforcement.core.scope_evaluator import (
 from enforcement.core.historical import is_historical_path
 from enforcement.core.file_scanner import is_file_modified_in_session
 from enforcement.core.file_classifier import FileChangeType, classify_file_change
+from enforcement.core.pattern_set import PatternSet
 from collections import Counter
 
 try:
@@ -61,6 +62,38 @@ except ImportError:  # pragma: no cover - fallback logger
     logger = _FallbackLogger()
 
 
+# Every HARDCODED_DATE_PATTERN match contains "20" followed by a digit (the year)
+_DATE_PREFIX_BYTES = re.compile(rb'20[0-9]')
+_DATE_PREFIX_TEXT = re.compile(r'20\d')
+
+
+def read_date_candidate(file_path: Path) -> Optional[str]:
+    """
+    Read a file and return its text only if it may contain a hardcoded date.
+
+    ASCII files are rejected with a byte-level search before any decoding or
+    regex work; other files are decoded first (``\\d`` also matches non-ASCII
+    digits, and dropped invalid bytes can join a "20" to digits).
+
+    Returns:
+        Decoded text (as text-mode ``open(..., errors='ignore')`` would read
+        it) or None when no line can match HARDCODED_DATE_PATTERN
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    if raw.isascii():
+        if not _DATE_PREFIX_BYTES.search(raw):
+            return None
+        text = raw.decode('ascii')
+    else:
+        text = raw.decode('utf-8', errors='ignore')
+        if not _DATE_PREFIX_TEXT.search(text):
+            return None
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
 class DateChecker:
     HARDCODED_DATE_PATTERN = re.compile(
         r'\b(20\d{2})[-/](0[1-9]|1[0-2])[-/](0[1-9]|[12]\d|3[01])\b|'
@@ -121,6 +154,10 @@ class DateChecker:
         CONSOLIDATED_HISTORICAL_PATTERNS if USE_CONSOLIDATED_PATTERNS else LEGACY_HISTORICAL_PATTERNS
     )
 
+    # Historical patterns as a PatternSet: rules led by \b and a literal share one
+    # alternation, the others are still searched one by one
+    HISTORICAL_PATTERN_SET = PatternSet(HISTORICAL_DATE_PATTERNS)
+
     def __init__(self, current_date: str):
         self.CURRENT_DATE = current_date
 
@@ -150,26 +187,24 @@ class DateChecker:
     def _is_historical_date_pattern(self, line: str, context: str = '') -> bool:
         if not self.HARDCODED_DATE_PATTERN.search(line):
             return False
-        for idx, pattern in enumerate(self.HISTORICAL_DATE_PATTERNS, 1):
-            if pattern.search(line):
-                logger.debug(
-                    "Historical date pattern matched",
-                    operation="check_hardcoded_dates",
-                    pattern_number=idx,
-                    pattern=pattern.pattern,
-                    line_preview=line[:100]
-                )
-                return True
-        if context:
-            for pattern in self.HISTORICAL_DATE_PATTERNS:
-                if pattern.search(context):
-                    logger.debug(
-                        "Historical date pattern matched in context",
-                        operation="check_hardcoded_dates",
-                        line_preview=line[:100],
-                        context_preview=context[:100]
-                    )
-                    return True
+        matched_idx = self.HISTORICAL_PATTERN_SET.first(line)
+        if matched_idx is not None:
+            logger.debug(
+                "Historical date pattern matched",
+                operation="check_hardcoded_dates",
+                pattern_number=matched_idx + 1,
+                pattern=self.HISTORICAL_PATTERN_SET.patterns[matched_idx].pattern,
+                line_preview=line[:100]
+            )
+            return True
+        if context and self.HISTORICAL_PATTERN_SET.search(context):
+            logger.debug(
+                "Historical date pattern matched in context",
+                operation="check_hardcoded_dates",
+                line_preview=line[:100],
+                context_preview=context[:100]
+            )
+            return True
         matches = self.HARDCODED_DATE_PATTERN.findall(line)
         for match in matches:
             date_str = self._normalize_date_match(match if isinstance(match, tuple) else (match,))
@@ -216,18 +251,10 @@ class DateChecker:
         else:
             untracked_files_list = [f for f in changed_files if f not in all_tracked]
 
+        # No cap on tracked files: files without a date-like byte run are
+        # rejected below before any git, DocumentContext or regex work
         tracked_files_list = [f for f in changed_files if f in all_tracked]
 
-        if len(tracked_files_list) > 50:
-            logger.warn(
-                f"Too many tracked files ({len(tracked_files_list)}) for date check, limiting to 50",
-                operation="check_hardcoded_dates",
-                total_tracked=len(tracked_files_list),
-                untracked_count=len(untracked_files_list),
-                limited_to=50
-            )
-            tracked_files_list = tracked_files_list[:50]
-
         changed_files = untracked_files_list + tracked_files_list
 
         original_count = len(changed_files)
@@ -266,6 +293,23 @@ class DateChecker:
                 filtered_out=skipped_files
             )
 
+        # Auto-generated enforcement artifacts (often untracked and regenerated every run)
+        auto_generated_enforcement_files = {
+            'ENFORCEMENT_BLOCK.md',
+            'VIOLATIONS.md',
+            'ACTIVE_VIOLATIONS.md',
+            'AGENT_REMINDERS.md',
+            'HISTORICAL_VIOLATIONS_REVIEW.md',
+            'ENFORCER_STATUS.md',
+        }
+
+        def is_auto_generated_enforcement_file(path_obj: Path) -> bool:
+            """Returns True if the file lives under enforcement/ and matches known auto-generated names."""
+            return (
+                'enforcement' in {p.lower() for p in path_obj.parts}
+                and path_obj.name in auto_generated_enforcement_files
+            )
+
         # PERFORMANCE OPTIMIZATION: Batch file modification status computation
         # Use git diff --name-status once for all files instead of calling is_file_modified_in_session()
         # for each file individually. This reduces git calls from 500-750 to 1-2 (99% reduction).
@@ -428,23 +472,6 @@ class DateChecker:
             '/docs/reference/',
         ]
 
-        # Auto-generated enforcement artifacts (often untracked and regenerated every run)
-        auto_generated_enforcement_files = {
-            'ENFORCEMENT_BLOCK.md',
-            'VIOLATIONS.md',
-            'ACTIVE_VIOLATIONS.md',
-            'AGENT_REMINDERS.md',
-            'HISTORICAL_VIOLATIONS_REVIEW.md',
-            'ENFORCER_STATUS.md',
-        }
-
-        def is_auto_generated_enforcement_file(path_obj: Path) -> bool:
-            """Returns True if the file lives under enforcement/ and matches known auto-generated names."""
-            return (
-                'enforcement' in {p.lower() for p in path_obj.parts}
-                and path_obj.name in auto_generated_enforcement_files
-            )
-
         # CRITICAL: Log what files we're processing to diagnose violation persistence
         memory_bank_files_in_changed = [f for f in changed_files if 'memory_bank' in f or 'memory-bank' in f]
         logger.info(
@@ -592,6 +619,28 @@ class DateChecker:
                     normalized_path=normalized_path
                 )
 
+            normalized_for_missing = str(file_path).replace("\\", "/")
+            required_paths = required_last_updated_paths or []
+            enforce_missing_last_updated = any(normalized_for_missing.startswith(p) for p in required_paths)
+
+            # Cheap byte-level prefilter: a file without a "20<digit>" run has no
+            # date to flag, so skip it before classification and git line checks
+            # (unless it must be checked for a missing "Last Updated" field)
+            try:
+                file_content = read_date_candidate(file_path)
+            except OSError:
+                file_content = None
+                if not enforce_missing_last_updated:
+                    continue
+            if file_content is None and not enforce_missing_last_updated:
+                logger.debug(
+                    f"Skipping file without date candidates: {file_path_str}",
+                    operation="check_hardcoded_dates",
+                    file_path=file_path_str,
+                    reason="no_date_candidates"
+                )
+                continue
+
             # SECOND: Check for log files and historical docs EARLY (before expensive operations)
             # This prevents reading files and finding dates for files that should be skipped
             # IMPORTANT: Use normalized_path as cache key for consistency
@@ -694,9 +743,6 @@ class DateChecker:
             if change_type not in [FileChangeType.CONTENT_CHANGED, FileChangeType.NEW_FILE]:
                 continue
 
-            normalized_for_missing = str(file_path).replace("\\", "/")
-            required_paths = required_last_updated_paths or []
-            enforce_missing_last_updated = any(normalized_for_missing.startswith(p) for p in required_paths)
             found_last_updated = False
 
             # File was already verified as modified in session above
@@ -732,10 +778,8 @@ class DateChecker:
             # NOW proceed with try block - log files are guaranteed to be filtered out
             try:
                 if detector and doc_context:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        file_content = f.read()
-
-                    date_matches = detector.find_dates(file_content, context_lines=3)
+                    # Text was already read by the prefilter; None means no candidates
+                    date_matches = detector.find_dates(file_content, context_lines=3) if file_content else []
 
                     for date_match in date_matches:
                         line_num = date_match.line_number
@@ -75,3 +75,35 @@ def test_date_checker_flags_stale_on_changed(monkeypatch, tmp_path):
     )
     assert isinstance(res, list)
 
+
+
+def test_date_checker_checks_all_tracked_files(monkeypatch, tmp_path):
+    checker = DateChecker(current_date="2025-12-05")
+    proj = tmp_path
+    session = make_session(tmp_path)
+    git_utils = GitUtils(proj)
+    git_utils.get_cached_changed_files = lambda: {"tracked": [], "untracked": []}  # type: ignore
+    monkeypatch.setattr("enforcement.checks.date_checker.is_file_modified_in_session", lambda *args, **kwargs: True)
+    monkeypatch.setattr("enforcement.checks.date_checker.classify_file_change", lambda *args, **kwargs: FileChangeType.CONTENT_CHANGED)
+
+    files = [f"src/module_{i:03d}.ts" for i in range(120)]
+    git_utils.get_batch_file_modification_status = lambda *args, **kwargs: dict.fromkeys(files, True)  # type: ignore
+    for i, name in enumerate(files):
+        (proj / "src").mkdir(exist_ok=True)
+        # Only every third file contains a date; the rest are rejected by the prefilter
+        body = "const stamp = '2025-12-04';\n" if i % 3 == 0 else "const size = 200;\n"
+        (proj / name).write_text(body)
+
+    res = checker.check_hardcoded_dates(
+        files,
+        proj,
+        session,
+        git_utils,
+        proj / ".cursor" / "enforcement",
+        violation_scope="current_session",
+        classification_map={name: "CONTENT_CHANGED" for name in files},
+        tracked_files=files,
+        untracked_files=[],
+    )
+    flagged = {Path(v.file_path).relative_to(proj).as_posix() for v in res}
+    assert flagged == {name for i, name in enumerate(files) if i % 3 == 0}
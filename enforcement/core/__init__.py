@@ -6,7 +6,10 @@ from .session_state import (
     get_file_hash,
     migrate_session_v1_to_v2,
     prune_session_data,
+    get_session_store,
+    session_mtime_ns,
 )
+from .session_store import SessionStore, LazyFileHashes
 from .scope_evaluator import (
     is_historical_dir_path,
     is_historical_document_file,
@@ -20,6 +23,14 @@ from .git_utils import (
     get_changed_files_impl,
     run_git_command_cached,
 )
+from .git_snapshot import GitSnapshot, GitSnapshotError
+from .line_index import LineIndex
+from .enforcer_daemon import (
+    EnforcerDaemon,
+    DaemonUnavailable,
+    get_daemon_socket_path,
+    request_check,
+)
 from .file_scanner import is_file_modified_in_session
 
 __all__ = [
@@ -32,6 +43,10 @@ __all__ = [
     "get_file_hash",
     "migrate_session_v1_to_v2",
     "prune_session_data",
+    "get_session_store",
+    "session_mtime_ns",
+    "SessionStore",
+    "LazyFileHashes",
     "is_historical_dir_path",
     "is_historical_document_file",
     "is_log_file",
@@ -41,6 +56,13 @@ __all__ = [
     "get_git_state_key",
     "get_changed_files_impl",
     "run_git_command_cached",
+    "GitSnapshot",
+    "GitSnapshotError",
+    "LineIndex",
+    "EnforcerDaemon",
+    "DaemonUnavailable",
+    "get_daemon_socket_path",
+    "request_check",
     "is_file_modified_in_session",
 ]
 
@@ -0,0 +1,325 @@
+"""
+Long-lived enforcer daemon and its client.
+
+Every enforcement run used to be a fresh ``auto-enforcer.py`` process that
+re-imported the checker modules, reloaded the session JSON, re-parsed rule
+metadata and rediscovered git state. The daemon keeps one warm enforcer and
+serves "check" requests over a Unix domain socket; the file watcher and the
+CLI send requests to it and fall back to a one-shot run when it isn't up.
+
+Protocol: one JSON object per line, one request per connection.
+
+- ``{"op": "ping"}`` -> ``{"ok": true, "pid": ..., "requests": ...}``
+- ``{"op": "check", "paths": [...] | null, "scope": "full", "user_message": null}``
+  -> ``{"ok": true, "exit_code": 0, "duration_ms": ..., ...}``
+- ``{"op": "shutdown"}`` -> ``{"ok": true}`` and the daemon exits
+"""
+
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from logger_util import get_logger
+    logger = get_logger(context="auto_enforcer.daemon")
+except ImportError:  # pragma: no cover - fallback for environments without logger_util
+    import logging
+
+    logging.basicConfig(level=logging.INFO)
+
+    class _FallbackLogger:
+        def __init__(self):
+            self._logger = logging.getLogger("auto_enforcer.daemon")
+
+        def info(self, msg, *args, **kwargs):
+            self._logger.info(msg)
+
+        def debug(self, msg, *args, **kwargs):
+            self._logger.debug(msg)
+
+        def warn(self, msg, *args, **kwargs):
+            self._logger.warning(msg)
+
+        def warning(self, msg, *args, **kwargs):
+            self._logger.warning(msg)
+
+        def error(self, msg, *args, **kwargs):
+            self._logger.error(msg)
+
+    logger = _FallbackLogger()
+
+
+SOCKET_NAME = "enforcer.sock"
+
+# AF_UNIX paths are limited to ~104-108 bytes depending on the platform
+_MAX_SOCKET_PATH = 100
+
+# Longest request line accepted from a client
+_MAX_REQUEST_BYTES = 4 * 1024 * 1024
+
+DEFAULT_CHECK_TIMEOUT = 180.0
+
+# Seconds _bind waits for an existing daemon to answer a ping
+PING_TIMEOUT = 2.0
+
+
+class DaemonUnavailable(Exception):
+    """Raised by the client when no daemon is listening on the socket."""
+
+
+CheckHandler = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+def daemon_supported() -> bool:
+    """True if this platform has Unix domain sockets."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def get_daemon_socket_path(project_root: Path) -> Path:
+    """
+    Return the socket path for a project's daemon.
+
+    ``ENFORCER_DAEMON_SOCKET`` overrides the default
+    ``.cursor/enforcement/enforcer.sock``; if that path is too long for
+    AF_UNIX, a per-project path in the temp directory is used instead.
+    """
+    override = os.getenv("ENFORCER_DAEMON_SOCKET")
+    if override:
+        return Path(override)
+    path = Path(project_root) / ".cursor" / "enforcement" / SOCKET_NAME
+    if len(str(path)) <= _MAX_SOCKET_PATH:
+        return path
+    digest = hashlib.sha1(str(Path(project_root).resolve()).encode("utf-8")).hexdigest()[:12]
+    return Path(tempfile.gettempdir()) / f"veroenforcer-{digest}.sock"
+
+
+def send_request(socket_path: Path, request: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Send one request to the daemon and return its response.
+
+    Args:
+        socket_path: Daemon socket
+        request: Request object (see module docstring)
+        timeout: Seconds to wait for the response (None waits forever)
+
+    Raises:
+        DaemonUnavailable: If the request couldn't be delivered (nothing
+            listening, or connect/send failed); the daemon never saw it
+        OSError: If the connection breaks or times out after the request was
+            sent (the daemon may still be running it)
+        ValueError: If the response isn't valid JSON
+    """
+    if not daemon_supported():
+        raise DaemonUnavailable("Unix domain sockets are not available on this platform")
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(socket_path))
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        except OSError as e:
+            raise DaemonUnavailable(f"No enforcer daemon reachable at {socket_path}: {e}") from e
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+    finally:
+        sock.close()
+    if not line:
+        raise OSError("Enforcer daemon closed the connection without a response")
+    return json.loads(line)
+
+
+def request_check(
+    socket_path: Path,
+    paths: Optional[List[str]] = None,
+    scope: str = "full",
+    user_message: Optional[str] = None,
+    changed_paths: Optional[List[str]] = None,
+    timeout: Optional[float] = DEFAULT_CHECK_TIMEOUT,
+) -> Optional[Dict[str, Any]]:
+    """
+    Ask the daemon to run the enforcer.
+
+    Args:
+        socket_path: Daemon socket
+        paths: Restrict checks to these files (None checks every changed file)
+        scope: "full" or "current_session", as for ``auto-enforcer.py --scope``
+        user_message: Optional user message for context recommendations
+        changed_paths: Files that triggered the request (logged by the daemon)
+        timeout: Seconds to wait for the run to finish
+
+    Returns:
+        The daemon's response, or None if the request never reached a daemon
+        (callers then run the enforcer themselves)
+
+    Raises:
+        OSError, ValueError: If the request was sent but no valid response
+            came back. The daemon may still be running the check, so callers
+            must not run it again themselves.
+    """
+    request = {
+        "op": "check",
+        "paths": paths,
+        "scope": scope,
+        "user_message": user_message,
+        "changed_paths": changed_paths or [],
+    }
+    try:
+        return send_request(socket_path, request, timeout=timeout)
+    except DaemonUnavailable:
+        return None
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Reads one JSON request line and writes one JSON response line."""
+
+    def handle(self):
+        daemon: "EnforcerDaemon" = self.server.daemon
+        line = self.rfile.readline(_MAX_REQUEST_BYTES)
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as e:
+            response = {"ok": False, "error": f"Invalid request: {e}"}
+        else:
+            response = daemon.dispatch(request)
+        try:
+            self.wfile.write(json.dumps(response, default=str).encode("utf-8") + b"\n")
+        except OSError:
+            # Client went away (e.g. timed out); the run still completed
+            pass
+
+
+class EnforcerDaemon:
+    """
+    Serves enforcer requests on a Unix domain socket.
+
+    Requests are handled one at a time, so the warm enforcer behind
+    check_handler never runs concurrently with itself.
+    """
+
+    def __init__(self, socket_path: Path, check_handler: CheckHandler):
+        """
+        Args:
+            socket_path: Where to listen
+            check_handler: Runs a "check" request and returns the response fields
+        """
+        if not daemon_supported():
+            raise OSError("The enforcer daemon needs Unix domain sockets")
+        self.socket_path = Path(socket_path)
+        self.check_handler = check_handler
+        self.requests = 0
+        self.started_at = time.time()
+        self._server: Optional[socketserver.UnixStreamServer] = None
+        # (st_dev, st_ino) of the socket file this process bound
+        self._socket_id: Optional[tuple] = None
+        self._lock = threading.Lock()
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle one decoded request."""
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid(), "requests": self.requests, "uptime_s": round(time.time() - self.started_at, 1)}
+        if op == "shutdown":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"ok": True}
+        if op != "check":
+            return {"ok": False, "error": f"Unknown op: {op!r}"}
+
+        with self._lock:
+            self.requests += 1
+            start = time.perf_counter()
+            try:
+                response = dict(self.check_handler(request))
+            except Exception as e:
+                logger.error(
+                    "Enforcer daemon request failed",
+                    operation="EnforcerDaemon.dispatch",
+                    error_code="DAEMON_REQUEST_FAILED",
+                    root_cause=str(e)
+                )
+                response = {"ok": False, "error": str(e)}
+            response.setdefault("ok", True)
+            response["duration_ms"] = int((time.perf_counter() - start) * 1000)
+            response["requests"] = self.requests
+            logger.info(
+                "Enforcer daemon request completed",
+                operation="EnforcerDaemon.dispatch",
+                duration_ms=response["duration_ms"],
+                paths=len(request.get("paths") or []),
+                changed_paths=len(request.get("changed_paths") or [])
+            )
+            return response
+
+    def _bind(self) -> socketserver.UnixStreamServer:
+        """
+        Bind the socket, replacing a stale one left by a dead daemon.
+
+        Only a refused connection (or a vanished file) marks the socket as
+        stale. A daemon that is busy with a long check doesn't answer the ping
+        in time but is still alive, so its socket is left alone.
+        """
+        if self.socket_path.exists():
+            try:
+                send_request(self.socket_path, {"op": "ping"}, timeout=PING_TIMEOUT)
+            except DaemonUnavailable as e:
+                if not isinstance(e.__cause__, (FileNotFoundError, ConnectionRefusedError)):
+                    raise OSError(
+                        f"An enforcer daemon at {self.socket_path} is not answering ({e}); "
+                        "not replacing its socket"
+                    ) from e
+                try:
+                    self.socket_path.unlink()
+                except FileNotFoundError:
+                    pass
+            except (OSError, ValueError) as e:
+                raise OSError(
+                    f"An enforcer daemon at {self.socket_path} is not answering ({e}); "
+                    "not replacing its socket"
+                ) from e
+            else:
+                raise OSError(f"An enforcer daemon is already running at {self.socket_path}")
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        # Create the socket owner-only; chmod after bind() would leave a window
+        old_umask = os.umask(0o177)
+        try:
+            server = socketserver.UnixStreamServer(str(self.socket_path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+        server.daemon = self
+        st = self.socket_path.stat()
+        self._socket_id = (st.st_dev, st.st_ino)
+        return server
+
+    def serve_forever(self) -> None:
+        """Listen until shutdown() is called, then remove the socket."""
+        self._server = self._bind()
+        logger.info(
+            "Enforcer daemon listening",
+            operation="EnforcerDaemon.serve_forever",
+            socket_path=str(self.socket_path),
+            pid=os.getpid()
+        )
+        try:
+            self._server.serve_forever(poll_interval=0.5)
+        finally:
+            self._server.server_close()
+            # Another daemon may have replaced the socket since; leave its file alone
+            try:
+                st = self.socket_path.stat()
+                if (st.st_dev, st.st_ino) == self._socket_id:
+                    self.socket_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def shutdown(self) -> None:
+        """Stop serve_forever() (safe to call from any thread but the serving one)."""
+        if self._server is not None:
+            self._server.shutdown()
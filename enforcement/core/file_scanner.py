@@ -18,19 +18,19 @@ except ImportError:  # pragma: no cover - fallback logger
             self._logger = logging.getLogger("file_scanner")
 
         def info(self, msg, *args, **kwargs):
-            self._logger.info(msg)
+            self._logger.info(msg, *args)
 
         def debug(self, msg, *args, **kwargs):
-            self._logger.debug(msg)
+            self._logger.debug(msg, *args)
 
         def warn(self, msg, *args, **kwargs):
-            self._logger.warning(msg)
+            self._logger.warning(msg, *args)
 
         def warning(self, msg, *args, **kwargs):
-            self._logger.warning(msg)
+            self._logger.warning(msg, *args)
 
         def error(self, msg, *args, **kwargs):
-            self._logger.error(msg)
+            self._logger.error(msg, *args)
 
     logger = _FallbackLogger()
 
@@ -68,7 +68,7 @@ def is_file_modified_in_session(
         
         if modification_cache_key in git_utils._file_modification_cache:
             logger.debug(
-                f"Using cached file modification status for {file_path}",
+                "Using cached file modification status for %s", file_path,
                 operation="is_file_modified_in_session",
                 cache_key=modification_cache_key
             )
@@ -90,7 +90,7 @@ def is_file_modified_in_session(
             )
         except Exception as e:
             logger.debug(
-                f"Could not populate changed files cache: {e}",
+                "Could not populate changed files cache: %s", e,
                 operation="is_file_modified_in_session",
                 error_code="CACHE_POPULATE_FAILED"
             )
@@ -131,10 +131,9 @@ def is_file_modified_in_session(
             pass  # Continue even if caching fails
         return result
     
-    # FIRST: Check if file is tracked in git
+    # FIRST: Check if file is tracked in git (answered from the run's git snapshot)
     try:
-        git_ls_output = git_utils.run_git_command(["ls-files", "--error-unmatch", "--", file_path])
-        is_tracked = git_ls_output and git_ls_output.strip() != ""
+        is_tracked = git_utils.is_tracked(file_path)
     except Exception:
         # If git command fails, check cached changed files
         cached_changed_files = git_utils.get_cached_changed_files()
@@ -156,16 +155,11 @@ def is_file_modified_in_session(
             # But verify with git to be sure (mtime can be misleading)
             try:
                 # Check if git shows any changes since session start
-                # Use --ignore-all-space to filter whitespace-only changes
-                git_diff = git_utils.run_git_command([
-                    "diff", "--ignore-all-space", "--ignore-cr-at-eol", "--ignore-blank-lines",
-                    "--name-only", "HEAD", "--", file_path
-                ])
-                
-                if not git_diff or not git_diff.strip():
+                # Whitespace-only changes are filtered out
+                if not git_utils.has_content_changes(file_path):
                     # Git confirms: no actual content changes
                     logger.debug(
-                        f"File not modified in session (mtime and git confirm): {file_path}",
+                        "File not modified in session (mtime and git confirm): %s", file_path,
                         operation="is_file_modified_in_session",
                         file_mtime=last_modified.isoformat(),
                         session_start=session_start.isoformat(),
@@ -174,25 +168,17 @@ def is_file_modified_in_session(
                     return cache_and_return(False)
             except Exception as e:
                 logger.debug(
-                    f"Git check failed, using mtime result: {e}",
+                    "Git check failed, using mtime result: %s", e,
                     operation="is_file_modified_in_session",
                     file_path=file_path
                 )
                 # If git check fails, trust mtime result
                 return False
         
-        # PERFORMANCE OPTIMIZATION: Consolidate multiple git diff calls into one
-        # Instead of calling git diff 3-4 times, use a single call with all flags
+        # PERFORMANCE OPTIMIZATION: All git queries below are in-memory lookups
+        # into the GitSnapshot built once per run (bulk status/numstat/log)
         try:
-            # Single git diff call that checks for content changes (ignoring whitespace)
-            # This replaces the previous 3-4 separate git diff calls
-            git_diff_result = git_utils.run_git_command([
-                "diff", "--numstat", "--ignore-all-space", 
-                "--ignore-cr-at-eol", "--ignore-blank-lines",
-                "HEAD", "--", file_path
-            ])
-            
-            has_content_changes = bool(git_diff_result and git_diff_result.strip())
+            has_content_changes = git_utils.has_content_changes(file_path)
             
             # Check if file was moved/renamed (not just modified)
             # Git rename detection: if file shows as modified but was actually moved, skip it
@@ -202,7 +188,7 @@ def is_file_modified_in_session(
                 # If git diff with ignore-whitespace shows no changes, it's just a move
                 if not has_content_changes:
                     logger.debug(
-                        f"File was renamed but content unchanged (whitespace-only): {file_path}",
+                        "File was renamed but content unchanged (whitespace-only): %s", file_path,
                         operation="is_file_modified_in_session",
                         file_path=file_path,
                         status_code=status_code,
@@ -223,20 +209,14 @@ def is_file_modified_in_session(
             # Verify file was modified after session start
             # Use git log to get the actual modification time from git
             try:
-                git_log_time = git_utils.run_git_command([
-                    "log", "-1", "--format=%ct", "--", file_path
-                ])
-                if git_log_time and git_log_time.strip():
-                    commit_time = datetime.fromtimestamp(int(git_log_time.strip()), tz=timezone.utc)
+                commit_time = git_utils.get_last_commit_time(file_path)
+                if commit_time is not None:
                     if commit_time < session_start:
                         # Last commit was before session start, but we have uncommitted changes
                         # Check if uncommitted changes are actual content changes
-                        unstaged_diff = git_utils.run_git_command([
-                            "diff", "--ignore-all-space", "--ignore-cr-at-eol", "--ignore-blank-lines", file_path
-                        ])
-                        if not unstaged_diff or not unstaged_diff.strip():
+                        if not git_utils.has_unstaged_content_changes(file_path):
                             logger.debug(
-                                f"File has uncommitted changes but only whitespace: {file_path}",
+                                "File has uncommitted changes but only whitespace: %s", file_path,
                                 operation="is_file_modified_in_session",
                                 file_path=file_path
                             )
@@ -264,7 +244,7 @@ def is_file_modified_in_session(
     last_modified = git_utils.get_file_last_modified_time(file_path)
     if not last_modified:
         logger.debug(
-            f"Could not determine modification time for untracked file {file_path}, skipping",
+            "Could not determine modification time for untracked file %s, skipping", file_path,
             operation="is_file_modified_in_session",
             file_path=file_path
         )
@@ -272,7 +252,7 @@ def is_file_modified_in_session(
     
     if last_modified < session_start:
         logger.debug(
-            f"Untracked file not modified in session (modified before session start): {file_path}",
+            "Untracked file not modified in session (modified before session start): %s", file_path,
             operation="is_file_modified_in_session",
             file_mtime=last_modified.isoformat(),
             session_start=session_start.isoformat()
@@ -298,7 +278,7 @@ def is_file_modified_in_session(
     current_hash = get_file_hash(full_path, session, project_root)
     if not current_hash:
         logger.debug(
-            f"Could not compute file hash for {file_path}, skipping",
+            "Could not compute file hash for %s, skipping", file_path,
             operation="is_file_modified_in_session",
             file_path=file_path
         )
@@ -318,8 +298,7 @@ def is_file_modified_in_session(
     
     if previous_hash is None:
         try:
-            git_ls_output = git_utils.run_git_command(["ls-files", "--error-unmatch", "--", file_path])
-            is_untracked = not git_ls_output or git_ls_output.strip() == ""
+            is_untracked = not git_utils.is_tracked(file_path)
         except Exception:
             cached_changed_files = git_utils.get_cached_changed_files()
             if cached_changed_files:
@@ -400,7 +379,7 @@ def is_file_modified_in_session(
                     pass  # Ignore errors, just proceed with normal check
             except Exception as e:
                 logger.debug(
-                    f"Could not apply move detection heuristic: {e}",
+                    "Could not apply move detection heuristic: %s", e,
                     operation="is_file_modified_in_session",
                     file_path=file_path,
                     error_code="MOVE_HEURISTIC_FAILED"
@@ -416,16 +395,9 @@ def is_file_modified_in_session(
             )
             return True
         
-        # PERFORMANCE OPTIMIZATION: Use single consolidated git diff call
+        # PERFORMANCE OPTIMIZATION: In-memory lookup into the run's GitSnapshot
         try:
-            # Single git diff call that checks for content changes (ignoring whitespace)
-            git_diff_result = git_utils.run_git_command([
-                "diff", "--numstat", "--ignore-all-space", 
-                "--ignore-cr-at-eol", "--ignore-blank-lines",
-                "HEAD", "--", file_path
-            ])
-            
-            has_content_changes = bool(git_diff_result and git_diff_result.strip())
+            has_content_changes = git_utils.has_content_changes(file_path)
             
             if not has_content_changes:
                 logger.debug(
@@ -457,7 +429,7 @@ def is_file_modified_in_session(
         session.file_hashes[previous_hash_key] = current_hash
         session.file_hashes[cache_key] = current_hash
         logger.debug(
-            f"File content hash changed, file was modified: {file_path}",
+            "File content hash changed, file was modified: %s", file_path,
             operation="is_file_modified_in_session",
             file_path=file_path,
             previous_hash=previous_hash[:16] + "..." if previous_hash else None,
@@ -466,7 +438,7 @@ def is_file_modified_in_session(
         return cache_and_return(True)
     
     logger.debug(
-        f"File content hash unchanged, file not modified: {file_path}",
+        "File content hash unchanged, file not modified: %s", file_path,
         operation="is_file_modified_in_session",
         file_path=file_path,
         hash=current_hash[:16] + "..."
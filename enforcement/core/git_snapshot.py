@@ -0,0 +1,356 @@
+"""
+Point-in-time snapshot of git working-tree state.
+
+Per-file questions (is it tracked, does it have content changes ignoring
+whitespace, when was it last committed, what is its diff) used to cost one or
+more git subprocesses each. A GitSnapshot answers them from a few bulk
+commands run once per enforcement run:
+
+- ``git status --porcelain=v2 -z --untracked-files=all``: staged/unstaged
+  status codes, rename sources and untracked files
+- ``git diff --numstat -z --no-renames <whitespace flags> HEAD``: files with
+  content changes against HEAD
+- ``git diff --numstat -z --no-renames <whitespace flags>``: files with
+  unstaged content changes
+- ``git log --name-only --format=%ct`` (lazily, streamed and stopped as soon
+  as every requested file is resolved): last commit time per file
+
+Diffs run with ``--no-renames`` so each file is reported exactly as the old
+``git diff ... -- <file>`` calls saw it.
+"""
+
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from logger_util import get_logger
+    logger = get_logger(context="auto_enforcer.git_snapshot")
+except ImportError:  # pragma: no cover - fallback for environments without logger_util
+    import logging
+
+    logging.basicConfig(level=logging.INFO)
+
+    class _FallbackLogger:
+        def __init__(self):
+            self._logger = logging.getLogger("auto_enforcer.git_snapshot")
+
+        def info(self, msg, *args, **kwargs):
+            self._logger.info(msg)
+
+        def debug(self, msg, *args, **kwargs):
+            self._logger.debug(msg)
+
+        def warn(self, msg, *args, **kwargs):
+            self._logger.warning(msg)
+
+        def warning(self, msg, *args, **kwargs):
+            self._logger.warning(msg)
+
+        def error(self, msg, *args, **kwargs):
+            self._logger.error(msg)
+
+    logger = _FallbackLogger()
+
+
+# Flags used everywhere the enforcer asks "did the content really change?"
+WHITESPACE_FLAGS = ['--ignore-all-space', '--ignore-cr-at-eol', '--ignore-blank-lines']
+
+# Bulk commands touch the whole tree, so allow more time than per-file calls
+SNAPSHOT_TIMEOUT = 60
+
+# Marks commit headers in the streamed git log output
+_COMMIT_MARKER = '\x01'
+
+
+class GitSnapshotError(Exception):
+    """Raised when a bulk git command fails (not a repository, no HEAD, ...)."""
+
+
+@dataclass(slots=True)
+class StatusEntry:
+    """One changed path from ``git status --porcelain=v2``."""
+    path: str
+    index_status: str
+    worktree_status: str
+    orig_path: Optional[str] = None
+
+
+@dataclass(slots=True)
+class NumstatEntry:
+    """Added/deleted line counts for a path (None for binary files)."""
+    added: Optional[int]
+    deleted: Optional[int]
+
+
+def _run_git(project_root: Path, args: List[str]) -> str:
+    """Run a bulk git command, raising GitSnapshotError on failure."""
+    try:
+        result = subprocess.run(
+            ['git'] + args,
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            timeout=SNAPSHOT_TIMEOUT,
+            check=False
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as e:
+        raise GitSnapshotError(f"git {args[0]} failed: {e}") from e
+    if result.returncode != 0:
+        raise GitSnapshotError(f"git {args[0]} exited {result.returncode}: {result.stderr.strip()}")
+    return result.stdout
+
+
+def parse_porcelain_v2(output: str) -> Tuple[Dict[str, StatusEntry], Set[str]]:
+    """
+    Parse ``git status --porcelain=v2 -z`` output.
+
+    Returns:
+        (changed tracked entries by path, untracked paths)
+    """
+    entries: Dict[str, StatusEntry] = {}
+    untracked: Set[str] = set()
+    tokens = output.split('\0')
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        i += 1
+        if not token:
+            continue
+        kind = token[0]
+        if kind == '1':
+            parts = token.split(' ', 8)
+            if len(parts) == 9:
+                entries[parts[8]] = StatusEntry(parts[8], parts[1][0], parts[1][1])
+        elif kind == '2':
+            parts = token.split(' ', 9)
+            orig_path = tokens[i] if i < len(tokens) else None
+            i += 1
+            if len(parts) == 10:
+                entries[parts[9]] = StatusEntry(parts[9], parts[1][0], parts[1][1], orig_path)
+        elif kind == 'u':
+            parts = token.split(' ', 10)
+            if len(parts) == 11:
+                entries[parts[10]] = StatusEntry(parts[10], parts[1][0], parts[1][1])
+        elif kind == '?':
+            untracked.add(token[2:])
+    return entries, untracked
+
+
+def parse_numstat(output: str) -> Dict[str, NumstatEntry]:
+    """Parse ``git diff --numstat -z --no-renames`` output."""
+    stats: Dict[str, NumstatEntry] = {}
+    for record in output.split('\0'):
+        parts = record.split('\t', 2)
+        if len(parts) != 3 or not parts[2]:
+            continue
+        added, deleted, path = parts
+        stats[path] = NumstatEntry(
+            int(added) if added.isdigit() else None,
+            int(deleted) if deleted.isdigit() else None,
+        )
+    return stats
+
+
+def split_patch(output: str) -> Dict[str, str]:
+    """
+    Split a ``git diff --no-renames`` patch into per-file chunks.
+
+    Paths git had to quote are skipped; callers fall back to a per-file diff.
+    """
+    chunks: Dict[str, str] = {}
+    header = 'diff --git '
+    for chunk in ('\n' + output).split('\n' + header)[1:]:
+        first_line, _, _ = chunk.partition('\n')
+        # "a/<path> b/<path>" with identical paths when renames are disabled
+        path_len = (len(first_line) - 5) // 2
+        path = first_line[2:2 + path_len]
+        if first_line != f'a/{path} b/{path}':
+            continue
+        chunks[path] = (header + chunk).strip()
+    return chunks
+
+
+class GitSnapshot:
+    """
+    In-memory view of git state for per-file queries.
+
+    Build with :meth:`capture`; the snapshot never refreshes itself, so owners
+    (GitUtils) drop it whenever the git state key changes.
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        status: Dict[str, StatusEntry],
+        untracked: Set[str],
+        head_numstat: Dict[str, NumstatEntry],
+        worktree_numstat: Dict[str, NumstatEntry],
+    ):
+        self.project_root = project_root
+        self.status = status
+        self.untracked = untracked
+        self.head_numstat = head_numstat
+        self.worktree_numstat = worktree_numstat
+        self._tracked_files: Optional[Set[str]] = None
+        self._commit_times: Dict[str, Optional[int]] = {}
+        self._staged_diffs: Optional[Dict[str, str]] = None
+        self._unstaged_diffs: Optional[Dict[str, str]] = None
+
+    @classmethod
+    def capture(cls, project_root: Path) -> 'GitSnapshot':
+        """
+        Run the bulk git commands and build a snapshot.
+
+        Raises:
+            GitSnapshotError: If any command fails (e.g. not a repository or no HEAD)
+        """
+        status, untracked = parse_porcelain_v2(
+            _run_git(project_root, ['status', '--porcelain=v2', '-z', '--untracked-files=all'])
+        )
+        head_numstat = parse_numstat(
+            _run_git(project_root, ['diff', '--numstat', '-z', '--no-renames'] + WHITESPACE_FLAGS + ['HEAD'])
+        )
+        worktree_numstat = parse_numstat(
+            _run_git(project_root, ['diff', '--numstat', '-z', '--no-renames'] + WHITESPACE_FLAGS)
+        )
+        logger.debug(
+            "Captured git snapshot",
+            operation="GitSnapshot.capture",
+            changed_count=len(status),
+            untracked_count=len(untracked),
+            content_changed_count=len(head_numstat)
+        )
+        return cls(project_root, status, untracked, head_numstat, worktree_numstat)
+
+    def is_tracked(self, file_path: str) -> bool:
+        """Equivalent of ``git ls-files --error-unmatch -- <file>`` succeeding."""
+        entry = self.status.get(file_path)
+        if entry is not None:
+            # Staged deletions are no longer in the index
+            return entry.index_status != 'D'
+        if file_path in self.untracked:
+            return False
+        if self._tracked_files is None:
+            output = _run_git(self.project_root, ['ls-files', '-z'])
+            self._tracked_files = set(filter(None, output.split('\0')))
+        return file_path in self._tracked_files
+
+    def has_content_changes(self, file_path: str) -> bool:
+        """True if ``git diff --numstat <whitespace flags> HEAD -- <file>`` is non-empty."""
+        return file_path in self.head_numstat
+
+    def has_worktree_content_changes(self, file_path: str) -> bool:
+        """True if ``git diff <whitespace flags> <file>`` (unstaged) is non-empty."""
+        return file_path in self.worktree_numstat
+
+    def change_status(self, file_path: str) -> Optional[str]:
+        """Staged status letter if any, else unstaged status letter, else None."""
+        entry = self.status.get(file_path)
+        if entry is None:
+            return None
+        if entry.index_status != '.':
+            return entry.index_status
+        if entry.worktree_status != '.':
+            return entry.worktree_status
+        return None
+
+    def rename_source(self, file_path: str) -> Optional[str]:
+        """Original path of a renamed file."""
+        entry = self.status.get(file_path)
+        return entry.orig_path if entry is not None else None
+
+    def last_commit_time(self, file_path: str, also_resolve: Iterable[str] = ()) -> Optional[int]:
+        """
+        Unix timestamp of the last commit touching file_path (``git log -1 --format=%ct``).
+
+        The first miss walks ``git log --name-only`` once for file_path and every
+        path in ``also_resolve`` (by default all files with content changes),
+        stopping as soon as all of them are found.
+        """
+        if file_path not in self._commit_times:
+            wanted = {file_path}
+            wanted.update(also_resolve or self.head_numstat)
+            self._resolve_commit_times(wanted.difference(self._commit_times))
+        return self._commit_times.get(file_path)
+
+    def adopt_commit_times(self, commit_times: Dict[str, Optional[int]]) -> None:
+        """
+        Reuse commit times resolved by an earlier snapshot taken at the same HEAD.
+
+        Commit times depend only on history, so they stay valid until HEAD moves.
+        """
+        for path, timestamp in commit_times.items():
+            self._commit_times.setdefault(path, timestamp)
+
+    def _resolve_commit_times(self, wanted: Set[str]) -> None:
+        """Stream git log until every wanted path has a commit time."""
+        remaining = set(wanted)
+        try:
+            process = subprocess.Popen(
+                ['git', 'log', '--name-only', '-z', f'--format={_COMMIT_MARKER}%ct'],
+                cwd=self.project_root,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding='utf-8',
+                errors='replace',
+            )
+        except (FileNotFoundError, OSError) as e:
+            raise GitSnapshotError(f"git log failed: {e}") from e
+
+        try:
+            commit_time: Optional[int] = None
+            buffer = ''
+            while remaining:
+                block = process.stdout.read(65536)
+                if not block:
+                    break
+                tokens = (buffer + block).split('\0')
+                buffer = tokens.pop()
+                for token in tokens:
+                    token = token.lstrip('\n')
+                    if token.startswith(_COMMIT_MARKER):
+                        commit_time = int(token[1:]) if token[1:].isdigit() else None
+                    elif token in remaining:
+                        self._commit_times[token] = commit_time
+                        remaining.discard(token)
+        finally:
+            if process.poll() is None:
+                process.kill()
+            process.stdout.close()
+            process.wait()
+
+        for path in remaining:
+            self._commit_times[path] = None
+
+    def file_diff(self, file_path: str) -> Optional[str]:
+        """
+        Staged + unstaged patch for a file, as GitUtils.get_file_diff builds it.
+
+        Returns None for untracked or unchanged files.
+        """
+        entry = self.status.get(file_path)
+        if entry is None:
+            return None
+        if self._staged_diffs is None:
+            self._staged_diffs = split_patch(_run_git(self.project_root, ['diff', '--cached', '--no-renames']))
+            self._unstaged_diffs = split_patch(_run_git(self.project_root, ['diff', '--no-renames']))
+
+        parts = []
+        for changed, diffs, args in (
+            (entry.index_status != '.', self._staged_diffs, ['diff', '--cached', '--', file_path]),
+            (entry.worktree_status != '.', self._unstaged_diffs, ['diff', '--', file_path]),
+        ):
+            if not changed:
+                continue
+            chunk = diffs.get(file_path)
+            if chunk is None:
+                # Quoted path in the bulk patch: ask git for this file alone
+                chunk = _run_git(self.project_root, args).strip()
+            if chunk:
+                parts.append(chunk)
+        return '\n'.join(parts) if parts else None
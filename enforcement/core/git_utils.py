@@ -36,6 +36,7 @@ except ImportError:  # pragma: no cover - fallback for environments without logg
     logger = _FallbackLogger()
 
 from enforcement.core.historical import is_historical_path
+from enforcement.core.git_snapshot import GitSnapshot, GitSnapshotError, WHITESPACE_FLAGS
 
 
 @lru_cache(maxsize=256)
@@ -160,8 +161,9 @@ class GitUtils:
     Helper class for git operations with caching support.
     """
     
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, use_snapshot: bool = True):
         self.project_root = project_root
+        self.use_snapshot = use_snapshot
         self._cached_changed_files: Optional[Dict[str, List[str]]] = None
         self._changed_files_cache_key: Optional[str] = None
         self._file_diff_cache: Dict[str, Optional[str]] = {}
@@ -172,6 +174,12 @@ class GitUtils:
         # Cache for batch file modification status (key: git_state_key)
         self._batch_file_modification_cache: Optional[Dict[str, bool]] = None
         self._batch_file_modification_cache_key: Optional[str] = None
+        # Bulk git state for per-file lookups (captured lazily, dropped on git state change)
+        self._snapshot: Optional[GitSnapshot] = None
+        self._snapshot_failed = False
+        # History-only data carried across refresh() while HEAD stays put
+        self._history_head: Optional[str] = None
+        self._carried_commit_times: Dict[str, Optional[int]] = {}
     
     def run_git_command(self, args: List[str]) -> str:
         return run_git_command(self.project_root, args)
@@ -184,6 +192,95 @@ class GitUtils:
         self._file_modification_cache.clear()
         self._batch_file_modification_cache = None
         self._batch_file_modification_cache_key = None
+        self._snapshot = None
+        self._snapshot_failed = False
+    
+    def refresh(self):
+        """
+        Drop all git-derived state before a new run in a long-lived process.
+        
+        A one-shot enforcer run never needs this; the daemon calls it per
+        request because run_git_command results are cached process-wide.
+        Last-commit times only depend on history and are kept while HEAD
+        hasn't moved.
+        """
+        previous = self._snapshot
+        run_git_command_cached.cache_clear()
+        self.invalidate_cache()
+        self.clear_diff_cache()
+        
+        head = run_git_command(self.project_root, ['rev-parse', 'HEAD'])
+        if head and head == self._history_head:
+            if previous is not None:
+                self._carried_commit_times.update(previous._commit_times)
+        else:
+            self._carried_commit_times = {}
+        self._history_head = head or None
+    
+    def get_snapshot(self) -> Optional[GitSnapshot]:
+        """
+        Return the git snapshot for this run, capturing it on first use.
+        
+        Returns None when the bulk commands fail (e.g. not a git repository);
+        callers then fall back to per-file git commands.
+        """
+        if not self.use_snapshot:
+            return None
+        if self._snapshot is None and not self._snapshot_failed:
+            try:
+                self._snapshot = GitSnapshot.capture(self.project_root)
+                if self._carried_commit_times:
+                    self._snapshot.adopt_commit_times(self._carried_commit_times)
+            except GitSnapshotError as e:
+                self._snapshot_failed = True
+                logger.debug(
+                    "Git snapshot unavailable, using per-file git commands",
+                    operation="get_snapshot",
+                    error_code="GIT_SNAPSHOT_FAILED",
+                    root_cause=str(e)
+                )
+        return self._snapshot
+    
+    def is_tracked(self, file_path: str) -> bool:
+        """Return True if file is in the git index."""
+        snapshot = self.get_snapshot()
+        if snapshot is not None:
+            try:
+                return snapshot.is_tracked(file_path)
+            except GitSnapshotError:
+                pass
+        output = self.run_git_command(["ls-files", "--error-unmatch", "--", file_path])
+        return bool(output and output.strip())
+    
+    def has_content_changes(self, file_path: str) -> bool:
+        """Return True if file differs from HEAD ignoring whitespace and blank lines."""
+        snapshot = self.get_snapshot()
+        if snapshot is not None:
+            return snapshot.has_content_changes(file_path)
+        output = self.run_git_command(["diff", "--numstat"] + WHITESPACE_FLAGS + ["HEAD", "--", file_path])
+        return bool(output and output.strip())
+    
+    def has_unstaged_content_changes(self, file_path: str) -> bool:
+        """Return True if the working tree differs from the index ignoring whitespace."""
+        snapshot = self.get_snapshot()
+        if snapshot is not None:
+            return snapshot.has_worktree_content_changes(file_path)
+        output = self.run_git_command(["diff"] + WHITESPACE_FLAGS + [file_path])
+        return bool(output and output.strip())
+    
+    def get_last_commit_time(self, file_path: str) -> Optional[datetime]:
+        """Return the time of the last commit touching file, or None."""
+        snapshot = self.get_snapshot()
+        if snapshot is not None:
+            try:
+                timestamp = snapshot.last_commit_time(file_path)
+                return datetime.fromtimestamp(timestamp, tz=timezone.utc) if timestamp is not None else None
+            except GitSnapshotError:
+                pass
+        output = self.run_git_command(["log", "-1", "--format=%ct", "--", file_path])
+        if output and output.strip():
+            return datetime.fromtimestamp(int(output.strip()), tz=timezone.utc)
+        return None
     
     def update_cache(self, cache_key: str):
         tracked = get_changed_files_impl(self.project_root, include_untracked=False)
@@ -202,6 +299,9 @@ class GitUtils:
         self._changed_files_cache_key = cache_key
         self._cached_classifications = None
         self._classification_cache_key = None
+        # New git state: per-file lookups must come from a fresh snapshot
+        self._snapshot = None
+        self._snapshot_failed = False
     
     def get_cache_key(self) -> Optional[str]:
         return self._changed_files_cache_key
@@ -315,6 +415,20 @@ class GitUtils:
             )
             return self._file_diff_cache[file_path]
         
+        snapshot = self.get_snapshot()
+        if snapshot is not None:
+            try:
+                result = snapshot.file_diff(file_path)
+                self._file_diff_cache[file_path] = result
+                return result
+            except GitSnapshotError as e:
+                logger.debug(
+                    f"Snapshot diff failed for {file_path}, using per-file git diff",
+                    operation="get_file_diff",
+                    error_code="GIT_SNAPSHOT_DIFF_FAILED",
+                    root_cause=str(e)
+                )
+        
         try:
             tracked = self.run_git_command(['ls-files', '--error-unmatch', file_path])
             if not tracked:
@@ -845,9 +959,12 @@ class GitUtils:
         """
         Get git status code for file (A, D, M, R, etc.).
         
-        Uses: git diff --name-status HEAD
+        Uses: git status snapshot (falls back to git diff --name-status)
         Returns: Status code or None
         """
+        snapshot = self.get_snapshot()
+        if snapshot is not None:
+            return snapshot.change_status(file_path)
         try:
             # Get staged changes
             staged_output = self.run_git_command(['diff', '--cached', '--name-status', '--', file_path])
@@ -882,9 +999,12 @@ class GitUtils:
         """
         For renamed files, get original path.
         
-        Uses: git diff --name-status --find-renames
+        Uses: git status snapshot (falls back to git diff --name-status --find-renames)
         Returns: Original path or None
         """
+        snapshot = self.get_snapshot()
+        if snapshot is not None:
+            return snapshot.rename_source(file_path)
         try:
             # Check staged renames
             staged_output = self.run_git_command(['diff', '--cached', '--name-status', '--find-renames', '--', file_path])
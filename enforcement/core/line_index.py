@@ -0,0 +1,49 @@
+"""
+Offset-to-line mapping for regex matches over whole files.
+
+Checkers scan full file contents and used to turn each match offset into a
+line number with ``content[:offset].count('\\n') + 1``, copying and scanning
+the prefix again for every match (quadratic in file size on files with many
+matches). A LineIndex records line start offsets once and answers each lookup
+with a binary search.
+"""
+
+import bisect
+from itertools import accumulate
+from typing import List
+
+
+class LineIndex:
+    """
+    Sorted line start offsets of a text, built once per file.
+    """
+
+    __slots__ = ('starts',)
+
+    def __init__(self, text: str):
+        """
+        Index a text.
+
+        Args:
+            text: Full file content
+        """
+        # Offsets where lines 2..N start (one past each newline), computed in C
+        self.starts: List[int] = list(accumulate(map((1).__add__, map(len, text.split('\n')[:-1]))))
+
+    def line_number(self, offset: int) -> int:
+        """
+        Return the 1-based line containing offset.
+
+        Same result as ``text[:offset].count('\\n') + 1``.
+        """
+        return bisect.bisect_right(self.starts, offset) + 1
+
+    def line_start(self, line_number: int) -> int:
+        """Return the offset at which a 1-based line starts."""
+        if line_number <= 1:
+            return 0
+        return self.starts[line_number - 2]
+
+    def __len__(self) -> int:
+        """Number of lines (length of ``text.split('\\n')``)."""
+        return len(self.starts) + 1
@@ -0,0 +1,245 @@
+"""
+Compiled multi-pattern matching for checker rule lists.
+
+Checkers keep lists of regexes (secret variable names, client-supplied tenant
+IDs, historical date markers, ...) and used to try each one against every
+line, paying a Python-level call per rule per line. A PatternSet scans whole
+texts in C instead:
+
+- Rules that start with a literal already get sre's fast prefix scan, so each
+  is run once over the text on its own.
+- Rules without a usable prefix (``\\bTOKEN\\b`` and friends) are tried at
+  every position anyway, so they are merged into one alternation per flag set
+  and share a single pass.
+
+Results are exact: scans only nominate candidate lines (or reject whole
+texts); the individual patterns then confirm every rule that matches, in
+declaration order, just like the original nested loops.
+"""
+
+import bisect
+import re
+from typing import Dict, Iterator, List, Optional, Pattern, Sequence, Tuple, Union
+
+
+PatternSpec = Union[str, Pattern]
+
+# Flags under which rules can share an alternation
+_MERGEABLE_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL
+
+# Flags that change how a pattern is parsed (e.g. VERBOSE); such rules aren't merged
+_UNSCOPABLE_FLAGS = ~(_MERGEABLE_FLAGS | re.UNICODE)
+
+# Numbered backreferences can't survive being renumbered inside an alternation
+_NUMBERED_BACKREF = re.compile(r'\\[1-9]|\(\?P=')
+
+# Rules led by a word boundary and a literal: no sre prefix, but cheap to merge
+_BOUNDARY_LED = re.compile(r'\\b(?:[A-Za-z0-9_]|\\[^A-Za-z0-9\s])')
+
+# Constructs whose meaning changes when a line is scanned inside a joined text
+_LINE_SENSITIVE = re.compile(r'\(\?<?[=!]|\\[AZ]')
+
+# A scanner and the rule indexes whose candidates it nominates (None: go line by line)
+Scanner = Tuple[Optional[Pattern], List[int]]
+
+
+def _confine_to_line(pattern: str) -> str:
+    """
+    Keep negated classes like ``[^`]*`` from running across newlines.
+
+    Lines never contain a newline, so excluding it changes nothing per line
+    but stops a joined-text scan from backtracking over the rest of the file.
+    """
+    out = []
+    i = 0
+    in_class = False
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            out.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if in_class:
+            if char == ']' and out[-1] not in ('[', '[^'):
+                in_class = False
+        elif char == '[':
+            in_class = True
+            if pattern.startswith('[^', i):
+                out.append('[^\\n')
+                i += 2
+                continue
+        out.append(char)
+        i += 1
+    return ''.join(out)
+
+
+def _build_scanners(patterns: List[Pattern], for_lines: bool = False) -> List[Scanner]:
+    """
+    Build the scanners covering a rule list.
+
+    With ``for_lines`` scanners are built for lines joined by newlines: ``^``
+    and ``$`` match at every line boundary and ``.`` never crosses one, so any
+    line a rule matches on its own also has a scanner match starting in it
+    (the reverse doesn't hold; hits are re-checked). Rules that can't be
+    scanned that way get a ``None`` scanner and are run line by line.
+    """
+    scanners: List[Scanner] = []
+    merge_groups: Dict[int, List[int]] = {}
+    for idx, pattern in enumerate(patterns):
+        flags = pattern.flags
+        if for_lines:
+            if pattern.flags & _UNSCOPABLE_FLAGS or _LINE_SENSITIVE.search(pattern.pattern):
+                scanners.append((None, [idx]))
+                continue
+            flags = (flags | re.MULTILINE) & ~re.DOTALL
+        mergeable = (
+            _BOUNDARY_LED.match(pattern.pattern)
+            and not _NUMBERED_BACKREF.search(pattern.pattern)
+            and not pattern.flags & _UNSCOPABLE_FLAGS
+        )
+        if mergeable:
+            merge_groups.setdefault(flags & _MERGEABLE_FLAGS, []).append(idx)
+        elif not for_lines:
+            scanners.append((pattern, [idx]))
+        else:
+            scanners.append((re.compile(_confine_to_line(pattern.pattern), flags), [idx]))
+
+    for flags, indexes in merge_groups.items():
+        sources = [patterns[idx].pattern for idx in indexes]
+        if for_lines:
+            sources = [_confine_to_line(source) for source in sources]
+        alternation = '|'.join(f'(?:{source})' for source in sources)
+        try:
+            scanners.append((re.compile(alternation, flags), indexes))
+        except re.error:
+            # e.g. global inline flags inside a rule
+            scanners.extend(
+                (re.compile(source, flags), [idx]) for source, idx in zip(sources, indexes)
+            )
+    return scanners
+
+
+class PatternSet:
+    """
+    A list of regex rules scanned together.
+
+    Rules are identified by their position in the list, or by an explicit
+    rule ID when given as (pattern, rule_id) pairs.
+    """
+
+    def __init__(
+        self,
+        patterns: Sequence[Union[PatternSpec, Tuple[PatternSpec, str]]],
+        flags: int = 0,
+    ):
+        """
+        Compile the rule list.
+
+        Args:
+            patterns: Regex strings, compiled patterns, or (pattern, rule_id) pairs
+            flags: re flags applied to string patterns (compiled patterns keep their own)
+        """
+        self.rule_ids: List[str] = []
+        self.patterns: List[Pattern] = []
+        for idx, spec in enumerate(patterns):
+            if isinstance(spec, tuple):
+                spec, rule_id = spec
+            else:
+                rule_id = str(idx)
+            compiled = spec if isinstance(spec, re.Pattern) else re.compile(spec, flags)
+            self.patterns.append(compiled)
+            self.rule_ids.append(rule_id)
+
+        self._text_scanners: List[Scanner] = _build_scanners(self.patterns)
+        self._line_scanners: List[Scanner] = _build_scanners(self.patterns, for_lines=True)
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def search(self, text: str) -> bool:
+        """Return True if any rule matches anywhere in text."""
+        return any(scanner.search(text) for scanner, _ in self._text_scanners)
+
+    def first(self, text: str) -> Optional[int]:
+        """
+        Return the index of the first rule (in declaration order) that matches text.
+
+        Equivalent to ``next(i for i, p in enumerate(patterns) if p.search(text))``.
+        """
+        matches = self.matching(text)
+        return matches[0] if matches else None
+
+    def matching(self, text: str) -> List[int]:
+        """Return indexes of every rule that matches text, in declaration order."""
+        matches: List[int] = []
+        for scanner, indexes in self._text_scanners:
+            if scanner.search(text) is None:
+                continue
+            if len(indexes) == 1 and scanner is self.patterns[indexes[0]]:
+                matches.append(indexes[0])
+            else:
+                matches.extend(idx for idx in indexes if self.patterns[idx].search(text))
+        return sorted(matches)
+
+    def matching_rule_ids(self, text: str) -> List[str]:
+        """Return rule IDs of every rule that matches text, in declaration order."""
+        return [self.rule_ids[idx] for idx in self.matching(text)]
+
+    def scan_lines(self, lines: Sequence[str]) -> Dict[int, List[int]]:
+        """
+        Scan lines and group hits by rule.
+
+        Args:
+            lines: Lines to scan
+
+        Returns:
+            Dictionary mapping rule index to the 1-based line numbers it matches.
+            Iterating rules in order and their lines in order reproduces the
+            ``for pattern in rules: for line in lines`` loop order.
+        """
+        hits: Dict[int, List[int]] = {}
+        if not lines:
+            return hits
+
+        text = '\n'.join(lines)
+        starts = [0]
+        for line in lines[:-1]:
+            starts.append(starts[-1] + len(line) + 1)
+
+        for scanner, indexes in self._line_scanners:
+            if scanner is None:
+                candidates: Iterator[int] = iter(range(1, len(lines) + 1))
+            else:
+                candidates = self._candidate_lines(scanner, text, starts)
+            for line_num in candidates:
+                line = lines[line_num - 1]
+                for idx in indexes:
+                    if self.patterns[idx].search(line):
+                        hits.setdefault(idx, []).append(line_num)
+        return dict(sorted(hits.items()))
+
+    @staticmethod
+    def _candidate_lines(scanner: Pattern, text: str, starts: List[int]) -> Iterator[int]:
+        """Yield 1-based numbers of lines in which a scanner match starts, in order."""
+        pos = 0
+        while True:
+            match = scanner.search(text, pos)
+            if match is None:
+                return
+            line_idx = bisect.bisect_right(starts, match.start()) - 1
+            yield line_idx + 1
+            if line_idx + 1 >= len(starts):
+                return
+            # Resume at the next line: a match spanning lines must not hide one
+            pos = starts[line_idx + 1]
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, 're.Match']]:
+        """
+        Yield (rule index, match) for every match of every rule.
+
+        Order matches ``for pattern in rules: for m in pattern.finditer(text)``;
+        rules are only run in full when their scanner found something.
+        """
+        for idx in self.matching(text):
+            for match in self.patterns[idx].finditer(text):
+                yield idx, match
@@ -1,11 +1,15 @@
 import json
 import hashlib
+import sqlite3
+import threading
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from enforcement.core.session_store import SESSION_DB_NAME, LazyFileHashes, SessionStore
+
 try:
     from logger_util import get_logger
     logger = get_logger(context="session_state")
@@ -51,7 +55,7 @@ class EnforcementSession:
     checks_passed: List[str]
     checks_failed: List[str]
     auto_fixes: List[Dict]  # Track auto-fixes
-    file_hashes: Dict[str, str] = None  # Track file content hashes to detect actual changes
+    file_hashes: Dict[str, str] = None  # Track file content hashes to detect actual changes (LazyFileHashes once saved)
     version: Optional[int] = None  # Session version for migration tracking
     
     @classmethod
@@ -118,6 +122,94 @@ def _init_session_sequence_tracker(session_id: str) -> Optional[Any]:
         return None
 
 
+# One open SessionStore per session.db in this process
+_stores: Dict[str, SessionStore] = {}
+_stores_lock = threading.Lock()
+
+def get_session_store(enforcement_dir: Path) -> SessionStore:
+    """Get the SessionStore for enforcement_dir/session.db (opened once per process)."""
+    db_path = str((enforcement_dir / SESSION_DB_NAME).resolve())
+    with _stores_lock:
+        store = _stores.get(db_path)
+        if store is None:
+            store = _stores[db_path] = SessionStore(Path(db_path))
+        return store
+
+
+def session_mtime_ns(enforcement_dir: Path) -> Optional[int]:
+    """Modification time of the persisted session (session.db, else session.json), or None."""
+    for name in (SESSION_DB_NAME, "session.json"):
+        try:
+            return (enforcement_dir / name).stat().st_mtime_ns
+        except OSError:
+            continue
+    return None
+
+
+def _is_stale_violation(v: Dict) -> bool:
+    """
+    Stale violations are not kept in the session:
+    1. N/A line numbers (violations that couldn't be properly parsed)
+    2. Violations for log files (memory_bank files)
+    """
+    line_num = v.get('line_number')
+    if line_num is None or line_num == "N/A" or str(line_num).upper() == "N/A":
+        return True
+    
+    file_path = v.get('file_path', '')
+    if file_path:
+        normalized_path = str(file_path).replace("\\", "/").lower()
+        if ".ai/memory_bank/" in normalized_path or ".ai/memory-bank/" in normalized_path:
+            return True
+    return False
+
+
+def _load_json_session(session_file: Path) -> EnforcementSession:
+    """Parse a legacy session.json (migrated to session.db by load_session)."""
+    with open(session_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    if 'version' not in data or data.get('version', 1) < 2:
+        try:
+            logger.info(
+                "Migrating session from v1 to v2",
+                operation="load_session",
+                old_version=data.get('version', 1)
+            )
+        except TypeError:
+            logger.info(f"Migrating session from v1 to v2 (old_version={data.get('version', 1)})")
+        data = migrate_session_v1_to_v2(data)
+    
+    if 'auto_fixes' not in data:
+        data['auto_fixes'] = []
+    if 'file_hashes' not in data:
+        data['file_hashes'] = {}
+    if 'version' not in data:
+        data['version'] = 2
+    if 'checks_passed' not in data:
+        data['checks_passed'] = []
+    if 'checks_failed' not in data:
+        data['checks_failed'] = []
+    
+    session = EnforcementSession(**data)
+    
+    # CRITICAL: Filter out stale violations when loading session
+    original_violation_count = len(session.violations)
+    session.violations = [v for v in session.violations if not _is_stale_violation(v)]
+    filtered_count = original_violation_count - len(session.violations)
+    
+    if filtered_count > 0:
+        logger.info(
+            f"Filtered {filtered_count} stale violations when loading session",
+            operation="load_session",
+            session_id=session.session_id,
+            original_count=original_violation_count,
+            filtered_count=filtered_count,
+            remaining_count=len(session.violations)
+        )
+    return session
+
+
 def load_session(
     enforcement_dir: Path,
     predictor: Optional[Any] = None,
@@ -125,90 +217,56 @@ def load_session(
 ) -> Tuple[EnforcementSession, Optional[Any]]:
     """
     Load enforcement session from disk (or create new) and optionally initialize tracker.
+    
+    Reads session.db (file_hashes on first use). An existing session.json
+    from before the SQLite store is parsed once and migrated into session.db.
     """
     session_file = enforcement_dir / "session.json"
     session_sequence_tracker = session_sequence_tracker_ref
+    session = None
     
-    if session_file.exists():
-        try:
-            with open(session_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            if 'version' not in data or data.get('version', 1) < 2:
-                try:
-                    logger.info(
-                        "Migrating session from v1 to v2",
-                        operation="load_session",
-                        old_version=data.get('version', 1)
-                    )
-                except TypeError:
-                    logger.info(f"Migrating session from v1 to v2 (old_version={data.get('version', 1)})")
-                data = migrate_session_v1_to_v2(data)
-            
-            if 'auto_fixes' not in data:
-                data['auto_fixes'] = []
-            if 'file_hashes' not in data:
-                data['file_hashes'] = {}
-            if 'version' not in data:
-                data['version'] = 2
-            if 'checks_passed' not in data:
-                data['checks_passed'] = []
-            if 'checks_failed' not in data:
-                data['checks_failed'] = []
-            
-            session = EnforcementSession(**data)
-            
-            # CRITICAL: Filter out stale violations when loading session
-            # Stale violations are identified by:
-            # 1. N/A line numbers (violations that couldn't be properly parsed)
-            # 2. Violations for log files (memory_bank files)
-            # 3. Violations for files that no longer exist or shouldn't be checked
-            original_violation_count = len(session.violations)
-            filtered_violations = []
-            
-            for v in session.violations:
-                # Skip violations with N/A line numbers (definitely stale)
-                line_num = v.get('line_number')
-                if line_num is None or line_num == "N/A" or str(line_num).upper() == "N/A":
-                    continue
-                
-                # Skip violations for log files
-                file_path = v.get('file_path', '')
-                if file_path:
-                    normalized_path = str(file_path).replace("\\", "/").lower()
-                    if ".ai/memory_bank/" in normalized_path or ".ai/memory-bank/" in normalized_path:
-                        continue
-                
-                filtered_violations.append(v)
-            
-            session.violations = filtered_violations
-            filtered_count = original_violation_count - len(filtered_violations)
-            
-            if filtered_count > 0:
-                logger.info(
-                    f"Filtered {filtered_count} stale violations when loading session",
-                    operation="load_session",
-                    session_id=session.session_id,
-                    original_count=original_violation_count,
-                    filtered_count=filtered_count,
-                    remaining_count=len(filtered_violations)
-                )
-            
+    try:
+        loaded = get_session_store(enforcement_dir).load() if enforcement_dir.is_dir() else None
+        if loaded is not None:
+            meta, lists, file_hashes = loaded
+            session = EnforcementSession(
+                session_id=meta['session_id'],
+                start_time=meta['start_time'],
+                last_check=meta['last_check'],
+                violations=lists.get('violations', []),
+                checks_passed=lists.get('checks_passed', []),
+                checks_failed=lists.get('checks_failed', []),
+                auto_fixes=lists.get('auto_fixes', []),
+                file_hashes=file_hashes,
+                version=meta.get('version', 2)
+            )
+        elif session_file.exists():
+            session = _load_json_session(session_file)
+            save_session(session, enforcement_dir)
             logger.info(
-                "Session loaded",
+                "Migrated session.json to session store",
                 operation="load_session",
                 session_id=session.session_id,
-                violations_count=len(session.violations)
+                file_hashes_count=len(session.file_hashes or {})
             )
-        except (FileNotFoundError, json.JSONDecodeError, PermissionError, OSError) as exc:
-            logger.warn(
-                "Failed to load session, creating new",
+        
+        if session is not None:
+            logger.info(
+                "Session loaded",
                 operation="load_session",
-                error_code="SESSION_LOAD_FAILED",
-                root_cause=str(exc)
+                session_id=session.session_id,
+                violations_count=len(session.violations)
             )
-            session = EnforcementSession.create_new()
-    else:
+    except (FileNotFoundError, json.JSONDecodeError, PermissionError, OSError, sqlite3.Error, KeyError, TypeError) as exc:
+        logger.warn(
+            "Failed to load session, creating new",
+            operation="load_session",
+            error_code="SESSION_LOAD_FAILED",
+            root_cause=str(exc)
+        )
+        session = None
+    
+    if session is None:
         session = EnforcementSession.create_new()
     
     if predictor and session_sequence_tracker is None:
@@ -231,7 +289,9 @@ def prune_session_data(session: EnforcementSession) -> None:
         )
     
     MAX_FILE_HASHES = 10000
-    if session.file_hashes and len(session.file_hashes) > MAX_FILE_HASHES:
+    # Hashes not read this run are unchanged (and were pruned when saved)
+    hashes_loaded = not isinstance(session.file_hashes, LazyFileHashes) or session.file_hashes.loaded
+    if hashes_loaded and session.file_hashes and len(session.file_hashes) > MAX_FILE_HASHES:
         oldest_keys = list(session.file_hashes.keys())[:-MAX_FILE_HASHES]
         for key in oldest_keys:
             del session.file_hashes[key]
@@ -250,25 +310,31 @@ def prune_session_data(session: EnforcementSession) -> None:
 
 def save_session(session: EnforcementSession, enforcement_dir: Path) -> None:
     """
-    Persist session state to disk (JSON).
+    Persist session state to disk (session.db).
+    
+    Only rows that changed since the last load/save are written (see
+    SessionStore); stale violations are not persisted.
     """
     prune_session_data(session)
     
-    session_file = enforcement_dir / "session.json"
     try:
-        session_dict = {
-            "session_id": session.session_id,
-            "start_time": session.start_time,
-            "last_check": session.last_check,
-            "violations": session.violations,
-            "checks_passed": session.checks_passed,
-            "checks_failed": session.checks_failed,
-            "auto_fixes": session.auto_fixes,
-            "file_hashes": session.file_hashes or {}
-        }
-        with open(session_file, 'w', encoding='utf-8') as f:
-            json.dump(session_dict, f, indent=2)
-    except (FileNotFoundError, PermissionError, OSError, TypeError) as exc:
+        store = get_session_store(enforcement_dir)
+        session.file_hashes = store.save(
+            meta={
+                "session_id": session.session_id,
+                "start_time": session.start_time,
+                "last_check": session.last_check,
+                "version": session.version or 2,
+            },
+            lists={
+                "violations": [v for v in session.violations if not _is_stale_violation(v)],
+                "checks_passed": session.checks_passed,
+                "checks_failed": session.checks_failed,
+                "auto_fixes": session.auto_fixes,
+            },
+            file_hashes=session.file_hashes
+        )
+    except (FileNotFoundError, PermissionError, OSError, TypeError, ValueError, sqlite3.Error) as exc:
         logger.error(
             "Failed to save session",
             operation="save_session",
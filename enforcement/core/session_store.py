@@ -0,0 +1,328 @@
+"""
+Incremental SQLite persistence for enforcement sessions.
+
+save_session() used to rewrite all of session.json (up to 2,000 violations
+and 10,000 file hashes) with ``json.dump(..., indent=2)`` on every save, and
+load_session() parsed the whole file on every start. SessionStore keeps the
+session in ``session.db`` instead and writes only what changed since the last
+save:
+
+- scalar fields live in ``meta`` and are upserted when their value changes
+- list fields (violations, checks, auto-fixes) live in ``items``, one row per
+  entry in list order; entries appended since the last save are inserted and
+  entries pruned from the head are deleted (any other change rewrites that
+  one list)
+- ``file_hashes`` rows are upserted/deleted per key through LazyFileHashes,
+  which also defers reading them until the mapping is first used
+
+The database uses a rollback journal, so its mtime changes on every commit
+(the enforcer daemon watches it to notice other writers), and is VACUUMed
+when deleted rows leave too many free pages.
+"""
+
+import json
+import sqlite3
+import threading
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from logger_util import get_logger
+    logger = get_logger(context="session_store")
+except ImportError:  # pragma: no cover - fallback for environments without logger_util
+    import logging
+
+    logging.basicConfig(level=logging.INFO)
+
+    class _FallbackLogger:
+        def __init__(self):
+            self._logger = logging.getLogger("session_store")
+
+        def info(self, msg, *args, **kwargs):
+            self._logger.info(msg)
+
+        def debug(self, msg, *args, **kwargs):
+            self._logger.debug(msg)
+
+        def warn(self, msg, *args, **kwargs):
+            self._logger.warning(msg)
+
+        def warning(self, msg, *args, **kwargs):
+            self._logger.warning(msg)
+
+        def error(self, msg, *args, **kwargs):
+            self._logger.error(msg)
+
+    logger = _FallbackLogger()
+
+
+SESSION_DB_NAME = "session.db"
+
+# VACUUM once free pages exceed this fraction of the file (and COMPACT_MIN_PAGES)
+COMPACT_FREE_RATIO = 0.5
+COMPACT_MIN_PAGES = 256
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, field TEXT NOT NULL, data TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS items_field ON items (field, id)",
+    "CREATE TABLE IF NOT EXISTS file_hashes (key TEXT PRIMARY KEY, hash TEXT NOT NULL)",
+)
+
+_MISSING = object()
+
+
+class LazyFileHashes(MutableMapping):
+    """
+    ``session.file_hashes`` backed by a SessionStore.
+
+    Rows are read on first access (a run that never hashes a file never
+    reads them) and changes are tracked so the next save writes only the
+    keys that were set or deleted. Iteration order matches a dict built in
+    insertion order, which prune_session_data() relies on.
+    """
+
+    __slots__ = ("_store", "_data", "_dirty", "_deleted")
+
+    def __init__(self, store: "SessionStore", data: Optional[Dict[str, str]] = None):
+        self._store = store
+        self._data = data
+        # Ordered so new keys are written in insertion order
+        self._dirty: Dict[str, None] = {}
+        self._deleted: set = set()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the rows have been read from the store."""
+        return self._data is not None
+
+    def _loaded(self) -> Dict[str, str]:
+        if self._data is None:
+            self._data = self._store._read_file_hashes()
+        return self._data
+
+    def __getitem__(self, key: str) -> str:
+        return self._loaded()[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._loaded().get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._loaded()
+
+    def __setitem__(self, key: str, value: str):
+        data = self._loaded()
+        if data.get(key, _MISSING) != value:
+            data[key] = value
+            self._dirty.setdefault(key)
+
+    def __delitem__(self, key: str):
+        del self._loaded()[key]
+        self._dirty.pop(key, None)
+        self._deleted.add(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._loaded())
+
+    def __len__(self) -> int:
+        return len(self._loaded())
+
+    def __repr__(self) -> str:
+        return f"LazyFileHashes({self._data!r})" if self.loaded else "LazyFileHashes(<not loaded>)"
+
+    def _take_changes(self) -> Tuple[List[Tuple[str, str]], List[str]]:
+        """(upserts in insertion order, deleted keys) since the last call."""
+        upserts = [(key, self._data[key]) for key in self._dirty]
+        deleted = list(self._deleted)
+        self._dirty = {}
+        self._deleted = set()
+        return upserts, deleted
+
+
+def _dropped_head(old: List[str], new: List[str]) -> int:
+    """
+    Number of leading old entries to delete so the rest is a prefix of new.
+
+    Returns len(old) when new doesn't continue old (the list is rewritten).
+    """
+    if not new:
+        return len(old)
+    first = new[0]
+    for k, text in enumerate(old):
+        if text == first and old[k:] == new[:len(old) - k]:
+            return k
+    return len(old)
+
+
+class SessionStore:
+    """
+    SQLite-backed session storage with change-proportional writes.
+
+    Keeps a snapshot of the rows it last read or wrote; save() diffs the
+    session against it. If another process committed in the meantime
+    (PRAGMA data_version changed), the snapshot is re-read first so the
+    save still leaves the database equal to the saved session.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Open (creating if needed) the session database.
+
+        Args:
+            db_path: Path of session.db
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=DELETE")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+        self._meta: Dict[str, str] = {}
+        self._items: Dict[str, List[Tuple[int, str]]] = {}
+        self._data_version: Optional[int] = None
+        self.last_save: Dict[str, int] = {}
+
+    def _current_data_version(self) -> int:
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _read_snapshot(self):
+        """Re-read meta and list rows into the snapshot (lock held)."""
+        self._meta = dict(self._conn.execute("SELECT key, value FROM meta"))
+        self._items = {}
+        for row_id, field, data in self._conn.execute("SELECT id, field, data FROM items ORDER BY field, id"):
+            self._items.setdefault(field, []).append((row_id, data))
+        self._data_version = self._current_data_version()
+
+    def _read_file_hashes(self) -> Dict[str, str]:
+        with self._lock:
+            return dict(self._conn.execute("SELECT key, hash FROM file_hashes ORDER BY rowid"))
+
+    def load(self) -> Optional[Tuple[Dict[str, Any], Dict[str, List[Any]], LazyFileHashes]]:
+        """
+        Load the stored session.
+
+        Returns:
+            (scalar fields, list fields, lazy file_hashes), or None if the
+            store holds no session
+        """
+        with self._lock:
+            self._read_snapshot()
+            if "session_id" not in self._meta:
+                return None
+            meta = {key: json.loads(value) for key, value in self._meta.items()}
+            lists = {field: [json.loads(data) for _, data in rows] for field, rows in self._items.items()}
+            return meta, lists, LazyFileHashes(self)
+
+    def save(
+        self,
+        meta: Dict[str, Any],
+        lists: Dict[str, List[Any]],
+        file_hashes: Optional[MutableMapping]
+    ) -> LazyFileHashes:
+        """
+        Write the changes since the last load/save in one transaction.
+
+        Args:
+            meta: Scalar fields (must include session_id)
+            lists: List fields, in order
+            file_hashes: The session's file_hashes (a plain dict is written in
+                full once and replaced by the returned LazyFileHashes)
+
+        Returns:
+            LazyFileHashes to assign back to the session
+        """
+        written = deleted = 0
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if self._data_version is None or self._current_data_version() != self._data_version:
+                    self._read_snapshot()
+                new_session = self._meta.get("session_id") != json.dumps(meta["session_id"])
+                if new_session:
+                    for table in ("meta", "items", "file_hashes"):
+                        self._conn.execute(f"DELETE FROM {table}")
+                    self._meta = {}
+                    self._items = {}
+
+                for key, value in meta.items():
+                    text = json.dumps(value)
+                    if self._meta.get(key) != text:
+                        self._conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, text))
+                        self._meta[key] = text
+                        written += 1
+
+                for field, values in lists.items():
+                    w, d = self._save_list(field, values)
+                    written += w
+                    deleted += d
+
+                if isinstance(file_hashes, LazyFileHashes) and file_hashes._store is self and not new_session:
+                    result = file_hashes
+                    if file_hashes.loaded:
+                        upserts, removed = file_hashes._take_changes()
+                        self._conn.executemany("DELETE FROM file_hashes WHERE key = ?", ((k,) for k in removed))
+                        self._conn.executemany(
+                            "INSERT INTO file_hashes VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET hash = excluded.hash",
+                            upserts
+                        )
+                        written += len(upserts)
+                        deleted += len(removed)
+                else:
+                    data = dict(file_hashes or {})
+                    deleted += self._conn.execute("DELETE FROM file_hashes").rowcount
+                    self._conn.executemany("INSERT INTO file_hashes VALUES (?, ?)", data.items())
+                    written += len(data)
+                    result = LazyFileHashes(self, data)
+
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                self._data_version = None  # Snapshot may not match the database
+                raise
+            self._data_version = self._current_data_version()
+            self.last_save = {"rows_written": written, "rows_deleted": deleted}
+            if deleted:
+                self._maybe_compact()
+            return result
+
+    def _save_list(self, field: str, values: List[Any]) -> Tuple[int, int]:
+        """Append new entries and drop pruned head entries of one list (transaction open)."""
+        old = self._items.get(field, [])
+        new = [json.dumps(value) for value in values]
+        old_texts = [text for _, text in old]
+        if new == old_texts:
+            return 0, 0
+        drop = _dropped_head(old_texts, new)
+        if drop:
+            self._conn.execute("DELETE FROM items WHERE field = ? AND id <= ?", (field, old[drop - 1][0]))
+        kept = old[drop:]
+        for text in new[len(kept):]:
+            cursor = self._conn.execute("INSERT INTO items (field, data) VALUES (?, ?)", (field, text))
+            kept.append((cursor.lastrowid, text))
+        self._items[field] = kept
+        return len(new) - (len(old) - drop), drop
+
+    def _maybe_compact(self):
+        """VACUUM when free pages exceed COMPACT_FREE_RATIO of the file."""
+        page_count = self._conn.execute("PRAGMA page_count").fetchone()[0]
+        free_pages = self._conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if page_count >= COMPACT_MIN_PAGES and free_pages > page_count * COMPACT_FREE_RATIO:
+            self.compact()
+
+    def compact(self):
+        """Rewrite the database without free pages."""
+        with self._lock:
+            self._conn.execute("VACUUM")
+            self._data_version = self._current_data_version()
+            logger.debug(
+                "Session store compacted",
+                operation="compact",
+                db_path=str(self.db_path)
+            )
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,248 @@
+import subprocess
+import threading
+
+import pytest
+
+from enforcement.core import enforcer_daemon
+from enforcement.core.enforcer_daemon import (
+    DaemonUnavailable,
+    EnforcerDaemon,
+    daemon_supported,
+    request_check,
+    send_request,
+)
+from enforcement.core.git_utils import GitUtils
+
+
+pytestmark = pytest.mark.skipif(not daemon_supported(), reason="needs Unix domain sockets")
+
+
+@pytest.fixture
+def socket_path(tmp_path_factory):
+    # Short directory: AF_UNIX paths are limited to ~100 bytes
+    return tmp_path_factory.mktemp("sock") / "d.sock"
+
+
+@pytest.fixture
+def daemon(socket_path):
+    calls = []
+
+    def handle(request):
+        calls.append(request)
+        if request.get("paths") == ["boom"]:
+            raise RuntimeError("checker exploded")
+        return {"exit_code": 0 if not request.get("paths") else 1}
+
+    server = EnforcerDaemon(socket_path, handle)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    for _ in range(200):
+        if socket_path.exists():
+            break
+        thread.join(0.01)
+    server.calls = calls
+    yield server
+    server.shutdown()
+    thread.join(5)
+
+
+def test_check_requests_reach_handler(daemon, socket_path):
+    response = request_check(socket_path, paths=["a.ts"], scope="current_session", changed_paths=["a.ts"])
+
+    assert response["ok"] is True
+    assert response["exit_code"] == 1
+    assert response["requests"] == 1
+    assert daemon.calls[0]["paths"] == ["a.ts"]
+    assert daemon.calls[0]["scope"] == "current_session"
+    assert request_check(socket_path)["requests"] == 2
+
+
+def test_handler_errors_are_reported(daemon, socket_path):
+    response = request_check(socket_path, paths=["boom"])
+
+    assert response["ok"] is False
+    assert "checker exploded" in response["error"]
+    assert send_request(socket_path, {"op": "ping"})["ok"] is True
+
+
+def test_invalid_requests_are_rejected(daemon, socket_path):
+    assert send_request(socket_path, {"op": "nope"})["ok"] is False
+    assert daemon.calls == []
+
+
+def test_no_daemon_returns_none(socket_path):
+    assert request_check(socket_path) is None
+    with pytest.raises(DaemonUnavailable):
+        send_request(socket_path, {"op": "ping"})
+
+
+def test_timeout_after_send_is_not_reported_as_no_daemon(socket_path):
+    import socket
+
+    busy = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    busy.bind(str(socket_path))
+    busy.listen(1)  # Takes the request but never answers
+    try:
+        # None would tell the caller to run the check itself
+        with pytest.raises(OSError):
+            request_check(socket_path, timeout=0.2)
+    finally:
+        busy.close()
+
+
+def test_stale_socket_is_replaced(socket_path):
+    import socket
+
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(socket_path))
+    stale.close()  # Socket file left behind, nothing listening
+
+    server = EnforcerDaemon(socket_path, lambda request: {"exit_code": 0})
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        for _ in range(200):
+            try:
+                assert send_request(socket_path, {"op": "ping"}, timeout=1)["ok"] is True
+                break
+            except DaemonUnavailable:
+                thread.join(0.01)
+        with pytest.raises(OSError):
+            EnforcerDaemon(socket_path, lambda request: {})._bind()
+    finally:
+        server.shutdown()
+        thread.join(5)
+    assert not socket_path.exists()
+
+
+def test_git_refresh_sees_new_changes_and_keeps_history(tmp_path):
+    def git(*args):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("config", "user.email", "dev@example.com")
+    git("config", "user.name", "dev")
+    (tmp_path / "a.txt").write_text("one\n")
+    git("add", ".")
+    git("commit", "-qm", "init")
+
+    utils = GitUtils(tmp_path)
+    utils.refresh()
+    assert utils.get_changed_files() == []
+    commit_time = utils.get_last_commit_time("a.txt")
+
+    (tmp_path / "a.txt").write_text("two\n")
+    utils.refresh()
+    assert utils.get_changed_files() == ["a.txt"]
+    assert "a.txt" in utils.get_snapshot()._commit_times
+    assert utils.get_last_commit_time("a.txt") == commit_time
+
+    git("commit", "-qam", "second")
+    utils.refresh()
+    assert utils.get_changed_files() == []
+    assert utils.get_snapshot()._commit_times == {}
+
+
+def test_cached_checker_sees_git_and_session_changes_between_requests(tmp_path, socket_path):
+    from enforcement.checkers.core_checker import CoreChecker
+    from enforcement.core.session_state import EnforcementSession, load_session, save_session, session_mtime_ns
+
+    def git(*args):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("config", "user.email", "dev@example.com")
+    git("config", "user.name", "dev")
+    (tmp_path / "doc.md").write_text("nothing dated yet\n")
+    (tmp_path / "notes.md").write_text("draft\n")
+    git("add", ".")
+    git("commit", "-qm", "init")
+
+    enforcement_dir = tmp_path / ".cursor" / "enforcement"
+    enforcement_dir.mkdir(parents=True)
+    save_session(EnforcementSession.create_new(), enforcement_dir)
+    rule_file = tmp_path / "02-core.mdc"
+    rule_file.write_text("")
+
+    # Same lifetimes as the daemon: one enforcer state, one cached checker
+    git_utils = GitUtils(tmp_path)
+    state = {"session": load_session(enforcement_dir)[0], "mtime": session_mtime_ns(enforcement_dir)}
+    checker = CoreChecker(project_root=tmp_path, rule_file=rule_file, rule_ref="02-core.mdc")
+    checker.detector = None  # plain pattern path
+
+    def handle(request):
+        git_utils.refresh()
+        if session_mtime_ns(enforcement_dir) != state["mtime"]:
+            state["session"] = load_session(enforcement_dir)[0]
+            state["mtime"] = session_mtime_ns(enforcement_dir)
+        checker.bind_run_state(session=state["session"], git_utils=git_utils)
+        changed = git_utils.get_changed_files()
+        result = checker.check(changed, classification_map={path: "CONTENT_CHANGED" for path in changed})
+        return {"exit_code": 1 if result.violations else 0, "session_id": checker.session.session_id}
+
+    server = EnforcerDaemon(socket_path, handle)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        for _ in range(200):
+            if socket_path.exists():
+                break
+            thread.join(0.01)
+        (tmp_path / "notes.md").write_text("draft, revised\n")
+        first = request_check(socket_path)
+        assert first["exit_code"] == 0
+
+        # Between requests: another process starts a new session, a file gains a stale date
+        new_session = EnforcementSession.create_new()
+        save_session(new_session, enforcement_dir)
+        (tmp_path / "doc.md").write_text("Released on 2020-01-01\n")
+
+        second = request_check(socket_path)
+        assert second["session_id"] == new_session.session_id != first["session_id"]
+        assert second["exit_code"] == 1
+    finally:
+        server.shutdown()
+        thread.join(5)
+
+
+def test_unresponsive_daemon_is_not_replaced(socket_path, monkeypatch):
+    import socket
+
+    busy = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    busy.bind(str(socket_path))
+    busy.listen(1)  # Alive but never answers, like a daemon busy with a long check
+    monkeypatch.setattr(enforcer_daemon, "PING_TIMEOUT", 0.2)
+    try:
+        with pytest.raises(OSError, match="not answering"):
+            EnforcerDaemon(socket_path, lambda request: {})._bind()
+        assert socket_path.exists()
+    finally:
+        busy.close()
+
+
+def test_shutdown_leaves_a_replaced_socket_alone(socket_path):
+    import socket
+
+    server = EnforcerDaemon(socket_path, lambda request: {"exit_code": 0})
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    for _ in range(200):
+        if socket_path.exists():
+            break
+        thread.join(0.01)
+
+    socket_path.unlink()
+    other = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    other.bind(str(socket_path))  # A second daemon took over the path
+    try:
+        server.shutdown()
+        thread.join(5)
+        assert socket_path.exists()
+    finally:
+        other.close()
+
+
+def test_socket_is_owner_only(daemon, socket_path):
+    import stat
+
+    assert stat.S_IMODE(socket_path.stat().st_mode) == 0o600
@@ -0,0 +1,109 @@
+import subprocess
+
+import pytest
+
+from enforcement.core.file_scanner import is_file_modified_in_session
+from enforcement.core.git_snapshot import GitSnapshot, GitSnapshotError, split_patch
+from enforcement.core.git_utils import GitUtils
+from enforcement.core.session_state import EnforcementSession
+
+
+FILES = ["real.txt", "ws.txt", "mv.txt", "staged.txt", "same.txt", "gone.txt", "dir/with space.txt"]
+
+
+def git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "config", "user.email", "dev@example.com")
+    git(tmp_path, "config", "user.name", "dev")
+    (tmp_path / "dir").mkdir()
+    for name in FILES:
+        (tmp_path / name).write_text(f"{name}\nline two\n")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-qm", "init")
+
+    (tmp_path / "real.txt").write_text("real.txt\nchanged\n")
+    (tmp_path / "ws.txt").write_text("ws.txt  \nline   two\n")
+    git(tmp_path, "mv", "mv.txt", "moved.txt")
+    (tmp_path / "staged.txt").write_text("staged.txt\nstaged change\n")
+    git(tmp_path, "add", "staged.txt")
+    (tmp_path / "gone.txt").unlink()
+    (tmp_path / "dir/with space.txt").write_text("spaced\n")
+    (tmp_path / "new.txt").write_text("brand new\n")
+    return tmp_path
+
+
+def make_session():
+    return EnforcementSession(
+        session_id="test",
+        start_time="2000-01-01T00:00:00+00:00",
+        last_check="2000-01-01T00:00:00+00:00",
+        violations=[],
+        checks_passed=[],
+        checks_failed=[],
+        auto_fixes=[],
+        file_hashes={},
+        version=2,
+    )
+
+
+def per_file_utils(repo):
+    return GitUtils(repo, use_snapshot=False)
+
+
+def test_snapshot_answers_match_per_file_git(repo):
+    paths = FILES + ["moved.txt", "new.txt", "missing.txt"]
+    snapshot_utils = GitUtils(repo)
+    fallback_utils = per_file_utils(repo)
+    assert snapshot_utils.get_snapshot() is not None
+
+    for path in paths:
+        assert snapshot_utils.is_tracked(path) == fallback_utils.is_tracked(path), path
+        assert snapshot_utils.has_content_changes(path) == fallback_utils.has_content_changes(path), path
+        if (repo / path).exists():
+            # Without "--", the per-file git diffs error out on deleted paths
+            assert (
+                snapshot_utils.has_unstaged_content_changes(path)
+                == fallback_utils.has_unstaged_content_changes(path)
+            ), path
+            assert snapshot_utils.get_file_diff(path) == fallback_utils.get_file_diff(path), path
+        assert snapshot_utils.get_last_commit_time(path) == fallback_utils.get_last_commit_time(path), path
+
+
+def test_is_file_modified_matches_per_file_git(repo):
+    for path in FILES + ["moved.txt", "new.txt"]:
+        expected = is_file_modified_in_session(path, make_session(), repo, per_file_utils(repo))
+        assert is_file_modified_in_session(path, make_session(), repo, GitUtils(repo)) == expected, path
+
+
+def test_status_and_renames(repo):
+    snapshot = GitSnapshot.capture(repo)
+
+    assert snapshot.change_status("moved.txt") == "R"
+    assert snapshot.rename_source("moved.txt") == "mv.txt"
+    assert snapshot.change_status("staged.txt") == "M"
+    assert snapshot.change_status("gone.txt") == "D"
+    assert snapshot.change_status("same.txt") is None
+    assert "new.txt" in snapshot.untracked
+    assert snapshot.has_content_changes("real.txt")
+    assert not snapshot.has_content_changes("ws.txt")
+
+
+def test_capture_outside_repository_fails(tmp_path):
+    with pytest.raises(GitSnapshotError):
+        GitSnapshot.capture(tmp_path)
+    assert GitUtils(tmp_path).get_snapshot() is None
+
+
+def test_split_patch_skips_quoted_paths():
+    patch = (
+        "diff --git a/a.txt b/a.txt\n--- a/a.txt\n+++ b/a.txt\n@@ -1 +1 @@\n-x\n+y\n"
+        'diff --git "a/t\\tb" "b/t\\tb"\n@@ -1 +1 @@\n'
+    )
+
+    assert list(split_patch(patch)) == ["a.txt"]
+    assert split_patch(patch)["a.txt"].endswith("+y")
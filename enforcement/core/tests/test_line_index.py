@@ -0,0 +1,41 @@
+import random
+
+from enforcement.core.line_index import LineIndex
+from enforcement.prisma_query_parser import parse_prisma_calls
+
+
+def test_line_number_matches_prefix_count():
+    rng = random.Random(7)
+    for _ in range(500):
+        text = ''.join(rng.choice('ab\n') for _ in range(rng.randint(0, 40)))
+        index = LineIndex(text)
+        assert len(index) == len(text.split('\n'))
+        for offset in range(len(text) + 2):
+            assert index.line_number(offset) == text[:offset].count('\n') + 1
+
+
+def test_line_start_round_trips():
+    text = "first\n\nthird line\nlast"
+    index = LineIndex(text)
+    for line_number, line in enumerate(text.split('\n'), 1):
+        start = index.line_start(line_number)
+        assert text[start:start + len(line)] == line
+        assert index.line_number(start) == line_number
+
+
+def test_prisma_call_line_numbers(tmp_path):
+    content = (
+        "class Service {\n"
+        "  async list() {\n"
+        "    return tx.customer.findMany({ where: { tenantId } });\n"
+        "  }\n"
+        "\n"
+        "  async get(id) {\n"
+        "    return await prisma.order.findUnique({\n"
+        "      where: { id },\n"
+        "    });\n"
+        "  }\n"
+        "}\n"
+    )
+    calls = parse_prisma_calls(tmp_path / "svc.ts", content)
+    assert [(c.model, c.line_number) for c in calls] == [("customer", 3), ("order", 7)]
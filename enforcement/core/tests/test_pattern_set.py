@@ -0,0 +1,88 @@
+import random
+import re
+
+from enforcement.checkers.secret_scanner_checker import SecretScannerChecker
+from enforcement.checks.date_checker import DateChecker
+from enforcement.core.pattern_set import PatternSet
+
+
+RULES = [
+    r'\bAPI_KEY\b',
+    r'\bTOKEN\b',
+    re.compile(r'\bsecret\b', re.IGNORECASE),
+    r'^#{1,6}\s+.*\d{4}',
+    r'end;$',
+    r'`[^`]*\d{4}[^`]*`',
+    r'\w+\([^)]*\d{4}',
+    r'SELECT\s+\*\s+FROM\s+\w+\s+(?!WHERE)',
+    re.compile(r'.*["\'].*?updated:\s*\d{4}.*?["\'].*', re.IGNORECASE | re.DOTALL),
+    r'(\w)\1',
+]
+
+FRAGMENTS = [
+    'API_KEY', 'TOKEN', 'Secret', '# Title 2025', 'end;', '`x 2024', 'y`', 'fn(', '2026)',
+    'SELECT * FROM t ', 'WHERE', '"updated: 2025"', 'aa', 'plain', '', '  ', ')', '`',
+]
+
+
+def naive_scan(patterns, lines):
+    hits = {}
+    for idx, pattern in enumerate(patterns):
+        for line_num, line in enumerate(lines, 1):
+            if pattern.search(line):
+                hits.setdefault(idx, []).append(line_num)
+    return hits
+
+
+def test_scan_lines_matches_naive_loops():
+    rng = random.Random(7)
+    pattern_set = PatternSet(RULES)
+
+    for _ in range(300):
+        lines = [
+            ' '.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 4)))
+            for _ in range(rng.randint(0, 12))
+        ]
+        assert pattern_set.scan_lines(lines) == naive_scan(pattern_set.patterns, lines)
+
+
+def test_match_spanning_lines_does_not_hide_next_line():
+    pattern_set = PatternSet([r'\w+\([^)]*\d{4}'])
+
+    assert pattern_set.scan_lines(['call(', 'other(2025']) == {0: [2]}
+
+
+def test_text_queries_match_individual_patterns():
+    pattern_set = PatternSet(RULES)
+    for text in ['nothing here', 'const TOKEN = 1', 'my SECRET', 'aa', 'x `2024` y', 'API_KEY TOKEN']:
+        expected = [idx for idx, p in enumerate(pattern_set.patterns) if p.search(text)]
+        assert pattern_set.matching(text) == expected
+        assert pattern_set.first(text) == (expected[0] if expected else None)
+        assert pattern_set.search(text) == bool(expected)
+
+
+def test_finditer_is_pattern_major():
+    pattern_set = PatternSet([r'\bb\b', r'\ba\b'])
+
+    found = [(idx, m.start()) for idx, m in pattern_set.finditer('a b a b')]
+
+    assert found == [(0, 2), (0, 6), (1, 0), (1, 4)]
+
+
+def test_rule_ids():
+    pattern_set = PatternSet([(r'\bAPI_KEY\b', 'api-key'), (r'\bTOKEN\b', 'token')])
+
+    assert pattern_set.matching_rule_ids('TOKEN and API_KEY') == ['api-key', 'token']
+
+
+def test_checker_rule_lists_on_repo_sources():
+    sets = [
+        PatternSet(SecretScannerChecker.SECRET_VARIABLE_PATTERNS),
+        PatternSet(SecretScannerChecker.SECRET_VARIABLE_PATTERNS, re.IGNORECASE),
+        PatternSet(list(DateChecker.HISTORICAL_DATE_PATTERNS)),
+    ]
+    with open(__file__, encoding='utf-8') as fh:
+        lines = fh.read().splitlines() + ['**Last Updated:** 2025-12-05', 'const JWT_SECRET = "x"']
+
+    for pattern_set in sets:
+        assert pattern_set.scan_lines(lines) == naive_scan(pattern_set.patterns, lines)
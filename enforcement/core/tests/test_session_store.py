@@ -0,0 +1,111 @@
+import json
+
+from enforcement.core.session_state import (
+    EnforcementSession,
+    get_session_store,
+    load_session,
+    save_session,
+)
+from enforcement.core.session_store import LazyFileHashes, SessionStore
+
+
+def _violation(i):
+    return {"rule": "date", "file_path": f"src/f{i}.ts", "line_number": i, "message": f"v{i}"}
+
+
+def _session(violations=50, hashes=100):
+    session = EnforcementSession.create_new()
+    session.violations = [_violation(i) for i in range(violations)]
+    session.checks_passed = ["date", "security"]
+    session.file_hashes = {f"/src/f{i}.ts:1.0": f"h{i}" for i in range(hashes)}
+    return session
+
+
+def test_save_writes_only_changed_rows(tmp_path):
+    session = _session()
+    save_session(session, tmp_path)
+    store = get_session_store(tmp_path)
+    assert isinstance(session.file_hashes, LazyFileHashes)
+
+    session.violations.append(_violation(50))
+    session.file_hashes["/src/new.ts:2.0"] = "hnew"
+    session.file_hashes["/src/f0.ts:1.0"] = "h0"  # unchanged value
+    save_session(session, tmp_path)
+    assert store.last_save == {"rows_written": 2, "rows_deleted": 0}
+
+    # Pruning from the head deletes rows instead of rewriting the list
+    session.violations = session.violations[10:]
+    save_session(session, tmp_path)
+    assert store.last_save == {"rows_written": 0, "rows_deleted": 10}
+
+
+def test_reload_round_trips_without_reading_hashes(tmp_path):
+    session = _session()
+    session.violations.append({"rule": "date", "file_path": "src/x.ts", "line_number": "N/A"})
+    save_session(session, tmp_path)
+
+    reopened = SessionStore(tmp_path / "session.db")
+    meta, lists, file_hashes = reopened.load()
+    assert meta["session_id"] == session.session_id
+    assert lists["violations"] == [_violation(i) for i in range(50)]  # stale entry not persisted
+    assert lists["checks_passed"] == ["date", "security"]
+    assert not file_hashes.loaded
+    assert dict(file_hashes) == {f"/src/f{i}.ts:1.0": f"h{i}" for i in range(100)}
+    reopened.close()
+
+
+def test_sees_writes_from_another_store(tmp_path):
+    session = _session()
+    save_session(session, tmp_path)
+
+    other = SessionStore(tmp_path / "session.db")
+    meta, lists, file_hashes = other.load()
+    lists["violations"] = lists["violations"][5:]
+    file_hashes["/src/other.ts:3.0"] = "hother"
+    other.save(meta, lists, file_hashes)
+    other.close()
+
+    # The cached store notices the other writer's commit and diffs against it
+    session.violations.append(_violation(99))
+    save_session(session, tmp_path)
+    loaded, _ = load_session(tmp_path)
+    assert loaded.violations == session.violations
+    assert "/src/other.ts:3.0" in loaded.file_hashes
+
+
+def test_migrates_session_json(tmp_path):
+    data = EnforcementSession.create_new()
+    legacy = {
+        "session_id": data.session_id,
+        "start_time": data.start_time,
+        "last_check": data.last_check,
+        "violations": [_violation(1), {"rule": "x", "file_path": ".ai/memory_bank/log.md", "line_number": 3}],
+        "checks_passed": [],
+        "checks_failed": ["date"],
+        "auto_fixes": [],
+        "file_hashes": {"/src/a.ts:1.0": "ha"},
+        "version": 2,
+    }
+    (tmp_path / "session.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+    session, _ = load_session(tmp_path)
+    assert session.violations == [_violation(1)]
+    assert (tmp_path / "session.db").exists()
+
+    reopened = SessionStore(tmp_path / "session.db")
+    meta, lists, file_hashes = reopened.load()
+    assert meta["session_id"] == data.session_id
+    assert lists["checks_failed"] == ["date"]
+    assert dict(file_hashes) == {"/src/a.ts:1.0": "ha"}
+    reopened.close()
+
+
+def test_new_session_id_replaces_stored_session(tmp_path):
+    save_session(_session(), tmp_path)
+    fresh = EnforcementSession.create_new()
+    save_session(fresh, tmp_path)
+
+    loaded, _ = load_session(tmp_path)
+    assert loaded.session_id == fresh.session_id
+    assert loaded.violations == []
+    assert len(loaded.file_hashes) == 0
@@ -14,6 +14,8 @@ from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
 
+from enforcement.core.pattern_set import PatternSet
+
 
 class DocumentContext:
     """
@@ -284,6 +286,7 @@ class DateDetector:
         re.compile(r'(`[^`]*\d{4}[^`]*`|\w+\([^)]*\d{4})', re.IGNORECASE),
         re.compile(r'^#{1,6}\s+.*\d{4}', re.IGNORECASE | re.MULTILINE),
     ]
+    HISTORICAL_PATTERN_SET = PatternSet(HISTORICAL_DATE_PATTERNS)
     
     def __init__(self, current_date: Optional[str] = None):
         """
@@ -301,6 +304,9 @@ class DateDetector:
         """
         Find all dates in text with context.
         
+        Only lines containing a date are examined; they are located with one
+        scan over the whole text (date matches never span a newline).
+        
         Args:
             text: Text to search for dates
             context_lines: Number of lines before/after to include in context
@@ -309,9 +315,12 @@ class DateDetector:
             List of DateMatch objects
         """
         matches = []
+        if '20' not in text:
+            return matches
         lines = text.split('\n')
         
-        for line_num, line in enumerate(lines, start=1):
+        for line_num in self._date_line_numbers(text):
+            line = lines[line_num - 1]
             # Find all date matches in this line
             date_matches = self.HARDCODED_DATE_PATTERN.findall(line)
             
@@ -335,6 +344,18 @@ class DateDetector:
         
         return matches
     
+    def _date_line_numbers(self, text: str):
+        """Yield 1-based numbers of lines containing a date match, in order."""
+        line_idx = 0
+        pos = 0
+        last_yielded = -1
+        for match in self.HARDCODED_DATE_PATTERN.finditer(text):
+            line_idx += text.count('\n', pos, match.start())
+            pos = match.start()
+            if line_idx != last_yielded:
+                last_yielded = line_idx
+                yield line_idx + 1
+    
     def classify_date(self, date_match: DateMatch, doc_context: DocumentContext) -> DateClassification:
         """
         Classify a date match based on context and document type.
@@ -449,16 +470,14 @@ class DateDetector:
         if not self.HARDCODED_DATE_PATTERN.search(line):
             return False
         
-        # Check consolidated patterns
-        for pattern in self.HISTORICAL_DATE_PATTERNS:
-            if pattern.search(line):
-                return True
+        # Check consolidated patterns: none is led by \b, so PatternSet doesn't
+        # merge them and each rule scans the line on its own until one matches
+        if self.HISTORICAL_PATTERN_SET.search(line):
+            return True
         
         # Check context if provided
-        if context:
-            for pattern in self.HISTORICAL_DATE_PATTERNS:
-                if pattern.search(context):
-                    return True
+        if context and self.HISTORICAL_PATTERN_SET.search(context):
+            return True
         
         return False
     
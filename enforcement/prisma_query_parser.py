@@ -7,10 +7,15 @@ and tenant key presence without requiring a full TypeScript AST.
 Python Bible Chapter 11: Clean Architecture principles.
 """
 
+import hashlib
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+from enforcement.core.line_index import LineIndex
 
 
 @dataclass
@@ -26,6 +31,10 @@ class PrismaCall:
         args_text: Full argument text between parentheses
         where_text: Raw text for where: {...} block, if found
         where_has_tenant_key: True if tenantId/tenant_id appears as a key in where clause
+        start: Offset of the call expression (e.g. "this.prisma...")
+        args_span: Offsets of the opening and closing parentheses
+        where_span: Offsets of the braces around the where object, if found
+        depth: Number of brackets enclosing the call expression
     """
     file_path: Path
     line_number: int
@@ -34,295 +43,241 @@ class PrismaCall:
     args_text: str
     where_text: Optional[str]
     where_has_tenant_key: bool
+    start: int = 0
+    args_span: Tuple[int, int] = (0, 0)
+    where_span: Optional[Tuple[int, int]] = None
+    depth: int = 0
 
 
-def parse_prisma_calls(file_path: Path, content: str) -> List[PrismaCall]:
+@dataclass(frozen=True)
+class PrismaCallSpan:
+    """Location of one Prisma call in a file, as found by scan_prisma_calls()."""
+    start: int
+    line_number: int
+    model: str
+    op: str
+    args_start: int
+    args_end: int
+    where_start: Optional[int]
+    where_end: Optional[int]
+    depth: int
+
+
+# Tokens that matter for call extraction; everything else is skipped by the regex engine.
+# Strings, comments and template literals are consumed whole so brackets and
+# "where:" inside them are never seen. The leading lookahead lets the regex
+# engine skip ahead on a single character class between tokens.
+_CODE_TOKEN = re.compile(
+    r"(?=[/'\"`(){}\[\]ptdwW])"
+    r"(?:(?P<comment>//[^\n]*|/\*[\s\S]*?(?:\*/|\Z))"
+    r"|(?P<string>'[^'\\\n]*(?:\\[\s\S][^'\\\n]*)*'|\"[^\"\\\n]*(?:\\[\s\S][^\"\\\n]*)*\")"
+    r"|(?P<template>`)"
+    r"|(?P<call>(?<![\w$])(?:this\.)?(?:prisma|db|tx)\.(?P<model>\w+)\.(?P<op>\w+)\s*\()"
+    r"|(?P<where>(?<![\w$])(?i:where)\s*:)"
+    r"|(?P<open>[({\[])"
+    r"|(?P<close>[)}\]]))"
+)
+
+# Template literal text up to its closing backtick or next ${ substitution
+_TEMPLATE_BODY = re.compile(r"[^`\\$]*(?:(?:\\[\s\S]|\$(?!\{))[^`\\$]*)*(?P<end>`|\$\{)?")
+
+_CLOSERS = {')': '(', '}': '{', ']': '['}
+
+# Frame roles
+_ROLE_CALL = 'call'
+_ROLE_ARGS = 'args'
+_ROLE_WHERE = 'where'
+
+# Scan results are shared by every checker looking at the same content
+_SCAN_CACHE_SIZE = 256
+_scan_cache: "OrderedDict[bytes, Tuple[PrismaCallSpan, ...]]" = OrderedDict()
+_scan_cache_lock = threading.Lock()
+
+
+class _OpenCall:
+    """A Prisma call whose closing parenthesis hasn't been reached yet."""
+    __slots__ = ('start', 'model', 'op', 'args_start', 'depth', 'where_start', 'where_end', 'pending_where')
+
+    def __init__(self, start: int, model: str, op: str, args_start: int, depth: int):
+        self.start = start
+        self.model = model
+        self.op = op
+        self.args_start = args_start
+        self.depth = depth
+        self.where_start: Optional[int] = None
+        self.where_end: Optional[int] = None
+        # End offset of a top-level "where:" still waiting for its "{"
+        self.pending_where: Optional[int] = None
+
+
+def _tokenize_prisma_calls(content: str) -> List[PrismaCallSpan]:
     """
-    Parse all Prisma client calls from a file's content.
-    
-    Args:
-        file_path: Path to the file being parsed
-        content: Full file content as string
-        
-    Returns:
-        List of PrismaCall objects representing each Prisma call found
+    Find Prisma calls, their argument spans and top-level where objects in one pass.
+
+    Brackets are tracked on a single stack; each frame is (opener, role, call).
     """
-    calls = []
-    
-    # Pattern to match Prisma call headers:
-    # - this.prisma.model.op(
-    # - this.db.model.op(
-    # - tx.model.op(
-    # - await prisma.model.op(
-    # - prisma.model.op(
-    prisma_patterns = [
-        re.compile(r'this\.(?:prisma|db)\.(\w+)\.(\w+)\s*\(', re.MULTILINE),
-        re.compile(r'tx\.(\w+)\.(\w+)\s*\(', re.MULTILINE),
-        re.compile(r'(?:await\s+)?prisma\.(\w+)\.(\w+)\s*\(', re.MULTILINE),
-    ]
-    
-    # Collect all matches from all patterns, avoiding duplicates
-    all_matches = []
-    seen_positions = set()
-    
-    for pattern in prisma_patterns:
-        for match in pattern.finditer(content):
-            # Avoid duplicate matches at the same position
-            pos_key = (match.start(), match.end())
-            if pos_key not in seen_positions:
-                seen_positions.add(pos_key)
-                all_matches.append(match)
-    
-    # Sort matches by position to process in order
-    all_matches.sort(key=lambda m: m.start())
-    
-    for match in all_matches:
-        model = match.group(1)
-        op = match.group(2)
-        call_start = match.end() - 1  # Position of opening parenthesis
-        
-        # Calculate line number
-        line_number = content[:call_start].count('\n') + 1
-        
-        # Extract argument block using parenthesis matching
-        args_text = _extract_argument_block(content, call_start)
-        
-        if args_text is None:
-            # Malformed call (unmatched parentheses) - skip
+    found: List[Tuple[_OpenCall, int]] = []
+    stack: List[Tuple[str, Optional[str], Optional[_OpenCall]]] = []
+    pos = 0
+    length = len(content)
+
+    while pos < length:
+        match = _CODE_TOKEN.search(content, pos)
+        if match is None:
+            break
+        pos = match.end()
+        kind = match.lastgroup
+
+        if kind == 'comment' or kind == 'string':
             continue
-        
-        # Extract where clause from args_text
-        where_text = _extract_where_clause(args_text)
-        
-        # Check if tenant key is present in where clause
-        where_has_tenant_key = _has_tenant_key(where_text) if where_text else False
-        
-        calls.append(PrismaCall(
-            file_path=file_path,
-            line_number=line_number,
-            model=model,
-            op=op,
-            args_text=args_text,
-            where_text=where_text,
-            where_has_tenant_key=where_has_tenant_key
-        ))
-    
-    return calls
 
+        if kind == 'template':
+            pos = _skip_template(content, pos, stack)
+            continue
 
-def _extract_argument_block(content: str, start_pos: int) -> Optional[str]:
-    """
-    Extract the complete argument block from a Prisma call using parenthesis matching.
-    
-    Args:
-        content: Full file content
-        start_pos: Position of opening parenthesis
-        
-    Returns:
-        Argument text between parentheses, or None if unmatched
-    """
-    depth = 0
-    in_string = False
-    string_char = None
-    escape_next = False
-    pos = start_pos
-    
-    while pos < len(content):
-        char = content[pos]
-        
-        if escape_next:
-            escape_next = False
-            pos += 1
+        if kind == 'call':
+            call = _OpenCall(match.start(), match.group('model'), match.group('op'), pos - 1, len(stack))
+            stack.append(('(', _ROLE_CALL, call))
             continue
-        
-        if char == '\\':
-            escape_next = True
-            pos += 1
+
+        if kind == 'where':
+            if stack:
+                _, role, call = stack[-1]
+                if call is not None and role in (_ROLE_CALL, _ROLE_ARGS) and call.where_start is None:
+                    call.pending_where = pos
             continue
-        
-        # Handle string literals
-        if not in_string and char in ('"', "'", '`'):
-            in_string = True
-            string_char = char
-            pos += 1
+
+        char = match.group()
+        if kind == 'open':
+            role = None
+            owner = None
+            if char == '{' and stack:
+                _, parent_role, call = stack[-1]
+                if call is not None and parent_role in (_ROLE_CALL, _ROLE_ARGS):
+                    if call.pending_where is not None and not content[call.pending_where:pos - 1].strip():
+                        role, owner = _ROLE_WHERE, call
+                        call.where_start = pos - 1
+                    elif parent_role == _ROLE_CALL and not content[call.args_start + 1:pos - 1].strip():
+                        role, owner = _ROLE_ARGS, call
+                    call.pending_where = None
+            stack.append((char, role, owner))
             continue
-        
-        if in_string:
-            if char == string_char:
-                in_string = False
-                string_char = None
-            pos += 1
+
+        # Closing bracket
+        if char == '}' and stack and stack[-1][0] == '${':
+            stack.pop()
+            pos = _skip_template(content, pos, stack)
             continue
-        
-        # Track parentheses depth
-        if char == '(':
-            depth += 1
-        elif char == ')':
-            depth -= 1
-            if depth == 0:
-                # Found matching closing parenthesis
-                return content[start_pos + 1:pos]  # Exclude the parentheses themselves
-        
-        pos += 1
-    
-    # Unmatched parentheses
-    return None
+        opener = _CLOSERS[char]
+        for depth in range(len(stack) - 1, -1, -1):
+            if stack[depth][0] == opener:
+                break
+        else:
+            continue  # Stray closer
+        # Frames above the match were never closed; their calls are dropped
+        _, role, call = stack[depth]
+        del stack[depth:]
+        if role == _ROLE_CALL:
+            found.append((call, match.start()))
+        elif role == _ROLE_WHERE and call.where_end is None:
+            call.where_end = match.start()
 
+    found.sort(key=lambda item: item[0].start)
+    line_index = LineIndex(content)
+    return [
+        PrismaCallSpan(
+            start=call.start,
+            line_number=line_index.line_number(call.args_start),
+            model=call.model,
+            op=call.op,
+            args_start=call.args_start,
+            args_end=args_end,
+            where_start=call.where_start if call.where_end is not None else None,
+            where_end=call.where_end,
+            depth=call.depth,
+        )
+        for call, args_end in found
+    ]
 
-def _extract_where_clause(args_text: str) -> Optional[str]:
+
+def _skip_template(content: str, pos: int, stack: list) -> int:
     """
-    Extract the where clause from Prisma call arguments.
-    
+    Skip template literal text starting at pos.
+
+    Returns the offset after the closing backtick, or after "${" (pushing a
+    frame so the matching "}" resumes the literal).
+    """
+    match = _TEMPLATE_BODY.match(content, pos)
+    end = match.group('end')
+    if end == '${':
+        stack.append(('${', None, None))
+    elif end is None:
+        return len(content)  # Unterminated literal
+    return match.end()
+
+
+def scan_prisma_calls(content: str) -> Tuple[PrismaCallSpan, ...]:
+    """
+    Locate every Prisma client call in TypeScript source.
+
+    Recognizes ``prisma.<model>.<op>(``, ``db.<model>.<op>(`` and
+    ``tx.<model>.<op>(`` (optionally prefixed with ``this.``), ignoring
+    occurrences in strings, template literals and comments. Results are
+    cached by content hash, so checkers scanning the same file share one pass.
+
     Args:
-        args_text: Argument text (without outer parentheses, may include outer braces)
-        
+        content: Full file content
+
     Returns:
-        Raw text of where: {...} block, or None if not found
+        Call spans ordered by position
     """
-    # Strip leading/trailing whitespace
-    args_text = args_text.strip()
-    
-    # Remove outer braces if present (args_text might be "{ ... }" or just "...")
-    # We need to find the matching closing brace, not just check start/end
-    if args_text.startswith('{'):
-        # Find the matching closing brace
-        inner = _extract_brace_block(args_text, 0)
-        if inner is not None:
-            args_text = inner
-        elif args_text.endswith('}'):
-            # Fallback: simple case where braces match at start/end
-            args_text = args_text[1:-1].strip()
-    
-    # Find "where" token at top level
-    where_pattern = re.compile(r'\bwhere\s*:', re.IGNORECASE)
-    
-    for match in where_pattern.finditer(args_text):
-        # Check if this "where" is at top level
-        before_where = args_text[:match.start()]
-        
-        # Count braces to determine nesting level
-        brace_depth = 0
-        bracket_depth = 0
-        paren_depth = 0
-        in_string = False
-        string_char = None
-        escape_next = False
-        
-        for i, char in enumerate(before_where):
-            if escape_next:
-                escape_next = False
-                continue
-            
-            if char == '\\':
-                escape_next = True
-                continue
-            
-            if not in_string and char in ('"', "'", '`'):
-                in_string = True
-                string_char = char
-                continue
-            
-            if in_string:
-                if char == string_char:
-                    in_string = False
-                    string_char = None
-                continue
-            
-            if char == '{':
-                brace_depth += 1
-            elif char == '}':
-                brace_depth -= 1
-            elif char == '[':
-                bracket_depth += 1
-            elif char == ']':
-                bracket_depth -= 1
-            elif char == '(':
-                paren_depth += 1
-            elif char == ')':
-                paren_depth -= 1
-        
-        # If we're at top level (brace_depth == 0), extract the where object
-        if brace_depth == 0 and bracket_depth == 0 and paren_depth == 0:
-            # Find the opening brace after the colon
-            after_colon = args_text[match.end():]
-            brace_start = None
-            
-            for i, char in enumerate(after_colon):
-                if char.isspace():
-                    continue
-                if char == '{':
-                    brace_start = match.end() + i
-                    break
-                elif char not in ('{', ' ', '\t', '\n'):
-                    # Not a valid where clause
-                    break
-            
-            if brace_start is None:
-                continue
-            
-            # Extract the where object using brace matching
-            where_text = _extract_brace_block(args_text, brace_start)
-            if where_text:
-                return where_text
-    
-    return None
+    key = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    with _scan_cache_lock:
+        spans = _scan_cache.get(key)
+        if spans is not None:
+            _scan_cache.move_to_end(key)
+            return spans
+
+    spans = tuple(_tokenize_prisma_calls(content))
+    with _scan_cache_lock:
+        _scan_cache[key] = spans
+        if len(_scan_cache) > _SCAN_CACHE_SIZE:
+            _scan_cache.popitem(last=False)
+    return spans
 
 
-def _extract_brace_block(content: str, start_pos: int) -> Optional[str]:
+def parse_prisma_calls(file_path: Path, content: str) -> List[PrismaCall]:
     """
-    Extract a complete {...} block starting at the given position.
+    Parse all Prisma client calls from a file's content.
     
     Args:
-        content: Text content
-        start_pos: Position of opening brace
+        file_path: Path to the file being parsed
+        content: Full file content as string
         
     Returns:
-        Text inside braces (excluding the braces), or None if unmatched
+        List of PrismaCall objects representing each Prisma call found
     """
-    depth = 0
-    in_string = False
-    string_char = None
-    escape_next = False
-    pos = start_pos
-    
-    while pos < len(content):
-        char = content[pos]
-        
-        if escape_next:
-            escape_next = False
-            pos += 1
-            continue
-        
-        if char == '\\':
-            escape_next = True
-            pos += 1
-            continue
-        
-        if not in_string and char in ('"', "'", '`'):
-            in_string = True
-            string_char = char
-            pos += 1
-            continue
-        
-        if in_string:
-            if char == string_char:
-                in_string = False
-                string_char = None
-            pos += 1
-            continue
-        
-        if char == '{':
-            depth += 1
-        elif char == '}':
-            depth -= 1
-            if depth == 0:
-                # Found matching closing brace
-                return content[start_pos + 1:pos]  # Exclude the braces themselves
-        
-        pos += 1
-    
-    # Unmatched braces
-    return None
+    calls = []
+    for span in scan_prisma_calls(content):
+        where_text = None
+        where_span = None
+        if span.where_start is not None:
+            where_text = content[span.where_start + 1:span.where_end]
+            where_span = (span.where_start, span.where_end)
+        calls.append(PrismaCall(
+            file_path=file_path,
+            line_number=span.line_number,
+            model=span.model,
+            op=span.op,
+            args_text=content[span.args_start + 1:span.args_end],
+            where_text=where_text,
+            where_has_tenant_key=_has_tenant_key(where_text) if where_text else False,
+            start=span.start,
+            args_span=(span.args_start, span.args_end),
+            where_span=where_span,
+            depth=span.depth,
+        ))
+    return calls
 
 
 def _has_tenant_key(where_text: str) -> bool:
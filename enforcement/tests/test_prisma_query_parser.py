@@ -11,7 +11,7 @@ from pathlib import Path
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from enforcement.prisma_query_parser import parse_prisma_calls, PrismaCall
+from enforcement.prisma_query_parser import parse_prisma_calls, scan_prisma_calls, PrismaCall
 
 
 def test_simple_where_with_tenant():
@@ -208,6 +208,73 @@ prisma.customer.findMany({
         assert 'tenantId' in call.where_text
 
 
+def test_strings_comments_and_templates_ignored():
+    """Test that calls and brackets inside strings, comments and templates are skipped."""
+    content = '''
+// await prisma.customer.delete({ where: { id } });
+/* prisma.order.update({ where: { id } }) */
+const label = "prisma.invoice.create(";
+const query = `prisma.user.findMany({ where: ${JSON.stringify({ a: "}" })} })`;
+await tx.payment.create({
+  data: { note: ')}', memo: `closing ${"}"} brace` },
+  where: { tenantId: user.tenantId },
+});
+'''
+    calls = parse_prisma_calls(Path('test.service.ts'), content)
+
+    assert [(call.model, call.op) for call in calls] == [('payment', 'create')]
+    assert calls[0].line_number == 6
+    assert calls[0].where_text.strip() == 'tenantId: user.tenantId'
+    assert calls[0].where_has_tenant_key is True
+
+
+def test_where_must_be_top_level():
+    """Test that a where key nested inside another argument is not the call's where."""
+    content = '''
+await prisma.customer.findMany({
+  include: { orders: { where: { tenantId } } },
+  where: { id: customerId },
+});
+'''
+    calls = parse_prisma_calls(Path('test.service.ts'), content)
+
+    assert len(calls) == 1
+    assert calls[0].where_text.strip() == 'id: customerId'
+    assert calls[0].where_has_tenant_key is False
+    start, end = calls[0].where_span
+    assert content[start] == '{' and content[end] == '}'
+
+
+def test_nested_calls_report_depth_and_spans():
+    """Test that nested calls are both reported with their argument spans."""
+    content = "await prisma.$transaction(async (tx) => { await tx.order.create({ data: {} }); });\n"
+    spans = scan_prisma_calls(content)
+
+    assert [(span.model, span.op, span.depth) for span in spans] == [('order', 'create', 2)]
+    assert content[spans[0].args_start] == '('
+    assert content[spans[0].args_end] == ')'
+
+
+def test_scan_results_are_cached():
+    """Test that scanning the same content twice reuses the first result."""
+    content = "await prisma.customer.findMany({ where: { tenantId } });\n"
+    assert scan_prisma_calls(content) is scan_prisma_calls(content)
+
+
+def test_checkers_share_one_scan_cache():
+    """Test that the tenant and backend-pattern checkers hit the same scan cache."""
+    from enforcement import prisma_query_parser
+    from enforcement.checkers import backend_patterns_checker, tenant_isolation_checker
+
+    content = "await prisma.invoice.findMany({ where: { status } });\n"
+    prisma_query_parser._scan_cache.clear()
+    tenant_isolation_checker.parse_prisma_calls(Path("invoice.service.ts"), content)
+    assert len(prisma_query_parser._scan_cache) == 1
+    cached = next(iter(prisma_query_parser._scan_cache.values()))
+    assert backend_patterns_checker.scan_prisma_calls(content) is cached
+    assert len(prisma_query_parser._scan_cache) == 1
+
+
 if __name__ == '__main__':
     test_simple_where_with_tenant()
     test_nested_and_with_tenant()
@@ -217,5 +284,10 @@ if __name__ == '__main__':
     test_this_prisma_pattern()
     test_tenant_id_variant()
     test_complex_nested_where()
+    test_strings_comments_and_templates_ignored()
+    test_where_must_be_top_level()
+    test_nested_calls_report_depth_and_spans()
+    test_scan_results_are_cached()
+    test_checkers_share_one_scan_cache()
     print("All tests passed!")
 